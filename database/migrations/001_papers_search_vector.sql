@@ -0,0 +1,19 @@
+-- ==================== 001: papers 전문 검색 컬럼 추가 ==================== --
+-- title(가중치 A) + abstract(가중치 B)를 합친 tsvector를 저장 컬럼으로 유지하고
+-- GIN 인덱스로 하이브리드 검색의 키워드 브랜치(_keyword_search)를 인덱스 스캔으로 처리
+--
+-- 적용: psql "$DATABASE_URL" -f database/migrations/001_papers_search_vector.sql
+-- (PostgreSQL 12 이상, 여러 번 실행해도 안전)
+
+-- ---------------------- search_vector 생성 컬럼 ---------------------- --
+ALTER TABLE papers ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(abstract, '')), 'B')
+    ) STORED;
+
+-- ---------------------- search_vector 인덱스 ---------------------- --
+CREATE INDEX IF NOT EXISTS idx_papers_search_vector ON papers USING GIN (search_vector);
+
+-- 통계 갱신 (플래너가 새 인덱스를 바로 사용하도록)
+ANALYZE papers;
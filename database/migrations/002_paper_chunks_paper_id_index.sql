@@ -0,0 +1,20 @@
+-- ==================== 002: paper_chunks 논문별 청크 조회 인덱스 ==================== --
+-- langchain_pg_embedding.cmetadata(JSONB)의 paper_id / chunk_index 표현식 인덱스
+-- 논문 하나의 전체 청크를 임베딩 호출 없이 읽기 순서대로 조회 (get_paper_chunks)
+--   WHERE collection_id = ? AND cmetadata->>'paper_id' = ?
+--   ORDER BY (cmetadata->>'chunk_index')::int
+-- → ANN 검색 대신 인덱스 범위 스캔 (정렬 단계 없음)
+--
+-- 적용: psql "$DATABASE_URL" -f database/migrations/002_paper_chunks_paper_id_index.sql
+-- (langchain_pg_embedding 테이블 생성 이후, 여러 번 실행해도 안전)
+
+-- ---------------------- paper_id + chunk_index 인덱스 ---------------------- --
+CREATE INDEX IF NOT EXISTS idx_pg_embedding_paper_chunk
+    ON langchain_pg_embedding (
+        collection_id,
+        (cmetadata->>'paper_id'),
+        ((cmetadata->>'chunk_index')::int)
+    );
+
+-- 통계 갱신 (플래너가 새 인덱스를 바로 사용하도록)
+ANALYZE langchain_pg_embedding;
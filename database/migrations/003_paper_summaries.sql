@@ -0,0 +1,20 @@
+-- ==================== 003: paper_summaries 테이블 추가 ==================== --
+-- 논문 수준별 요약을 (paper_id, level, prompt_version, model) 단위로 저장
+-- summarize_node는 저장된 요약을 DB 조회로 반환하고, 없을 때만 LLM으로 생성 후 저장
+-- (src/utils/paper_summaries.py가 최초 사용 시 같은 DDL로 자동 생성)
+--
+-- 적용: psql "$DATABASE_URL" -f database/migrations/003_paper_summaries.sql
+-- (여러 번 실행해도 안전)
+
+-- ---------------------- paper_summaries 테이블 ---------------------- --
+CREATE TABLE IF NOT EXISTS paper_summaries (
+    summary_id SERIAL PRIMARY KEY,
+    paper_id INT NOT NULL REFERENCES papers(paper_id) ON DELETE CASCADE,
+    level VARCHAR(20) NOT NULL,
+    prompt_version VARCHAR(16) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    summary TEXT NOT NULL,
+    chunk_count INT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (paper_id, level, prompt_version, model)
+);
@@ -14,11 +14,16 @@ CREATE TABLE IF NOT EXISTS papers (
     citation_count INT DEFAULT 0,                       -- 인용 수
     abstract TEXT,                                      -- 논문 초록
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,     -- 생성 시간
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP      -- 수정 시간
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,     -- 수정 시간
+    search_vector tsvector GENERATED ALWAYS AS (        -- 전문 검색 벡터 (title: A, abstract: B)
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(abstract, '')), 'B')
+    ) STORED
 );
 
 -- ---------------------- papers 테이블 인덱스 ---------------------- --
 CREATE INDEX IF NOT EXISTS idx_papers_title ON papers USING GIN (to_tsvector('english', title));
+CREATE INDEX IF NOT EXISTS idx_papers_search_vector ON papers USING GIN (search_vector);
 CREATE INDEX IF NOT EXISTS idx_papers_category ON papers(category);
 CREATE INDEX IF NOT EXISTS idx_papers_publish_date ON papers(publish_date DESC);
 CREATE INDEX IF NOT EXISTS idx_papers_created_at ON papers(created_at DESC);
@@ -80,4 +85,17 @@ CREATE TABLE IF NOT EXISTS evaluation_results (
 
 -- ---------------------- evaluation_results 테이블 인덱스 ---------------------- --
 CREATE INDEX IF NOT EXISTS idx_evaluation_results_created_at ON evaluation_results(created_at DESC);
-CREATE INDEX IF NOT EXISTS idx_evaluation_results_total_score ON evaluation_results(total_score DESC);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_evaluation_results_total_score ON evaluation_results(total_score DESC);
+
+-- ==================== paper_summaries 테이블 (논문 수준별 요약) ==================== --
+CREATE TABLE IF NOT EXISTS paper_summaries (
+    summary_id SERIAL PRIMARY KEY,                      -- 요약 고유 ID
+    paper_id INT NOT NULL REFERENCES papers(paper_id) ON DELETE CASCADE,  -- 논문 ID
+    level VARCHAR(20) NOT NULL,                         -- 요약 수준 (elementary, beginner, intermediate, advanced)
+    prompt_version VARCHAR(16) NOT NULL,                -- 요약 템플릿 해시
+    model VARCHAR(100) NOT NULL,                        -- 생성 모델 (provider:model)
+    summary TEXT NOT NULL,                              -- 요약 본문
+    chunk_count INT,                                    -- 요약에 사용한 청크 수
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,     -- 생성 시간
+    UNIQUE (paper_id, level, prompt_version, model)     -- 조회 키 (유니크 인덱스 겸용)
+);
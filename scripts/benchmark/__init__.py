@@ -0,0 +1,2 @@
+# scripts.benchmark 패키지 초기화 파일
+# 성능 측정(벤치마크) 스크립트
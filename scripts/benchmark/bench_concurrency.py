@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# ---------------------- 동시 사용자 처리량 벤치마크 ---------------------- #
+"""
+Agent 그래프 동기 / 비동기 실행 처리량 비교 (프로세스 1개 기준)
+
+주요 기능:
+- sync: 요청마다 스레드 1개가 그래프 전체를 점유 (Streamlit 워커 스레드 방식, --threads로 제한)
+- async: 이벤트 루프 1개에서 graph.ainvoke 동시 실행
+  (general / search_paper / glossary / summarize 답변은 llm.ainvoke,
+   나머지 블로킹 노드와 DB 검색 구간은 async_graph.blocking_workers 스레드 풀)
+- 동시 사용자 수별 처리량(질문/초), p50 / p95 지연, 최대 스레드 수
+
+기본은 지연 시간을 흉내 내는 가짜 LLM 사용 (API 비용 없음, --real 시 실제 LLM)
+질문은 general 도구로 라우팅되는 일반 질문 (DB / 웹 검색 불필요)
+
+실행:
+    python scripts/benchmark/bench_concurrency.py --users 1,8,32 --requests 64 --llm-latency 0.8
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import sys                                     # 경로 설정
+import time                                    # 시간 측정
+import asyncio                                 # 비동기 실행
+import argparse                                # 명령줄 인자 처리
+import threading                               # 스레드 수 측정
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path                       # 파일 경로 처리
+from statistics import median                  # 통계 함수
+from typing import List, Optional
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent import graph as graph_module
+from src.agent.graph import create_agent_graph
+from src.llm.registry import get_llm_registry
+
+
+QUESTIONS = [
+    "인공지능이 뭐야?",
+    "머신러닝과 딥러닝의 차이를 설명해줘",
+    "신경망은 어떻게 학습해?",
+    "과적합을 줄이는 방법을 알려줘",
+]
+
+
+# ==================== 가짜 LLM ==================== #
+class LatencyChatModel(BaseChatModel):
+    """고정 지연 후 고정 답변을 반환하는 채팅 모델 (동기: time.sleep, 비동기: asyncio.sleep)"""
+
+    latency: float = 0.8
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-fake"
+
+    def _result(self) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="general"))])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        return self._result()
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._result()
+
+
+def install_fake_llm(latency: float):
+    """레지스트리가 모든 키에 가짜 모델을 반환하도록 교체 (답변 캐시도 끔: 임베딩 API 호출 없음)"""
+    fake = LatencyChatModel(latency=latency)
+    get_llm_registry().get = lambda *args, **kwargs: fake
+    graph_module.get_answer_cache = lambda: None
+
+
+# ==================== 측정 유틸 ==================== #
+def percentile(values, pct):
+    """단순 백분위수 (nearest-rank)"""
+    ordered = sorted(values)
+    idx = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+class ThreadPeak:
+    """측정 중 최대 활성 스레드 수 샘플링"""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def make_inputs(i: int):
+    return {"question": QUESTIONS[i % len(QUESTIONS)], "difficulty": "easy", "messages": []}
+
+
+# ==================== 실행 모드 ==================== #
+def run_sync(graph, users: int, requests: int, threads: Optional[int]) -> List[float]:
+    """스레드 풀에서 graph.invoke 동시 실행 (요청당 스레드 1개 점유)"""
+    def one(i):
+        start = time.perf_counter()
+        graph.invoke(make_inputs(i))
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=min(users, threads or users)) as executor:
+        return list(executor.map(one, range(requests)))
+
+
+def run_async(graph, users: int, requests: int) -> List[float]:
+    """이벤트 루프 1개에서 graph.ainvoke 동시 실행 (동시 사용자 수만큼 세마포어)"""
+    async def main():
+        semaphore = asyncio.Semaphore(users)
+
+        async def one(i):
+            async with semaphore:
+                start = time.perf_counter()
+                await graph.ainvoke(make_inputs(i))
+                return time.perf_counter() - start
+
+        return await asyncio.gather(*(one(i) for i in range(requests)))
+
+    return asyncio.run(main())
+
+
+# ==================== 메인 ==================== #
+def main():
+    parser = argparse.ArgumentParser(description="Agent 그래프 동시 사용자 처리량 벤치마크 (sync vs async)")
+    parser.add_argument("--users", default="1,8,32", help="동시 사용자 수 목록 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=64, help="측정당 총 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="가짜 LLM 호출 지연 (초)")
+    parser.add_argument("--threads", type=int, default=8, help="sync 모드 최대 워커 스레드 수 (Streamlit 워커 제한)")
+    parser.add_argument("--real", action="store_true", help="실제 LLM 사용 (API 비용 발생)")
+    args = parser.parse_args()
+
+    if not args.real:
+        install_fake_llm(args.llm_latency)
+
+    graph = create_agent_graph()
+    graph = getattr(graph, "graph", graph)      # 답변 캐시 래퍼 제외 (반복 질문 캐시 히트 방지)
+
+    # 워밍업 (설정 / 라우터 컴파일 / 스레드 풀 생성)
+    graph.invoke(make_inputs(0))
+    asyncio.run(graph.ainvoke(make_inputs(0)))
+
+    print(f"요청 수: {args.requests}, 가짜 LLM 지연: {'실제 LLM' if args.real else f'{args.llm_latency}s'}, "
+          f"sync 스레드 제한: {args.threads}")
+    print()
+    print(f"{'mode':6} | {'users':>5} | {'질문/초':>8} | {'p50 (s)':>8} | {'p95 (s)':>8} | {'최대 스레드':>10}")
+    print("-" * 62)
+
+    for users in [int(u) for u in args.users.split(",")]:
+        for mode in ("sync", "async"):
+            with ThreadPeak() as peak:
+                start = time.perf_counter()
+                if mode == "sync":
+                    latencies = run_sync(graph, users, args.requests, args.threads)
+                else:
+                    latencies = run_async(graph, users, args.requests)
+                wall = time.perf_counter() - start
+
+            print(
+                f"{mode:6} | {users:>5} | {len(latencies) / wall:>8.2f} | {median(latencies):>8.2f} | "
+                f"{percentile(latencies, 95):>8.2f} | {peak.peak:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
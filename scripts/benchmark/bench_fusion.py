@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# ---------------------- 순위 결합 벤치마크 ---------------------- #
+"""
+src.rag.ranking.fuse 마이크로 벤치마크
+
+주요 기능:
+- 후보 수(100 ~ 10,000)별 rrf / minmax / zscore 실행 시간 측정
+- 벡터(거리) + 키워드(ts_rank) 2개 브랜치, 50% 중복 후보 가정
+
+실행:
+    python scripts/benchmark/bench_fusion.py --repeat 20
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import sys                                     # 경로 설정
+import random                                  # 가짜 점수 생성
+import argparse                                # 명령줄 인자 처리
+from pathlib import Path                       # 파일 경로 처리
+from timeit import repeat                      # 실행 시간 측정
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.rag.ranking import FUSION_METHODS, fuse
+
+
+# ==================== 입력 생성 ==================== #
+def make_branches(n: int, seed: int = 42):
+    """
+    후보 n개짜리 벡터/키워드 브랜치 생성
+
+    Args:
+        n: 브랜치별 후보 수
+
+    Returns:
+        fuse()에 전달할 branches 딕셔너리
+    """
+    rng = random.Random(seed)
+    vector = [(i, rng.uniform(0.05, 1.2)) for i in range(n)]                 # cosine distance
+    keyword = [(i, rng.uniform(0.0, 1.0)) for i in range(n // 2, n + n // 2)]  # ts_rank_cd
+    return {"vector": vector, "keyword": keyword}
+
+
+# ==================== 메인 ==================== #
+def main():
+    parser = argparse.ArgumentParser(description="순위 결합 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'candidates':>10} | " + " | ".join(f"{m:>12}" for m in FUSION_METHODS))
+    print("-" * (13 + 15 * len(FUSION_METHODS)))
+
+    for n in args.sizes:
+        branches = make_branches(n)
+        cells = []
+        for method in FUSION_METHODS:
+            # 최솟값 = 노이즈가 가장 적은 측정
+            best = min(repeat(
+                lambda: fuse(
+                    branches,
+                    method=method,
+                    weights={"vector": 0.7, "keyword": 0.3},
+                    higher_is_better={"vector": False, "keyword": True},
+                ),
+                number=1,
+                repeat=args.repeat,
+            ))
+            cells.append(f"{best * 1000:>9.3f} ms")
+        print(f"{n:>10} | " + " | ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
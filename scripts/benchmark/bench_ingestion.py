@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# ---------------------- PDF 적재 병렬 처리량 벤치마크 ---------------------- #
+"""
+로컬 PDF 코퍼스(data/raw/pdfs) 파싱 처리량의 코어 수별 변화 측정
+
+주요 기능:
+- 파싱 프로세스 수(--workers)마다 IngestionEngine.run(parse_only=True) 실행
+  (PyPDFLoader + 저작권 페이지 필터 + 청크 분할, 임베딩 / DB 저장 / 체크포인트 기록 없음)
+- 논문/분, 청크/초, 1프로세스 대비 배속, 병렬 효율(배속 / 프로세스 수)
+- 임베딩 단계는 API 속도 제한(호출 스케줄러)에 묶이므로 코어 수와 무관해 제외
+
+- 로컬 코퍼스가 없으면 --synthetic N으로 텍스트 PDF N편을 생성해 측정
+
+실행:
+    python scripts/benchmark/bench_ingestion.py --workers 1,2,4,8
+    python scripts/benchmark/bench_ingestion.py --limit 20 --repeat 3
+    python scripts/benchmark/bench_ingestion.py --synthetic 24 --pages 12
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import os                                      # CPU 코어 수
+import random                                  # 합성 PDF 본문
+import sys                                     # 경로 설정
+import shutil                                  # 부분 코퍼스 복사
+import argparse                                # 명령줄 인자 처리
+import tempfile                                # 부분 코퍼스 임시 폴더
+from pathlib import Path                       # 파일 경로 처리
+from statistics import median                  # 통계 함수
+
+# 프로젝트 루트를 경로에 추가
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.data.ingestion import IngestionEngine
+
+
+def default_workers() -> str:
+    """1, 2, 4, ... CPU 코어 수"""
+    cores = os.cpu_count() or 1
+    counts, n = [], 1
+    while n < cores:
+        counts.append(n)
+        n *= 2
+    counts.append(cores)
+    return ",".join(str(c) for c in counts)
+
+
+# ==================== 합성 코퍼스 ==================== #
+WORDS = (
+    "attention transformer encoder decoder retrieval embedding gradient layer token sequence "
+    "model training dataset benchmark evaluation baseline latency memory parameter network"
+).split()
+
+
+def write_synthetic_pdf(path: Path, pages: int, rng: random.Random):
+    """페이지마다 Helvetica 텍스트 40줄을 가진 최소 PDF 작성 (PyPDFLoader로 추출 가능)"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for _ in range(pages):
+        lines = [" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(40)]
+        text = "".join(f"({line}) Tj T* " for line in lines)
+        stream = f"BT /F1 9 Tf 11 TL 50 760 Td {text}ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % pages
+
+    out, offsets = bytearray(b"%PDF-1.4\n"), []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+# ==================== 메인 ==================== #
+def main():
+    parser = argparse.ArgumentParser(description="PDF 파싱 처리량 벤치마크 (프로세스 수별 논문/분)")
+    parser.add_argument("--pdf-dir", default=str(ROOT / "data/raw/pdfs"), help="PDF 폴더")
+    parser.add_argument("--metadata", default=str(ROOT / "data/raw/arxiv_papers_metadata.json"), help="논문 메타데이터 JSON")
+    parser.add_argument("--workers", default=default_workers(), help="파싱 프로세스 수 목록 (쉼표 구분)")
+    parser.add_argument("--limit", type=int, help="앞에서부터 N편만 사용")
+    parser.add_argument("--repeat", type=int, default=1, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--synthetic", type=int, help="로컬 PDF 대신 합성 PDF N편 생성해 측정")
+    parser.add_argument("--pages", type=int, default=12, help="합성 PDF 1편당 페이지 수")
+    args = parser.parse_args()
+
+    pdf_dir = Path(args.pdf_dir)
+    workdir = None
+    if args.synthetic:
+        workdir = tempfile.mkdtemp(prefix="bench_ingestion_")
+        rng = random.Random(0)
+        for i in range(args.synthetic):
+            write_synthetic_pdf(Path(workdir) / f"2401.{i:05d}v1.pdf", args.pages, rng)
+        pdf_dir = Path(workdir)
+    pdfs = sorted(pdf_dir.glob("*.pdf"))
+    if not pdfs:
+        print(f"❌ PDF가 없습니다: {pdf_dir} (scripts/data/collect_arxiv_papers.py로 수집)")
+        return 1
+
+    # 부분 코퍼스: 임시 폴더에 N편만 복사
+    if args.limit and args.limit < len(pdfs) and workdir is None:
+        workdir = tempfile.mkdtemp(prefix="bench_ingestion_")
+        for pdf in pdfs[:args.limit]:
+            shutil.copy(pdf, workdir)
+        pdf_dir, pdfs = Path(workdir), pdfs[:args.limit]
+
+    size_mb = sum(p.stat().st_size for p in pdfs) / 1e6
+    print(f"코퍼스: {len(pdfs)}편 ({size_mb:.1f}MB), CPU 코어: {os.cpu_count()}, 반복: {args.repeat}")
+    print()
+    print(f"{'workers':>7} | {'논문/분':>8} | {'청크/초':>8} | {'소요 (s)':>8} | {'배속':>5} | {'효율':>5} | {'실패':>4}")
+    print("-" * 64)
+
+    baseline = None
+    try:
+        for workers in [int(w) for w in args.workers.split(",")]:
+            runs = [
+                IngestionEngine(pdf_dir, args.metadata, workers=workers).run(parse_only=True)
+                for _ in range(max(args.repeat, 1))
+            ]
+            elapsed = median(r["elapsed_s"] for r in runs)
+            stats = runs[0]
+            papers_per_minute = stats["parsed"] / elapsed * 60 if elapsed else 0.0
+            baseline = baseline or papers_per_minute
+            speedup = papers_per_minute / baseline if baseline else 0.0
+
+            print(
+                f"{workers:>7} | {papers_per_minute:>8.1f} | {stats['chunks'] / elapsed if elapsed else 0:>8.1f} | "
+                f"{elapsed:>8.2f} | {speedup:>4.2f}x | {speedup / workers:>5.0%} | {stats['failed']:>4}"
+            )
+    finally:
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# ---------------------- 라우터 벤치마크 ---------------------- #
+"""
+고속 라우터(src/agent/fast_router.py) 벤치마크
+
+주요 기능:
+- Golden Dataset 질문(get_golden_questions) 기준 라우팅 지연 시간 비교
+  - legacy: 기존 router_node 방식 (패턴 순회 + 부분 문자열 스캔)
+  - compiled: Aho-Corasick 오토마톤 1회 순회 + 신뢰도 계산
+- LLM 호출 비율 비교
+  - legacy: 패턴 미매칭 시 항상 LLM 라우팅
+  - compiled: confidence < 임계값(패턴 / 키워드 점수별)일 때만 LLM 라우팅
+- LLM 없이 결정된 질문의 expected_tool 일치율 (legacy 패턴 결정 대비, 결정 방법별)
+  (LLM 라우팅 자체의 정확도는 API 호출이 필요하므로 여기서 측정하지 않음)
+
+실행:
+    python scripts/benchmark/bench_router.py --repeat 200
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import sys                                     # 경로 설정
+import time                                    # 시간 측정
+import argparse                                # 명령줄 인자 처리
+from pathlib import Path                       # 파일 경로 처리
+from statistics import median                  # 통계 함수
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.config_loader import get_multi_request_patterns
+from src.agent.fast_router import get_compiled_router
+from src.prompts.loader import get_golden_questions
+
+
+# ==================== 기존 방식 ==================== #
+def legacy_route(question: str, patterns):
+    """
+    기존 router_node 패턴 매칭 (우선순위 순회 + 부분 문자열 스캔)
+
+    Returns:
+        매칭된 패턴의 tools (미매칭 시 None → LLM 라우팅)
+    """
+    for pattern in patterns:
+        keywords = pattern.get("keywords", [])
+        any_of_keywords = pattern.get("any_of_keywords", [])
+        exclude_keywords = pattern.get("exclude_keywords", [])
+
+        keywords_match = all(kw in question for kw in keywords)
+        any_keywords_match = any(kw in question for kw in any_of_keywords) if any_of_keywords else True
+        exclude_match = any(ex_kw in question for ex_kw in exclude_keywords) if exclude_keywords else False
+
+        if keywords_match and any_keywords_match and not exclude_match:
+            return pattern.get("tools", [])
+    return None
+
+
+# ==================== 측정 유틸 ==================== #
+def measure_us(fn, repeat: int):
+    """fn을 repeat회 실행한 1회당 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def percentile(values, pct):
+    """단순 백분위수 (nearest-rank)"""
+    ordered = sorted(values)
+    idx = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+# ==================== 메인 ==================== #
+def main():
+    parser = argparse.ArgumentParser(description="라우터 지연 시간 / LLM 호출 비율 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="질문당 반복 횟수")
+    args = parser.parse_args()
+
+    questions = get_golden_questions()
+    patterns = get_multi_request_patterns()
+
+    # 컴파일 시간 (로드 시점 1회)
+    start = time.perf_counter()
+    router = get_compiled_router(force_rebuild=True)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    legacy_times, compiled_times = [], []
+    legacy_llm, compiled_llm = 0, 0
+    legacy_correct = 0
+    by_method = {}                              # 결정 방법 → [결정 수, 일치 수]
+
+    for item in questions:
+        question = item["question"]
+
+        legacy_times.append(measure_us(lambda: legacy_route(question, patterns), args.repeat))
+        compiled_times.append(measure_us(lambda: router.route(question), args.repeat))
+
+        legacy_tools = legacy_route(question, patterns)
+        if legacy_tools is None:
+            legacy_llm += 1
+        else:
+            legacy_correct += legacy_tools[0] == item["expected_tool"]
+
+        decision = router.route(question)
+        if router.is_confident(decision):
+            counts = by_method.setdefault(decision["method"], [0, 0])
+            counts[0] += 1
+            counts[1] += decision["tool"] == item["expected_tool"]
+        else:
+            compiled_llm += 1
+
+    n = len(questions)
+    print(f"Golden 질문 수: {n}, 패턴 수: {len(patterns)}, 오토마톤 상태 수: {len(router.automaton)}")
+    print(f"오토마톤 컴파일 시간: {compile_ms:.2f} ms (프로세스당 1회)")
+    print(f"confidence_threshold: {router.confidence_threshold} (패턴), {router.keyword_confidence_threshold} (키워드 점수)")
+    print()
+    print(f"{'':10} | {'p50 (us)':>10} | {'p95 (us)':>10} | {'LLM 호출 비율':>12}")
+    print("-" * 52)
+    print(f"{'legacy':10} | {median(legacy_times):>10.1f} | {percentile(legacy_times, 95):>10.1f} | {legacy_llm / n:>12.1%}")
+    print(f"{'compiled':10} | {median(compiled_times):>10.1f} | {percentile(compiled_times, 95):>10.1f} | {compiled_llm / n:>12.1%}")
+    print()
+
+    # LLM 없이 결정된 질문의 expected_tool 일치율
+    legacy_decided = n - legacy_llm
+    compiled_decided = sum(c[0] for c in by_method.values())
+    compiled_correct = sum(c[1] for c in by_method.values())
+    if legacy_decided:
+        print(f"legacy   LLM 없이 결정 {legacy_decided}개 중 expected_tool 일치: {legacy_correct / legacy_decided:.1%}")
+    if compiled_decided:
+        print(f"compiled LLM 없이 결정 {compiled_decided}개 중 expected_tool 일치: {compiled_correct / compiled_decided:.1%}")
+        for method, (decided, correct) in sorted(by_method.items()):
+            print(f"  - {method}: {correct}/{decided} ({correct / decided:.1%})")
+
+
+if __name__ == "__main__":
+    main()
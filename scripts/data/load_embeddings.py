@@ -1,14 +1,19 @@
 """임베딩을 생성하고 Vector DB에 저장하는 스크립트.
 
+PDF 파싱(프로세스 풀) → 제한 크기 큐 → 임베딩 저장을 src.data.ingestion.IngestionEngine으로 실행하며,
+논문별 체크포인트(data/processed/ingestion_checkpoints.sqlite3) 덕분에 재실행 시 끝난 논문은 건너뜁니다.
+체크포인트가 없는 논문은 첫 저장 전에 기존 청크를 지우므로, 엔진 도입 전 적재 결과와 중복되지 않습니다.
+
 사용법:
-    python scripts/load_embeddings.py
+    python scripts/load_embeddings.py                 # 새 논문 / 실패한 논문만 적재
+    python scripts/load_embeddings.py --force         # 전체 재적재
+    python scripts/load_embeddings.py --workers 4     # 파싱 프로세스 수 지정
 """
 
 from __future__ import annotations
 
-import json
+import argparse
 import sys
-import time
 from pathlib import Path
 from typing import List
 
@@ -16,8 +21,9 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
 from langchain_core.documents import Document
-from src.data.document_loader import PaperDocumentLoader
-from src.database.vector_store import get_pgvector_store
+from src.data.ingestion import IngestionCheckpoint, IngestionEngine, get_ingestion_config
+from src.database.vector_store import ensure_paper_chunk_index
+from src.llm.scheduler import background_priority, get_scheduler_stats
 
 
 def deduplicate_chunks(chunks: List[Document]) -> List[Document]:
@@ -51,11 +57,18 @@ def deduplicate_chunks(chunks: List[Document]) -> List[Document]:
 
 def main() -> int:
     """임베딩을 생성하고 Vector DB에 저장합니다."""
-    
+
+    parser = argparse.ArgumentParser(description="PDF 파싱 + 임베딩 + Vector DB 저장 (병렬, 재개 가능)")
+    parser.add_argument("--workers", type=int, help="PDF 파싱 프로세스 수 (기본값: ingestion.workers 설정)")
+    parser.add_argument("--force", action="store_true", help="체크포인트와 무관하게 모든 논문 재적재")
+    args = parser.parse_args()
+
     # 설정
+    config = get_ingestion_config()
     pdf_dir = ROOT / "data/raw/pdfs"
     metadata_path = ROOT / "data/raw/arxiv_papers_metadata.json"
     mapping_path = ROOT / "data/processed/paper_id_mapping.json"
+    checkpoint_path = ROOT / config["checkpoint_path"]
     
     # 파일 존재 확인
     if not pdf_dir.exists():
@@ -78,131 +91,60 @@ def main() -> int:
     print(f"PDF 디렉토리: {pdf_dir}")
     print(f"메타데이터: {metadata_path}")
     print(f"매핑 파일: {mapping_path}")
+    print(f"체크포인트: {checkpoint_path}")
     print()
-    
-    # Document 로드
-    print("1단계: PDF 문서 로드 및 청크 분할 중...")
-    loader = PaperDocumentLoader(chunk_size=1000, chunk_overlap=200)
-
-    try:
-        chunks = loader.load_all_pdfs(pdf_dir, metadata_path)
-        print(f"   ✅ {len(chunks)}개 청크 생성 완료")
-
-        # 중복 제거
-        chunks = deduplicate_chunks(chunks)
-        print(f"   ✅ 중복 제거 후: {len(chunks)}개 청크")
-    except Exception as e:
-        print(f"   ❌ 오류: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-    
-    # 매핑 파일 로드
-    print("\n2단계: paper_id 매핑 파일 로드 중...")
-    try:
-        with open(mapping_path, 'r', encoding='utf-8') as f:
-            mapping = json.load(f)
-        print(f"   ✅ {len(mapping)}개 매핑 로드 완료")
-    except Exception as e:
-        print(f"   ❌ 오류: {e}")
-        return 1
-    
-    # paper_id 메타데이터 추가
-    print("\n3단계: paper_id 메타데이터 추가 중...")
-    enriched_docs = []
-    for doc in chunks:
-        # arxiv_id 추출
-        arxiv_id = doc.metadata.get("arxiv_id")
-        if not arxiv_id:
-            # entry_id에서 추출
-            entry_id = doc.metadata.get("entry_id", "")
-            arxiv_id = entry_id.split("/")[-1] if entry_id else None
-
-        # paper_id 매핑
-        if arxiv_id and arxiv_id in mapping:
-            doc.metadata["paper_id"] = mapping[arxiv_id]
-            enriched_docs.append(doc)
-        else:
-            print(f"   ⚠️  paper_id를 찾을 수 없음: {arxiv_id}")
-
-    print(f"   ✅ {len(enriched_docs)}/{len(chunks)}개 문서에 paper_id 추가 완료")
 
-    # 임베딩 및 저장
-    print("\n4단계: 임베딩 생성 및 Vector DB 저장 중...")
-    print("   (시간이 소요될 수 있습니다. 배치 처리 중...)")
+    # 1~4단계: PDF 파싱(프로세스 풀) → paper_id 부여 / 중복 제거 → 임베딩 저장 (논문 단위로 흘려보냄)
+    checkpoint = IngestionCheckpoint(checkpoint_path)
+    engine = IngestionEngine(
+        pdf_dir,
+        metadata_path,
+        mapping_path,
+        workers=args.workers,
+        checkpoint=checkpoint,
+    )
+    print(f"1~4단계: PDF 파싱 ({engine.workers}개 프로세스) + 임베딩 저장 중...")
 
     try:
-        # VectorStore 초기화
-        vectorstore = get_pgvector_store(collection_name="paper_chunks")
-
-        # 배치 처리
-        batch_size = 50
-        total = 0
-        failed_batches = []
-        num_batches = (len(enriched_docs) + batch_size - 1) // batch_size
-
-        for i in range(0, len(enriched_docs), batch_size):
-            batch = enriched_docs[i : i + batch_size]
-            batch_num = i // batch_size + 1
-            max_retries = 3
-            retry_count = 0
-            success = False
-
-            while retry_count < max_retries and not success:
-                try:
-                    vectorstore.add_documents(batch)
-                    total += len(batch)
-                    success = True
-                    print(f"   배치 {batch_num}/{num_batches}: {len(batch)}개 문서 저장 완료 (총: {total})")
-
-                    # Rate Limit 대응
-                    if i + batch_size < len(enriched_docs):
-                        time.sleep(0.1)
-
-                except Exception as e:
-                    retry_count += 1
-                    error_msg = str(e).lower()
-
-                    if "rate limit" in error_msg or "429" in error_msg:
-                        wait_time = 5 * retry_count  # 5초, 10초, 15초
-                        print(f"   ⚠️  배치 {batch_num} Rate limit 발생, {wait_time}초 대기 후 재시도 ({retry_count}/{max_retries})...")
-                        time.sleep(wait_time)
-                    else:
-                        print(f"   ⚠️  배치 {batch_num} 오류 발생: {e}")
-                        if retry_count < max_retries:
-                            print(f"   재시도 중... ({retry_count}/{max_retries})")
-                            time.sleep(1)
-                        else:
-                            print(f"   ❌ 배치 {batch_num} 최대 재시도 횟수 초과, 실패 목록에 추가")
-                            failed_batches.append((batch_num, batch))
-
-        # 실패한 배치 재시도
-        if failed_batches:
-            print(f"\n⚠️  {len(failed_batches)}개 배치 실패, 재시도 중...")
-            for batch_num, batch in failed_batches:
-                try:
-                    print(f"   재시도: 배치 {batch_num}...")
-                    vectorstore.add_documents(batch)
-                    total += len(batch)
-                    print(f"   ✅ 배치 {batch_num} 재시도 성공 ({len(batch)}개 문서)")
-                except Exception as e:
-                    print(f"   ❌ 배치 {batch_num} 재시도 실패: {e}")
-
-        success_rate = (total / len(enriched_docs) * 100) if enriched_docs else 0
-        print(f"\n✅ {total}/{len(enriched_docs)}개 문서가 Vector DB에 저장되었습니다. (성공률: {success_rate:.1f}%)")
-
-        if total < len(enriched_docs):
-            print(f"⚠️  {len(enriched_docs) - total}개 문서가 저장되지 않았습니다.")
-
-        return 0
-
+        stats = engine.run(force=args.force)
     except Exception as e:
         print(f"❌ 오류: {e}")
         import traceback
         traceback.print_exc()
         return 1
 
+    print(
+        f"\n✅ 논문 {stats['papers']}편 중 {stats['embedded']}편 저장, {stats['skipped']}편 건너뜀 (이미 적재), "
+        f"{stats['failed']}편 실패"
+    )
+    print(
+        f"   청크 {stats['chunks']}개 생성 / {stats['chunks_saved']}개 저장 "
+        f"({stats['elapsed_s']}초, {stats['papers_per_minute']}편/분)"
+    )
+    for arxiv_id, error in checkpoint.failures().items():
+        print(f"   ⚠️  {arxiv_id}: {error}")
+    if stats["failed"]:
+        print("   실패한 논문은 다시 실행하면 이어서 적재됩니다.")
+
+    # 임베딩 API 대기열 통계 (호출 스케줄러)
+    for provider, provider_stats in get_scheduler_stats().items():
+        print(
+            f"   📊 {provider}: 호출 {provider_stats['acquired']}회, 평균 대기 {provider_stats['avg_wait_ms']}ms, "
+            f"최대 대기열 {provider_stats['max_queue_depth']}, 429 {provider_stats['rate_limited']}회"
+        )
+
+    # 5단계: 논문별 청크 조회 인덱스 (paper_id + chunk_index)
+    print("\n5단계: 논문별 청크 조회 인덱스 생성 중...")
+    if ensure_paper_chunk_index():
+        print("   ✅ idx_pg_embedding_paper_chunk 준비 완료")
+    else:
+        print("   ⚠️  인덱스 생성 실패 (database/migrations/002_paper_chunks_paper_id_index.sql 수동 적용 필요)")
+
+    checkpoint.close()
+    return 1 if stats["failed"] else 0
 
-if __name__ == "__main__":
-    raise SystemExit(main())
 
+if __name__ == "__main__":
+    # 적재 작업은 background 우선순위 (동시에 실행 중인 채팅 요청이 먼저 처리됨)
+    with background_priority():
+        raise SystemExit(main())
@@ -0,0 +1,70 @@
+"""논문 수준별 요약을 미리 생성하여 paper_summaries 테이블에 저장하는 스크립트.
+
+이미 현재 프롬프트 버전/모델로 저장된 요약은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+사용법:
+    python scripts/data/precompute_summaries.py
+    python scripts/data/precompute_summaries.py --paper-id 12 --levels beginner intermediate
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from src.database.db import execute_query
+from src.utils.paper_summaries import schedule_paper_summaries
+
+
+def main() -> int:
+    """papers 테이블의 논문 요약을 백그라운드 작업으로 생성하고 완료를 기다립니다."""
+
+    parser = argparse.ArgumentParser(description="논문 수준별 요약 사전 생성")
+    parser.add_argument("--paper-id", type=int, action="append", help="대상 paper_id (여러 번 지정 가능, 미지정 시 전체)")
+    parser.add_argument("--levels", nargs="+", help="생성할 수준 (미지정 시 model_config.yaml paper_summaries.levels)")
+    parser.add_argument("--limit", type=int, default=None, help="최대 논문 수")
+    args = parser.parse_args()
+
+    if args.paper_id:
+        paper_ids = args.paper_id
+    else:
+        rows = execute_query("SELECT paper_id FROM papers ORDER BY paper_id", fetch=True)
+        paper_ids = [row[0] for row in rows]
+    if args.limit:
+        paper_ids = paper_ids[: args.limit]
+
+    print("=" * 60)
+    print("논문 요약 사전 생성")
+    print("=" * 60)
+    print(f"대상 논문: {len(paper_ids)}편")
+
+    start = time.perf_counter()
+    futures = {}
+    for paper_id in paper_ids:
+        future = schedule_paper_summaries(paper_id, levels=args.levels)
+        if future is None:
+            print("⚠️  paper_summaries 사전 생성이 비활성화되어 있습니다 (configs/model_config.yaml).")
+            return 0
+        futures[future] = paper_id
+
+    created = 0
+    for done, future in enumerate(as_completed(futures), 1):
+        count = future.result()
+        created += count
+        print(f"   [{done}/{len(futures)}] paper_id={futures[future]}: 신규 {count}개")
+
+    print(f"\n✅ 신규 요약 {created}개 생성 ({time.perf_counter() - start:.1f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
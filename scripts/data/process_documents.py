@@ -47,6 +47,8 @@ def main() -> int:
     try:
         chunks = loader.load_all_pdfs(pdf_dir, metadata_path)
         print(f"✅ 총 {len(chunks)}개 청크 생성 완료")
+        for filename, error in loader.failed.items():
+            print(f"⚠️  {filename} 로드 실패: {error}")
         
         # 샘플 출력
         if chunks:
@@ -102,8 +102,9 @@ def main() -> int:
         steps = [
             ("collect_arxiv_papers.py", "Phase 1: arXiv 논문 수집"),
             ("setup_database.py", "Phase 2: PostgreSQL 데이터베이스 초기화"),
-            ("process_documents.py", "Phase 3: PDF 문서 로드 및 청크 분할"),
-            ("load_embeddings.py", "Phase 4: 임베딩 생성 및 Vector DB 저장"),
+            # PDF 파싱 + 청크 분할 + 임베딩은 한 단계에서 논문 단위로 흘려보냄 (체크포인트로 재개 가능)
+            ("load_embeddings.py", "Phase 3: PDF 파싱 · 임베딩 생성 및 Vector DB 저장"),
+            ("precompute_summaries.py", "Phase 4: 논문 수준별 요약 사전 생성"),
         ]
 
         for script, description in steps:
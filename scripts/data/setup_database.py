@@ -60,6 +60,9 @@ DDL_ALTER_GLOSSARY_COLUMNS = """
 ALTER TABLE glossary ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
 """
 
+# 하이브리드 검색 키워드 브랜치용 전문 검색 컬럼 (database/migrations/001_papers_search_vector.sql)
+DDL_PAPERS_SEARCH_VECTOR = (ROOT / "database" / "migrations" / "001_papers_search_vector.sql").read_text(encoding="utf-8")
+
 DDL_CREATE_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_papers_category ON papers (category);
 CREATE INDEX IF NOT EXISTS idx_papers_date ON papers (publish_date);
@@ -204,6 +207,7 @@ def main() -> int:
             cur.execute(DDL_ALTER_PAPERS_COLUMNS)
             cur.execute(DDL_ALTER_GLOSSARY_COLUMNS)
             cur.execute(DDL_CREATE_INDEXES)
+            cur.execute(DDL_PAPERS_SEARCH_VECTOR)
         conn.commit()
         print("Schema created and committed.")
 
@@ -4,344 +4,188 @@
 실험 평가 지표 집계 도구
 
 주요 기능:
-- 여러 실험의 evaluation/ 폴더 데이터 수집
+- 지표 저장소(experiments/metrics.sqlite3)에서 기간(--from/--to) 단위로 한 번에 집계
 - RAG 평가 지표 집계 (Recall, Precision, Faithfulness)
 - Agent 정확도 집계 (도구 선택 정확도)
 - 응답 시간 집계 (p50, p95, p99)
 - 비용 분석 집계 (토큰 사용량, USD/KRW)
+- 요청 집계 (응답 시간 백분위수, 도구 분포, 성공률)
+- 저장소 도입 전 실험 폴더 적재 (--import)
 - CSV/JSON 형식으로 결과 저장
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
 import json                                    # JSON 파일 처리
 import csv                                     # CSV 파일 처리
+import sys                                     # 모듈 경로 설정
 import argparse                                # 명령줄 인자 처리
 from pathlib import Path                       # 파일 경로 처리
 from datetime import datetime                  # 날짜 및 시간 처리
-from typing import Dict, List, Optional        # 타입 힌팅
-from statistics import mean, median            # 통계 함수
+from typing import Dict, Optional              # 타입 힌팅
+
+# 프로젝트 루트를 모듈 경로에 추가 (scripts/system에서 직접 실행 시)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils.metrics_store import MetricsStore, get_metrics_store, get_metrics_store_config
+
+
+# ==================== 저장소 ==================== #
+# ---------------------- 저장소 선택 ---------------------- #
+def _store(store: Optional[MetricsStore] = None) -> MetricsStore:
+    """
+    조회할 지표 저장소 (지정이 없으면 전역 저장소, 비활성화 시 설정 경로)
+
+    진행 중인 기록이 조회에 보이도록 전역 저장소는 먼저 flush
+    """
+    if store is not None:
+        return store
+    store = get_metrics_store()
+    if store is None:
+        return MetricsStore(get_metrics_store_config()["path"])
+    store.flush()
+    return store
+
+
+def _stats(metric: Optional[Dict], *keys: str) -> Dict:
+    """저장소 집계 결과에서 필요한 통계만 선택 (median = p50)"""
+    metric = metric or {}
+    result = {}
+    for key in keys:
+        source = "p50" if key == "median" else key
+        result[key] = metric.get(source) or 0
+    return result
 
 
 # ==================== 집계 함수들 ==================== #
 # ---------------------- RAG 평가 지표 집계 ---------------------- #
-def aggregate_rag_metrics(date: str) -> Dict:
+def aggregate_rag_metrics(date: str, date_to: Optional[str] = None, store: Optional[MetricsStore] = None) -> Dict:
     """
     RAG 평가 지표 집계
 
     Args:
-        date: 날짜 (YYYYMMDD)
+        date: 날짜 또는 기간 시작 (YYYYMMDD)
+        date_to: 기간 끝 (YYYYMMDD, 없으면 date 하루)
+        store: 지표 저장소 (기본값: 전역 저장소)
 
     Returns:
         집계된 RAG 평가 지표
     """
-    metrics_list = []                          # RAG 평가 지표 리스트
-
-    # 날짜별 실험 폴더 검색
-    date_dir = Path(f"experiments/{date}")
-    if not date_dir.exists():
-        print(f"날짜 폴더가 존재하지 않습니다: {date}")
-        return {}
-
-    # 모든 session 폴더 순회
-    for session_dir in date_dir.glob("*_session_*"):
-        rag_metrics_file = session_dir / "evaluation" / "rag_metrics.json"
-
-        # rag_metrics.json 파일이 있으면 로드
-        if rag_metrics_file.exists():
-            try:
-                with open(rag_metrics_file, encoding='utf-8') as f:
-                    metrics = json.load(f)
-                    metrics_list.append(metrics)
-            except Exception as e:
-                print(f"RAG 메트릭 읽기 실패: {rag_metrics_file} - {e}")
-
-    # 데이터가 없으면 빈 딕셔너리 반환
-    if not metrics_list:
+    agg = _store(store).aggregate_metrics("rag", date, date_to)
+    if not agg:
         return {}
 
-    # -------------- 집계 계산 -------------- #
-    # Retrieval 지표 집계 (flat 및 nested 구조 모두 지원)
-    recall_values = []
-    precision_values = []
-    faithfulness_values = []
-    relevancy_values = []
-
-    for m in metrics_list:
-        # flat 구조 우선 확인, 없으면 nested 구조 확인
-        recall_values.append(
-            m.get('recall_at_5') or m.get('retrieval_metrics', {}).get('recall_at_5', 0)
-        )
-        precision_values.append(
-            m.get('precision_at_5') or m.get('retrieval_metrics', {}).get('precision_at_5', 0)
-        )
-        faithfulness_values.append(
-            m.get('faithfulness') or m.get('generation_metrics', {}).get('faithfulness', 0)
-        )
-        relevancy_values.append(
-            m.get('answer_relevancy') or m.get('generation_metrics', {}).get('answer_relevancy', 0)
-        )
-
     return {
-        'total_sessions': len(metrics_list),           # 총 세션 수
-        'recall_at_5': {
-            'mean': mean(recall_values),               # 평균
-            'min': min(recall_values),                 # 최소값
-            'max': max(recall_values),                 # 최대값
-            'median': median(recall_values)            # 중앙값
-        },
-        'precision_at_5': {
-            'mean': mean(precision_values),
-            'min': min(precision_values),
-            'max': max(precision_values),
-            'median': median(precision_values)
-        },
-        'faithfulness': {
-            'mean': mean(faithfulness_values),
-            'min': min(faithfulness_values),
-            'max': max(faithfulness_values),
-            'median': median(faithfulness_values)
-        },
-        'answer_relevancy': {
-            'mean': mean(relevancy_values),
-            'min': min(relevancy_values),
-            'max': max(relevancy_values),
-            'median': median(relevancy_values)
+        'total_sessions': agg['total_sessions'],       # 총 세션 수
+        **{
+            name: _stats(agg.get(name), 'mean', 'min', 'max', 'median')
+            for name in ('recall_at_5', 'precision_at_5', 'faithfulness', 'answer_relevancy')
         }
     }
 
 
 # ---------------------- Agent 정확도 집계 ---------------------- #
-def aggregate_agent_accuracy(date: str) -> Dict:
+def aggregate_agent_accuracy(date: str, date_to: Optional[str] = None, store: Optional[MetricsStore] = None) -> Dict:
     """
     Agent 정확도 집계
 
     Args:
-        date: 날짜 (YYYYMMDD)
+        date: 날짜 또는 기간 시작 (YYYYMMDD)
+        date_to: 기간 끝 (YYYYMMDD, 없으면 date 하루)
+        store: 지표 저장소 (기본값: 전역 저장소)
 
     Returns:
         집계된 Agent 정확도
     """
-    accuracy_list = []                         # Agent 정확도 리스트
-
-    # 날짜별 실험 폴더 검색
-    date_dir = Path(f"experiments/{date}")
-    if not date_dir.exists():
-        return {}
-
-    # 모든 session 폴더 순회
-    for session_dir in date_dir.glob("*_session_*"):
-        accuracy_file = session_dir / "evaluation" / "agent_accuracy.json"
-
-        # agent_accuracy.json 파일이 있으면 로드
-        if accuracy_file.exists():
-            try:
-                with open(accuracy_file, encoding='utf-8') as f:
-                    accuracy = json.load(f)
-                    accuracy_list.append(accuracy)
-            except Exception as e:
-                print(f"Agent 정확도 읽기 실패: {accuracy_file} - {e}")
-
-    # 데이터가 없으면 빈 딕셔너리 반환
-    if not accuracy_list:
+    agg = _store(store).aggregate_metrics("agent_accuracy", date, date_to)
+    if not agg:
         return {}
 
     # -------------- 집계 계산 -------------- #
-    # 도구 선택 정확도 집계 (flat 및 nested 구조 모두 지원)
-    routing_accuracy_values = []
-    correct_decisions = 0
-    incorrect_decisions = 0
-    confidence_values = []
-
-    for a in accuracy_list:
-        # flat 구조 우선 확인
-        if 'routing_accuracy' in a:
-            routing_accuracy_values.append(a.get('routing_accuracy', 0))
-        if 'correct_decisions' in a:
-            correct_decisions += a.get('correct_decisions', 0)
-        if 'incorrect_decisions' in a:
-            incorrect_decisions += a.get('incorrect_decisions', 0)
-        if 'average_confidence' in a:
-            confidence_values.append(a.get('average_confidence', 0))
-
-        # nested 구조 확인
-        if 'routing_decision' in a:
-            rd = a.get('routing_decision', {})
-            if rd.get('correct', False):
-                correct_decisions += 1
-            else:
-                incorrect_decisions += 1
-            confidence_values.append(rd.get('confidence', 0))
-
+    correct_decisions = int((agg.get('correct_decisions') or {}).get('sum') or 0)
+    incorrect_decisions = int((agg.get('incorrect_decisions') or {}).get('sum') or 0)
     total_decisions = correct_decisions + incorrect_decisions
-    total_count = len(accuracy_list)
+    routing_accuracy = (agg.get('routing_accuracy') or {}).get('mean')
+    if routing_accuracy is None:
+        routing_accuracy = correct_decisions / total_decisions if total_decisions > 0 else 0
 
     return {
-        'total_sessions': total_count,                 # 총 세션 수
+        'total_sessions': agg['total_sessions'],       # 총 세션 수
         'total_decisions': total_decisions,            # 총 결정 수
-        'routing_accuracy': mean(routing_accuracy_values) if routing_accuracy_values else (correct_decisions / total_decisions if total_decisions > 0 else 0),
+        'routing_accuracy': routing_accuracy,          # 도구 선택 정확도
         'correct_decisions': correct_decisions,        # 정확한 선택 수
         'incorrect_decisions': incorrect_decisions,    # 잘못된 선택 수
-        'average_confidence': mean(confidence_values) if confidence_values else 0     # 평균 신뢰도
+        'average_confidence': (agg.get('average_confidence') or {}).get('mean') or 0     # 평균 신뢰도
     }
 
 
 # ---------------------- 응답 시간 집계 ---------------------- #
-def aggregate_latency(date: str) -> Dict:
+def aggregate_latency(date: str, date_to: Optional[str] = None, store: Optional[MetricsStore] = None) -> Dict:
     """
-    응답 시간 집계
+    응답 시간 집계 (evaluation/latency_report.json 기준)
 
     Args:
-        date: 날짜 (YYYYMMDD)
+        date: 날짜 또는 기간 시작 (YYYYMMDD)
+        date_to: 기간 끝 (YYYYMMDD, 없으면 date 하루)
+        store: 지표 저장소 (기본값: 전역 저장소)
 
     Returns:
         집계된 응답 시간
     """
-    latency_list = []                          # 응답 시간 리스트
-
-    # 날짜별 실험 폴더 검색
-    date_dir = Path(f"experiments/{date}")
-    if not date_dir.exists():
+    agg = _store(store).aggregate_metrics("latency", date, date_to)
+    if not agg:
         return {}
 
-    # 모든 session 폴더 순회
-    for session_dir in date_dir.glob("*_session_*"):
-        latency_file = session_dir / "evaluation" / "latency_report.json"
-
-        # latency_report.json 파일이 있으면 로드
-        if latency_file.exists():
-            try:
-                with open(latency_file, encoding='utf-8') as f:
-                    latency = json.load(f)
-                    latency_list.append(latency)
-            except Exception as e:
-                print(f"응답 시간 읽기 실패: {latency_file} - {e}")
-
-    # 데이터가 없으면 빈 딕셔너리 반환
-    if not latency_list:
-        return {}
-
-    # -------------- 집계 계산 -------------- #
-    # 전체 응답 시간 집계 (flat 및 nested 구조 모두 지원)
-    total_times = []
-    routing_times = []
-    retrieval_times = []
-    generation_times = []
-
-    for l in latency_list:
-        # flat 구조 우선 확인, 없으면 nested 구조 확인
-        total_times.append(
-            l.get('total_time_ms') or l.get('total_latency', {}).get('total_time_ms', 0)
-        )
-        routing_times.append(
-            l.get('routing_time_ms') or l.get('breakdown', {}).get('routing_time_ms', 0)
-        )
-        retrieval_times.append(
-            l.get('retrieval_time_ms') or l.get('breakdown', {}).get('retrieval_time_ms', 0)
-        )
-        generation_times.append(
-            l.get('generation_time_ms') or l.get('breakdown', {}).get('generation_time_ms', 0)
-        )
-
     return {
-        'total_sessions': len(latency_list),           # 총 세션 수
-        'total_time_ms': {
-            'mean': mean(total_times),                 # 평균
-            'min': min(total_times),                   # 최소값
-            'max': max(total_times),                   # 최대값
-            'median': median(total_times),             # 중앙값
-            'p95': sorted(total_times)[int(len(total_times) * 0.95)] if total_times else 0    # p95
-        },
-        'routing_time_ms': {
-            'mean': mean(routing_times) if routing_times else 0,
-            'median': median(routing_times) if routing_times else 0
-        },
-        'retrieval_time_ms': {
-            'mean': mean(retrieval_times) if retrieval_times else 0,
-            'median': median(retrieval_times) if retrieval_times else 0
-        },
-        'generation_time_ms': {
-            'mean': mean(generation_times) if generation_times else 0,
-            'median': median(generation_times) if generation_times else 0
-        }
+        'total_sessions': agg['total_sessions'],       # 총 세션 수
+        'total_time_ms': _stats(agg.get('total_time_ms'), 'mean', 'min', 'max', 'median', 'p95', 'p99'),
+        'routing_time_ms': _stats(agg.get('routing_time_ms'), 'mean', 'median'),
+        'retrieval_time_ms': _stats(agg.get('retrieval_time_ms'), 'mean', 'median'),
+        'generation_time_ms': _stats(agg.get('generation_time_ms'), 'mean', 'median')
     }
 
 
 # ---------------------- 비용 분석 집계 ---------------------- #
-def aggregate_cost(date: str) -> Dict:
+def aggregate_cost(date: str, date_to: Optional[str] = None, store: Optional[MetricsStore] = None) -> Dict:
     """
     비용 분석 집계
 
     Args:
-        date: 날짜 (YYYYMMDD)
+        date: 날짜 또는 기간 시작 (YYYYMMDD)
+        date_to: 기간 끝 (YYYYMMDD, 없으면 date 하루)
+        store: 지표 저장소 (기본값: 전역 저장소)
 
     Returns:
         집계된 비용 분석
     """
-    cost_list = []                             # 비용 분석 리스트
-
-    # 날짜별 실험 폴더 검색
-    date_dir = Path(f"experiments/{date}")
-    if not date_dir.exists():
+    agg = _store(store).aggregate_metrics("cost", date, date_to)
+    if not agg:
         return {}
 
-    # 모든 session 폴더 순회
-    for session_dir in date_dir.glob("*_session_*"):
-        cost_file = session_dir / "evaluation" / "cost_analysis.json"
-
-        # cost_analysis.json 파일이 있으면 로드
-        if cost_file.exists():
-            try:
-                with open(cost_file, encoding='utf-8') as f:
-                    cost = json.load(f)
-                    cost_list.append(cost)
-            except Exception as e:
-                print(f"비용 분석 읽기 실패: {cost_file} - {e}")
-
-    # 데이터가 없으면 빈 딕셔너리 반환
-    if not cost_list:
-        return {}
-
-    # -------------- 집계 계산 -------------- #
-    # 토큰 사용량 집계 (flat 및 nested 구조 모두 지원)
-    total_tokens = []
-    cost_usd = []
-    cost_krw = []
-
-    for c in cost_list:
-        # flat 구조 우선 확인, 없으면 nested 구조 확인
-        total_tokens.append(
-            c.get('total_tokens') or c.get('llm_usage', {}).get('total_tokens', 0)
-        )
-        cost_usd.append(
-            c.get('cost_usd') or c.get('cost_breakdown_usd', {}).get('total_cost', 0)
-        )
-        cost_krw.append(
-            c.get('cost_krw') or c.get('cost_breakdown_krw', {}).get('total_cost', 0)
-        )
-
     return {
-        'total_sessions': len(cost_list),              # 총 세션 수
-        'total_tokens': {
-            'sum': sum(total_tokens),                  # 총합
-            'mean': mean(total_tokens),                # 평균
-            'min': min(total_tokens),                  # 최소값
-            'max': max(total_tokens)                   # 최대값
-        },
-        'total_cost_usd': {
-            'sum': sum(cost_usd),                      # 총 비용 (USD)
-            'mean': mean(cost_usd),                    # 평균 비용
-            'min': min(cost_usd),                      # 최소 비용
-            'max': max(cost_usd)                       # 최대 비용
-        },
-        'total_cost_krw': {
-            'sum': sum(cost_krw),                      # 총 비용 (KRW)
-            'mean': mean(cost_krw),                    # 평균 비용
-            'min': min(cost_krw),                      # 최소 비용
-            'max': max(cost_krw)                       # 최대 비용
-        }
+        'total_sessions': agg['total_sessions'],       # 총 세션 수
+        'total_tokens': _stats(agg.get('total_tokens'), 'sum', 'mean', 'min', 'max'),
+        'total_cost_usd': _stats(agg.get('cost_usd'), 'sum', 'mean', 'min', 'max'),
+        'total_cost_krw': _stats(agg.get('cost_krw'), 'sum', 'mean', 'min', 'max')
     }
 
 
+# ---------------------- 요청 집계 ---------------------- #
+def aggregate_requests(date: str, date_to: Optional[str] = None, store: Optional[MetricsStore] = None) -> Dict:
+    """
+    세션 / 요청 집계 (metadata 기준: 응답 시간 백분위수, 도구 분포, 난이도 분포, 성공률)
+
+    Args:
+        date: 날짜 또는 기간 시작 (YYYYMMDD)
+        date_to: 기간 끝 (YYYYMMDD, 없으면 date 하루)
+        store: 지표 저장소 (기본값: 전역 저장소)
+
+    Returns:
+        집계된 요청 지표
+    """
+    return _store(store).aggregate_requests(date, date_to)
+
+
 # ==================== 저장 함수들 ==================== #
 # ---------------------- JSON 형식으로 저장 ---------------------- #
 def save_as_json(aggregated_data: Dict, output_path: str):
@@ -407,6 +251,18 @@ def save_as_csv(aggregated_data: Dict, output_path: str):
                 writer.writerow(['Cost', 'Total Cost USD (Sum)', f"${cost.get('total_cost_usd', {}).get('sum', 0):.4f}"])
                 writer.writerow(['Cost', 'Total Cost KRW (Sum)', f"₩{cost.get('total_cost_krw', {}).get('sum', 0):.2f}"])
 
+        # 요청 집계 작성
+        if 'requests' in aggregated_data:
+            requests = aggregated_data['requests']
+            if requests:
+                latency = requests.get('response_time_ms', {})
+                writer.writerow(['Requests', 'Total', requests.get('total', 0)])
+                writer.writerow(['Requests', 'Successes', requests.get('successes', 0)])
+                for label in ('p50', 'p95', 'p99'):
+                    writer.writerow(['Requests', f'Response Time ({label}) ms', f"{latency.get(label) or 0:.1f}"])
+                for tool, stats in requests.get('tools', {}).items():
+                    writer.writerow(['Tool Mix', tool, stats.get('count', 0)])
+
     print(f"\nCSV 파일 저장 완료: {output_path}")
 
 
@@ -416,26 +272,37 @@ def main():
     """메인 실행 함수"""
     # 명령줄 인자 파서 생성
     parser = argparse.ArgumentParser(
-        description='실험 평가 지표 집계',
+        description='실험 평가 지표 집계 (지표 저장소 기반)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
                 사용 예시:
                 # 특정 날짜의 평가 지표 집계 (JSON 출력)
-                python scripts/aggregate_metrics.py --date 20251031 --output results.json
+                python scripts/system/aggregate_metrics.py --date 20251031 --output results.json
 
-                # 특정 날짜의 평가 지표 집계 (CSV 출력)
-                python scripts/aggregate_metrics.py --date 20251031 --output results.csv
+                # 기간 집계 (CSV 출력)
+                python scripts/system/aggregate_metrics.py --from 20251001 --to 20251031 --output results.csv
 
-                # 모든 메트릭 집계
-                python scripts/aggregate_metrics.py --date 20251031 --output results.json
+                # 저장소 도입 전 실험 폴더를 적재한 뒤 집계
+                python scripts/system/aggregate_metrics.py --import --from 20251001 --to 20251031 --output results.json
                 """
     )
 
-    # 필수 인자 추가
+    # 기간 인자 추가
     parser.add_argument(
         '--date',
-        required=True,
-        help='집계할 날짜 (YYYYMMDD 형식, 예: 20251031)'
+        help='집계할 날짜 (YYYYMMDD 형식, 예: 20251031, --from/--to 대신 하루만)'
+    )
+
+    parser.add_argument(
+        '--from',
+        dest='date_from',
+        help='기간 시작 (YYYYMMDD)'
+    )
+
+    parser.add_argument(
+        '--to',
+        dest='date_to',
+        help='기간 끝 (YYYYMMDD, 기본값: --from과 같은 날)'
     )
 
     parser.add_argument(
@@ -444,37 +311,68 @@ def main():
         help='출력 파일 경로 (.json 또는 .csv)'
     )
 
+    parser.add_argument(
+        '--db',
+        help='지표 저장소 경로 (기본값: configs/model_config.yaml의 metrics_store.path)'
+    )
+
+    parser.add_argument(
+        '--import',
+        dest='import_dirs',
+        action='store_true',
+        help='집계 전에 experiments/ 폴더의 기존 세션을 저장소에 적재'
+    )
+
     # 인자 파싱
     args = parser.parse_args()
 
+    date_from = args.date or args.date_from
+    date_to = args.date or args.date_to or date_from
+    if not date_from:
+        parser.error('--date 또는 --from을 지정하세요')
+    period = date_from if date_from == date_to else f"{date_from} ~ {date_to}"
+
+    store = MetricsStore(args.db) if args.db else _store()
+
     print(f"\n{'='*80}")
-    print(f"평가 지표 집계 시작: {args.date}")
+    print(f"평가 지표 집계 시작: {period}")
     print(f"{'='*80}\n")
 
+    # -------------- 기존 실험 폴더 적재 -------------- #
+    if args.import_dirs:
+        imported = store.import_experiments("experiments", date_from, date_to)
+        print(f"실험 폴더 적재: {imported}개 세션")
+
     # -------------- 평가 지표 집계 -------------- #
     aggregated_data = {}
 
     # RAG 평가 지표 집계
     print("RAG 평가 지표 집계 중...")
-    aggregated_data['rag_metrics'] = aggregate_rag_metrics(args.date)
+    aggregated_data['rag_metrics'] = aggregate_rag_metrics(date_from, date_to, store)
 
     # Agent 정확도 집계
     print("Agent 정확도 집계 중...")
-    aggregated_data['agent_accuracy'] = aggregate_agent_accuracy(args.date)
+    aggregated_data['agent_accuracy'] = aggregate_agent_accuracy(date_from, date_to, store)
 
     # 응답 시간 집계
     print("응답 시간 집계 중...")
-    aggregated_data['latency'] = aggregate_latency(args.date)
+    aggregated_data['latency'] = aggregate_latency(date_from, date_to, store)
 
     # 비용 분석 집계
     print("비용 분석 집계 중...")
-    aggregated_data['cost'] = aggregate_cost(args.date)
+    aggregated_data['cost'] = aggregate_cost(date_from, date_to, store)
+
+    # 요청 집계 (응답 시간 백분위수 / 도구 분포)
+    print("요청 집계 중...")
+    aggregated_data['requests'] = aggregate_requests(date_from, date_to, store)
 
     # 메타 정보 추가
     aggregated_data['meta'] = {
-        'date': args.date,
+        'date_from': date_from,
+        'date_to': date_to,
         'aggregated_at': datetime.now().isoformat(),
-        'total_experiments': aggregated_data.get('rag_metrics', {}).get('total_sessions', 0)
+        'total_experiments': aggregated_data.get('rag_metrics', {}).get('total_sessions', 0),
+        'total_requests': aggregated_data.get('requests', {}).get('total', 0)
     }
 
     # -------------- 결과 저장 -------------- #
@@ -494,6 +392,14 @@ def main():
     print("집계 요약")
     print(f"{'='*80}")
 
+    if aggregated_data.get('requests'):
+        requests = aggregated_data['requests']
+        latency = requests.get('response_time_ms', {})
+        print(f"\n[요청]")
+        print(f"  총 요청: {requests.get('total', 0)}개 (성공 {requests.get('successes', 0)} / 실패 {requests.get('failures', 0)})")
+        print(f"  응답 시간 p50 / p95 / p99: {latency.get('p50') or 0:.1f} / {latency.get('p95') or 0:.1f} / {latency.get('p99') or 0:.1f} ms")
+        print("  도구 분포: " + ", ".join(f"{tool} {stats['count']}" for tool, stats in requests.get('tools', {}).items()))
+
     if aggregated_data.get('rag_metrics'):
         rag = aggregated_data['rag_metrics']
         print(f"\n[RAG 평가 지표]")
@@ -1,22 +1,30 @@
 #!/usr/bin/env python3
 # ---------------------- 실험 검색 스크립트 ---------------------- #
 """
-metadata.json 기반 실험 검색 도구
+지표 저장소 기반 실험 검색 도구
 
 주요 기능:
 - 난이도별 실험 검색 (easy/hard)
 - 사용 도구별 검색 (rag_paper, web_search 등)
-- 날짜별 검색 (YYYYMMDD)
+- 날짜 / 기간별 검색 (YYYYMMDD)
 - 응답 시간 기준 검색 (min/max)
 - 복합 조건 검색
+- metadata.json을 하나씩 읽는 대신 지표 저장소(experiments/metrics.sqlite3) 인덱스로 조회
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
 import json                                    # JSON 파일 처리
+import sys                                     # 모듈 경로 설정
 import argparse                                # 명령줄 인자 처리
 from pathlib import Path                       # 파일 경로 처리
 from typing import Optional, List, Dict        # 타입 힌팅
 
+# 프로젝트 루트를 모듈 경로에 추가 (scripts/system에서 직접 실행 시)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils.metrics_store import MetricsStore, get_metrics_store, get_metrics_store_config
+
 
 # ==================== 검색 함수 ==================== #
 # ---------------------- 실험 검색 함수 ---------------------- #
@@ -26,79 +34,65 @@ def find_experiments(
     date: Optional[str] = None,
     min_response_time: Optional[int] = None,
     max_response_time: Optional[int] = None,
-    min_success: Optional[bool] = None
+    min_success: Optional[bool] = None,
+    date_to: Optional[str] = None,
+    store: Optional[MetricsStore] = None,
+    limit: Optional[int] = None
 ) -> List[Dict]:
     """
-    metadata.json 기반 실험 검색
+    지표 저장소 기반 실험 검색
 
     Args:
         difficulty: 난이도 필터 (easy/hard)
         tool: 도구 필터 (rag_paper, web_search 등)
-        date: 날짜 필터 (YYYYMMDD)
+        date: 날짜 필터 또는 기간 시작 (YYYYMMDD)
         min_response_time: 최소 응답 시간 (ms)
         max_response_time: 최대 응답 시간 (ms)
         min_success: 성공 여부 필터 (True/False)
+        date_to: 기간 끝 (YYYYMMDD, 없으면 date 하루)
+        store: 지표 저장소 (기본값: 전역 저장소)
+        limit: 최대 결과 수
 
     Returns:
         검색된 실험 목록 (경로 및 메타데이터)
     """
-    results = []                               # 검색 결과 리스트
-
-    # -------------- 검색 경로 설정 -------------- #
-    if date:
-        # 특정 날짜 검색
-        search_path = Path(f"experiments/{date}")
-        if not search_path.exists():
-            print(f"날짜 폴더가 존재하지 않습니다: experiments/{date}")
-            return []
-    else:
-        # 전체 검색
-        search_path = Path("experiments")
-        if not search_path.exists():
-            print("experiments 폴더가 존재하지 않습니다")
-            return []
-
-    # -------------- 모든 metadata.json 찾기 -------------- #
-    # 재귀적으로 모든 metadata.json 파일 검색
-    for meta_file in search_path.rglob("metadata.json"):
-        try:
-            # metadata.json 파일 읽기
-            with open(meta_file, encoding='utf-8') as f:
-                meta = json.load(f)
-        except Exception as e:
-            print(f"메타데이터 읽기 실패: {meta_file} - {e}")
-            continue
-
-        # -------------- 필터 적용 -------------- #
-        # 난이도 필터
-        if difficulty and meta.get('difficulty') != difficulty:
-            continue
-
-        # 도구 필터
-        if tool and meta.get('tool_used') != tool:
-            continue
-
-        # 최소 응답 시간 필터
-        if min_response_time and meta.get('response_time_ms', 0) < min_response_time:
-            continue
-
-        # 최대 응답 시간 필터
-        if max_response_time and meta.get('response_time_ms', float('inf')) > max_response_time:
-            continue
-
-        # 성공 여부 필터
-        if min_success is not None and meta.get('success') != min_success:
-            continue
-
-        # 검색 조건을 모두 통과한 실험 추가
+    # -------------- 저장소 선택 -------------- #
+    if store is None:
+        store = get_metrics_store()
+        if store is None:
+            store = MetricsStore(get_metrics_store_config()["path"])
+        else:
+            store.flush()                      # 진행 중인 기록 반영
+
+    # -------------- 인덱스 조회 (필터는 SQL WHERE로 처리) -------------- #
+    rows = store.find_requests(
+        date_from=date,
+        date_to=date_to,
+        difficulty=difficulty,
+        tool=tool,
+        success=min_success,
+        min_response_time=min_response_time,
+        max_response_time=max_response_time,
+        limit=limit,
+    )
+
+    # 검색 조건을 모두 통과한 실험 (시작 시간 순)
+    results = []
+    for row in rows:
         results.append({
-            'path': str(meta_file.parent),     # 실험 폴더 경로
-            'metadata': meta                   # 메타데이터
+            'path': row['path'] or row['key'],     # 실험 폴더 경로
+            'metadata': {                          # 메타데이터
+                'session_id': row['key'],
+                'start_time': row['ts'],
+                'difficulty': row['difficulty'],
+                'tool_used': row['tool_used'],
+                'user_query': row['user_query'],
+                'success': None if row['success'] is None else bool(row['success']),
+                'response_time_ms': row['response_time_ms'],
+                'tokens_used': {'total': row['total_tokens']} if row['total_tokens'] is not None else {},
+            }
         })
 
-    # 시작 시간 기준으로 정렬
-    results.sort(key=lambda x: x['metadata'].get('start_time', ''))
-
     return results
 
 
@@ -131,8 +125,16 @@ def print_results(results: List[Dict], verbose: bool = False):
         print(f"사용 도구: {meta.get('tool_used', 'N/A')}")
         print(f"사용자 질문: {meta.get('user_query', 'N/A')}")
 
-        # 상세 정보 출력 (verbose 모드)
+        # 상세 정보 출력 (verbose 모드: 찾은 실험의 metadata.json만 읽음)
         if verbose:
+            meta_file = Path(path) / "metadata.json"
+            if meta_file.exists():
+                try:
+                    with open(meta_file, encoding='utf-8') as f:
+                        meta = {**meta, **json.load(f)}
+                except Exception as e:
+                    print(f"메타데이터 읽기 실패: {meta_file} - {e}")
+
             print(f"종료 시간: {meta.get('end_time', 'N/A')}")
             print(f"성공 여부: {meta.get('success', 'N/A')}")
             print(f"응답 시간: {meta.get('response_time_ms', 'N/A')} ms")
@@ -152,7 +154,7 @@ def main():
     """메인 실행 함수"""
     # 명령줄 인자 파서 생성
     parser = argparse.ArgumentParser(
-        description='metadata.json 기반 실험 검색',
+        description='지표 저장소 기반 실험 검색',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
                 사용 예시:
@@ -165,6 +167,12 @@ def main():
                 # 날짜별 검색
                 python scripts/find_experiments.py --date 20251031
 
+                # 기간 검색
+                python scripts/find_experiments.py --date 20251001 --to 20251031 --tool rag_paper
+
+                # 저장소 도입 전 실험 폴더 적재 후 검색
+                python scripts/find_experiments.py --import --date 20251031
+
                 # 응답 시간 기준 검색 (빠른 실험만)
                 python scripts/find_experiments.py --max-time 3000
 
@@ -190,7 +198,13 @@ def main():
 
     parser.add_argument(
         '--date',
-        help='날짜 필터 (YYYYMMDD 형식, 예: 20251031)'
+        help='날짜 필터 또는 기간 시작 (YYYYMMDD 형식, 예: 20251031)'
+    )
+
+    parser.add_argument(
+        '--to',
+        dest='date_to',
+        help='기간 끝 (YYYYMMDD, --date와 함께 사용)'
     )
 
     parser.add_argument(
@@ -217,9 +231,35 @@ def main():
         help='상세 정보 출력'
     )
 
+    parser.add_argument(
+        '--limit',
+        type=int,
+        help='최대 결과 수'
+    )
+
+    parser.add_argument(
+        '--db',
+        help='지표 저장소 경로 (기본값: configs/model_config.yaml의 metrics_store.path)'
+    )
+
+    parser.add_argument(
+        '--import',
+        dest='import_dirs',
+        action='store_true',
+        help='검색 전에 experiments/ 폴더의 기존 세션을 저장소에 적재'
+    )
+
     # 인자 파싱
     args = parser.parse_args()
 
+    store = MetricsStore(args.db) if args.db else None
+
+    # 기존 실험 폴더 적재
+    if args.import_dirs:
+        store = store or get_metrics_store() or MetricsStore(get_metrics_store_config()["path"])
+        imported = store.import_experiments("experiments", args.date, args.date_to)
+        print(f"\n실험 폴더 적재: {imported}개 세션")
+
     # 검색 실행
     print("\n실험 검색 중...")
     results = find_experiments(
@@ -228,7 +268,10 @@ def main():
         date=args.date,
         min_response_time=args.min_time,
         max_response_time=args.max_time,
-        min_success=True if args.success_only else None
+        min_success=True if args.success_only else None,
+        date_to=args.date_to,
+        store=store,
+        limit=args.limit
     )
 
     # 결과 출력
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# ---------------------- 요청 트레이스 분석 스크립트 ---------------------- #
+"""
+요청 트레이스(JSONL) 분석 도구
+
+src/utils/tracing.py가 기록한 logs/traces/traces_YYYYMMDD.jsonl을 읽어:
+- 트레이스별 span 트리 (시작 오프셋 / 소요 시간 / 주요 속성)
+- 임계 경로(critical path): 루트에서 가장 늦게 끝난 하위 span을 따라간 경로
+- span 이름별 호출 수 / 총 소요 시간 / p50 / p95 집계
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import json                                    # JSON 파일 처리
+import argparse                                # 명령줄 인자 처리
+from pathlib import Path                       # 파일 경로 처리
+from datetime import datetime                  # 날짜 및 시간 처리
+from typing import Any, Dict, List, Optional   # 타입 힌팅
+
+# 트리 출력 시 함께 보여줄 속성
+SHOWN_ATTRIBUTES = (
+    "tool", "status", "model", "total_tokens", "estimated_prompt_tokens",
+    "results", "rowcount", "misses", "statement",
+)
+
+
+# ==================== 로드 ==================== #
+def _attr_value(value: Dict[str, Any]) -> Any:
+    """OTLP AnyValue → 파이썬 값"""
+    if "stringValue" in value:
+        return value["stringValue"]
+    if "intValue" in value:
+        return int(value["intValue"])
+    if "doubleValue" in value:
+        return value["doubleValue"]
+    if "boolValue" in value:
+        return value["boolValue"]
+    if "arrayValue" in value:
+        return [_attr_value(v) for v in value["arrayValue"].get("values", [])]
+    return None
+
+
+def load_traces(path: Path) -> List[Dict[str, Any]]:
+    """
+    트레이스 JSONL 로드
+
+    Args:
+        path: traces_YYYYMMDD.jsonl 경로
+
+    Returns:
+        [{"trace_id", "name", "spans": [{"span_id", "parent_id", "name", "start_ms", "duration_ms", "attributes", "error"}]}]
+    """
+    traces = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            for resource_spans in data.get("resourceSpans", []):
+                resource = {a["key"]: _attr_value(a["value"]) for a in resource_spans["resource"]["attributes"]}
+                spans = []
+                trace_id = None
+                for scope_spans in resource_spans.get("scopeSpans", []):
+                    for s in scope_spans.get("spans", []):
+                        trace_id = s["traceId"]
+                        spans.append({
+                            "span_id": s["spanId"],
+                            "parent_id": s.get("parentSpanId"),
+                            "name": s["name"],
+                            "start_ns": int(s["startTimeUnixNano"]),
+                            "duration_ms": (int(s["endTimeUnixNano"]) - int(s["startTimeUnixNano"])) / 1e6,
+                            "attributes": {a["key"]: _attr_value(a["value"]) for a in s.get("attributes", [])},
+                            "error": s.get("status", {}).get("message") if s.get("status", {}).get("code") == 2 else None,
+                        })
+                if not spans:
+                    continue
+                origin = min(s["start_ns"] for s in spans)
+                for s in spans:
+                    s["start_ms"] = (s.pop("start_ns") - origin) / 1e6
+                traces.append({
+                    "trace_id": trace_id,
+                    "name": resource.get("trace.name"),
+                    "dropped_spans": resource.get("trace.dropped_spans", 0),
+                    "spans": spans,
+                })
+    return traces
+
+
+# ==================== 분석 ==================== #
+def _children(spans: List[Dict[str, Any]]) -> Dict[Optional[str], List[Dict[str, Any]]]:
+    ids = {s["span_id"] for s in spans}
+    children: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for s in sorted(spans, key=lambda s: s["start_ms"]):
+        parent = s["parent_id"] if s["parent_id"] in ids else None
+        children.setdefault(parent, []).append(s)
+    return children
+
+
+def critical_path(trace: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    임계 경로: 루트부터 가장 늦게 끝난 하위 span을 따라감
+
+    Args:
+        trace: load_traces() 항목
+
+    Returns:
+        루트 → 말단 순서의 span 리스트
+    """
+    children = _children(trace["spans"])
+    roots = children.get(None, [])
+    if not roots:
+        return []
+    path = [max(roots, key=lambda s: s["duration_ms"])]
+    while children.get(path[-1]["span_id"]):
+        path.append(max(children[path[-1]["span_id"]], key=lambda s: s["start_ms"] + s["duration_ms"]))
+    return path
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarize_spans(traces: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    span 이름별 집계 (총 소요 시간 내림차순)
+
+    Returns:
+        [{"name", "count", "errors", "total_ms", "p50_ms", "p95_ms"}]
+    """
+    durations: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    for trace in traces:
+        for s in trace["spans"]:
+            durations.setdefault(s["name"], []).append(s["duration_ms"])
+            errors[s["name"]] = errors.get(s["name"], 0) + int(bool(s["error"]))
+
+    rows = [
+        {
+            "name": name,
+            "count": len(values),
+            "errors": errors[name],
+            "total_ms": round(sum(values), 1),
+            "p50_ms": round(_percentile(values, 0.5), 1),
+            "p95_ms": round(_percentile(values, 0.95), 1),
+        }
+        for name, values in durations.items()
+    ]
+    return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+
+# ==================== 출력 ==================== #
+def print_tree(trace: Dict[str, Any]):
+    """span 트리 출력 (시작 오프셋 + 소요 시간 + 주요 속성)"""
+    children = _children(trace["spans"])
+
+    def walk(parent_id, depth):
+        for s in children.get(parent_id, []):
+            shown = {k: s["attributes"][k] for k in SHOWN_ATTRIBUTES if k in s["attributes"]}
+            error = f"  ❌ {s['error']}" if s["error"] else ""
+            print(f"  {'  ' * depth}+{s['start_ms']:8.1f}ms {s['duration_ms']:9.1f}ms  {s['name']}  {shown or ''}{error}")
+            walk(s["span_id"], depth + 1)
+
+    walk(None, 0)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description='요청 트레이스 분석 (span 트리 / 임계 경로 / 구간별 집계)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+                사용 예시:
+                # 오늘 트레이스 집계 + 가장 느린 트레이스 3개 트리 출력
+                python scripts/system/trace_report.py --slowest 3
+
+                # 특정 날짜 / 특정 트레이스
+                python scripts/system/trace_report.py --date 20261018 --trace-id 4bf92f35...
+                """
+    )
+    parser.add_argument('--date', default=datetime.now().strftime("%Y%m%d"), help='날짜 (YYYYMMDD, 기본값: 오늘)')
+    parser.add_argument('--file', help='트레이스 파일 경로 (지정 시 --date 무시)')
+    parser.add_argument('--trace-id', help='출력할 트레이스 ID')
+    parser.add_argument('--slowest', type=int, default=3, help='트리를 출력할 느린 트레이스 수')
+    args = parser.parse_args()
+
+    path = Path(args.file) if args.file else Path(f"logs/traces/traces_{args.date}.jsonl")
+    if not path.exists():
+        print(f"트레이스 파일이 존재하지 않습니다: {path}")
+        return
+
+    traces = load_traces(path)
+    if args.trace_id:
+        traces = [t for t in traces if t["trace_id"] == args.trace_id]
+    if not traces:
+        print("트레이스가 없습니다")
+        return
+
+    print(f"\n{'='*80}")
+    print(f"트레이스 {len(traces)}개: {path}")
+    print(f"{'='*80}\n")
+
+    # -------------- 구간별 집계 -------------- #
+    print(f"{'span':40s} {'count':>6s} {'errors':>6s} {'total_ms':>10s} {'p50_ms':>9s} {'p95_ms':>9s}")
+    for row in summarize_spans(traces):
+        print(f"{row['name'][:40]:40s} {row['count']:6d} {row['errors']:6d} "
+              f"{row['total_ms']:10.1f} {row['p50_ms']:9.1f} {row['p95_ms']:9.1f}")
+
+    # -------------- 느린 트레이스 트리 + 임계 경로 -------------- #
+    def total_ms(trace):
+        return max(s["start_ms"] + s["duration_ms"] for s in trace["spans"])
+
+    for trace in sorted(traces, key=total_ms, reverse=True)[:max(args.slowest, 1)]:
+        print(f"\n--- {trace['trace_id']} ({total_ms(trace):.1f}ms) ---")
+        print_tree(trace)
+        path_names = " → ".join(f"{s['name']}({s['duration_ms']:.0f}ms)" for s in critical_path(trace))
+        print(f"  임계 경로: {path_names}")
+        if trace["dropped_spans"]:
+            print(f"  ⚠️ 버려진 span: {trace['dropped_spans']}개")
+
+
+if __name__ == "__main__":
+    main()
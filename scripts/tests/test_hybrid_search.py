@@ -4,7 +4,7 @@
 import sys
 sys.path.insert(0, '/home/ieyeppo/AI_Lab/langchain-project')
 
-from src.tools.search_paper import search_paper_database
+from src.tools.search_paper import search_paper_database, get_last_branch_timings
 
 def test_hybrid_search():
     """RAG 키워드로 하이브리드 검색 테스트"""
@@ -66,5 +66,22 @@ def test_hybrid_search():
         print("✅ 검색 성공!")
         print(f"\n{result3[:500]}...\n")
 
+    # 4. 병렬 / 순차 브랜치 실행 비교
+    print("\n" + "="*80)
+    print("4️⃣ 브랜치 실행 시간 비교 (병렬 vs 순차)")
+    for parallel in (True, False):
+        result4 = search_paper_database.invoke({
+            "query": "Retrieval-Augmented Generation",
+            "top_k": 5,
+            "with_scores": True,
+            "use_hybrid": True,
+            "tool_name": "search_paper",
+            "parallel": parallel,
+        })
+        mode = "병렬" if parallel else "순차"
+        print(f"\n[{mode}] 검색 결과 길이: {len(result4)} 글자")
+        for branch, info in get_last_branch_timings().items():
+            print(f"  - {branch}: {info.get('elapsed_ms')}ms ({info.get('status')})")
+
 if __name__ == "__main__":
     test_hybrid_search()
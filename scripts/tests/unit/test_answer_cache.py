@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# ---------------------- 답변 캐시 단위 테스트 ---------------------- #
+"""
+src.agent.answer_cache.SemanticAnswerCache 단위 테스트
+
+테스트 항목:
+- 유사 질문 히트 / 다른 질문 미스
+- 난이도별 분리
+- 도구별 TTL (0이면 저장 안 함)
+- 테이블 변경 시 의존 답변 무효화
+- 테이블 지문 조회(DB 왕복) 중에도 다른 조회는 잠금 대기 없이 진행
+- 라우팅 도구가 다른 유사 질문은 미스 (키: 임베딩, 난이도, 도구)
+- 임베딩 클라이언트 지연 생성 (그래프 생성 시 API 키 불필요)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import threading
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent import answer_cache
+from src.agent.answer_cache import CachedAgentGraph, SemanticAnswerCache
+from src.database import embeddings
+
+
+# ==================== 테스트 유틸 ==================== #
+# 질문별 고정 벡터 (API 호출 없이 유사도 제어)
+VECTORS = {
+    "Transformer란?": [1.0, 0.0, 0.0],
+    "Transformer가 뭐야?": [0.99, 0.05, 0.0],
+    "BLEU Score가 뭐야?": [0.0, 1.0, 0.0],
+}
+
+
+def fake_embed(text):
+    return VECTORS.get(text, [0.0, 0.0, 1.0])
+
+
+def make_response(tool="glossary", answer="정의"):
+    return {"tool_choice": tool, "final_answer": answer, "tool_status": "success"}
+
+
+# ==================== 조회 테스트 ==================== #
+# ---------------------- 유사 질문 히트 테스트 ---------------------- #
+def test_similar_question_hits():
+    """임계값 이상 유사한 질문은 히트, 다른 질문은 미스"""
+    cache = SemanticAnswerCache(fake_embed, similarity_threshold=0.95)
+    assert cache.store("Transformer란?", "easy", make_response())
+
+    hit = cache.lookup("Transformer가 뭐야?", "easy")
+    assert hit is not None
+    assert hit["response"]["final_answer"] == "정의"
+    assert hit["question"] == "Transformer란?"
+
+    assert cache.lookup("BLEU Score가 뭐야?", "easy") is None
+    assert cache.lookup("Transformer란?", "hard") is None    # 난이도 분리
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+# ---------------------- 라우팅 도구 분리 테스트 ---------------------- #
+def test_different_route_tool_misses():
+    """임베딩이 비슷해도 LLM 라우팅 전 결정된 도구가 다르면 미스"""
+    routes = {"Transformer란?": "glossary", "Transformer가 뭐야?": "search_paper"}
+    cache = SemanticAnswerCache(fake_embed, route_fn=routes.get)
+    assert cache.store("Transformer란?", "easy", make_response("glossary"))
+
+    assert cache.lookup("Transformer가 뭐야?", "easy") is None
+    routes["Transformer가 뭐야?"] = "glossary"
+    assert cache.lookup("Transformer가 뭐야?", "easy")["tool"] == "glossary"
+
+
+# ---------------------- 임베딩 지연 생성 테스트 ---------------------- #
+def test_cache_builds_without_embedding_client(monkeypatch):
+    """get_answer_cache는 임베딩 클라이언트를 만들지 않음 (첫 조회 / 저장 때 생성)"""
+    def no_client(*args, **kwargs):
+        raise RuntimeError("OPENAI_API_KEY 없음")
+
+    monkeypatch.setattr(embeddings, "get_embeddings", no_client)
+    monkeypatch.setattr(answer_cache, "_answer_cache", None)
+    monkeypatch.setattr(answer_cache, "_load_answer_cache_config", lambda: dict(answer_cache.DEFAULT_ANSWER_CACHE_CONFIG))
+
+    cache = answer_cache.get_answer_cache()
+    assert cache is not None
+
+    class FakeGraph:
+        def invoke(self, state, config=None):
+            return {**state, **make_response()}
+
+    # 조회 / 저장 시 임베딩 실패는 캐시 미스 / 저장 생략으로 처리
+    graph = CachedAgentGraph(FakeGraph(), cache)
+    assert graph.invoke({"question": "Transformer란?", "difficulty": "easy"})["final_answer"] == "정의"
+    assert len(cache) == 0
+
+
+# ---------------------- 도구별 TTL 테스트 ---------------------- #
+def test_tool_ttl_zero_skips_store():
+    """TTL 0인 도구와 실패 응답은 저장하지 않음"""
+    cache = SemanticAnswerCache(fake_embed, tool_ttl_seconds={"save_file": 0})
+    assert not cache.store("Transformer란?", "easy", make_response(tool="save_file"))
+    assert not cache.store("Transformer란?", "easy", {**make_response(), "tool_status": "failed"})
+    assert len(cache) == 0
+
+
+# ==================== 무효화 테스트 ==================== #
+# ---------------------- 명시적 무효화 테스트 ---------------------- #
+def test_invalidate_dependent_tools_only():
+    """glossary 변경 시 glossary 답변만 제거"""
+    cache = SemanticAnswerCache(fake_embed)
+    cache.store("Transformer란?", "easy", make_response(tool="glossary"))
+    cache.store("BLEU Score가 뭐야?", "easy", make_response(tool="general"))
+
+    assert cache.invalidate("glossary") == 1
+    assert cache.lookup("Transformer란?", "easy") is None
+    assert cache.lookup("BLEU Score가 뭐야?", "easy") is not None
+
+
+# ---------------------- 테이블 지문 변경 테스트 ---------------------- #
+def test_version_change_invalidates():
+    """테이블 지문이 바뀌면 다음 조회에서 의존 답변 무효화"""
+    versions = {"papers": "10:a", "glossary": "5:a"}
+    cache = SemanticAnswerCache(fake_embed, version_fn=lambda: dict(versions), version_check_interval=0)
+    cache.lookup("Transformer란?", "easy")                    # 최초 지문 기록
+    cache.store("Transformer란?", "easy", make_response(tool="search_paper"))
+
+    versions["papers"] = "11:b"
+    assert cache.lookup("Transformer란?", "easy") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+# ---------------------- 지문 조회 중 잠금 미점유 테스트 ---------------------- #
+def test_version_fetch_does_not_hold_lock():
+    """version_fn이 느려도 다른 스레드의 조회/저장은 기다리지 않고, 확인은 한 스레드만 수행"""
+    entered, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_versions():
+        calls.append(1)
+        entered.set()
+        release.wait(2)
+        return {"papers": "10:a"}
+
+    cache = SemanticAnswerCache(fake_embed, version_fn=slow_versions, version_check_interval=60)
+    checker = threading.Thread(target=cache.lookup, args=("Transformer란?", "easy"))
+    checker.start()
+    assert entered.wait(2)
+
+    # 지문 조회가 끝나지 않은 상태에서 저장 / 조회 완료
+    results = []
+    other = threading.Thread(target=lambda: results.extend([
+        cache.store("Transformer란?", "easy", make_response()),
+        cache.lookup("Transformer가 뭐야?", "easy") is not None,
+    ]))
+    other.start()
+    other.join(1)
+    finished = not other.is_alive()
+
+    release.set()
+    checker.join(2)
+    other.join(2)
+    assert finished and results == [True, True]
+    assert len(calls) == 1
+
+
+# ==================== 그래프 래퍼 테스트 ==================== #
+# ---------------------- 캐시 히트 시 그래프 생략 테스트 ---------------------- #
+def test_cached_graph_skips_invoke_on_hit():
+    """두 번째 호출은 그래프를 실행하지 않고 cache_hit=True 반환"""
+    class FakeGraph:
+        calls = 0
+
+        def invoke(self, state, config=None):
+            FakeGraph.calls += 1
+            return {**state, **make_response()}
+
+    graph = CachedAgentGraph(FakeGraph(), SemanticAnswerCache(fake_embed))
+    first = graph.invoke({"question": "Transformer란?", "difficulty": "easy"})
+    second = graph.invoke({"question": "Transformer가 뭐야?", "difficulty": "easy"})
+
+    assert FakeGraph.calls == 1
+    assert not first.get("cache_hit")
+    assert second["cache_hit"] is True
+    assert second["tool_choice"] == "glossary"
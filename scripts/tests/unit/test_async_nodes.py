@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# ---------------------- 비동기 노드 단위 테스트 ---------------------- #
+"""
+src.agent.async_nodes / 비동기 도구 래퍼 / agenerate_levels 단위 테스트
+
+테스트 항목:
+- 동기 노드를 비동기로 감싸도 이벤트 루프를 막지 않음 (동시 실행)
+- 비동기 도구 래퍼의 tool_status / tool_timeline 처리
+- agenerate_levels 동시 실행 및 타임아웃
+- search_paper / glossary 비동기 노드: 검색은 스레드 풀, 답변은 llm.ainvoke (동기 invoke 미사용)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.async_nodes import to_async_node
+from src.agent.tool_wrapper import awrap_tool_node
+from src.tools import glossary, search_paper
+from src.tools.multi_level import agenerate_levels
+
+
+# ==================== 테스트 유틸 ==================== #
+class FakeAsyncLLM:
+    """ainvoke만 허용하는 LLM (동기 invoke 호출 시 실패)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages, config=None):
+        raise AssertionError("비동기 노드에서 동기 invoke 호출")
+
+    async def ainvoke(self, messages, config=None):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(content=f"답변 {self.calls}")
+
+
+# ==================== 블로킹 노드 테스트 ==================== #
+def test_blocking_node_runs_off_loop():
+    """time.sleep 노드 4개를 동시에 실행해도 총 시간 ≈ 1개"""
+    def blocking_node(state):
+        time.sleep(0.2)
+        return {**state, "done": True}
+
+    async_node = to_async_node(blocking_node)
+
+    async def main():
+        return await asyncio.gather(*(async_node({"i": i}) for i in range(4)))
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    assert time.perf_counter() - start < 0.6
+    assert all(r["done"] for r in results)
+
+
+# ==================== 비동기 도구 래퍼 테스트 ==================== #
+def test_async_tool_wrapper_sets_status():
+    """성공 / 예외 모두 tool_status와 타임라인 기록"""
+    async def ok_node(state, exp_manager=None):
+        state["final_answer"] = "정상 답변입니다. " * 10
+        return state
+
+    async def broken_node(state, exp_manager=None):
+        raise RuntimeError("boom")
+
+    ok = asyncio.run(awrap_tool_node(ok_node, "general")({"tool_timeline": []}))
+    assert ok["tool_status"] == "success"
+    assert [e["event"] for e in ok["tool_timeline"]] == ["tool_start", "tool_end"]
+
+    broken = asyncio.run(awrap_tool_node(broken_node, "glossary")({"tool_timeline": []}))
+    assert broken["tool_status"] == "error"
+    assert "boom" in broken["failure_reason"]
+
+
+# ==================== 비동기 수준별 생성 테스트 ==================== #
+def test_agenerate_levels_concurrent_with_timeout():
+    """두 수준 동시 실행, 느린 수준은 타임아웃 안내 문구"""
+    async def answer(level):
+        await asyncio.sleep(0.5 if level == "elementary" else 0.05)
+        return f"{level} 답변"
+
+    state = {"tool_timeline": []}
+    answers = asyncio.run(agenerate_levels(
+        ["elementary", "beginner"], answer, state=state, tool_name="general", primary="beginner",
+        timeout_seconds=0.2,
+    ))
+
+    assert answers["beginner"] == "beginner 답변"
+    assert "시간이 초과" in answers["elementary"]
+    assert [e["level"] for e in state["tool_timeline"]] == ["beginner", "elementary"]
+
+
+# ==================== 네이티브 비동기 도구 노드 테스트 ==================== #
+@pytest.mark.parametrize("module, tool_attr, node_name", [
+    (search_paper, "search_paper_database", "search_paper_node_async"),
+    (glossary, "search_glossary", "glossary_node_async"),
+])
+def test_tool_nodes_answer_with_ainvoke(monkeypatch, module, tool_attr, node_name):
+    """검색(블로킹)은 이벤트 루프 밖 스레드에서, 수준별 답변은 ainvoke로 생성"""
+    llm = FakeAsyncLLM()
+    search_threads = []
+
+    def fake_search(args):
+        search_threads.append(threading.current_thread().name)
+        return "[검색 결과] Transformer"
+
+    monkeypatch.setattr(module, tool_attr, SimpleNamespace(invoke=fake_search))
+    monkeypatch.setattr(module.LLMClient, "from_difficulty", staticmethod(lambda **kwargs: SimpleNamespace(llm=llm)))
+    if module is search_paper:
+        monkeypatch.setattr(module, "get_last_branch_timings", lambda: {})
+
+    state = {"question": "Transformer 설명", "difficulty": "easy", "tool_timeline": []}
+    result = asyncio.run(getattr(module, node_name)(state))
+
+    assert llm.calls == 2
+    assert set(result["final_answers"]) == {"elementary", "beginner"}
+    assert result["final_answer"] == result["final_answers"]["beginner"]
+    assert search_threads and search_threads[0].startswith("agent-blocking")
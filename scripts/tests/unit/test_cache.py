@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# ---------------------- LRUCache 단위 테스트 ---------------------- #
+"""
+src.utils.cache.LRUCache 단위 테스트
+
+테스트 항목:
+- hit/miss 통계
+- 최대 크기 초과 시 LRU 제거
+- TTL 만료
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import time                                    # TTL 대기
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest                                  # 테스트 프레임워크
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils.cache import LRUCache
+
+
+# ==================== 기본 동작 테스트 ==================== #
+# ---------------------- hit/miss 통계 테스트 ---------------------- #
+def test_hit_miss_stats():
+    """조회 결과에 따라 hit/miss 통계가 누적되는지 확인"""
+    cache = LRUCache(max_size=10)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+# ---------------------- LRU 제거 테스트 ---------------------- #
+def test_lru_eviction():
+    """최근에 사용하지 않은 항목부터 제거되는지 확인"""
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")                             # a를 최근 사용으로 갱신
+    cache.set("c", 3)                          # b 제거
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+# ---------------------- TTL 만료 테스트 ---------------------- #
+def test_ttl_expiration():
+    """TTL이 지난 항목은 미스로 처리되는지 확인"""
+    cache = LRUCache(max_size=10, ttl_seconds=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+# ---------------------- 저장 비활성화 테스트 ---------------------- #
+def test_zero_size_disables_cache():
+    """max_size=0이면 아무것도 저장하지 않는지 확인"""
+    cache = LRUCache(max_size=0)
+    cache.set("a", 1)
+    assert len(cache) == 0
@@ -7,7 +7,7 @@ project_root = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(project_root))
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
-from src.database.db import execute_query
+from src.database.db import execute_query, get_cursor, get_pool_metrics
 
 # ---------------------- PostgreSQL 버전 확인 ---------------------- #
 result = execute_query("SELECT version()", fetch=True)
@@ -15,4 +15,14 @@ print(f"PostgreSQL 버전: {result[0][0]}")
 
 # ---------------------- papers 테이블 개수 확인 ---------------------- #
 result = execute_query("SELECT COUNT(*) FROM papers", fetch=True)
-print(f"papers 테이블 레코드 수: {result[0][0]}")
\ No newline at end of file
+print(f"papers 테이블 레코드 수: {result[0][0]}")
+# ---------------------- 연결 풀 재사용 확인 ---------------------- #
+for _ in range(5):
+    with get_cursor() as cursor:
+        cursor.execute("SELECT 1")
+        assert cursor.fetchone()[0] == 1
+
+metrics = get_pool_metrics()
+print(f"연결 풀 메트릭: {metrics}")
+assert metrics["in_use"] == 0, "모든 연결이 풀에 반환되어야 함"
+assert metrics["open_connections"] <= metrics["max_connections"]
@@ -9,6 +9,7 @@ ExperimentManager 클래스 단위 테스트
 - metadata.json 업데이트
 - 평가 지표 저장
 - with 문 컨텍스트 매니저
+- 종료 시 기록 스레드 파일 핸들 해제
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
@@ -114,7 +115,8 @@ def test_folder_structure_creation():
         assert exp.outputs_dir.exists()
         assert exp.evaluation_dir.exists()
 
-        # 로그 파일 존재 확인
+        # 로그 파일 존재 확인 (비동기 기록기 반영 후)
+        exp.sync()
         assert (exp.experiment_dir / "chatbot.log").exists()
 
 
@@ -193,7 +195,8 @@ def test_metadata_update():
         assert exp.metadata['success'] is True
         assert exp.metadata['response_time_ms'] == 3250
 
-        # 파일 저장 확인
+        # 파일 저장 확인 (비동기 기록기 반영 후)
+        exp.sync()
         with open(exp.metadata_file, 'r', encoding='utf-8') as f:
             saved_meta = json.load(f)
 
@@ -345,14 +348,17 @@ def test_save_prompts():
     with ExperimentManager() as exp:
         # 시스템 프롬프트 저장
         exp.save_system_prompt("You are a helpful AI assistant.")
+        exp.sync()
         assert (exp.prompts_dir / "system_prompt.txt").exists()
 
         # 사용자 프롬프트 저장
         exp.save_user_prompt("RAG에 대해 알려줘")
+        exp.sync()
         assert (exp.prompts_dir / "user_prompt.txt").exists()
 
         # 최종 프롬프트 저장
         exp.save_final_prompt("System: ...\nUser: RAG에 대해 알려줘")
+        exp.sync()
         assert (exp.prompts_dir / "final_prompt.txt").exists()
 
 
@@ -375,7 +381,8 @@ def test_log_sql_query():
             execution_time_ms=150
         )
 
-        # 파일 존재 확인
+        # 파일 존재 확인 (비동기 기록기 반영 후)
+        exp.sync()
         queries_file = exp.database_dir / "queries.sql"
         assert queries_file.exists()
 
@@ -387,6 +394,26 @@ def test_log_sql_query():
         assert "RAG 관련 논문 검색" in content
 
 
+# ---------------------- 종료 시 파일 핸들 해제 테스트 ---------------------- #
+def test_close_releases_writer_handles():
+    """
+    종료 시 기록 스레드 파일 핸들 해제 테스트
+
+    검증 항목:
+    - queries.sql / user_interactions.log 핸들이 close 후 남지 않음
+    """
+    with ExperimentManager() as exp:
+        if exp._writer is None:
+            pytest.skip("logging.async_writer 비활성화")
+        exp.log_sql_query(query="SELECT 1", description="핸들 테스트", tool="rag_paper")
+        exp.log_ui_interaction("버튼 클릭")
+        exp.sync()
+        experiment_dir = exp.experiment_dir
+
+    open_paths = [path for path in exp._writer._files if experiment_dir in path.parents]
+    assert open_paths == []
+
+
 # ==================== with 문 컨텍스트 매니저 테스트 ==================== #
 # ---------------------- with 문 자동 종료 테스트 ---------------------- #
 def test_context_manager_with_statement():
@@ -459,6 +486,7 @@ def test_get_tool_logger():
         rag_logger = exp.get_tool_logger("rag_paper")
         rag_logger.write("RAG 도구 실행 시작")
         rag_logger.close()
+        exp.sync()
 
         # 로그 파일 존재 확인
         rag_log_file = exp.tools_dir / "rag_paper.log"
@@ -468,6 +496,7 @@ def test_get_tool_logger():
         web_logger = exp.get_tool_logger("web_search")
         web_logger.write("웹 검색 도구 실행 시작")
         web_logger.close()
+        exp.sync()
 
         # 로그 파일 존재 확인
         web_log_file = exp.tools_dir / "web_search.log"
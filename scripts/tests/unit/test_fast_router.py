@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# ---------------------- 고속 라우터 단위 테스트 ---------------------- #
+"""
+src.agent.fast_router 단위 테스트
+
+테스트 항목:
+- Aho-Corasick 오토마톤 다중 키워드 탐색
+- 패턴 매칭 결과가 기존 router_node 순회 방식과 동일한지 (Golden Dataset)
+- 패턴 미매칭 시 질문 유형 키워드 점수 / 신뢰도
+- 일반 키워드 1개 / 여러 유형에 걸친 단서로는 LLM 라우팅·분류를 생략하지 않음
+"""
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.config_loader import get_multi_request_patterns
+from src.agent.fast_router import CompiledRouter, KeywordAutomaton, get_compiled_router
+from src.prompts.loader import get_golden_questions
+
+
+# ==================== 오토마톤 테스트 ==================== #
+# ---------------------- 겹치는 키워드 탐색 테스트 ---------------------- #
+def test_automaton_finds_overlapping_keywords():
+    """접미사가 겹치는 키워드도 한 번 순회로 모두 탐색"""
+    automaton = KeywordAutomaton(["he", "she", "his", "hers", "논문", "문"])
+    assert automaton.find("ushers") == {"he", "she", "hers"}
+    assert automaton.find("RAG 논문 찾아줘") == {"논문", "문"}
+    assert automaton.find("") == set()
+
+
+# ==================== 라우팅 테스트 ==================== #
+# ---------------------- 기존 방식과 동일성 테스트 ---------------------- #
+def test_pattern_match_equals_legacy_scan():
+    """Golden Dataset 전체에서 첫 매칭 패턴이 기존 부분 문자열 스캔 결과와 동일"""
+    patterns = get_multi_request_patterns()
+    router = get_compiled_router(force_rebuild=True)
+
+    for item in get_golden_questions():
+        question = item["question"]
+        legacy = None
+        for pattern in patterns:
+            any_of = pattern.get("any_of_keywords", [])
+            if (
+                all(kw in question for kw in pattern.get("keywords", []))
+                and (not any_of or any(kw in question for kw in any_of))
+                and not any(kw in question for kw in pattern.get("exclude_keywords", []))
+            ):
+                legacy = pattern
+                break
+
+        decision = router.route(question)
+        assert decision["pattern"] is legacy, question
+
+
+# ---------------------- 키워드 점수 신뢰도 테스트 ---------------------- #
+def test_keyword_scoring_confidence():
+    """패턴이 없으면 질문 유형 키워드로 추정, 단서가 없으면 confidence 0"""
+    router = CompiledRouter(
+        patterns=[],
+        question_type_keywords={"paper_search": ["논문", "검색"], "statistics": ["통계"]},
+        confidence_threshold=0.5,
+    )
+
+    decision = router.route("GPT-4 논문 검색")
+    assert decision["method"] == "keyword"
+    assert decision["question_type"] == "paper_search"
+    assert decision["tool"] == "search_paper"
+    assert router.is_confident(decision)
+
+    # 두 유형에 걸친 단서 → 신뢰도 낮음 → LLM 위임
+    mixed = router.route("논문 통계")
+    assert not router.is_confident(mixed)
+
+    none = router.route("안녕하세요")
+    assert none["method"] == "none"
+    assert not router.is_confident(none)
+
+
+# ---------------------- 약한 키워드 단서 LLM 위임 테스트 ---------------------- #
+def test_weak_keyword_evidence_falls_through_to_llm():
+    """키워드 1개("비교") 또는 2개 vs 다른 유형 1개는 LLM 라우팅 / 질문 유형 분류로 위임"""
+    router = get_compiled_router(force_rebuild=True)
+
+    for question in [
+        "BERT와 RoBERTa의 차이점을 관련 논문들을 바탕으로 비교해줘",   # general 2 vs paper_search 1
+        "2024년 Transformer 변형 모델들의 효율성 비교",                # general 1
+        "Transformer 설명하고 관련 논문도 보여줘",                      # term_definition 1 vs paper_search 1
+    ]:
+        decision = router.route(question)
+        assert decision["method"] == "keyword", question
+        assert not router.is_confident(decision), question
+        assert not router.is_type_confident(decision), question
+
+    # 패턴이 매칭돼도 질문 유형 단서가 약하면 분류는 LLM으로
+    decision = router.route("BERT의 핵심 구조는?")
+    assert decision["method"] == "pattern" and router.is_confident(decision)
+    assert not router.is_type_confident(decision)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# ---------------------- PDF 적재 엔진 단위 테스트 ---------------------- #
+"""
+src.data.ingestion 단위 테스트 (텍스트 파일을 PDF 대신 파싱, 가짜 벡터 저장소)
+
+테스트 항목:
+- 적재 후 재실행 시 끝난 논문은 건너뛰고 실패한 논문만 다시 처리
+- 프로세스 풀 파싱 결과 / 고정 청크 ID
+- 내용이 바뀐 논문은 다시 적재하고 남는 이전 청크 삭제 (저장 실패 후 재시도 포함)
+- 체크포인트 없는 논문은 첫 저장 전에 기존 행 삭제
+- 모듈 docstring
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import ast
+import json
+from types import SimpleNamespace
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.data import ingestion
+from src.data.ingestion import IngestionCheckpoint, IngestionEngine, chunk_id
+
+
+# ==================== 테스트 유틸 ==================== #
+def parse_lines(pdf_path, metadata):
+    """한 줄 = 청크 1개 ("FAIL" 줄이 있으면 파싱 오류)"""
+    lines = open(pdf_path, encoding="utf-8").read().splitlines()
+    if "FAIL" in lines:
+        raise ValueError("손상된 PDF")
+    return [
+        SimpleNamespace(page_content=line, metadata=dict(metadata, chunk_index=i))
+        for i, line in enumerate(lines)
+    ]
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.docs = {}
+        self.calls = 0
+        self.fail = False                           # True면 저장 실패 (임베딩 API 오류 흉내)
+        self.purged = []
+
+    def add_documents(self, docs, ids):
+        if self.fail:
+            raise ConnectionError("embedding API down")
+        self.calls += 1
+        for doc, doc_id in zip(docs, ids):
+            self.docs[doc_id] = doc
+
+    def delete(self, ids):
+        for doc_id in ids:
+            self.docs.pop(doc_id, None)
+
+    def purge(self, arxiv_id, paper_id):
+        """purge_fn: arxiv_id / paper_id 메타데이터가 일치하는 청크 삭제"""
+        self.purged.append(arxiv_id)
+        stale = [
+            doc_id for doc_id, doc in self.docs.items()
+            if doc.metadata.get("arxiv_id") == arxiv_id or doc.metadata.get("paper_id") == paper_id
+        ]
+        for doc_id in stale:
+            del self.docs[doc_id]
+        return len(stale)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    pdf_dir = tmp_path / "pdfs"
+    pdf_dir.mkdir()
+    (pdf_dir / "2401.00001v1.pdf").write_text("attention\ntransformer\nencoder", encoding="utf-8")
+    (pdf_dir / "2401.00002v1.pdf").write_text("diffusion\nFAIL", encoding="utf-8")
+    (pdf_dir / "2401.00003v1.pdf").write_text("retrieval\nattention", encoding="utf-8")
+    (tmp_path / "metadata.json").write_text(json.dumps([
+        {"entry_id": "http://arxiv.org/abs/2401.00001v1", "title": "A"},
+    ]), encoding="utf-8")
+    mapping = {"2401.00001v1": 1, "2401.00002v1": 2, "2401.00003v1": 3}
+    (tmp_path / "mapping.json").write_text(json.dumps(mapping), encoding="utf-8")
+    return tmp_path
+
+
+def make_engine(corpus, store, workers=1):
+    return IngestionEngine(
+        corpus / "pdfs", corpus / "metadata.json", corpus / "mapping.json",
+        workers=workers,
+        checkpoint=IngestionCheckpoint(corpus / "checkpoints.sqlite3"),
+        vectorstore=store,
+        config={"embed_batch_size": 2, "queue_size": 1},
+        parse_fn=parse_lines,
+        purge_fn=store.purge,
+    )
+
+
+# ==================== 테스트 ==================== #
+def test_resume_skips_done_and_retries_failed(corpus):
+    """끝난 논문은 건너뛰고, 고친 실패 논문만 다시 적재"""
+    store = FakeVectorStore()
+    stats = make_engine(corpus, store).run()
+    assert (stats["parsed"], stats["embedded"], stats["failed"]) == (2, 2, 1)
+    # 논문 간 중복 청크("attention")는 한 번만 저장
+    assert (stats["chunks"], stats["chunks_saved"]) == (5, 4)
+
+    doc = store.docs[chunk_id("2401.00001v1", 1)]
+    assert (doc.page_content, doc.metadata["paper_id"], doc.metadata["title"]) == ("transformer", 1, "A")
+
+    checkpoint = IngestionCheckpoint(corpus / "checkpoints.sqlite3")
+    assert checkpoint.summary() == {"embed/done": 2, "parse/failed": 1}
+    assert "손상된 PDF" in checkpoint.failures()["2401.00002v1"]
+
+    (corpus / "pdfs" / "2401.00002v1.pdf").write_text("diffusion\nscore", encoding="utf-8")
+    stats = make_engine(corpus, store).run()
+    assert (stats["skipped"], stats["embedded"], stats["failed"]) == (2, 1, 0)
+    assert checkpoint.summary() == {"embed/done": 3}
+
+
+def test_process_pool_matches_sequential(corpus):
+    """프로세스 풀 파싱도 같은 청크 저장 (논문 간 중복 청크는 먼저 끝난 논문 쪽에 남음)"""
+    sequential, pooled = FakeVectorStore(), FakeVectorStore()
+    make_engine(corpus, sequential).run(force=True)
+    (corpus / "checkpoints.sqlite3").unlink()
+    stats = make_engine(corpus, pooled, workers=2).run()
+
+    assert stats["workers"] == 2
+    assert len(pooled.docs) == len(sequential.docs) == 4
+    assert chunk_id("2401.00001v1", 1) in pooled.docs
+    assert {d.page_content for d in pooled.docs.values()} == {d.page_content for d in sequential.docs.values()}
+
+
+def test_changed_paper_replaces_stale_chunks(corpus):
+    """내용이 바뀌어 청크 수가 줄면 이전 청크 삭제"""
+    store = FakeVectorStore()
+    make_engine(corpus, store).run()
+    assert chunk_id("2401.00001v1", 2) in store.docs
+
+    (corpus / "pdfs" / "2401.00001v1.pdf").write_text("attention v2", encoding="utf-8")
+    stats = make_engine(corpus, store).run()
+    assert stats["embedded"] == 1
+    assert chunk_id("2401.00001v1", 2) not in store.docs
+    assert store.docs[chunk_id("2401.00001v1", 0)].page_content == "attention v2"
+
+    # parse_only는 저장 / 체크포인트 없이 파싱만
+    assert make_engine(corpus, store).run(force=True, parse_only=True)["embedded"] == 0
+
+
+def test_stale_chunks_removed_after_failed_embed_retry(corpus):
+    """청크 수가 줄어든 뒤 저장이 실패해도, 재시도 때 이전 청크 수 기준으로 남는 청크 삭제"""
+    store = FakeVectorStore()
+    make_engine(corpus, store).run()
+
+    (corpus / "pdfs" / "2401.00001v1.pdf").write_text("attention v2", encoding="utf-8")
+    store.fail = True
+    make_engine(corpus, store).run()
+    checkpoint = IngestionCheckpoint(corpus / "checkpoints.sqlite3").get("2401.00001v1")
+    assert (checkpoint["stage"], checkpoint["status"], checkpoint["chunks"]) == ("embed", "failed", 3)
+
+    store.fail = False
+    make_engine(corpus, store).run()
+    assert chunk_id("2401.00001v1", 1) not in store.docs
+    assert chunk_id("2401.00001v1", 2) not in store.docs
+    assert store.docs[chunk_id("2401.00001v1", 0)].page_content == "attention v2"
+
+
+def test_first_save_purges_rows_without_checkpoint(corpus):
+    """체크포인트 없는 논문은 이전 방식(임의 ID)으로 저장된 행을 지우고 저장, 이후 실행에서는 삭제 안 함"""
+    store = FakeVectorStore()
+    store.docs["legacy-uuid"] = SimpleNamespace(page_content="attention", metadata={"paper_id": 1})
+    make_engine(corpus, store).run()
+
+    assert "legacy-uuid" not in store.docs
+    assert store.purged == ["2401.00001v1", "2401.00003v1"]
+    assert len(store.docs) == 4
+
+    # 파싱 실패로 저장된 적 없던 논문만 첫 저장 전에 삭제
+    store.purged.clear()
+    (corpus / "pdfs" / "2401.00002v1.pdf").write_text("diffusion\nscore", encoding="utf-8")
+    make_engine(corpus, store).run(force=True)
+    assert store.purged == ["2401.00002v1"]
+
+
+def test_module_docstring():
+    """from __future__보다 docstring이 먼저 → 모듈 docstring으로 인식"""
+    tree = ast.parse(open(ingestion.__file__, encoding="utf-8").read())
+    assert ast.get_docstring(tree).startswith("병렬 · 재개 가능한 논문 PDF 적재 엔진")
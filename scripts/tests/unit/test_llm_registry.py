@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# ---------------------- LLM 레지스트리 단위 테스트 ---------------------- #
+"""
+src.llm.registry 단위 테스트 (API 호출 없이 모델 생성 함수 대체)
+
+테스트 항목:
+- 같은 (provider, model, temperature, streaming) 키는 같은 인스턴스
+- 호출 통계 (호출 수 / 오류 수 / 지연 시간)
+- 설정 YAML은 파일이 바뀌지 않으면 재파싱하지 않음 (복사본 반환)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import os
+import uuid
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.llm.registry import LLMCallStats, LLMRegistry
+from src.utils.config_loader import ConfigLoader
+
+
+# ==================== 인스턴스 공유 테스트 ==================== #
+def test_registry_reuses_instances(monkeypatch):
+    """같은 키는 한 번만 생성, 온도 / 스트리밍이 다르면 별도 인스턴스"""
+    created = []
+
+    def fake_create(self, provider, model, temperature, streaming, stats):
+        created.append((provider, model, temperature, streaming))
+        return object()
+
+    monkeypatch.setattr(LLMRegistry, "_create", fake_create)
+    registry = LLMRegistry(config={})
+
+    first = registry.get("solar", "solar-pro2", 0.7)
+    assert registry.get("solar", "solar-pro2", 0.7) is first
+    assert registry.get("solar", "solar-pro2", 0.0) is not first
+    assert registry.get("openai", "gpt-5", 0.7) is not first
+
+    assert created == [
+        ("solar", "solar-pro2", 0.7, True),
+        ("solar", "solar-pro2", 0.0, True),
+        ("openai", "gpt-5", 0.7, False),        # GPT-5는 스트리밍 미사용
+    ]
+    assert len(registry) == 3
+    assert set(registry.stats()) == {
+        "solar:solar-pro2(t=0.7, stream=True)",
+        "solar:solar-pro2(t=0.0, stream=True)",
+        "openai:gpt-5(t=0.7, stream=False)",
+    }
+
+
+# ==================== 호출 통계 테스트 ==================== #
+def test_call_stats_counts_calls_and_errors():
+    """start → end / error 쌍으로 호출 수와 오류 수 집계"""
+    stats = LLMCallStats()
+    ok, failed = uuid.uuid4(), uuid.uuid4()
+
+    stats.on_chat_model_start({}, [], run_id=ok)
+    stats.on_llm_end(None, run_id=ok)
+    stats.on_chat_model_start({}, [], run_id=failed)
+    stats.on_llm_error(RuntimeError("boom"), run_id=failed)
+    stats.on_llm_end(None, run_id=uuid.uuid4())    # 시작 기록 없는 run은 무시
+
+    snapshot = stats.snapshot()
+    assert snapshot["calls"] == 2
+    assert snapshot["errors"] == 1
+    assert snapshot["avg_latency_ms"] >= 0.0
+
+
+# ==================== 설정 캐시 테스트 ==================== #
+def test_config_loader_caches_until_file_changes(tmp_path):
+    """수정 시각이 같으면 캐시 사용, 반환값 수정은 캐시에 영향 없음"""
+    path = tmp_path / "model_config.yaml"
+    path.write_text("llm:\n  model: a\n", encoding="utf-8")
+    loader = ConfigLoader(config_dir=str(tmp_path))
+
+    config = loader.load_model_config()
+    config["llm"]["model"] = "changed"
+    assert loader.load_model_config()["llm"]["model"] == "a"
+
+    path.write_text("llm:\n  model: b\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert loader.load_model_config()["llm"]["model"] == "b"
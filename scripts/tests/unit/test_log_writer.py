@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# ---------------------- 비동기 로그 기록기 단위 테스트 ---------------------- #
+"""
+src.utils.log_writer / src.utils.logger 단위 테스트
+
+테스트 항목:
+- 기록 스레드가 순서대로 추가 / 전체 기록 처리, sync() 후 파일 반영
+- 대기열이 가득 차면 대기하지 않고 버림 (dropped)
+- Logger 수준 필터 (level 미만 메시지는 기록 안 함, print_error는 항상 기록)
+- Logger close() 이후 기록은 무시 (기록 스레드가 파일을 다시 열지 않음)
+- 잘못된 durability 설정 거부
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import time
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils import logger as logger_module
+from src.utils.log_writer import AsyncLogWriter
+from src.utils.logger import Logger
+
+
+# ==================== 기록기 테스트 ==================== #
+def test_writer_appends_in_order_and_syncs(tmp_path):
+    """추가 기록은 순서대로, write()는 파일 전체 교체, sync() 후 모두 반영"""
+    writer = AsyncLogWriter(flush_interval=10.0, durability="fsync")
+    log_path = tmp_path / "nested" / "chatbot.log"
+
+    for i in range(500):
+        writer.append(log_path, f"line {i}\n")
+    writer.write(tmp_path / "prompt.txt", "첫 번째")
+    writer.write(tmp_path / "prompt.txt", "두 번째")
+
+    assert writer.sync(timeout=5)
+    assert log_path.read_text(encoding="utf-8").splitlines() == [f"line {i}" for i in range(500)]
+    assert (tmp_path / "prompt.txt").read_text(encoding="utf-8") == "두 번째"
+
+    stats = writer.stats()
+    assert stats["records"] == 502
+    assert stats["batches"] < 502                   # 묶음 단위 처리
+    writer.shutdown()
+
+
+def test_writer_drops_instead_of_blocking(tmp_path):
+    """대기열이 가득 차면 요청 스레드는 기다리지 않고 버린 수를 집계"""
+    writer = AsyncLogWriter(flush_interval=10.0, max_queue_size=1, batch_size=1)
+    writer._thread.join(0)                          # 기록 스레드는 정상 동작 중
+    start = time.perf_counter()
+    for i in range(2000):
+        writer.append(tmp_path / "busy.log", f"{i}\n")
+    assert time.perf_counter() - start < 1.0
+
+    writer.sync(timeout=5)
+    stats = writer.stats()
+    assert stats["records"] + stats["dropped"] == 2000
+    writer.shutdown()
+
+
+def test_invalid_durability_rejected():
+    """지원하지 않는 durability는 ValueError"""
+    with pytest.raises(ValueError):
+        AsyncLogWriter(durability="always")
+
+
+# ==================== Logger 테스트 ==================== #
+def test_logger_level_filter(tmp_path):
+    """INFO 수준 Logger는 DEBUG 메시지를 버리고, print_error는 항상 기록"""
+    logger = Logger(str(tmp_path / "tool.log"), print_also=False, level="INFO")
+    logger.write("디버깅 상세", level="DEBUG")
+    logger.write("도구 실행")
+    logger.write("실패", print_error=True, level="DEBUG")
+    logger.close()
+    logger.sync()
+
+    lines = (tmp_path / "tool.log").read_text(encoding="utf-8").splitlines()
+    assert [line.split(" | ", 1)[1] for line in lines] == ["도구 실행", "실패"]
+
+
+def test_logger_ignores_writes_after_close(tmp_path, monkeypatch):
+    """닫힌 Logger의 기록은 큐에 넣지 않음 → 기록 스레드에 열린 파일 핸들이 남지 않음"""
+    writer = AsyncLogWriter(flush_interval=10.0)
+    monkeypatch.setattr(logger_module, "get_log_writer", lambda: writer)
+
+    for i in range(3):
+        logger = Logger(str(tmp_path / "summarize.log"), print_also=False)
+        logger.write(f"실행 {i}")
+        logger.close()
+        logger.write("닫힌 뒤 기록")
+
+    assert writer.sync(timeout=5)
+    assert writer._files == {}
+    lines = (tmp_path / "summarize.log").read_text(encoding="utf-8").splitlines()
+    assert [line.split(" | ", 1)[1] for line in lines] == ["실행 0", "실행 1", "실행 2"]
+    writer.shutdown()
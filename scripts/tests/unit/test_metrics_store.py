@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# ---------------------- 실험 지표 저장소 단위 테스트 ---------------------- #
+"""
+src.utils.metrics_store 단위 테스트 (임시 폴더의 SQLite 파일 사용)
+
+테스트 항목:
+- flat / nested 지표 이름 정규화
+- 기간 집계 (평균 / 합계 / 백분위수) + 같은 세션 덮어쓰기
+- 요청 집계 (응답 시간 백분위수 / 도구 분포 / 성공률) + 조건 검색
+- 기존 실험 폴더 적재 (import_experiments)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import json
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils.metrics_store import MetricsStore, normalize_metrics, request_row
+
+
+# ==================== 테스트 유틸 ==================== #
+@pytest.fixture
+def store(tmp_path):
+    metrics_store = MetricsStore(str(tmp_path / "metrics.sqlite3"), batch_size=7)
+    yield metrics_store
+    metrics_store.close()
+
+
+# ==================== 테스트 ==================== #
+def test_normalize_flat_and_nested():
+    """nested 경로는 표준 이름으로, 나머지 숫자 값은 평탄화 경로로 기록"""
+    nested = normalize_metrics("rag", {
+        "retrieval_metrics": {"recall_at_5": 0.8, "mrr": 0.5},
+        "generation_metrics": {"faithfulness": 0.9},
+        "timestamp": "2026-10-18T10:00:00",
+    })
+    assert nested == {"recall_at_5": 0.8, "faithfulness": 0.9, "retrieval_metrics.mrr": 0.5}
+
+    decision = normalize_metrics("agent_accuracy", {"routing_decision": {"correct": False, "confidence": 0.4}})
+    assert decision == {"correct_decisions": 0.0, "incorrect_decisions": 1.0, "average_confidence": 0.4}
+
+
+def test_aggregate_metrics_over_date_range(store):
+    """기간 안의 세션만 집계, 같은 세션 / 지표는 덮어씀"""
+    for day, key, total in [("20261016", "s1", 1000), ("20261017", "s2", 2000),
+                            ("20261018", "s3", 3000), ("20261019", "s4", 9000)]:
+        store.record_metrics(key, "latency", {"total_time_ms": total, "routing_time_ms": 100}, date=day)
+        store.record_metrics(key, "cost", {"llm_usage": {"total_tokens": 100}, "cost_usd": 0.01}, date=day)
+    store.record_metrics("s3", "latency", {"total_time_ms": 4000}, date="20261018")
+    assert store.flush()
+
+    latency = store.aggregate_metrics("latency", "20261016", "20261018")
+    assert latency["total_sessions"] == 3
+    assert latency["total_time_ms"]["count"] == 3
+    assert latency["total_time_ms"]["mean"] == pytest.approx(7000 / 3)
+    assert (latency["total_time_ms"]["p50"], latency["total_time_ms"]["p99"]) == (2000, 4000)
+
+    cost = store.aggregate_metrics("cost", "20261016", "20261019")
+    assert cost["total_tokens"]["sum"] == 400
+    assert store.aggregate_metrics("rag", "20261016", "20261019") == {}
+
+
+def test_aggregate_and_find_requests(store):
+    """응답 시간 백분위수 / 도구 분포 / 성공률 + 조건 검색"""
+    for i in range(10):
+        store.record_request(request_row(f"req{i}", {
+            "date": "20261018",
+            "start_time": f"2026-10-18T10:00:{i:02d}",
+            "difficulty": "easy" if i % 2 else "hard",
+            "tool_used": "search_paper" if i < 6 else "glossary",
+            "success": i != 9,
+            "response_time_ms": (i + 1) * 100,
+            "tokens_used": {"total": 10},
+        }, "request"))
+    assert store.flush()
+
+    summary = store.aggregate_requests("20261018")
+    assert (summary["total"], summary["successes"], summary["failures"]) == (10, 9, 1)
+    assert summary["total_tokens"] == 100
+    assert summary["response_time_ms"]["p50"] == 600
+    assert summary["response_time_ms"]["p95"] == 1000
+    assert summary["tools"]["search_paper"]["count"] == 6
+    assert summary["tools"]["glossary"]["success_rate"] == pytest.approx(0.75)
+    assert summary["difficulties"] == {"easy": 5, "hard": 5}
+
+    rows = store.find_requests("20261018", tool="glossary", success=True, max_response_time=800)
+    assert [r["key"] for r in rows] == ["req6", "req7"]
+    assert store.find_requests("20261017") == []
+
+
+def test_import_experiments(store, tmp_path):
+    """기존 세션 폴더 적재 (여러 번 실행해도 중복 없음)"""
+    session = tmp_path / "experiments" / "20261018" / "20261018_100000_session_001"
+    (session / "evaluation").mkdir(parents=True)
+    (session / "metadata.json").write_text(json.dumps({
+        "start_time": "2026-10-18T10:00:00", "tool_used": "web_search", "success": True, "response_time_ms": 1500,
+    }), encoding="utf-8")
+    (session / "evaluation" / "rag_metrics.json").write_text(json.dumps({"recall_at_5": 0.7}), encoding="utf-8")
+
+    for _ in range(2):
+        assert store.import_experiments(str(tmp_path / "experiments")) == 1
+
+    rows = store.find_requests("20261018")
+    assert len(rows) == 1 and rows[0]["path"] == str(session)
+    assert store.aggregate_metrics("rag", "20261018")["recall_at_5"]["mean"] == pytest.approx(0.7)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# ---------------------- 수준별 답변 동시 생성 단위 테스트 ---------------------- #
+"""
+src.tools.multi_level 단위 테스트 (LLM 호출 없이 sleep 함수 사용)
+
+테스트 항목:
+- 두 수준 동시 실행 (총 소요 시간 ≈ 가장 느린 수준)
+- 주 수준 결과 먼저 반환, 반환 딕셔너리는 수준 순서 유지
+- 수준별 타임아웃 / tool_timeline 기록
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import time
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.tools.multi_level import generate_levels, iter_level_results
+
+
+# ==================== 테스트 유틸 ==================== #
+def sleepy(delays):
+    """수준별 지연 후 '{level} 답변' 반환"""
+    def fn(level):
+        time.sleep(delays[level])
+        return f"{level} 답변"
+    return fn
+
+
+# ==================== 동시 실행 테스트 ==================== #
+def test_levels_run_concurrently_primary_first():
+    """주 수준 먼저 반환, 총 시간은 순차 실행보다 짧음"""
+    started = time.perf_counter()
+    results = list(iter_level_results(
+        ["elementary", "beginner"], sleepy({"elementary": 0.3, "beginner": 0.3}), primary="beginner"
+    ))
+    elapsed = time.perf_counter() - started
+
+    assert [r["level"] for r in results] == ["beginner", "elementary"]
+    assert all(r["status"] == "success" for r in results)
+    assert elapsed < 0.55
+
+
+def test_generate_levels_timeout_and_timeline():
+    """느린 수준은 타임아웃 안내 문구, 타임라인에 수준별 이벤트 기록"""
+    state = {"tool_timeline": []}
+    answers = generate_levels(
+        ["intermediate", "advanced"],
+        sleepy({"intermediate": 0.5, "advanced": 0.0}),
+        state=state,
+        tool_name="general",
+        primary="advanced",
+        timeout_seconds=0.2,
+    )
+
+    assert list(answers) == ["intermediate", "advanced"]
+    assert answers["advanced"] == "advanced 답변"
+    assert "시간이 초과" in answers["intermediate"]
+    assert [(e["level"], e["status"]) for e in state["tool_timeline"]] == [
+        ("advanced", "success"),
+        ("intermediate", "timeout"),
+    ]
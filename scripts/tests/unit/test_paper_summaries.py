@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# ---------------------- 논문 요약 저장소 단위 테스트 ---------------------- #
+"""
+src.utils.paper_summaries 단위 테스트 (DB / LLM 호출 없이 저장 함수 대체)
+
+테스트 항목:
+- 저장된 요약 적중 시 LLM 미호출
+- 미스 시 생성 후 저장 (lazy fill)
+- 사전 생성 시 이미 있는 수준 건너뜀
+"""
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils import paper_summaries
+
+
+# ==================== 테스트 유틸 ==================== #
+PAPER = {"paper_id": 1, "title": "Attention Is All You Need", "authors": "Vaswani", "abstract": "", "publish_date": None}
+
+
+class FakeDoc:
+    def __init__(self, text):
+        self.page_content = text
+
+
+def patch_store(monkeypatch, stored):
+    """저장소 / 청크 조회 / 요약 생성 대체 → 호출 기록 반환"""
+    calls = {"generate": [], "chunks": 0}
+
+    def fake_generate(paper, level, docs=None, logger=None, on_prompt=None):
+        calls["generate"].append(level)
+        stored[(paper["paper_id"], level)] = f"{level} 요약"
+        return stored[(paper["paper_id"], level)]
+
+    def fake_chunks(paper_id, collection_name="paper_chunks", limit=None):
+        calls["chunks"] += 1
+        return [FakeDoc("chunk 0"), FakeDoc("chunk 1")]
+
+    monkeypatch.setattr(paper_summaries, "get_stored_summary", lambda pid, level: stored.get((pid, level)))
+    monkeypatch.setattr(paper_summaries, "generate_summary", fake_generate)
+    monkeypatch.setattr(paper_summaries, "get_paper_chunks", fake_chunks)
+    monkeypatch.setattr(paper_summaries, "fetch_paper", lambda pid: dict(PAPER, paper_id=pid))
+    return calls
+
+
+# ==================== 조회 / lazy fill 테스트 ==================== #
+def test_get_or_create_hit_and_fill(monkeypatch):
+    """적중 시 저장된 요약 반환, 미스 시 생성"""
+    stored = {(1, "beginner"): "저장된 요약"}
+    calls = patch_store(monkeypatch, stored)
+
+    assert paper_summaries.get_or_create_summary(PAPER, "beginner") == ("저장된 요약", True)
+    assert paper_summaries.get_or_create_summary(PAPER, "advanced") == ("advanced 요약", False)
+    assert calls["generate"] == ["advanced"]
+
+
+# ==================== 사전 생성 테스트 ==================== #
+def test_precompute_skips_existing_levels(monkeypatch):
+    """이미 있는 수준은 건너뛰고 청크는 한 번만 조회"""
+    stored = {(1, "elementary"): "기존"}
+    calls = patch_store(monkeypatch, stored)
+
+    created = paper_summaries.precompute_paper_summaries(1, levels=["elementary", "beginner", "advanced"])
+    assert created == 2
+    assert calls["generate"] == ["beginner", "advanced"]
+    assert calls["chunks"] == 1
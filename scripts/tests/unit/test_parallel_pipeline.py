@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# ---------------------- 파이프라인 병렬 실행 단위 테스트 ---------------------- #
+"""
+src.agent.parallel_pipeline 단위 테스트 (LangGraph / LLM 없이 가짜 도구 노드 사용)
+
+테스트 항목:
+- depends_on 기반 독립 도구 묶음 계산
+- 묶음 동시 실행 + 파이프라인 순서대로 결과 병합 (순차 실행과 같은 최종 상태)
+- 실패한 도구까지만 병합 (Fallback 대상 위치)
+- 마지막 도구만 답변 토큰 스트리밍
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import time
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.parallel_pipeline import (
+    PARALLEL_NODE,
+    make_parallel_node,
+    parallel_group,
+    route_tool_or_parallel,
+)
+from src.agent.streaming import ANSWER_STREAM_TAG, answer_stream_config
+
+
+# ==================== 테스트 유틸 ==================== #
+def fake_tool(name, delay=0.1, status="success", seen_tags=None):
+    """tool_result / final_answer를 쓰고 타임라인 이벤트를 남기는 가짜 도구 노드"""
+    def node(state):
+        if seen_tags is not None:
+            seen_tags[name] = answer_stream_config("beginner")["tags"]
+        time.sleep(delay)
+        state["tool_status"] = status
+        state["tool_result"] = f"{name} 결과"
+        state["final_answer"] = f"{name} 답변"
+        state.setdefault("tool_timeline", []).append({"event": "tool_end", "tool": name})
+        return state
+    return node
+
+
+class AsyncNode:
+    """ainvoke만 있는 가짜 비동기 노드"""
+
+    def __init__(self, name, delay=0.1):
+        self.name = name
+        self.delay = delay
+
+    async def ainvoke(self, state):
+        await asyncio.sleep(self.delay)
+        state["tool_status"] = "success"
+        state["final_answer"] = f"{self.name} 답변"
+        state["tool_timeline"].append({"event": "tool_end", "tool": self.name})
+        return state
+
+
+def pipeline_state(tools, dependencies):
+    return {
+        "question": "RAG가 뭐야? 관련 논문도 보여줘",
+        "tool_pipeline": list(tools),
+        "tool_choice": tools[0],
+        "pipeline_index": 1,
+        "pipeline_dependencies": dependencies,
+        "tool_timeline": [{"event": "routing"}],
+    }
+
+
+# ==================== 묶음 계산 테스트 ==================== #
+def test_parallel_group_respects_dependencies():
+    """의존 도구를 만나면 묶음 종료, depends_on 미선언(None)은 순차"""
+    tools = ["search_paper", "general", "save_file"]
+    dependencies = {"save_file": ["search_paper", "general"]}
+
+    assert parallel_group(tools, 0, dependencies, 4) == ["search_paper", "general"]
+    assert parallel_group(tools, 2, dependencies, 4) == ["save_file"]
+    assert parallel_group(tools, 0, None, 4) == ["search_paper"]
+    assert parallel_group(tools, 0, {}, 2) == ["search_paper", "general"]
+    assert parallel_group(tools, 3, {}, 4) == []
+
+
+def test_route_tool_or_parallel():
+    """묶음이 2개 이상일 때만 병렬 노드로 라우팅"""
+    state = pipeline_state(["glossary", "search_paper"], {})
+    assert route_tool_or_parallel(state, "glossary") == PARALLEL_NODE
+
+    state["pipeline_dependencies"] = None
+    assert route_tool_or_parallel(state, "glossary") == "glossary"
+
+
+# ==================== 병렬 실행 / 병합 테스트 ==================== #
+def test_parallel_node_runs_concurrently_and_merges_in_order():
+    """두 도구가 동시에 실행되고, 마지막 도구 결과가 final_answer로 남음"""
+    seen_tags = {}
+    parallel_tools, _ = make_parallel_node({
+        "glossary": fake_tool("glossary", delay=0.2, seen_tags=seen_tags),
+        "search_paper": fake_tool("search_paper", delay=0.2, seen_tags=seen_tags),
+    })
+    state = pipeline_state(["glossary", "search_paper"], {})
+
+    start = time.perf_counter()
+    result = parallel_tools(state)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.35                       # 순차 실행이면 0.4초 이상
+    assert result["final_answer"] == "search_paper 답변"
+    assert result["tool_choice"] == "search_paper"
+    assert result["pipeline_index"] == 2
+    assert [e.get("tool") for e in result["tool_timeline"][1:3]] == ["glossary", "search_paper"]
+    assert result["tool_timeline"][-1]["event"] == "pipeline_parallel"
+
+    # 마지막 도구만 답변 토큰 태그 유지
+    assert ANSWER_STREAM_TAG in seen_tags["search_paper"]
+    assert seen_tags["glossary"] == []
+
+
+def test_parallel_node_stops_merge_at_failed_tool():
+    """실패한 도구까지만 병합, pipeline_index는 실패한 도구 다음 (Fallback 대상)"""
+    parallel_tools, _ = make_parallel_node({
+        "glossary": fake_tool("glossary", status="failed"),
+        "search_paper": fake_tool("search_paper"),
+    })
+    result = parallel_tools(pipeline_state(["glossary", "search_paper"], {}))
+
+    assert result["tool_status"] == "failed"
+    assert result["tool_choice"] == "glossary"
+    assert result["pipeline_index"] == 1
+    assert result["final_answer"] == "glossary 답변"
+    assert result["tool_timeline"][-1]["merged_tools"] == ["glossary"]
+
+
+def test_async_parallel_node():
+    """비동기 노드는 이벤트 루프에서 동시 실행"""
+    _, parallel_tools_async = make_parallel_node({
+        "glossary": AsyncNode("glossary", delay=0.2),
+        "general": AsyncNode("general", delay=0.2),
+    })
+    state = pipeline_state(["glossary", "general"], {})
+
+    start = time.perf_counter()
+    result = asyncio.run(parallel_tools_async(state))
+
+    assert time.perf_counter() - start < 0.35
+    assert result["final_answer"] == "general 답변"
+    assert result["pipeline_index"] == 2
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# ---------------------- 질문 분류 캐시 단위 테스트 ---------------------- #
+"""
+src.agent.question_classifier.QuestionClassifier 캐시 단위 테스트
+
+테스트 항목:
+- 질문 정규화 (공백/대소문자/끝 문장부호)
+- 인메모리 LRU 크기 제한
+- 영구 저장소 공유 (다른 인스턴스에서 LLM 호출 없이 적중)
+- 적중률 통계
+"""
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent import question_classifier
+from src.agent.question_classifier import (
+    QuestionClassifier,
+    SQLiteClassificationStore,
+    normalize_question,
+)
+
+
+# ==================== 테스트 유틸 ==================== #
+class FakeLLM:
+    """고정 응답 LLM (호출 횟수 기록)"""
+
+    def __init__(self, answer="term_definition"):
+        self.answer = answer
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return type("Response", (), {"content": self.answer})()
+
+
+def patch_llm(monkeypatch, llm):
+    """LLMClient.from_difficulty → FakeLLM 래퍼 반환"""
+    client = type("Client", (), {"llm": llm})()
+    monkeypatch.setattr(
+        question_classifier.LLMClient, "from_difficulty",
+        staticmethod(lambda difficulty, logger=None: client),
+    )
+
+
+# ==================== 정규화 테스트 ==================== #
+def test_normalize_question():
+    """공백/대소문자/끝 문장부호 차이는 같은 키"""
+    assert normalize_question("  Transformer  란 ?") == normalize_question("transformer 란")
+    assert normalize_question("BLEU가 뭐야?!") == "bleu가 뭐야"
+
+
+# ==================== 인메모리 캐시 테스트 ==================== #
+def test_memory_cache_is_bounded(monkeypatch):
+    """max_size 초과 시 LRU 제거, 정규화된 질문은 재호출 없음"""
+    llm = FakeLLM()
+    patch_llm(monkeypatch, llm)
+    classifier = QuestionClassifier(max_size=2)
+
+    classifier.classify("Transformer란?")
+    classifier.classify("transformer란")
+    assert llm.calls == 1
+
+    classifier.classify("BLEU란?")
+    classifier.classify("Attention이란?")
+    assert classifier.get_cache_size() == 2
+
+    stats = classifier.get_cache_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["llm_calls"] == 3
+    assert stats["hit_rate"] == 0.25
+
+
+# ==================== 영구 저장소 테스트 ==================== #
+def test_persistent_store_shared(monkeypatch, tmp_path):
+    """다른 인스턴스(워커)가 저장한 결과를 LLM 호출 없이 재사용"""
+    llm = FakeLLM("paper_search")
+    patch_llm(monkeypatch, llm)
+    path = tmp_path / "classifications.sqlite"
+
+    first = QuestionClassifier(store=SQLiteClassificationStore(str(path)))
+    assert first.classify("RAG 논문 찾아줘") == "paper_search"
+
+    second = QuestionClassifier(store=SQLiteClassificationStore(str(path)))
+    assert second.classify("rag 논문 찾아줘?") == "paper_search"
+    assert llm.calls == 1
+    assert second.get_cache_stats()["persistent_hits"] == 1
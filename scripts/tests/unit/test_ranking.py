@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# ---------------------- 순위 결합 단위 테스트 ---------------------- #
+"""
+src.rag.ranking 단위 테스트
+
+테스트 항목:
+- min-max / z-score 정규화
+- RRF 결합 (순위만 사용)
+- 거리(낮을수록 좋음) + 키워드 점수(높을수록 좋음) 결합
+- 점수 없는 브랜치의 순위 기반 처리
+"""
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest                                  # 테스트 프레임워크
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.rag.ranking import (
+    fuse,
+    minmax_normalize,
+    reciprocal_rank_fusion,
+    zscore_normalize,
+)
+
+
+# ==================== 정규화 테스트 ==================== #
+# ---------------------- min-max 정규화 테스트 ---------------------- #
+def test_minmax_normalize():
+    """최솟값 0, 최댓값 1로 변환되고 동점만 있으면 1.0인지 확인"""
+    assert minmax_normalize({"a": 2.0, "b": 4.0, "c": 3.0}) == {"a": 0.0, "b": 1.0, "c": 0.5}
+    assert minmax_normalize({"a": 5.0, "b": 5.0}) == {"a": 1.0, "b": 1.0}
+    assert minmax_normalize({}) == {}
+
+
+# ---------------------- z-score 정규화 테스트 ---------------------- #
+def test_zscore_normalize():
+    """평균 0 / 표준편차 1로 변환되는지 확인"""
+    norm = zscore_normalize({"a": 1.0, "b": 3.0})
+    assert norm["a"] == pytest.approx(-1.0)
+    assert norm["b"] == pytest.approx(1.0)
+    assert zscore_normalize({"a": 2.0, "b": 2.0}) == {"a": 0.0, "b": 0.0}
+
+
+# ==================== 결합 테스트 ==================== #
+# ---------------------- RRF 테스트 ---------------------- #
+def test_rrf_prefers_documents_in_both_branches():
+    """두 브랜치 모두에 등장한 문서가 한쪽 1위보다 앞서는지 확인"""
+    fused = reciprocal_rank_fusion(
+        {
+            "vector": [("a", 0.1), ("b", 0.2), ("c", 0.3)],
+            "keyword": [("b", 0.9), ("d", 0.8)],
+        },
+        higher_is_better={"vector": False, "keyword": True},
+        k=60,
+    )
+    keys = [key for key, _ in fused]
+    assert keys[0] == "b"
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+# ---------------------- 거리 + 키워드 점수 결합 테스트 ---------------------- #
+@pytest.mark.parametrize("method", ["minmax", "zscore"])
+def test_distance_and_keyword_scores(method):
+    """벡터 거리는 낮을수록, 키워드 점수는 높을수록 상위가 되는지 확인"""
+    fused = fuse(
+        {
+            "vector": [(1, 0.2), (1, 0.1), (2, 0.4), (3, 0.8)],   # 같은 논문 여러 청크 → 최소 거리
+            "keyword": [(3, 0.9), (4, 0.5)],
+        },
+        method=method,
+        weights={"vector": 0.7, "keyword": 0.3},
+        higher_is_better={"vector": False, "keyword": True},
+    )
+    keys = [key for key, _ in fused]
+    assert keys[0] == 1
+    assert sorted(keys) == [1, 2, 3, 4]
+
+
+# ---------------------- 점수 없는 브랜치 테스트 ---------------------- #
+def test_unscored_branch_uses_rank():
+    """점수가 None이면 입력 순서대로 순위가 매겨져 0점이 되지 않는지 확인"""
+    fused = dict(fuse({"vector": [("a", None), ("b", None), ("c", None)]}, method="minmax"))
+    assert fused["a"] > fused["b"] > fused["c"]
+    assert fused["a"] == pytest.approx(1.0)
+
+
+# ---------------------- 잘못된 방식 테스트 ---------------------- #
+def test_unknown_method_raises():
+    """지원하지 않는 결합 방식이면 ValueError"""
+    with pytest.raises(ValueError):
+        fuse({"vector": [("a", 0.1)]}, method="borda")
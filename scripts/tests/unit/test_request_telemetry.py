@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# ---------------------- 요청 단위 텔레메트리 단위 테스트 ---------------------- #
+"""
+src.utils.request_telemetry 단위 테스트 (임시 폴더 사용)
+
+테스트 항목:
+- 동시 요청의 메타데이터 / 로그 분리 (request_id 접두어)
+- 요청 종료 시 requests.jsonl / rollup.json 집계
+- 요청별 기록 리스트 상한
+- 재시작 시 기존 rollup.json 이어서 집계
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import json
+import threading
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils.request_telemetry import (
+    DEFAULT_TELEMETRY_CONFIG,
+    DailyRollup,
+    TelemetryManager,
+    current_request_id,
+    request_scope,
+)
+
+
+# ==================== 테스트 유틸 ==================== #
+@pytest.fixture
+def manager(tmp_path):
+    """임시 폴더에 기록하는 TelemetryManager"""
+    telemetry = TelemetryManager({
+        **DEFAULT_TELEMETRY_CONFIG,
+        "base_dir": str(tmp_path),
+        "max_records_per_request": 3,
+        "rollup_interval_seconds": 60,
+    })
+    yield telemetry
+    telemetry.close()
+
+
+def telemetry_dir(manager):
+    return manager.current().experiment_dir
+
+
+# ==================== 테스트 ==================== #
+def test_concurrent_requests_are_isolated(manager):
+    """스레드마다 다른 요청 컨텍스트, 공유 객체 API는 현재 요청으로 위임"""
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def handle(question, tool):
+        with request_scope(manager, difficulty="easy") as context:
+            manager.update_metadata(user_query=question)
+            barrier.wait()
+            manager.logger.write(f"질문: {question}")
+            manager.update_metadata(tool_used=tool, success=True, response_time_ms=120)
+            seen[question] = (context.request_id, dict(manager.metadata), current_request_id())
+
+    threads = [threading.Thread(target=handle, args=args) for args in (("RAG?", "glossary"), ("논문?", "search_paper"))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen["RAG?"][1]["tool_used"] == "glossary"
+    assert seen["논문?"][1]["tool_used"] == "search_paper"
+    assert seen["RAG?"][0] == seen["RAG?"][2] != seen["논문?"][0]
+    assert current_request_id() is None
+
+    manager.sync()
+    log = (telemetry_dir(manager) / "chatbot.log").read_text(encoding="utf-8")
+    assert f"[{seen['RAG?'][0]}] 질문: RAG?" in log
+    assert f"[{seen['논문?'][0]}] 질문: 논문?" in log
+
+
+def test_requests_are_rolled_up(manager):
+    """요청 종료 → requests.jsonl 한 줄 + rollup.json 집계 (실패 요청 포함)"""
+    with manager.request(difficulty="easy"):
+        manager.update_metadata(tool_used="glossary", success=True, response_time_ms=450)
+    with pytest.raises(RuntimeError):
+        with manager.request(difficulty="hard"):
+            raise RuntimeError("LLM 오류")
+
+    manager.sync()
+    lines = (telemetry_dir(manager) / "requests.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["success"] for line in lines] == [True, False]
+
+    rollup = json.loads((telemetry_dir(manager) / "rollup.json").read_text(encoding="utf-8"))
+    assert (rollup["requests"], rollup["successes"], rollup["failures"]) == (2, 1, 1)
+    assert rollup["tools"] == {"glossary": 1}
+    assert rollup["latency_ms"]["p50"] == 500.0
+
+
+def test_per_request_records_are_bounded(manager):
+    """요청별 SQL 기록은 max_records_per_request개까지만 메모리에 보관"""
+    with manager.request() as context:
+        for i in range(10):
+            manager.log_sql_query(f"SELECT {i}", description="테스트")
+        assert [q["query"] for q in context.db_queries] == ["SELECT 7", "SELECT 8", "SELECT 9"]
+
+    manager.sync()
+    events = (telemetry_dir(manager) / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert sum(json.loads(line)["type"] == "sql_query" for line in events) == 10
+
+
+def test_rollup_resumes_from_saved_file():
+    """재시작 시 저장된 집계(히스토그램 포함)를 이어서 누적"""
+    rollup = DailyRollup("20261018")
+    for latency in (90, 150, 8000):
+        rollup.add({"success": True, "tool_used": "general", "response_time_ms": latency})
+
+    resumed = DailyRollup.from_dict(json.loads(json.dumps(rollup.to_dict())))
+    resumed.add({"success": True, "tool_used": "general", "response_time_ms": 120})
+
+    data = resumed.to_dict()
+    assert data["requests"] == 4
+    assert data["tools"] == {"general": 4}
+    assert data["latency_ms"]["count"] == 4
+    assert data["latency_ms"]["p95"] == 10000.0
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# ---------------------- 호출 스케줄러 단위 테스트 ---------------------- #
+"""
+src.llm.scheduler 단위 테스트 (외부 API 호출 없음)
+
+테스트 항목:
+- 토큰 버킷 (RPM / TPM) 대기 시간 계산
+- 제공자별 동시 실행 수 제한
+- interactive 요청이 대기 중인 background 요청보다 먼저 슬롯 확보
+- 대기열 시간 초과 / 429 일시 정지 / 비동기 슬롯 / 통계
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import threading
+import time
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.llm.scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    ProviderLimiter,
+    RequestScheduler,
+    SchedulerTimeout,
+    TokenBucket,
+    background_priority,
+    current_priority,
+)
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# ==================== 토큰 버킷 테스트 ==================== #
+def test_token_bucket_refills_per_minute():
+    """분당 60회 → 가득 찬 버킷을 비우면 1초마다 1회 충전"""
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)
+
+    for _ in range(60):
+        assert bucket.wait_time(1) == 0
+        bucket.consume(1)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+    clock.now += 0.5
+    assert bucket.wait_time(1) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.wait_time(1) == 0
+
+
+def test_token_bucket_unlimited_and_oversized_requests():
+    """0이면 무제한, 용량보다 큰 요청은 가득 찼을 때 통과 (영구 대기 방지)"""
+    assert TokenBucket(0).wait_time(10 ** 9) == 0
+
+    bucket = TokenBucket(100, FakeClock())
+    assert bucket.wait_time(500) == 0
+
+
+# ==================== 동시성 / 우선순위 테스트 ==================== #
+def test_limiter_caps_concurrency():
+    """max_concurrency=2면 동시에 2개까지만 실행"""
+    limiter = ProviderLimiter("test", max_concurrency=2)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def worker():
+        limiter.acquire()
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+        limiter.release()
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    stats = limiter.snapshot()
+    assert stats["acquired"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+    assert stats["max_queue_depth"] >= 3
+
+
+def test_interactive_requests_jump_background_queue():
+    """슬롯이 찬 동안 background가 먼저 도착해도 interactive가 먼저 실행"""
+    limiter = ProviderLimiter("test", max_concurrency=1)
+    limiter.acquire()                           # 슬롯 점유
+    order = []
+
+    def worker(priority):
+        limiter.acquire(priority)
+        order.append(priority)
+        limiter.release()
+
+    background = [threading.Thread(target=worker, args=(BACKGROUND,)) for _ in range(2)]
+    for thread in background:
+        thread.start()
+    while limiter.snapshot()["queued"] < 2:
+        time.sleep(0.005)
+
+    interactive = threading.Thread(target=worker, args=(INTERACTIVE,))
+    interactive.start()
+    while limiter.snapshot()["queued"] < 3:
+        time.sleep(0.005)
+    stats = limiter.snapshot()
+    assert (stats["queued_interactive"], stats["queued_background"]) == (1, 2)
+
+    limiter.release()
+    for thread in background + [interactive]:
+        thread.join()
+
+    assert order == [INTERACTIVE, BACKGROUND, BACKGROUND]
+
+
+def test_acquire_timeout_leaves_queue_clean():
+    """대기 시간 초과 시 SchedulerTimeout, 대기열에서 제거"""
+    limiter = ProviderLimiter("test", max_concurrency=1)
+    limiter.acquire()
+
+    with pytest.raises(SchedulerTimeout):
+        limiter.acquire(timeout=0.05)
+
+    stats = limiter.snapshot()
+    assert stats["timeouts"] == 1
+    assert stats["queued"] == 0
+
+
+def test_rate_limit_pause_holds_queue():
+    """429 보고 시 정지 시간 동안 슬롯을 내주지 않음"""
+    scheduler = RequestScheduler(config={"providers": {"test": {"max_concurrency": 4, "rpm": 0}}})
+    scheduler.report_rate_limited("test", retry_after=0.1)
+
+    start = time.perf_counter()
+    with scheduler.slot("test"):
+        waited = time.perf_counter() - start
+
+    assert waited >= 0.09
+    assert scheduler.stats()["test"]["rate_limited"] == 1
+
+
+# ==================== 스케줄러 / 우선순위 컨텍스트 테스트 ==================== #
+def test_background_priority_context():
+    """background_priority() 블록 안에서만 background"""
+    assert current_priority() == INTERACTIVE
+    with background_priority():
+        assert current_priority() == BACKGROUND
+    assert current_priority() == INTERACTIVE
+
+
+def test_async_slot_and_unknown_provider_defaults():
+    """aslot()은 이벤트 루프에서 동작, 설정에 없는 제공자는 default 한도"""
+    scheduler = RequestScheduler(config={"default": {"max_concurrency": 2, "rpm": 0, "tpm": 0}, "providers": {}})
+    active = []
+    peak = []
+
+    async def call():
+        async with scheduler.aslot("custom"):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(5)))
+
+    asyncio.run(main())
+
+    assert max(peak) == 2
+    assert scheduler.stats()["custom"]["acquired"] == 5
+    assert scheduler.stats()["custom"]["max_concurrency"] == 2
+
+
+def test_disabled_scheduler_is_passthrough():
+    """enabled: false면 제한기 생성 없이 바로 실행"""
+    scheduler = RequestScheduler(config={"enabled": False})
+    with scheduler.slot("openai"):
+        pass
+    assert scheduler.stats() == {}
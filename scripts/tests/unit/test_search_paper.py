@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# ---------------------- 논문 검색 도구 단위 테스트 ---------------------- #
+"""
+src.tools.search_paper 단위 테스트 (DB / LLM 없이 가짜 브랜치 / 검색 함수 사용)
+
+테스트 항목:
+- 마감 시간을 넘긴 브랜치: 풀 대기 중이면 취소, 결과는 None
+- pgvector 검색 SQL 실행 제한 (statement_timeout 컨텍스트, 워커 스레드 전파)
+- 확장 쿼리 검색은 공용 스레드 풀에서 실행
+- 키워드 검색: 키워드별 plainto_tsquery OR 결합 / 키워드로만 찾은 논문 결과 포함 (약한 매칭 제외)
+- 관련성 검증: 벡터 distance가 멀고 키워드 매칭도 약하면 "관련 논문을 찾을 수 없습니다."
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+from langchain_core.documents import Document
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.database import vector_store
+from src.rag import retriever
+from src.tools import search_paper
+
+
+# ==================== 테스트 유틸 ==================== #
+class FakeCursor:
+    def __init__(self, rows=()):
+        self.statements = []
+        self.params = []
+        self.rows = list(rows)
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        self.params.append(params)
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeRetriever:
+    """벡터 검색 결과를 고정한 RAGRetriever"""
+    pairs = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def similarity_search_with_score(self, query, k=None):
+        return list(self.pairs)
+
+
+def keyword_row(paper_id, title, score):
+    return (paper_id, title, f"{title} abstract", "Kim", "2024-01-01", "cs.CL", 10, f"http://arxiv.org/abs/{paper_id}", score)
+
+
+def run_search(query="BERT RoBERTa"):
+    return search_paper.search_paper_database.invoke({
+        "query": query, "use_multi_query": False, "search_mode": "similarity", "parallel": False,
+    })
+
+
+@pytest.fixture
+def fake_search(monkeypatch):
+    """벡터 / 키워드 / 메타데이터 조회를 가짜로 교체하고 키워드 결과 목록 반환"""
+    keyword_results = []
+    FakeRetriever.pairs = []
+    monkeypatch.setattr(search_paper, "RAGRetriever", FakeRetriever)
+    monkeypatch.setattr(search_paper, "_fetch_paper_meta", lambda paper_ids, statement_timeout_ms=None: {})
+    monkeypatch.setattr(search_paper, "_keyword_search", lambda query, top_k=5, statement_timeout_ms=None: list(keyword_results))
+    return keyword_results
+
+
+# ==================== 테스트 ==================== #
+def test_timed_out_branch_is_cancelled_before_start(monkeypatch):
+    """공용 풀이 가득 차 시작하지 못한 브랜치는 마감 후 취소되어 실행되지 않음"""
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(search_paper, "_BRANCH_EXECUTOR", pool)
+    release, ran = threading.Event(), []
+
+    def slow():
+        release.wait(2)
+        return "slow"
+
+    branches = {"slow": slow, "queued": lambda: ran.append("queued")}
+    timings = {}
+    results = search_paper._run_branches(branches, {"slow": 0.05, "queued": 0.05}, True, timings)
+    release.set()
+    pool.shutdown(wait=True)
+
+    assert results == {"slow": None, "queued": None}
+    assert timings["queued"]["status"] == "timeout"
+    assert ran == []
+
+
+def test_statement_timeout_applies_only_inside_context():
+    """컨텍스트 안의 검색 SQL에만 SET LOCAL statement_timeout 적용 (워커 스레드 포함)"""
+    cursor = FakeCursor()
+    vector_store._apply_statement_timeout(None, cursor, "SELECT 1", None, None, False)
+    assert cursor.statements == []
+
+    with vector_store.statement_timeout(1500):
+        vector_store._apply_statement_timeout(None, cursor, "SELECT 1", None, None, False)
+        worker = retriever._QUERY_EXECUTOR.submit(
+            retriever.contextvars.copy_context().run,
+            vector_store._apply_statement_timeout, None, cursor, "SELECT 1", None, None, False,
+        )
+        worker.result()
+
+    assert cursor.statements == ["SET LOCAL statement_timeout = 1500"] * 2
+
+
+def test_multi_query_search_uses_shared_pool():
+    """확장 쿼리별 검색은 공용 풀에서 실행하고 문서별 최소 distance만 유지"""
+    rag = object.__new__(retriever.RAGRetriever)
+    rag.k = 2
+    threads = []
+    doc_a = SimpleNamespace(page_content="a", metadata={})
+    doc_b = SimpleNamespace(page_content="b", metadata={})
+    scores = {"q": [(doc_a, 0.4)], "q2": [(doc_a, 0.2), (doc_b, 0.3)], "q3": []}
+
+    def fake_search(query, k=None):
+        threads.append(threading.current_thread().name)
+        return scores[query]
+
+    rag.expand_queries = lambda query: ["q", "q2", "q3"]
+    rag.similarity_search_with_score = fake_search
+
+    pairs = rag.multi_query_search_with_score("q")
+    assert [(d.page_content, s) for d, s in pairs] == [("a", 0.2), ("b", 0.3)]
+    assert len(threads) == 3 and all(name.startswith("multi_query") for name in threads)
+
+
+def test_keyword_query_ors_one_tsquery_per_keyword(monkeypatch):
+    """추출한 키워드마다 plainto_tsquery를 만들고 OR로 결합, 값은 바인딩 파라미터로 전달"""
+    assert search_paper._build_tsquery_sql(["BERT"]) == "plainto_tsquery('english', %s)"
+
+    cursor = FakeCursor(rows=[keyword_row(7, "RoBERTa", 0.5)])
+
+    @contextmanager
+    def fake_get_cursor(cursor_factory=None, statement_timeout_ms=None):
+        cursor.timeout = statement_timeout_ms
+        yield cursor
+
+    monkeypatch.setattr(search_paper, "get_cursor", fake_get_cursor)
+    results = search_paper._keyword_search("BERT와 RoBERTa의 차이", top_k=3, statement_timeout_ms=5000)
+
+    sql = cursor.statements[0]
+    assert "plainto_tsquery('english', %s) || plainto_tsquery('english', %s)" in sql
+    assert "ts_rank_cd(p.search_vector, q.query, 32)" in sql
+    assert cursor.params[0] == ("BERT", "RoBERTa", 3)
+    assert cursor.timeout == 5000
+    assert results[0]["paper_id"] == 7 and results[0]["keyword_score"] == 0.5
+
+
+def test_keyword_only_papers_need_min_score(fake_search):
+    """벡터 검색에 없던 논문도 키워드 점수가 충분하면 결과에 포함, 약한 매칭은 제외"""
+    fake_search.extend([
+        search_paper._row_to_keyword_result(keyword_row(1, "RoBERTa Pretraining", 0.6)),
+        search_paper._row_to_keyword_result(keyword_row(2, "Generic Model Survey", 0.2)),
+    ])
+
+    markdown = run_search()
+    assert "RoBERTa Pretraining" in markdown
+    assert "- **섹션**: 초록" in markdown
+    assert "Generic Model Survey" not in markdown
+
+
+def test_off_topic_query_returns_not_found(fake_search):
+    """흔한 단어 하나만 약하게 매칭된 논문은 관련 근거가 아님 → 검색 실패 메시지 (Fallback 트리거)"""
+    FakeRetriever.pairs = [(Document(page_content="weather station data", metadata={"paper_id": 3, "title": "Sensor Model"}), 0.82)]
+    fake_search.append(search_paper._row_to_keyword_result(keyword_row(3, "Sensor Model", 0.29)))
+
+    assert run_search("오늘 서울 weather model 알려줘") == "관련 논문을 찾을 수 없습니다."
+
+    # 같은 논문이라도 키워드 점수가 충분하면 관련 결과로 인정
+    fake_search[0]["keyword_score"] = 0.55
+    assert "Sensor Model" in run_search("오늘 서울 weather model 알려줘")
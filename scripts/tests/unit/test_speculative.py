@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# ---------------------- 라우팅 중 선행 검색 단위 테스트 ---------------------- #
+"""
+src.agent.speculative 단위 테스트 (DB / LLM 없이 가짜 검색 작업 사용)
+
+테스트 항목:
+- 비활성화(기본값)면 선행 검색 없음
+- 선택된 도구는 같은 검색 인자일 때 결과 재사용 (hit)
+- 선택되지 않은 도구 / 재작성된 질문은 폐기 (discarded / stale)
+- 같은 질문으로 다시 시작하면 진행 중인 묶음 재사용
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import threading
+import time
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent import speculative
+from src.agent.speculative import (
+    get_speculative_stats,
+    is_prefetched,
+    reset_speculative_stats,
+    run_or_take,
+    settle_prefetch,
+    start_prefetch,
+    take_prefetched,
+)
+
+
+# ==================== 테스트 유틸 ==================== #
+@pytest.fixture
+def fake_jobs(monkeypatch):
+    """도구 검색 / 임베딩 / 설정을 가짜로 교체하고 호출 기록 반환"""
+    calls = []
+    release = threading.Event()
+
+    def make_job(tool, delay=0.0):
+        def job(question, difficulty):
+            args = {"query": question, "difficulty": difficulty}
+
+            def run():
+                calls.append(tool)
+                if delay:
+                    release.wait(delay)
+                return f"{tool}:{question}"
+            return args, run
+        return job
+
+    monkeypatch.setattr(speculative, "_JOBS", {
+        "glossary": make_job("glossary"),
+        "search_paper": make_job("search_paper", delay=1.0),
+    })
+    monkeypatch.setattr(speculative, "_warm_embedding", lambda question: None)
+    monkeypatch.setattr(speculative, "get_speculative_config", lambda: {
+        **speculative.DEFAULT_SPECULATIVE_CONFIG, "enabled": True,
+    })
+    reset_speculative_stats()
+    yield calls, release
+    release.set()
+
+
+def routed_state(*tools):
+    return {"question": "RAG가 뭐야?", "tool_pipeline": list(tools), "tool_timeline": []}
+
+
+# ==================== 테스트 ==================== #
+def test_disabled_by_default(monkeypatch):
+    """기본 설정(enabled: false)이면 아무것도 시작하지 않음"""
+    monkeypatch.setattr(speculative, "get_speculative_config", lambda: dict(speculative.DEFAULT_SPECULATIVE_CONFIG))
+    state = {"question": "RAG가 뭐야?"}
+
+    assert start_prefetch(state, state["question"], "easy") is None
+    assert "speculative_prefetch_id" not in state
+    assert not is_prefetched(take_prefetched(state, "glossary", {"query": "RAG가 뭐야?"}))
+
+
+def test_chosen_tool_reuses_result_and_other_is_discarded(fake_jobs):
+    """glossary 선택 → glossary 결과 재사용, search_paper는 폐기"""
+    calls, _ = fake_jobs
+    state = routed_state("glossary")
+    start_prefetch(state, "RAG가 뭐야?", "easy")
+
+    settled = settle_prefetch(state)
+    assert settled == {"kept": ["glossary"], "discarded": ["search_paper"]}
+    assert state["tool_timeline"][-1]["event"] == "speculative_prefetch"
+
+    result = run_or_take(
+        state, "glossary", {"query": "RAG가 뭐야?", "difficulty": "easy"},
+        lambda: pytest.fail("선행 검색 결과를 재사용해야 함"),
+    )
+    assert result == "glossary:RAG가 뭐야?"
+
+    stats = get_speculative_stats()
+    assert (stats["started"], stats["hits"], stats["discarded"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert calls.count("glossary") == 1
+
+
+def test_rewritten_query_is_stale(fake_jobs):
+    """재작성된 질문으로 검색하면 선행 결과는 폐기하고 직접 검색"""
+    state = routed_state("glossary", "search_paper")
+    start_prefetch(state, "RAG가 뭐야?", "easy")
+    settle_prefetch(state)
+
+    result = run_or_take(
+        state, "glossary", {"query": "Retrieval-Augmented Generation", "difficulty": "easy"},
+        lambda: "직접 검색",
+    )
+
+    assert result == "직접 검색"
+    assert get_speculative_stats()["stale"] == 1
+
+
+def test_waits_for_in_flight_prefetch(fake_jobs):
+    """진행 중인 선행 검색은 끝날 때까지 기다려 재사용"""
+    calls, release = fake_jobs
+    state = routed_state("search_paper")
+    start_prefetch(state, "RAG 논문 찾아줘", "easy")
+    settle_prefetch(state)
+
+    threading.Timer(0.05, release.set).start()
+    start = time.perf_counter()
+    result = take_prefetched(state, "search_paper", {"query": "RAG 논문 찾아줘", "difficulty": "easy"})
+
+    assert result == "search_paper:RAG 논문 찾아줘"
+    assert time.perf_counter() - start < 0.9
+    assert calls.count("search_paper") == 1
+    assert get_speculative_stats()["hits"] == 1
+
+
+def test_same_question_reuses_batch(fake_jobs):
+    """분류 단계에서 시작한 묶음을 라우터가 다시 시작하지 않음"""
+    state = {"question": "RAG가 뭐야?"}
+    first = start_prefetch(state, "RAG가 뭐야?", "easy")
+    second = start_prefetch(state, "RAG가 뭐야?", "easy")
+
+    assert first == second
+    assert get_speculative_stats()["batches"] == 1
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# ---------------------- Agent 스트리밍 단위 테스트 ---------------------- #
+"""
+src.agent.streaming 단위 테스트 (LangGraph 없이 가짜 그래프 사용)
+
+테스트 항목:
+- 답변 태그가 붙은 LLM 호출 토큰만 전달 (수준 포함)
+- 노드 진행 / 최종 상태 이벤트
+- 답변 캐시 히트 시 그래프 실행 없이 최종 상태만 반환
+"""
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.answer_cache import CachedAgentGraph, SemanticAnswerCache
+from src.agent.streaming import answer_stream_config, stream_agent
+
+
+# ==================== 테스트 유틸 ==================== #
+class Chunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeGraph:
+    """stream_mode=["updates", "messages", "values"] 형식의 (mode, chunk) 튜플 생성"""
+
+    def __init__(self):
+        self.stream_calls = 0
+
+    def stream(self, state, config=None, stream_mode=None):
+        self.stream_calls += 1
+        yield ("updates", {"router": {"tool_choice": "general"}})
+        yield ("messages", (Chunk("라우팅"), {"langgraph_node": "router", "tags": []}))
+        tags = answer_stream_config("beginner")["tags"]
+        yield ("messages", (Chunk("안녕"), {"langgraph_node": "general", "tags": tags}))
+        yield ("messages", (Chunk("하세요"), {"langgraph_node": "general", "tags": tags}))
+        yield ("values", {"question": state["question"], "final_answer": "안녕하세요", "tool_choice": "general",
+                          "tool_status": "success"})
+
+
+# ==================== 이벤트 변환 테스트 ==================== #
+def test_stream_agent_filters_answer_tokens():
+    """라우터 LLM 토큰은 제외, 답변 토큰은 수준과 함께 전달"""
+    events = list(stream_agent(FakeGraph(), {"question": "안녕?"}))
+
+    tokens = [e for e in events if e["type"] == "token"]
+    assert [(t["level"], t["content"]) for t in tokens] == [("beginner", "안녕"), ("beginner", "하세요")]
+    assert events[0] == {"type": "node", "node": "router", "update": {"tool_choice": "general"}}
+    assert events[-1]["type"] == "final"
+    assert events[-1]["state"]["final_answer"] == "안녕하세요"
+
+
+# ==================== 답변 캐시 연동 테스트 ==================== #
+def test_cached_graph_stream_stores_and_hits():
+    """첫 스트리밍 결과를 저장하고, 같은 질문은 그래프 실행 없이 최종 상태 반환"""
+    graph = FakeGraph()
+    cached = CachedAgentGraph(graph, SemanticAnswerCache(lambda text: [1.0, 0.0]))
+
+    first = list(stream_agent(cached, {"question": "안녕?", "difficulty": "easy"}))
+    second = list(stream_agent(cached, {"question": "안녕?", "difficulty": "easy"}))
+
+    assert graph.stream_calls == 1
+    assert first[-1]["state"]["final_answer"] == "안녕하세요"
+    assert [e["type"] for e in second] == ["final"]
+    assert second[-1]["state"]["cache_hit"] is True
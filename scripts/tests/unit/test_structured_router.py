@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# ---------------------- 통합 라우팅 단위 테스트 ---------------------- #
+"""
+src.agent.structured_router 단위 테스트
+
+테스트 항목:
+- 구조화 출력 dict 파싱
+- 코드 펜스 / 앞뒤 설명이 섞인 문자열 파싱
+- 도구 별칭 정규화 및 잘못된 값 처리
+- 구조화 출력 미지원 LLM 폴백
+"""
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.structured_router import invoke_combined_router, parse_routing_decision
+
+
+# ==================== 파싱 테스트 ==================== #
+def test_parse_structured_dict():
+    """스키마 형식 dict는 그대로 정규화"""
+    decision = parse_routing_decision({
+        "question_type": "paper_search",
+        "tools": ["search_paper", "summarize"],
+        "refined_query": "RAG 논문",
+        "valid": True,
+        "reason": "논문 검색 후 요약",
+    })
+    assert decision["question_type"] == "paper_search"
+    assert decision["tools"] == ["search_paper", "summarize"]
+    assert decision["valid"] is True
+
+
+def test_parse_fenced_text_with_aliases():
+    """코드 펜스 + 설명 문장 + 별칭 도구명 + 문자열 valid"""
+    raw = (
+        "다음과 같이 판단했습니다.\n```json\n"
+        '{"question_type": "unknown", "tools": [{"name": "논문 검색", "query": "Transformer"}, "bogus"],'
+        ' "valid": "no", "reason": "모호함"}\n```'
+    )
+    decision = parse_routing_decision(raw)
+    assert decision["tools"] == ["search_paper"]
+    assert decision["question_type"] == "general_question"
+    assert decision["refined_query"] == "Transformer"
+    assert decision["valid"] is False
+
+
+def test_parse_failure_returns_none():
+    """JSON 없음 / 유효 도구 없음 → None"""
+    assert parse_routing_decision("search_paper") is None
+    assert parse_routing_decision('{"tools": ["unknown"]}') is None
+
+
+# ==================== LLM 호출 테스트 ==================== #
+class PlainLLM:
+    """with_structured_output 미지원 LLM"""
+
+    def invoke(self, prompt):
+        content = '```json\n{"question_type": "term_definition", "tools": ["glossary"], "valid": true}\n```'
+        return type("Response", (), {"content": content})()
+
+
+def test_invoke_without_structured_output():
+    """구조화 출력이 없으면 일반 호출 후 파싱"""
+    result = invoke_combined_router(PlainLLM(), "prompt")
+    assert result["structured"] is False
+    assert result["decision"]["tools"] == ["glossary"]
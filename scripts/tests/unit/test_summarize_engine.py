@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# ---------------------- 긴 논문 요약 엔진 단위 테스트 ---------------------- #
+"""
+src.tools.summarize_engine 단위 테스트 (LLM 호출 없이 가짜 invoke 함수 사용)
+
+테스트 항목:
+- 토큰 예산 단위 연속 청크 묶기 (순서 유지)
+- 짧은 논문은 map 없이 원문 그대로 (stuff)
+- 긴 논문 map → 계층 reduce, 섹션 정리 캐시 재사용
+- 동시에 실행되는 수준별 요약은 진행 중인 섹션 정리 호출을 공유 (중복 LLM 호출 없음)
+- 최종 요약 프롬프트에 본문이 한 번만 포함
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import threading
+import time
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.tools import summarize_engine
+from src.tools.summarize_engine import MapReduceSummarizer, batch_by_tokens, count_tokens
+from src.utils.cache import LRUCache
+
+
+# ==================== 테스트 유틸 ==================== #
+CONFIG = {
+    "single_pass_max_tokens": 100,
+    "section_max_tokens": 60,
+    "reduce_max_tokens": 40,
+    "map_concurrency": 3,
+    "section_cache_size": 100,
+}
+
+
+class FakeLLM:
+    """프롬프트 종류별 호출 수를 세고 짧은 정리를 반환"""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = {"map": 0, "reduce": 0}
+        self.lock = threading.Lock()
+        self.delay = delay
+
+    def __call__(self, prompt: str) -> str:
+        stage = "reduce" if "통합 정리" in prompt else "map"
+        with self.lock:
+            self.calls[stage] += 1
+        time.sleep(self.delay)
+        return f"{stage} 정리 " + "x" * 45
+
+
+def make_chunks(n: int):
+    return [f"chunk {i} " + "본문" * 40 for i in range(n)]
+
+
+# ==================== 묶기 테스트 ==================== #
+def test_batch_by_tokens_keeps_order_and_budget():
+    """연속 청크를 예산 이하로 묶고 순서 유지, 예산 초과 단일 청크는 단독"""
+    texts = ["a" * 30, "b" * 30, "c" * 30, "d" * 600]
+    batches = batch_by_tokens(texts, max_tokens=25)
+
+    assert [t for batch in batches for t in batch] == texts
+    assert batches[-1] == ["d" * 600]
+    for batch in batches[:-1]:
+        assert sum(count_tokens(t) for t in batch) <= 25
+
+
+# ==================== 요약 흐름 테스트 ==================== #
+def test_short_paper_single_pass():
+    """짧은 논문은 LLM 호출 없이 원문 그대로"""
+    llm = FakeLLM()
+    summarizer = MapReduceSummarizer(llm, "fake:model", config=CONFIG, cache=LRUCache(max_size=10))
+
+    assert summarizer.condense("T", ["짧은 본문"]) == "짧은 본문"
+    assert summarizer.stats["method"] == "stuff"
+    assert llm.calls == {"map": 0, "reduce": 0}
+
+
+def test_long_paper_map_reduce_and_cache():
+    """긴 논문은 섹션 map 후 예산 이하로 reduce, 같은 모델 재요약 시 캐시 적중"""
+    cache = LRUCache(max_size=100)
+    chunks = make_chunks(8)
+
+    llm = FakeLLM()
+    summarizer = MapReduceSummarizer(llm, "fake:model", config=CONFIG, cache=cache)
+    condensed = summarizer.condense("T", chunks)
+
+    assert summarizer.stats["method"] == "map_reduce"
+    assert llm.calls["map"] == summarizer.stats["sections"] > 1
+    assert llm.calls["reduce"] >= 1
+    assert count_tokens(condensed) < count_tokens("\n\n".join(chunks))
+
+    # 다른 수준 요약 (같은 모델) → 섹션 정리 전부 캐시 적중
+    again = FakeLLM()
+    summarizer = MapReduceSummarizer(again, "fake:model", config=CONFIG, cache=cache)
+    assert summarizer.condense("T", chunks) == condensed
+    assert again.calls == {"map": 0, "reduce": 0}
+
+
+def test_concurrent_levels_share_inflight_calls():
+    """두 수준이 동시에 같은 논문을 압축해도 섹션 정리 LLM 호출은 한 수준 분량만 발생"""
+    chunks = make_chunks(8)
+    single = FakeLLM()
+    expected = MapReduceSummarizer(single, "fake:model", config=CONFIG, cache=LRUCache(max_size=100)).condense("T", chunks)
+
+    cache = LRUCache(max_size=100)
+    llm = FakeLLM(delay=0.05)
+    summarizers = [MapReduceSummarizer(llm, "fake:model", config=CONFIG, cache=cache) for _ in range(2)]
+    results = [None, None]
+
+    def run(i):
+        results[i] = summarizers[i].condense("T", chunks)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert results == [expected, expected]
+    assert llm.calls == single.calls
+    assert sum(s.stats["map_calls"] + s.stats["reduce_calls"] for s in summarizers) == sum(single.calls.values())
+
+
+def test_engine_version_is_stable():
+    """같은 설정/프롬프트면 버전 동일"""
+    assert summarize_engine.get_engine_version() == summarize_engine.get_engine_version()
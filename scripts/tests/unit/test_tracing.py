@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# ---------------------- 요청 트레이싱 단위 테스트 ---------------------- #
+"""
+src.utils.tracing 단위 테스트 (임시 폴더에 OTLP JSONL 기록)
+
+테스트 항목:
+- 트레이스 밖 span은 기록하지 않음
+- 중첩 span 부모 관계 + 스레드 풀 컨텍스트 전파
+- 예외 span은 error 상태로 기록
+- LLM 콜백 span에 토큰 수 기록
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import contextvars
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+# ------------------------- 서드파티 라이브러리 ------------------------- #
+import pytest
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils import tracing
+from src.utils.log_writer import sync_log_writer
+from src.utils.tracing import NOOP_SPAN, current_trace_id, span, start_trace, traced
+
+
+# ==================== 테스트 유틸 ==================== #
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    """임시 경로로 내보내는 설정 + 기록된 트레이스 로드 함수"""
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(tracing, "get_tracing_config", lambda: {
+        **tracing.DEFAULT_TRACING_CONFIG, "export_path": str(path),
+    })
+
+    def load():
+        sync_log_writer()
+        lines = path.read_text(encoding="utf-8").splitlines()
+        return [json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"] for line in lines]
+    return load
+
+
+def by_name(spans):
+    return {s["name"]: s for s in spans}
+
+
+def attributes(span_data):
+    return {a["key"]: list(a["value"].values())[0] for a in span_data["attributes"]}
+
+
+# ==================== 테스트 ==================== #
+def test_span_outside_trace_is_noop():
+    """트레이스 밖에서는 NOOP_SPAN만 반환"""
+    with span("router_node") as s:
+        assert s is NOOP_SPAN
+    assert current_trace_id() is None
+
+
+def test_nested_spans_and_thread_propagation(trace_file):
+    """부모 관계 유지 + copy_context()로 넘긴 작업도 같은 트레이스에 기록"""
+    @traced("classify_question")
+    def classify():
+        return "simple"
+
+    def search(name):
+        with span(f"pgvector.{name}", kind="client"):
+            pass
+
+    with start_trace("chat.question", difficulty="easy") as root:
+        trace_id = current_trace_id()
+        with span("router_node"):
+            assert classify() == "simple"
+        with span("tool.search_paper"), ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, search, n) for n in ("a", "b")]
+            for f in futures:
+                f.result()
+
+    assert root.trace_id == trace_id
+    spans = by_name(trace_file()[0])
+    assert {s["traceId"] for s in spans.values()} == {trace_id}
+    assert spans["classify_question"]["parentSpanId"] == spans["router_node"]["spanId"]
+    assert spans["pgvector.a"]["parentSpanId"] == spans["tool.search_paper"]["spanId"]
+    assert "parentSpanId" not in spans["chat.question"]
+    assert attributes(spans["chat.question"])["difficulty"] == "easy"
+    assert current_trace_id() is None
+
+
+def test_error_span_and_async_decorator(trace_file):
+    """예외는 error 상태로 기록하고 그대로 전달, 비동기 함수도 span 기록"""
+    @traced("router_node")
+    async def route():
+        await asyncio.sleep(0)
+        return "glossary"
+
+    with pytest.raises(ValueError):
+        with start_trace("chat.question"):
+            assert asyncio.run(route()) == "glossary"
+            with span("db.sql", kind="client", statement="SELECT 1"):
+                raise ValueError("연결 끊김")
+
+    spans = by_name(trace_file()[0])
+    assert "router_node" in spans
+    assert spans["db.sql"]["status"] == {"code": 2, "message": "ValueError: 연결 끊김"}
+    assert spans["db.sql"]["kind"] == tracing.SPAN_KINDS["client"]
+    assert spans["chat.question"]["status"]["code"] == 2
+
+
+def test_llm_callback_records_tokens(trace_file):
+    """LLM 콜백은 시작 시점의 span을 부모로 토큰 수 기록"""
+    from src.llm.registry import LLMTracingCallback
+
+    callback = LLMTracingCallback("openai", "gpt-5")
+    run_id = uuid.uuid4()
+    response = SimpleNamespace(llm_output={"token_usage": {"prompt_tokens": 12, "completion_tokens": 30, "total_tokens": 42}})
+
+    with start_trace("chat.question"):
+        with span("tool.general"):
+            callback.on_llm_start({}, ["RAG가 뭐야?"], run_id=run_id)
+        callback.on_llm_end(response, run_id=run_id)
+        callback.on_llm_start({}, ["트레이스 밖에서 끝나지 않는 호출"], run_id=uuid.uuid4())
+
+    spans = by_name(trace_file()[0])
+    llm = attributes(spans["llm.openai"])
+    assert spans["llm.openai"]["parentSpanId"] == spans["tool.general"]["spanId"]
+    assert (llm["model"], llm["total_tokens"]) == ("gpt-5", "42")
+    assert llm["estimated_prompt_tokens"] != "0"
@@ -10,7 +10,14 @@ Langchain PGVector를 사용하여 문서 추가 및 유사도 검색을 테스
 from langchain.schema import Document
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
-from src.database.vector_store import get_pgvector_store
+from src.database.vector_store import (
+    get_pgvector_store,
+    refresh_pgvector_store,
+    close_pgvector_stores,
+    get_registered_stores,
+    ensure_paper_chunk_index,
+    get_paper_chunks,
+)
 
 
 # ==================== 메인 테스트 ==================== #
@@ -108,6 +115,43 @@ if __name__ == "__main__":
         print(f"    내용: {doc.page_content[:150]}...")
         print(f"    메타데이터: {doc.metadata}")
 
+    # ---------------------- 6. 논문별 청크 조회 (임베딩 호출 없음) ---------------------- #
+    print("\n[6] 논문별 청크 조회 (paper_id, chunk_index 순)")
+    print("-" * 80)
+
+    chunk_documents = [
+        Document(
+            page_content=f"Sample paper chunk {i}",
+            metadata={"paper_id": 999999, "chunk_index": i, "source": "Sample Paper"}
+        )
+        for i in (2, 0, 1)
+    ]
+    chunk_ids = vector_store.add_documents(chunk_documents)
+    print(f"인덱스 준비: {ensure_paper_chunk_index()}")
+
+    chunks = get_paper_chunks(999999, collection_name="paper_chunks")
+    assert [c.metadata["chunk_index"] for c in chunks] == [0, 1, 2], "chunk_index 순서여야 함"
+    assert all(c.metadata["paper_id"] == 999999 for c in chunks), "다른 논문 청크가 섞이면 안 됨"
+    print(f"✅ {len(chunks)}개 청크를 읽기 순서로 조회")
+    vector_store.delete(chunk_ids)
+
+    # ---------------------- 7. VectorStore 레지스트리 재사용 ---------------------- #
+    print("\n[7] VectorStore 레지스트리 재사용")
+    print("-" * 80)
+
+    same_store = get_pgvector_store(collection_name="paper_chunks")
+    assert same_store is vector_store, "동일 키는 같은 인스턴스를 반환해야 함"
+    print("✅ 동일 (컬렉션, 모델, 연결) 조합 → 같은 인스턴스 반환")
+
+    refreshed = refresh_pgvector_store(collection_name="paper_chunks")
+    assert refreshed is not vector_store, "refresh 후에는 새 인스턴스여야 함"
+    assert get_pgvector_store(collection_name="paper_chunks") is refreshed
+    print("✅ refresh_pgvector_store → 새 인스턴스로 교체")
+
+    print(f"등록된 VectorStore: {len(get_registered_stores())}개")
+    closed = close_pgvector_stores()
+    print(f"✅ {closed}개 VectorStore 종료")
+
     print("\n" + "=" * 80)
     print("✅ PGVector 벡터 검색 테스트 완료")
     print("=" * 80)
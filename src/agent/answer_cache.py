@@ -0,0 +1,621 @@
+# src/agent/answer_cache.py
+"""
+의미 기반 답변 캐시 모듈
+
+create_agent_graph로 만든 그래프 앞단에서 동작하는 응답 캐시:
+- 키: (정규화된 질문 임베딩, 난이도, 도구)
+  - 도구: LLM 라우팅 전에 알 수 있는 고속 라우터(패턴 / 키워드 점수) 결정, 확신이 없으면 None
+- 임베딩 클라이언트는 첫 조회 / 저장 때 생성 (그래프 생성 시 API 키 불필요)
+- 코사인 유사도 임계값 이상이면 그래프 실행 없이 저장된 답변 반환
+- 도구별 TTL (web_search 등 시의성 있는 도구는 짧게, save_file은 저장 안 함)
+- papers / glossary 테이블 변경 시 해당 테이블에 의존하는 답변 무효화
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 answer_cache 섹션이 없을 때 사용
+DEFAULT_ANSWER_CACHE_CONFIG = {
+    "enabled": True,                                # 답변 캐시 사용 여부
+    "similarity_threshold": 0.95,                   # 코사인 유사도 임계값
+    "max_entries": 500,                             # 최대 저장 답변 수
+    "default_ttl_seconds": 86400,                   # 기본 TTL (초)
+    "tool_ttl_seconds": {                           # 도구별 TTL (0이면 캐시 안 함)
+        "web_search": 3600,
+        "save_file": 0,
+    },
+    "version_check_interval": 30,                   # 테이블 변경 확인 주기 (초)
+}
+
+# 도구별 의존 테이블 (테이블 변경 시 해당 도구 답변 무효화)
+TOOL_DEPENDENCIES: Dict[str, tuple] = {
+    "search_paper": ("papers",),
+    "summarize": ("papers",),
+    "text2sql": ("papers",),
+    "glossary": ("glossary",),
+}
+
+# 변경 감지 대상 테이블
+WATCHED_TABLES = ("papers", "glossary")
+
+# 캐시 응답에 포함할 그래프 상태 필드
+CACHED_FIELDS = (
+    "final_answer",
+    "final_answers",
+    "tool_choice",
+    "tool_result",
+    "tool_pipeline",
+    "routing_reason",
+    "routing_method",
+    "pipeline_description",
+    "source_documents",
+)
+
+# 이전 대화를 참조하는 질문 판별용 표현 (router_node와 동일 목적)
+CONTEXTUAL_KEYWORDS = (
+    "그거", "이거", "저거", "해당", "방금", "앞서", "이전",
+    "그럼", "그러면", "그래서", "그런데", "위 ", "위의",
+)
+
+
+# ==================== 유틸리티 ==================== #
+
+def _unit(vector: Sequence[float]) -> List[float]:
+    """
+    L2 정규화 (내적 = 코사인 유사도)
+
+    Args:
+        vector: 임베딩 벡터
+
+    Returns:
+        단위 벡터 (영벡터면 그대로)
+    """
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    """두 단위 벡터의 내적 (코사인 유사도)"""
+    return sum(x * y for x, y in zip(a, b))
+
+
+def _load_answer_cache_config() -> Dict[str, Any]:
+    """
+    답변 캐시 설정 로드 (기본값과 병합)
+
+    Returns:
+        답변 캐시 설정 딕셔너리
+    """
+    config = dict(DEFAULT_ANSWER_CACHE_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        user_config = get_model_config().get("answer_cache", {}) or {}
+        tool_ttl = dict(config["tool_ttl_seconds"])
+        tool_ttl.update(user_config.get("tool_ttl_seconds", {}) or {})
+        config.update(user_config)
+        config["tool_ttl_seconds"] = tool_ttl
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def fetch_table_versions(tables: Sequence[str] = WATCHED_TABLES) -> Dict[str, str]:
+    """
+    테이블별 변경 지문 조회 (행 수 + 최신 created_at/updated_at)
+
+    Args:
+        tables: 조회할 테이블 이름
+
+    Returns:
+        {테이블명: 지문 문자열}
+    """
+    from src.database.db import get_cursor
+
+    versions: Dict[str, str] = {}
+    with get_cursor() as cur:
+        for table in tables:
+            # 테이블명은 WATCHED_TABLES 상수만 사용 (사용자 입력 아님)
+            cur.execute(
+                f"SELECT COUNT(*), MAX(GREATEST(created_at, updated_at)) FROM {table}"
+            )
+            count, latest = cur.fetchone()
+            versions[table] = f"{count}:{latest}"
+    return versions
+
+
+def fast_route_tool(question: str) -> Optional[str]:
+    """
+    LLM 호출 없이 결정되는 도구 (고속 라우터, 캐시 키의 도구 성분)
+
+    Args:
+        question: 사용자 질문
+
+    Returns:
+        패턴 / 키워드 점수로 확신한 도구, 확신이 없으면 None (LLM 라우팅 대상)
+    """
+    from src.agent.fast_router import get_compiled_router
+
+    router = get_compiled_router()
+    decision = router.route(question)
+    return decision["tool"] if router.is_confident(decision) else None
+
+
+def is_context_dependent(question: str, messages: Optional[list] = None) -> bool:
+    """
+    이전 대화를 참조하는 질문인지 판별 (캐시 조회/저장 제외 대상)
+
+    Args:
+        question: 사용자 질문
+        messages: 대화 히스토리 (현재 질문 포함)
+
+    Returns:
+        bool: 이전 대화가 있고 맥락 참조 표현이 포함되면 True
+    """
+    if not messages or len(messages) <= 1:
+        return False
+    return any(kw in question for kw in CONTEXTUAL_KEYWORDS)
+
+
+# ==================== 의미 기반 답변 캐시 ==================== #
+class SemanticAnswerCache:
+    """
+    질문 임베딩 기반 답변 캐시
+
+    - 난이도별로 항목을 분리 저장, 조회 시 같은 난이도 · 같은 라우팅 도구 안에서 최고 유사도 탐색
+    - 도구별 TTL 및 의존 테이블 버전으로 만료/무효화
+    - 스레드 안전
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], List[float]],
+        similarity_threshold: float = 0.95,
+        max_entries: int = 500,
+        default_ttl_seconds: float = 86400,
+        tool_ttl_seconds: Optional[Dict[str, float]] = None,
+        version_fn: Optional[Callable[[], Dict[str, str]]] = None,
+        version_check_interval: float = 30,
+        route_fn: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        """
+        Args:
+            embed_fn: 질문 → 임베딩 벡터 함수 (정규화 포함)
+            similarity_threshold: 코사인 유사도 임계값
+            max_entries: 최대 저장 답변 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            default_ttl_seconds: 기본 TTL (초)
+            tool_ttl_seconds: 도구별 TTL (0이면 해당 도구 답변은 저장 안 함)
+            version_fn: 테이블 변경 지문 조회 함수 (None이면 명시적 무효화만 사용)
+            version_check_interval: 테이블 변경 확인 주기 (초)
+            route_fn: 질문 → LLM 라우팅 전 결정되는 도구 (None 반환 시 미결정, route_fn이 None이면 도구 구분 안 함)
+        """
+        self.embed_fn = embed_fn
+        self.similarity_threshold = float(similarity_threshold)
+        self.max_entries = int(max_entries)
+        self.default_ttl_seconds = float(default_ttl_seconds)
+        self.tool_ttl_seconds = dict(tool_ttl_seconds or {})
+        self.version_fn = version_fn
+        self.version_check_interval = float(version_check_interval)
+        self.route_fn = route_fn
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}     # 난이도 → 항목 리스트
+        self._versions: Dict[str, str] = {}                     # 마지막으로 확인한 테이블 지문
+        self._epochs: Dict[str, int] = {t: 0 for t in WATCHED_TABLES}  # 테이블별 무효화 세대
+        self._last_version_check = 0.0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "expirations": 0, "invalidations": 0, "evictions": 0}
+
+    # ---------------------- 무효화 ---------------------- #
+    def invalidate(self, table: Optional[str] = None) -> int:
+        """
+        테이블 변경에 따른 무효화
+
+        Args:
+            table: 변경된 테이블 (None이면 전체 삭제)
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self._lock:
+            if table is None:
+                removed = sum(len(items) for items in self._entries.values())
+                self._entries.clear()
+                self._epochs = {t: e + 1 for t, e in self._epochs.items()}
+            else:
+                self._epochs[table] = self._epochs.get(table, 0) + 1
+                removed = 0
+                for difficulty, items in self._entries.items():
+                    kept = [e for e in items if table not in e["tables"]]
+                    removed += len(items) - len(kept)
+                    self._entries[difficulty] = kept
+            self._stats["invalidations"] += removed
+            return removed
+
+    def _check_versions(self):
+        """
+        version_check_interval마다 테이블 지문을 비교하여 변경된 테이블 무효화
+
+        - 확인 차례는 잠금 안에서 한 스레드만 가져감
+        - version_fn(DB 왕복)은 잠금 밖에서 호출 → 그동안 다른 조회/저장이 막히지 않음
+        - 무효화 반영은 다시 잠금 안에서
+        """
+        if self.version_fn is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_version_check < self.version_check_interval:
+                return
+            self._last_version_check = now
+
+        try:
+            versions = self.version_fn()
+        except Exception:
+            # DB 확인 실패 시 다음 주기에 재시도 (캐시는 TTL로 만료)
+            return
+
+        with self._lock:
+            for table, version in versions.items():
+                previous = self._versions.get(table)
+                if previous is not None and previous != version:
+                    self.invalidate(table)
+                self._versions[table] = version
+
+    def _route(self, question: str) -> Optional[str]:
+        """캐시 키의 도구 성분 (route_fn 없으면 None)"""
+        return self.route_fn(question) if self.route_fn is not None else None
+
+    # ---------------------- 조회 ---------------------- #
+    def lookup(self, question: str, difficulty: str) -> Optional[Dict[str, Any]]:
+        """
+        유사 질문의 답변 조회
+
+        Args:
+            question: 사용자 질문
+            difficulty: 난이도
+
+        Returns:
+            캐시 히트 시 {"response", "similarity", "question", "tool", "age_seconds"}, 미스 시 None
+        """
+        self._check_versions()
+        route = self._route(question)
+
+        with self._lock:
+            if not any(e["route"] == route for e in self._entries.get(difficulty, [])):
+                self._stats["misses"] += 1
+                return None
+
+        vector = _unit(self.embed_fn(question))
+
+        with self._lock:
+            now = time.time()
+            items = self._entries.get(difficulty, [])
+
+            # 만료 항목 정리
+            alive = [e for e in items if e["expires_at"] > now]
+            self._stats["expirations"] += len(items) - len(alive)
+            self._entries[difficulty] = alive
+
+            best, best_sim = None, -1.0
+            for entry in alive:
+                if entry["route"] != route:
+                    continue
+                sim = _dot(vector, entry["vector"])
+                if sim > best_sim:
+                    best, best_sim = entry, sim
+
+            if best is None or best_sim < self.similarity_threshold:
+                self._stats["misses"] += 1
+                return None
+
+            best["last_used"] = now
+            self._stats["hits"] += 1
+            return {
+                "response": dict(best["response"]),
+                "similarity": best_sim,
+                "question": best["question"],
+                "tool": best["tool"],
+                "age_seconds": now - best["created_at"],
+            }
+
+    # ---------------------- 저장 ---------------------- #
+    def store(self, question: str, difficulty: str, response: Dict[str, Any]) -> bool:
+        """
+        그래프 응답 저장
+
+        Args:
+            question: 사용자 질문
+            difficulty: 난이도
+            response: 그래프 최종 상태
+
+        Returns:
+            bool: 저장 여부 (실패 응답/TTL 0 도구는 저장 안 함)
+        """
+        tool = response.get("tool_choice") or "unknown"
+        if response.get("tool_status", "success") != "success" or not response.get("final_answer"):
+            return False
+
+        # 파이프라인이면 포함된 모든 도구 중 가장 짧은 TTL 적용
+        tools = list(response.get("tool_pipeline") or []) or [tool]
+        ttl = min(float(self.tool_ttl_seconds.get(t, self.default_ttl_seconds)) for t in tools)
+        if ttl <= 0:
+            return False
+        tables = {t for name in tools for t in TOOL_DEPENDENCIES.get(name, ())}
+
+        with self._lock:
+            epochs = dict(self._epochs)
+
+        route = self._route(question)
+        vector = _unit(self.embed_fn(question))
+        now = time.time()
+        entry = {
+            "vector": vector,
+            "question": question,
+            "tool": tool,
+            "route": route,
+            "tables": tables,
+            "response": {k: response[k] for k in CACHED_FIELDS if k in response},
+            "created_at": now,
+            "last_used": now,
+            "expires_at": now + ttl,
+        }
+
+        with self._lock:
+            # 임베딩 계산 중 의존 테이블이 변경되었으면 저장하지 않음
+            if any(epochs.get(t) != self._epochs.get(t) for t in tables):
+                return False
+
+            self._entries.setdefault(difficulty, []).append(entry)
+            self._stats["stores"] += 1
+            self._evict_if_needed()
+        return True
+
+    def _evict_if_needed(self):
+        """max_entries 초과 시 가장 오래 사용되지 않은 항목부터 제거"""
+        total = sum(len(items) for items in self._entries.values())
+        while total > self.max_entries:
+            difficulty, idx = min(
+                ((d, i) for d, items in self._entries.items() for i in range(len(items))),
+                key=lambda pair: self._entries[pair[0]][pair[1]]["last_used"],
+            )
+            del self._entries[difficulty][idx]
+            self._stats["evictions"] += 1
+            total -= 1
+
+    # ---------------------- 통계 ---------------------- #
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: size, hits, misses, hit_rate, stores, expirations, invalidations, evictions
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = sum(len(items) for items in self._entries.values())
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._entries.values())
+
+
+# ==================== 그래프 래퍼 ==================== #
+class CachedAgentGraph:
+    """
+    컴파일된 Agent 그래프 앞단에 답변 캐시를 두는 래퍼
+
+    - invoke / ainvoke / stream: 캐시 히트 시 그래프 실행 없이 저장된 응답 반환 (cache_hit=True)
+    - 그 외 속성(get_graph 등)은 원본 그래프로 위임
+    """
+
+    def __init__(self, graph, cache: SemanticAnswerCache, exp_manager=None):
+        """
+        Args:
+            graph: 컴파일된 LangGraph 그래프
+            cache: SemanticAnswerCache 인스턴스
+            exp_manager: ExperimentManager 인스턴스 (선택 사항)
+        """
+        self.graph = graph
+        self.cache = cache
+        self.exp_manager = exp_manager
+
+    def _log(self, message: str):
+        if self.exp_manager:
+            self.exp_manager.logger.write(message)
+
+    def _lookup(self, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (히트 시 응답 상태, 미스 / 캐시 대상 아님 시 None)"""
+        question = state.get("question", "")
+        difficulty = state.get("difficulty", "easy")
+        if not self._is_cacheable(state):
+            return None
+
+        start = time.perf_counter()
+        try:
+            hit = self.cache.lookup(question, difficulty)
+        except Exception as e:
+            # 임베딩 실패 등은 캐시 미스로 처리
+            self._log(f"답변 캐시 조회 실패: {e}")
+            hit = None
+
+        if not hit:
+            return None
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._log(
+            f"답변 캐시 히트: 유사도 {hit['similarity']:.4f}, 도구 {hit['tool']}, "
+            f"원 질문 '{hit['question']}' ({elapsed_ms:.1f}ms)"
+        )
+        response = dict(state)
+        response.update(hit["response"])
+        response["cache_hit"] = True
+        response["cache_similarity"] = round(hit["similarity"], 4)
+        response["cached_question"] = hit["question"]
+        response["tool_status"] = "success"
+        return response
+
+    def _store(self, state: Dict[str, Any], response: Any):
+        """그래프 실행 결과 저장 (캐시 대상일 때만)"""
+        if self._is_cacheable(state) and isinstance(response, dict):
+            try:
+                if self.cache.store(state.get("question", ""), state.get("difficulty", "easy"), response):
+                    self._log(f"답변 캐시 저장: 도구 {response.get('tool_choice')}")
+            except Exception as e:
+                self._log(f"답변 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def _is_cacheable(state: Dict[str, Any]) -> bool:
+        question = state.get("question", "")
+        return bool(question) and not is_context_dependent(question, state.get("messages"))
+
+    def invoke(self, state: Dict[str, Any], config=None, **kwargs) -> Dict[str, Any]:
+        """
+        답변 캐시 조회 후 미스면 그래프 실행 및 결과 저장
+
+        Args:
+            state: 그래프 입력 상태 (question, difficulty, messages)
+            config: LangGraph 실행 설정
+
+        Returns:
+            dict: 그래프 최종 상태 (캐시 히트 시 cache_hit, cache_similarity 포함)
+        """
+        # -------------- 캐시 조회 -------------- #
+        hit = self._lookup(state)
+        if hit is not None:
+            return hit
+
+        # -------------- 그래프 실행 -------------- #
+        response = self.graph.invoke(state, config=config, **kwargs)
+
+        # -------------- 결과 저장 -------------- #
+        self._store(state, response)
+        return response
+
+    async def ainvoke(self, state: Dict[str, Any], config=None, **kwargs) -> Dict[str, Any]:
+        """
+        invoke의 비동기 버전 (캐시 조회 / 저장의 임베딩 호출은 스레드에서 실행)
+
+        Args:
+            state: 그래프 입력 상태
+            config: LangGraph 실행 설정
+
+        Returns:
+            dict: 그래프 최종 상태
+        """
+        hit = await asyncio.to_thread(self._lookup, state)
+        if hit is not None:
+            return hit
+
+        response = await self.graph.ainvoke(state, config=config, **kwargs)
+        await asyncio.to_thread(self._store, state, response)
+        return response
+
+    def stream(self, state: Dict[str, Any], config=None, stream_mode=None, **kwargs):
+        """
+        답변 캐시 조회 후 미스면 그래프 스트리밍 실행 및 최종 상태 저장
+
+        Args:
+            state: 그래프 입력 상태
+            config: LangGraph 실행 설정
+            stream_mode: LangGraph stream_mode (리스트면 (mode, chunk) 튜플 반환)
+
+        Yields:
+            그래프 stream 결과 (캐시 히트 시 최종 상태 values 하나)
+        """
+        multi_mode = isinstance(stream_mode, list)
+
+        # -------------- 캐시 조회 -------------- #
+        hit = self._lookup(state)
+        if hit is not None:
+            yield ("values", hit) if multi_mode else hit
+            return
+
+        # -------------- 그래프 스트리밍 실행 -------------- #
+        last_values = None
+        for item in self.graph.stream(state, config=config, stream_mode=stream_mode, **kwargs):
+            if multi_mode and item[0] == "values":
+                last_values = item[1]
+            elif stream_mode in (None, "values"):
+                last_values = item
+            yield item
+
+        # -------------- 결과 저장 (values 모드로 최종 상태를 받은 경우) -------------- #
+        if last_values is not None:
+            self._store(state, last_values)
+
+    def __getattr__(self, name):
+        return getattr(self.graph, name)
+
+
+# ==================== 전역 캐시 인스턴스 ==================== #
+_answer_cache: Optional[SemanticAnswerCache] = None
+_answer_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> Optional[SemanticAnswerCache]:
+    """
+    프로세스 공용 답변 캐시 반환 (최초 호출 시 생성, 비활성화 시 None)
+
+    Returns:
+        SemanticAnswerCache 또는 None
+    """
+    global _answer_cache
+
+    config = _load_answer_cache_config()
+    if not config.get("enabled", True):
+        return None
+
+    if _answer_cache is None:
+        with _answer_cache_lock:
+            if _answer_cache is None:
+                from src.database.embeddings import get_embeddings, normalize_text
+                # 임베딩 클라이언트는 첫 조회 / 저장 때 생성 (프로세스 공용 인스턴스 재사용)
+                _answer_cache = SemanticAnswerCache(
+                    embed_fn=lambda text: get_embeddings().embed_query(normalize_text(text)),
+                    similarity_threshold=config["similarity_threshold"],
+                    max_entries=config["max_entries"],
+                    default_ttl_seconds=config["default_ttl_seconds"],
+                    tool_ttl_seconds=config["tool_ttl_seconds"],
+                    version_fn=fetch_table_versions,
+                    version_check_interval=config["version_check_interval"],
+                    route_fn=fast_route_tool,
+                )
+    return _answer_cache
+
+
+def invalidate_answer_cache(table: Optional[str] = None) -> int:
+    """
+    답변 캐시 무효화 (papers/glossary 저장 후 호출)
+
+    Args:
+        table: 변경된 테이블 (None이면 전체)
+
+    Returns:
+        int: 삭제된 항목 수 (캐시 미생성 시 0)
+    """
+    if _answer_cache is None:
+        return 0
+    return _answer_cache.invalidate(table)
+
+
+def get_answer_cache_stats() -> Dict[str, Any]:
+    """
+    답변 캐시 통계 반환 (캐시 미생성 시 빈 딕셔너리)
+
+    Returns:
+        dict: 답변 캐시 통계
+    """
+    if _answer_cache is None:
+        return {}
+    return _answer_cache.stats()
@@ -0,0 +1,128 @@
+# src/agent/async_nodes.py
+"""
+비동기 그래프 실행용 노드 어댑터
+
+create_agent_graph()가 등록하는 노드는 동기 함수(invoke)와 비동기 함수(ainvoke)를 모두 갖습니다:
+- 동기 호출 (기존 UI / 스크립트): 기존 노드 함수를 그대로 실행
+- 비동기 호출 (graph.ainvoke / astream):
+  - 네이티브 비동기 노드(general / search_paper / glossary / summarize)는 이벤트 루프에서 직접 실행
+    - LLM 답변 생성은 llm.ainvoke, DB 검색 등 블로킹 구간만 run_blocking으로 공용 스레드 풀 사용
+  - 나머지 블로킹 I/O 노드(psycopg2, Tavily, 동기 LLM)는 노드 전체를 제한된 공용 스레드 풀에서 실행
+    → 요청 하나가 스레드 하나를 끝까지 점유하지 않고, 블로킹 구간만 스레드를 사용
+
+동시 사용자 처리량 비교: scripts/benchmark/bench_concurrency.py
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+# ------------------------- LangChain 라이브러리 ------------------------- #
+from langchain_core.runnables import RunnableLambda
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 async_graph 섹션이 없을 때 사용
+DEFAULT_ASYNC_GRAPH_CONFIG = {
+    "enabled": True,                                # 노드에 비동기 경로 등록 (동기 경로는 그대로)
+    "blocking_workers": 16,                         # 블로킹 노드 실행용 공용 스레드 수
+}
+
+
+def get_async_graph_config() -> Dict[str, Any]:
+    """
+    비동기 그래프 설정 로드 (기본값과 병합)
+
+    Returns:
+        비동기 그래프 설정 딕셔너리
+    """
+    config = dict(DEFAULT_ASYNC_GRAPH_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("async_graph", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+# ==================== 블로킹 노드 실행 풀 ==================== #
+_blocking_executor: Optional[ThreadPoolExecutor] = None
+_blocking_lock = threading.Lock()
+
+
+def _get_blocking_executor() -> ThreadPoolExecutor:
+    """블로킹 노드 실행용 스레드 풀 (최초 호출 시 생성)"""
+    global _blocking_executor
+
+    if _blocking_executor is None:
+        with _blocking_lock:
+            if _blocking_executor is None:
+                _blocking_executor = ThreadPoolExecutor(
+                    max_workers=int(get_async_graph_config()["blocking_workers"]),
+                    thread_name_prefix="agent-blocking",
+                )
+    return _blocking_executor
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """
+    블로킹 함수를 공용 스레드 풀에서 실행하고 결과를 기다림 (비동기 노드의 DB 검색 구간 등)
+
+    호출 컨텍스트(LangChain 콜백 / 스트리밍)를 워커 스레드로 복사
+
+    Args:
+        func: 블로킹 함수
+        *args / **kwargs: func 인자
+
+    Returns:
+        func 반환값
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_get_blocking_executor(), partial(ctx.run, func, *args, **kwargs))
+
+
+def to_async_node(node_func: Callable) -> Callable:
+    """
+    동기 노드 함수 → 비동기 노드 함수 (공용 스레드 풀에서 실행)
+
+    호출 컨텍스트(LangChain 콜백 / 스트리밍)를 워커 스레드로 복사
+
+    Args:
+        node_func: state → state 동기 함수 (exp_manager는 partial로 바인딩)
+
+    Returns:
+        Callable: state → Awaitable[state]
+    """
+    async def async_node(state):
+        return await run_blocking(node_func, state)
+
+    async_node.__name__ = getattr(node_func, "__name__", "async_node")
+    return async_node
+
+
+def dual_node(node_func: Callable, async_node_func: Optional[Callable] = None, exp_manager=None, name: str = None):
+    """
+    동기 / 비동기 경로를 모두 가진 그래프 노드 생성
+
+    Args:
+        node_func: 동기 노드 함수 (state, exp_manager)
+        async_node_func: 비동기 노드 함수 (없으면 to_async_node(node_func))
+        exp_manager: 노드에 바인딩할 ExperimentManager
+        name: 노드 실행 이름 (트레이싱 표시용)
+
+    Returns:
+        RunnableLambda: invoke → node_func, ainvoke → async_node_func
+    """
+    sync_fn = partial(node_func, exp_manager=exp_manager)
+    if async_node_func is not None:
+        async_fn = partial(async_node_func, exp_manager=exp_manager)
+    else:
+        async_fn = to_async_node(sync_fn)
+    return RunnableLambda(sync_fn, afunc=async_fn, name=name or getattr(node_func, "__name__", None))
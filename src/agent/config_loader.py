@@ -36,6 +36,8 @@ DEFAULT_CONFIG = {
 # ==================== 설정 캐시 ==================== #
 _config_cache = None
 _multi_request_patterns_cache = None
+_fast_router_config_cache = None
+_routing_config_cache = None
 
 
 # ==================== 설정 로더 함수 ==================== #
@@ -393,3 +395,95 @@ def get_multi_request_patterns() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: 다중 요청 패턴 리스트
     """
     return load_multi_request_patterns()
+
+
+# ==================== 고속 라우터 설정 로더 ==================== #
+DEFAULT_FAST_ROUTER_CONFIG = {
+    "enabled": True,                    # 고속 라우터 사용 여부
+    "confidence_threshold": 0.5,        # 패턴 매칭 신뢰도가 이 값 미만이면 LLM 라우팅
+    "keyword_confidence_threshold": 0.7,  # 키워드 점수 신뢰도가 이 값 미만이면 LLM 라우팅 / 분류
+    "question_type_keywords": {},       # 질문 유형별 키워드
+}
+
+
+def get_fast_router_config(force_reload: bool = False) -> Dict[str, Any]:
+    """
+    고속 라우터 설정 로드 (multi_request_patterns.yaml의 fast_router 섹션)
+
+    Args:
+        force_reload: 캐시 무시하고 강제로 재로드
+
+    Returns:
+        Dict[str, Any]: 기본값과 병합된 고속 라우터 설정
+    """
+    global _fast_router_config_cache
+
+    if _fast_router_config_cache is not None and not force_reload:
+        return _fast_router_config_cache
+
+    config = dict(DEFAULT_FAST_ROUTER_CONFIG)
+    config_path = Path(__file__).parent.parent.parent / "configs" / "multi_request_patterns.yaml"
+
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+        config.update(data.get("fast_router", {}) or {})
+    except Exception as e:
+        print(f"경고: 고속 라우터 설정 로드 실패: {e}")
+        print("기본 설정을 사용합니다.")
+
+    _fast_router_config_cache = config
+    return _fast_router_config_cache
+
+
+# ==================== 라우팅 모드 설정 로더 ==================== #
+ROUTING_MODES = ("chain", "combined")
+
+DEFAULT_ROUTING_CONFIG = {
+    "mode": "chain",                    # chain: 분류 → 라우팅 → 검증 순차 호출 / combined: 1회 통합 호출
+    "structured_output": True,          # combined 모드에서 JSON Schema 구조화 출력 우선 사용
+}
+
+
+def get_routing_config(force_reload: bool = False) -> Dict[str, Any]:
+    """
+    라우팅 모드 설정 로드 (model_config.yaml의 routing 섹션)
+
+    Args:
+        force_reload: 캐시 무시하고 강제로 재로드
+
+    Returns:
+        Dict[str, Any]: 기본값과 병합된 라우팅 설정 (알 수 없는 mode는 chain)
+    """
+    global _routing_config_cache
+
+    if _routing_config_cache is not None and not force_reload:
+        return _routing_config_cache
+
+    config = dict(DEFAULT_ROUTING_CONFIG)
+    config_path = Path(__file__).parent.parent.parent / "configs" / "model_config.yaml"
+
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+        config.update(data.get("routing", {}) or {})
+    except Exception as e:
+        print(f"경고: 라우팅 설정 로드 실패: {e}")
+        print("기본 설정을 사용합니다.")
+
+    if config.get("mode") not in ROUTING_MODES:
+        print(f"경고: 알 수 없는 라우팅 모드: {config.get('mode')} → chain 사용")
+        config["mode"] = "chain"
+
+    _routing_config_cache = config
+    return _routing_config_cache
+
+
+def is_combined_routing() -> bool:
+    """
+    통합 라우팅(combined) 모드 여부 반환
+
+    Returns:
+        bool: routing.mode == "combined"
+    """
+    return get_routing_config().get("mode") == "combined"
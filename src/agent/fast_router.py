@@ -0,0 +1,316 @@
+# src/agent/fast_router.py
+"""
+결정론적 고속 라우터 모듈 (LLM 호출 없음)
+
+configs/multi_request_patterns.yaml의 패턴 키워드와 질문 유형 키워드로
+Aho-Corasick 오토마톤을 로드 시점에 한 번만 구성하고,
+질문을 한 번 순회하여 도구와 신뢰도(confidence)를 결정합니다.
+
+- 패턴 매칭: 기존 router_node의 우선순위 순회와 동일한 결과
+  (키워드 포함 여부를 문자열 스캔 대신 매칭 집합 조회로 판정)
+- 패턴 미매칭: 질문 유형 키워드 점수로 도구 추정
+- confidence < 임계값이면 LLM 라우팅으로 위임
+  (패턴: confidence_threshold, 키워드 점수: keyword_confidence_threshold
+   → 키워드 1개 / 여러 유형에 걸친 단서만으로는 LLM을 생략하지 않음)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.config_loader import (
+    get_fast_router_config,
+    get_multi_request_patterns,
+    get_priority_chain,
+)
+
+
+# ==================== Aho-Corasick 오토마톤 ==================== #
+class KeywordAutomaton:
+    """
+    다중 키워드 동시 탐색용 Aho-Corasick 오토마톤
+
+    - 구성: O(전체 키워드 길이)
+    - 탐색: O(질문 길이 + 매칭 수), 키워드 개수와 무관
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords: 탐색할 키워드 목록 (대소문자 구분, 중복 허용)
+        """
+        self._goto: List[Dict[str, int]] = [{}]         # 상태별 전이
+        self._fail: List[int] = [0]                     # 실패 링크
+        self._out: List[List[str]] = [[]]               # 상태별 매칭 키워드
+
+        for keyword in dict.fromkeys(kw for kw in keywords if kw):
+            self._add(keyword)
+        self._build_fail_links()
+
+    def _add(self, keyword: str):
+        """트라이에 키워드 추가"""
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(keyword)
+
+    def _build_fail_links(self):
+        """BFS로 실패 링크 구성 (출력은 실패 링크 방향으로 누적)"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0   # 루트 자식은 루트로
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """
+        텍스트에 포함된 모든 키워드 탐색 (한 번 순회)
+
+        Args:
+            text: 탐색 대상 문자열
+
+        Returns:
+            Set[str]: 포함된 키워드 집합
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            # 루트에서 시작할 수 없는 문자는 바로 건너뜀 (대부분의 문자)
+            if not state and ch not in root:
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+# ==================== 컴파일된 라우터 ==================== #
+class CompiledRouter:
+    """
+    패턴 + 질문 유형 키워드를 하나의 오토마톤으로 컴파일한 라우터
+
+    route() 결과:
+        {
+            "tool": 첫 번째 도구,
+            "tools": 순차 실행 도구 리스트,
+            "confidence": 0.0 ~ 1.0,
+            "method": "pattern" | "keyword" | "none",
+            "question_type": 추정 질문 유형 (없으면 None),
+            "type_confidence": 질문 유형 추정 신뢰도 (키워드 점수 기준),
+            "pattern": 매칭된 패턴 딕셔너리 (없으면 None),
+            "matched_keywords": 매칭된 키워드 리스트,
+        }
+    """
+
+    def __init__(
+        self,
+        patterns: List[Dict[str, Any]],
+        question_type_keywords: Dict[str, List[str]],
+        confidence_threshold: float = 0.5,
+        keyword_confidence_threshold: float = 0.7,
+    ):
+        """
+        Args:
+            patterns: 다중 요청 패턴 (우선순위 내림차순 정렬)
+            question_type_keywords: 질문 유형별 키워드
+            confidence_threshold: 패턴 매칭 결과가 이 값 미만이면 LLM 라우팅 필요
+            keyword_confidence_threshold: 키워드 점수 추정이 이 값 미만이면 LLM 라우팅 / 분류 필요
+        """
+        self.patterns = patterns
+        self.question_type_keywords = {qt: list(kws) for qt, kws in (question_type_keywords or {}).items()}
+        self.confidence_threshold = float(confidence_threshold)
+        self.keyword_confidence_threshold = float(keyword_confidence_threshold)
+
+        # 패턴 판정용 키워드 집합 (매칭 집합과 집합 연산으로 비교)
+        self._pattern_sets = [
+            (
+                pattern,
+                frozenset(pattern.get("keywords", [])),
+                frozenset(pattern.get("any_of_keywords", [])),
+                frozenset(pattern.get("exclude_keywords", [])),
+            )
+            for pattern in patterns
+        ]
+
+        keywords: List[str] = []
+        for pattern in patterns:
+            keywords += pattern.get("keywords", [])
+            keywords += pattern.get("any_of_keywords", [])
+            keywords += pattern.get("exclude_keywords", [])
+        for kws in self.question_type_keywords.values():
+            keywords += kws
+        self.automaton = KeywordAutomaton(keywords)
+
+    # ---------------------- 패턴 판정 ---------------------- #
+    def _matched_patterns(self, found: Set[str]) -> List[Dict[str, Any]]:
+        """기존 router_node 판정과 동일: AND(keywords) + OR(any_of) + NOT(exclude), 우선순위 순"""
+        return [
+            pattern
+            for pattern, required, any_of, exclude in self._pattern_sets
+            if required <= found and (not any_of or any_of & found) and not exclude & found
+        ]
+
+    # ---------------------- 라우팅 ---------------------- #
+    def route(self, question: str) -> Dict[str, Any]:
+        """
+        질문 → 도구 결정 (LLM 호출 없음)
+
+        Args:
+            question: 사용자 질문
+
+        Returns:
+            dict: 라우팅 결과 (클래스 docstring 참고)
+        """
+        found = self.automaton.find(question)
+        type_scores = self._score_question_types(found)
+        question_type = max(type_scores, key=type_scores.get) if type_scores else None
+        type_confidence = self._type_confidence(type_scores, question_type)
+
+        # -------------- 1) 패턴 매칭 (우선순위 순) -------------- #
+        matched = self._matched_patterns(found)
+        if matched:
+            winner = matched[0]
+            # 다른 도구 조합을 가리키는 패턴이 함께 매칭되면 우선순위 비율만큼 신뢰도 감소
+            competing = sum(
+                max(p.get("priority", 0), 1) for p in matched[1:] if p.get("tools") != winner.get("tools")
+            )
+            winner_weight = max(winner.get("priority", 0), 1)
+            return {
+                "tool": winner["tools"][0],
+                "tools": list(winner["tools"]),
+                "confidence": round(winner_weight / (winner_weight + competing), 4),
+                "method": "pattern",
+                "question_type": question_type,
+                "type_confidence": type_confidence,
+                "pattern": winner,
+                "matched_keywords": sorted(found),
+            }
+
+        # -------------- 2) 질문 유형 키워드 점수 -------------- #
+        if question_type:
+            tool = get_priority_chain(question_type)[0]
+            return {
+                "tool": tool,
+                "tools": [tool],
+                "confidence": type_confidence,
+                "method": "keyword",
+                "question_type": question_type,
+                "type_confidence": type_confidence,
+                "pattern": None,
+                "matched_keywords": sorted(found),
+            }
+
+        return {
+            "tool": "general",
+            "tools": ["general"],
+            "confidence": 0.0,
+            "method": "none",
+            "question_type": None,
+            "type_confidence": 0.0,
+            "pattern": None,
+            "matched_keywords": [],
+        }
+
+    def _score_question_types(self, found: Set[str]) -> Dict[str, int]:
+        """질문 유형별 매칭 키워드 수 (0점 유형 제외, 동점은 설정 순서 우선)"""
+        scores: Dict[str, int] = {}
+        for question_type, keywords in self.question_type_keywords.items():
+            hits = sum(1 for kw in keywords if kw in found)
+            if hits:
+                scores[question_type] = hits
+        return scores
+
+    @staticmethod
+    def _type_confidence(type_scores: Dict[str, int], question_type: Optional[str]) -> float:
+        """
+        질문 유형 추정 신뢰도
+
+        단일 유형 키워드 1개: 0.6 / 2개 이상: 0.9 (패턴 매칭보다 낮게 0.9 상한),
+        다른 유형 키워드가 함께 나오면 점유율만큼 감소 (예: 2개 vs 1개 → 0.6)
+        """
+        if not question_type:
+            return 0.0
+        top = type_scores[question_type]
+        share = top / sum(type_scores.values())
+        return round(0.9 * share * min(1.0, (top + 1) / 3), 4)
+
+    def is_confident(self, decision: Dict[str, Any]) -> bool:
+        """
+        LLM 호출 없이 결과를 사용해도 되는지 여부
+
+        Args:
+            decision: route() 결과
+
+        Returns:
+            bool: 패턴이면 confidence >= confidence_threshold,
+                  키워드 점수면 confidence >= keyword_confidence_threshold
+        """
+        if decision["method"] == "pattern":
+            return decision["confidence"] >= self.confidence_threshold
+        if decision["method"] == "keyword":
+            return decision["confidence"] >= self.keyword_confidence_threshold
+        return False
+
+    def is_type_confident(self, decision: Dict[str, Any]) -> bool:
+        """
+        질문 유형 LLM 분류를 생략해도 되는지 여부 (패턴 매칭 여부와 무관하게 키워드 점수 기준)
+
+        Args:
+            decision: route() 결과
+
+        Returns:
+            bool: type_confidence >= keyword_confidence_threshold
+        """
+        return bool(decision["question_type"]) and decision["type_confidence"] >= self.keyword_confidence_threshold
+
+
+# ==================== 전역 인스턴스 ==================== #
+_compiled_router: Optional[CompiledRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_compiled_router(force_rebuild: bool = False) -> CompiledRouter:
+    """
+    프로세스 공용 CompiledRouter 반환 (최초 호출 시 한 번만 컴파일)
+
+    Args:
+        force_rebuild: 패턴 파일 변경 후 재컴파일
+
+    Returns:
+        CompiledRouter 인스턴스
+    """
+    global _compiled_router
+
+    if _compiled_router is None or force_rebuild:
+        with _router_lock:
+            if _compiled_router is None or force_rebuild:
+                config = get_fast_router_config()
+                _compiled_router = CompiledRouter(
+                    patterns=get_multi_request_patterns(),
+                    question_type_keywords=config.get("question_type_keywords", {}),
+                    confidence_threshold=config.get("confidence_threshold", 0.5),
+                    keyword_confidence_threshold=config.get("keyword_confidence_threshold", 0.7),
+                )
+    return _compiled_router
@@ -6,6 +6,8 @@ LangGraph StateGraph 기반 AI Agent 그래프:
 - 노드 추가 (router + 7개 도구 + Fallback 노드들)
 - 조건부 엣지 설정 (Fallback Chain 지원)
 - 그래프 컴파일
+- 노드별 동기 / 비동기 경로 등록 (invoke와 ainvoke 모두 지원, src/agent/async_nodes.py)
+- 다중 요청 파이프라인의 독립 도구 동시 실행 (depends_on 선언 패턴, src/agent/parallel_pipeline.py)
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
@@ -21,11 +23,15 @@ from src.agent.state import AgentState
 from src.agent.nodes import (
     router_node,
     general_answer_node,
+    general_answer_node_async,
     save_file_node,
     search_paper_node,
+    search_paper_node_async,
     web_search_node,
     glossary_node,
+    glossary_node_async,
     summarize_node,
+    summarize_node_async,
     text2sql_node,
     fallback_router_node,
     validate_tool_choice_node,
@@ -35,11 +41,18 @@ from src.agent.config_loader import (
     load_fallback_config,
     get_priority_chain,
     is_fallback_enabled,
-    is_validation_enabled
+    is_validation_enabled,
+    get_fast_router_config,
+    is_combined_routing
 )
 from src.agent.question_classifier import classify_question
+from src.agent.fast_router import get_compiled_router
 from src.agent.failure_detector import is_tool_failed
-from src.agent.tool_wrapper import wrap_tool_node
+from src.agent.tool_wrapper import awrap_tool_node, wrap_tool_node
+from src.agent.async_nodes import dual_node, get_async_graph_config
+from src.agent.parallel_pipeline import PARALLEL_NODE, make_parallel_node, route_tool_or_parallel
+from src.agent.speculative import start_prefetch
+from src.agent.answer_cache import CachedAgentGraph, get_answer_cache
 
 
 # ==================== 라우팅 함수 ==================== #
@@ -198,7 +211,7 @@ def create_agent_graph(exp_manager=None):
         exp_manager: ExperimentManager 인스턴스 (선택 사항)
 
     Returns:
-        CompiledGraph: 컴파일된 Agent 그래프
+        CompiledGraph: 컴파일된 Agent 그래프 (답변 캐시 활성화 시 CachedAgentGraph로 감싸서 반환)
     """
     # -------------- 로깅 -------------- #
     if exp_manager:
@@ -220,33 +233,54 @@ def create_agent_graph(exp_manager=None):
     workflow = StateGraph(AgentState)           # AgentState 기반 그래프 생성
 
     # -------------- exp_manager를 바인딩한 노드 함수 생성 -------------- #
-    # partial을 사용하여 각 노드에 exp_manager를 미리 바인딩
-    router_with_exp = partial(router_node, exp_manager=exp_manager)
+    # async_graph.enabled: 동기(invoke) / 비동기(ainvoke) 경로를 모두 가진 노드로 등록
+    use_async = get_async_graph_config().get("enabled", True)
+
+    def bind(node_func, async_node_func=None):
+        """노드에 exp_manager 바인딩 (비동기 경로 포함 여부는 설정에 따름)"""
+        if use_async:
+            return dual_node(node_func, async_node_func, exp_manager=exp_manager)
+        # partial을 사용하여 각 노드에 exp_manager를 미리 바인딩
+        return partial(node_func, exp_manager=exp_manager)
+
+    router_with_exp = bind(router_node)
 
     # Fallback 활성화 시 도구 래퍼 적용
     if fallback_enabled:
         # 래퍼 적용 (tool_status 자동 설정)
-        general_with_exp = partial(wrap_tool_node(general_answer_node, "general"), exp_manager=exp_manager)
-        save_file_with_exp = partial(wrap_tool_node(save_file_node, "save_file"), exp_manager=exp_manager)
-        search_paper_with_exp = partial(wrap_tool_node(search_paper_node, "search_paper"), exp_manager=exp_manager)
-        web_search_with_exp = partial(wrap_tool_node(web_search_node, "web_search"), exp_manager=exp_manager)
-        glossary_with_exp = partial(wrap_tool_node(glossary_node, "glossary"), exp_manager=exp_manager)
-        summarize_with_exp = partial(wrap_tool_node(summarize_node, "summarize"), exp_manager=exp_manager)
-        text2sql_with_exp = partial(wrap_tool_node(text2sql_node, "text2sql"), exp_manager=exp_manager)
+        general_with_exp = bind(
+            wrap_tool_node(general_answer_node, "general"),
+            awrap_tool_node(general_answer_node_async, "general"),
+        )
+        save_file_with_exp = bind(wrap_tool_node(save_file_node, "save_file"))
+        search_paper_with_exp = bind(
+            wrap_tool_node(search_paper_node, "search_paper"),
+            awrap_tool_node(search_paper_node_async, "search_paper"),
+        )
+        web_search_with_exp = bind(wrap_tool_node(web_search_node, "web_search"))
+        glossary_with_exp = bind(
+            wrap_tool_node(glossary_node, "glossary"),
+            awrap_tool_node(glossary_node_async, "glossary"),
+        )
+        summarize_with_exp = bind(
+            wrap_tool_node(summarize_node, "summarize"),
+            awrap_tool_node(summarize_node_async, "summarize"),
+        )
+        text2sql_with_exp = bind(wrap_tool_node(text2sql_node, "text2sql"))
     else:
         # 래퍼 없이 기존 방식
-        general_with_exp = partial(general_answer_node, exp_manager=exp_manager)
-        save_file_with_exp = partial(save_file_node, exp_manager=exp_manager)
-        search_paper_with_exp = partial(search_paper_node, exp_manager=exp_manager)
-        web_search_with_exp = partial(web_search_node, exp_manager=exp_manager)
-        glossary_with_exp = partial(glossary_node, exp_manager=exp_manager)
-        summarize_with_exp = partial(summarize_node, exp_manager=exp_manager)
-        text2sql_with_exp = partial(text2sql_node, exp_manager=exp_manager)
+        general_with_exp = bind(general_answer_node, general_answer_node_async)
+        save_file_with_exp = bind(save_file_node)
+        search_paper_with_exp = bind(search_paper_node, search_paper_node_async)
+        web_search_with_exp = bind(web_search_node)
+        glossary_with_exp = bind(glossary_node, glossary_node_async)
+        summarize_with_exp = bind(summarize_node, summarize_node_async)
+        text2sql_with_exp = bind(text2sql_node)
 
     # Fallback 관련 노드
-    fallback_router_with_exp = partial(fallback_router_node, exp_manager=exp_manager)
-    validator_with_exp = partial(validate_tool_choice_node, exp_manager=exp_manager)
-    final_fallback_with_exp = partial(final_fallback_node, exp_manager=exp_manager)
+    fallback_router_with_exp = bind(fallback_router_node)
+    validator_with_exp = bind(validate_tool_choice_node)
+    final_fallback_with_exp = bind(final_fallback_node)
 
     # -------------- 노드 추가 -------------- #
     workflow.add_node("router", router_with_exp)                    # 라우터 노드
@@ -271,12 +305,30 @@ def create_agent_graph(exp_manager=None):
     if fallback_enabled:
         # ========== Fallback Chain 활성화 모드 ========== #
 
+        # 독립 도구 묶음 동시 실행 노드 (depends_on이 선언된 패턴에서만 사용)
+        parallel_sync, parallel_async = make_parallel_node({
+            "general": general_with_exp,
+            "glossary": glossary_with_exp,
+            "search_paper": search_paper_with_exp,
+            "web_search": web_search_with_exp,
+            "summarize": summarize_with_exp,
+            "text2sql": text2sql_with_exp,
+            "save_file": save_file_with_exp,
+        })
+        workflow.add_node(PARALLEL_NODE, bind(parallel_sync, parallel_async))
+
+        def route_after_router(state: AgentState) -> str:
+            """검증 후 도구 선택 (첫 도구가 독립 도구 묶음이면 동시 실행 노드)"""
+            target = should_validate_and_route(state)
+            return target if target == "router" else route_tool_or_parallel(state, target)
+
         # Router → 검증 후 도구 선택
         workflow.add_conditional_edges(
             "router",
-            should_validate_and_route,
+            route_after_router,
             {
                 "router": "router",                 # 검증 실패 → 재라우팅
+                PARALLEL_NODE: PARALLEL_NODE,       # 독립 도구 동시 실행
                 "general": "general",               # 도구 선택
                 "glossary": "glossary",
                 "search_paper": "search_paper",
@@ -309,7 +361,7 @@ def create_agent_graph(exp_manager=None):
             return "end"
 
         # 각 도구 → Pipeline 또는 Fallback
-        for tool_name in ["general", "glossary", "search_paper", "web_search", "summarize", "text2sql", "save_file"]:
+        for tool_name in ["general", "glossary", "search_paper", "web_search", "summarize", "text2sql", "save_file", PARALLEL_NODE]:
             workflow.add_conditional_edges(
                 tool_name,
                 check_pipeline_or_fallback,
@@ -381,14 +433,15 @@ def create_agent_graph(exp_manager=None):
 
             return state
 
-        pipeline_router_with_exp = partial(pipeline_router, exp_manager=exp_manager)
+        pipeline_router_with_exp = bind(pipeline_router)
         workflow.add_node("pipeline_router", pipeline_router_with_exp)
 
-        # Pipeline Router → 다음 도구
+        # Pipeline Router → 다음 도구 (독립 도구 묶음이면 동시 실행 노드)
         workflow.add_conditional_edges(
             "pipeline_router",
-            route_to_tool,
+            lambda state: route_tool_or_parallel(state, route_to_tool(state)),
             {
+                PARALLEL_NODE: PARALLEL_NODE,
                 "general": "general",
                 "glossary": "glossary",
                 "search_paper": "search_paper",
@@ -446,6 +499,19 @@ def create_agent_graph(exp_manager=None):
     if exp_manager:
         exp_manager.logger.write("Agent 그래프 컴파일 완료")
 
+    # -------------- 의미 기반 답변 캐시 (그래프 앞단) -------------- #
+    try:
+        answer_cache = get_answer_cache()       # model_config.yaml answer_cache.enabled=false면 None
+    except Exception as e:
+        # 캐시를 만들 수 없어도 그래프는 그대로 사용
+        answer_cache = None
+        if exp_manager:
+            exp_manager.logger.write(f"답변 캐시 생성 실패 (캐시 없이 실행): {e}")
+    if answer_cache is not None:
+        if exp_manager:
+            exp_manager.logger.write(f"답변 캐시 활성화 (유사도 임계값: {answer_cache.similarity_threshold})")
+        agent_executor = CachedAgentGraph(agent_executor, answer_cache, exp_manager=exp_manager)
+
     return agent_executor                       # 컴파일된 그래프 반환
 
 
@@ -472,14 +538,31 @@ def initialize_fallback_state(state: AgentState, exp_manager=None) -> AgentState
     question = state.get("question", "")
     difficulty = state.get("difficulty", "easy")
 
-    question_type = classify_question(
-        question=question,
-        difficulty=difficulty,
-        logger=exp_manager.logger if exp_manager else None
-    )
+    # 고속 라우터가 충분히 확신하면 LLM 분류 생략
+    fast_decision = get_compiled_router().route(question)
+    if (
+        get_fast_router_config().get("enabled", True)
+        and get_compiled_router().is_type_confident(fast_decision)
+    ):
+        question_type = fast_decision["question_type"]
+        if exp_manager:
+            exp_manager.logger.write(f"질문 유형 고속 분류: {question_type} (confidence: {fast_decision['type_confidence']})")
+    elif is_combined_routing():
+        # 통합 라우팅 모드: 질문 유형은 router_node의 1회 호출에서 함께 결정
+        question_type = ""
+        if exp_manager:
+            exp_manager.logger.write("통합 라우팅 모드: 질문 유형 분류를 라우터 호출과 병합")
+    else:
+        # 분류 LLM 호출 동안 도구 검색 선행 (speculative_prefetch, opt-in)
+        start_prefetch(state, question, difficulty, exp_manager)
+        question_type = classify_question(
+            question=question,
+            difficulty=difficulty,
+            logger=exp_manager.logger if exp_manager else None
+        )
 
     # -------------- 도구 우선순위 로드 -------------- #
-    fallback_chain = get_priority_chain(question_type)
+    fallback_chain = get_priority_chain(question_type) if question_type else []
 
     # -------------- 상태 초기화 -------------- #
     state["retry_count"] = 0
@@ -498,6 +581,6 @@ def initialize_fallback_state(state: AgentState, exp_manager=None) -> AgentState
     if exp_manager:
         exp_manager.logger.write("Fallback Chain 상태 초기화 완료")
         exp_manager.logger.write(f"질문 유형: {question_type}")
-        exp_manager.logger.write(f"Fallback Chain: {' → '.join(fallback_chain)}")
+        exp_manager.logger.write(f"Fallback Chain: {' → '.join(fallback_chain) or '(라우터에서 결정)'}")
 
     return state
@@ -8,25 +8,38 @@ LangGraph Agent의 노드 함수들:
 """
 
 # ==================== 라이브러리 Import ==================== #
+import time
 from datetime import datetime
 from src.agent.state import AgentState
 from src.llm.client import LLMClient
-from src.prompts import get_routing_prompt
-from src.agent.config_loader import get_priority_chain, get_max_retries, get_max_validation_retries, get_multi_request_patterns
+from src.prompts import get_routing_prompt, get_combined_routing_prompt
+from src.agent.config_loader import (
+    get_priority_chain,
+    get_max_retries,
+    get_max_validation_retries,
+    get_fast_router_config,
+    get_routing_config,
+    is_combined_routing,
+)
 from src.agent.question_classifier import classify_question
+from src.agent.fast_router import get_compiled_router
+from src.agent.structured_router import invoke_combined_router
+from src.agent.speculative import settle_prefetch, start_prefetch
+from src.utils.tracing import traced
 
 # ==================== 도구 Import ==================== #
-from src.tools.general_answer import general_answer_node
+from src.tools.general_answer import general_answer_node, general_answer_node_async
 from src.tools.save_file import save_file_node
-from src.tools.search_paper import search_paper_node
+from src.tools.search_paper import search_paper_node, search_paper_node_async
 from src.tools.web_search import web_search_node
-from src.tools.glossary import glossary_node
-from src.tools.summarize import summarize_node
+from src.tools.glossary import glossary_node, glossary_node_async
+from src.tools.summarize import summarize_node, summarize_node_async
 from src.tools.text2sql import text2sql
 
 
 # ==================== 라우터 노드 ==================== #
 # ---------------------- 질문 분석 및 도구 선택 ---------------------- #
+@traced("router_node")
 def router_node(state: AgentState, exp_manager=None):
     """
     라우터 노드: 질문을 분석하여 적절한 도구 선택
@@ -65,13 +78,17 @@ def router_node(state: AgentState, exp_manager=None):
     # 맥락 참조가 있어도 명확한 다중 요청 키워드가 있으면 패턴 매칭 시도
     skip_pattern_matching = has_contextual_ref and len(state.get("messages", [])) > 1 and not has_multi_request_indicator
 
-    # 디버깅 로그
+    # 디버깅 로그 (logging.level: INFO 이상이면 기록 안 함)
     if exp_manager:
-        exp_manager.logger.write(f"패턴 매칭 조건 체크:")
-        exp_manager.logger.write(f"  has_contextual_ref: {has_contextual_ref}")
-        exp_manager.logger.write(f"  has_multi_request_indicator: {has_multi_request_indicator}")
-        exp_manager.logger.write(f"  messages 개수: {len(state.get('messages', []))}")
-        exp_manager.logger.write(f"  skip_pattern_matching: {skip_pattern_matching}")
+        exp_manager.logger.write(f"패턴 매칭 조건 체크:", level="DEBUG")
+        exp_manager.logger.write(f"  has_contextual_ref: {has_contextual_ref}", level="DEBUG")
+        exp_manager.logger.write(f"  has_multi_request_indicator: {has_multi_request_indicator}", level="DEBUG")
+        exp_manager.logger.write(f"  messages 개수: {len(state.get('messages', []))}", level="DEBUG")
+        exp_manager.logger.write(f"  skip_pattern_matching: {skip_pattern_matching}", level="DEBUG")
+
+    # 고속 라우터 (키워드 오토마톤) 결과: 맥락 참조로 패턴 매칭을 건너뛰면 None
+    fast_router_enabled = get_fast_router_config().get("enabled", True)
+    fast_decision = None
 
     if skip_pattern_matching:
         # 맥락 참조가 있고 다중 요청 아닌 경우만 패턴 매칭 건너뛰기
@@ -80,137 +97,144 @@ def router_node(state: AgentState, exp_manager=None):
         # 패턴 매칭을 건너뛰고 LLM 라우팅으로 진행
         pass
     else:
-        # -------------- 다중 요청 감지 (YAML 패턴 기반) -------------- #
-        # YAML 파일에서 패턴 로드 (우선순위 정렬됨)
-        multi_request_patterns = get_multi_request_patterns()
+        # -------------- 다중 요청 감지 (컴파일된 키워드 오토마톤) -------------- #
+        # 패턴 + 질문 유형 키워드를 질문 1회 순회로 탐색 (src/agent/fast_router.py)
+        compiled_router = get_compiled_router()
+        fast_decision = compiled_router.route(question)
 
         if exp_manager:
-            exp_manager.logger.write(f"패턴 매칭 시작: 총 {len(multi_request_patterns)}개 패턴 체크")
-
-        # 다중 요청 패턴 확인 (우선순위 높은 순서대로)
-        pattern_matched = False
-        for pattern in multi_request_patterns:
+            exp_manager.logger.write(f"패턴 매칭 시작: 총 {len(compiled_router.patterns)}개 패턴 체크", level="DEBUG")
+            exp_manager.logger.write(
+                f"고속 라우터 결과: {fast_decision['method']} → {fast_decision['tools']} "
+                f"(confidence: {fast_decision['confidence']})"
+            )
+
+        # 패턴 매칭 결과 사용 여부 (고속 라우터 비활성화 시 기존처럼 항상 사용)
+        pattern_matched = fast_decision["method"] == "pattern" and (
+            not fast_router_enabled or compiled_router.is_confident(fast_decision)
+        )
+        if fast_decision["method"] == "pattern" and not pattern_matched and exp_manager:
+            exp_manager.logger.write(
+                f"패턴 충돌로 신뢰도 낮음 ({fast_decision['confidence']} < "
+                f"{compiled_router.confidence_threshold}) → LLM 라우팅 사용"
+            )
+
+        if pattern_matched:
+            pattern = fast_decision["pattern"]
             keywords = pattern.get("keywords", [])
             any_of_keywords = pattern.get("any_of_keywords", [])
             exclude_keywords = pattern.get("exclude_keywords", [])
             tools = pattern.get("tools", [])
+            description = pattern.get('description', 'N/A')
 
-            # 모든 키워드가 질문에 포함되는지 확인 (AND 로직)
-            keywords_match = all(kw in question for kw in keywords)
-
-            # any_of_keywords 중 하나라도 질문에 포함되는지 확인 (OR 로직)
-            # any_of_keywords가 없으면 True (조건 무시)
-            any_keywords_match = any(kw in question for kw in any_of_keywords) if any_of_keywords else True
-
-            # 제외 키워드가 하나라도 있으면 패턴 불일치
-            exclude_match = any(ex_kw in question for ex_kw in exclude_keywords) if exclude_keywords else False
-
-            if keywords_match and any_keywords_match and not exclude_match:
-                pattern_matched = True
-                description = pattern.get('description', 'N/A')
-
-                if exp_manager:
-                    pattern_info = f"키워드: {keywords}"
-                    if any_of_keywords:
-                        pattern_info += f" + 선택 키워드: {any_of_keywords}"
-                    if exclude_keywords:
-                        pattern_info += f" (제외: {exclude_keywords})"
-                    exp_manager.logger.write(f"✅ 다중 요청 감지: {pattern_info} → {tools}")
-                    exp_manager.logger.write(f"패턴 설명: {description}")
-                    if len(tools) > 1:
-                        exp_manager.logger.write(f"순차 실행 도구: {' → '.join(tools)}")
-                    else:
-                        exp_manager.logger.write(f"단일 도구 실행: {tools[0]}")
-
-                # tool_pipeline 설정 (순차 실행 도구 목록)
-                state["tool_pipeline"] = tools
-                state["tool_choice"] = tools[0]  # 첫 번째 도구부터 실행
-                state["pipeline_index"] = 1      # 첫 번째 도구 실행 후 index는 1
-
-                # 도구 선택 이유 및 방법 기록
-                state["routing_method"] = "pattern_based"
-                state["routing_reason"] = f"패턴 매칭: {description}"
-
+            if exp_manager:
+                pattern_info = f"키워드: {keywords}"
+                if any_of_keywords:
+                    pattern_info += f" + 선택 키워드: {any_of_keywords}"
+                if exclude_keywords:
+                    pattern_info += f" (제외: {exclude_keywords})"
+                exp_manager.logger.write(f"✅ 다중 요청 감지: {pattern_info} → {tools}")
+                exp_manager.logger.write(f"패턴 설명: {description}", level="DEBUG")
                 if len(tools) > 1:
-                    state["pipeline_description"] = f"순차 실행: {' → '.join(tools)}"
+                    exp_manager.logger.write(f"순차 실행 도구: {' → '.join(tools)}")
                 else:
-                    state["pipeline_description"] = f"단일 도구: {tools[0]}"
+                    exp_manager.logger.write(f"단일 도구 실행: {tools[0]}")
+
+            # tool_pipeline 설정 (순차 실행 도구 목록)
+            state["tool_pipeline"] = tools
+            state["tool_choice"] = tools[0]  # 첫 번째 도구부터 실행
+            state["pipeline_index"] = 1      # 첫 번째 도구 실행 후 index는 1
+            # 도구 간 의존성 (선언된 패턴만 독립 도구 동시 실행, src/agent/parallel_pipeline.py)
+            state["pipeline_dependencies"] = pattern.get("depends_on")
+            if exp_manager and pattern.get("depends_on") is not None:
+                exp_manager.logger.write(f"도구 의존성: {pattern.get('depends_on') or '없음 (모두 독립)'}")
+
+            # 도구 선택 이유 및 방법 기록
+            state["routing_method"] = "pattern_based"
+            state["routing_reason"] = f"패턴 매칭: {description}"
+
+            if len(tools) > 1:
+                state["pipeline_description"] = f"순차 실행: {' → '.join(tools)}"
+            else:
+                state["pipeline_description"] = f"단일 도구: {tools[0]}"
 
-                # ✅ 패턴 매칭 성공 후에도 맥락 참조가 있으면 LLM 호출하여 refined_query 생성
-                if has_contextual_ref and len(state.get("messages", [])) > 1:
-                    if exp_manager:
-                        exp_manager.logger.write(f"맥락 참조 감지: LLM 호출하여 질문 재작성")
-
-                    # 이전 대화 컨텍스트 추출 (동적 윈도우)
-                    messages = state.get("messages", [])
-                    context = ""
-                    if len(messages) > 1:
-                        # 최근 5개 메시지 사용 (이전 3개 → 5개로 확장)
-                        # 각 메시지는 200자로 제한하여 토큰 사용량 관리
-                        recent_messages = messages[-5:]  # 최근 5개 메시지
-                        context = "\n\n[이전 대화 컨텍스트]\n"
-                        for msg in recent_messages[:-1]:  # 마지막 메시지(현재 질문)는 제외
-                            role = "사용자" if hasattr(msg, 'type') and msg.type == "human" else "AI"
-                            content = msg.content if hasattr(msg, 'content') else str(msg)
-                            context += f"{role}: {content[:200]}...\n" if len(content) > 200 else f"{role}: {content}\n"
-
-                    # JSON 프롬프트 로드
-                    routing_prompt_template = get_routing_prompt()
-                    difficulty = state.get("difficulty", "easy")
-
-                    # 프롬프트에 컨텍스트 추가
-                    base_prompt = routing_prompt_template.format(question=question, difficulty=difficulty)
-                    routing_prompt = f"{context}{base_prompt}" if context else base_prompt
-
-                    # 난이도별 LLM 초기화
-                    llm_client = LLMClient.from_difficulty(
-                        difficulty=difficulty,
-                        logger=exp_manager.logger if exp_manager else None
-                    )
-
-                    try:
-                        # LLM 호출
-                        raw_response = llm_client.llm.invoke(routing_prompt).content.strip()
-
-                        # 마크다운 코드 펜스 제거
-                        cleaned_response = raw_response
-                        if "```" in cleaned_response:
-                            lines = cleaned_response.split("\n")
-                            lines = [line for line in lines if not line.strip().startswith("```")]
-                            cleaned_response = "\n".join(lines).strip()
-
-                        # query 필드 추출 (JSON 파싱 시도)
-                        if cleaned_response.strip().startswith("{"):
-                            try:
-                                import json
-                                parsed = json.loads(cleaned_response)
-
-                                if "tools" in parsed and len(parsed["tools"]) > 0:
-                                    tool_info = parsed["tools"][0]
-                                    if "query" in tool_info and tool_info["query"]:
-                                        refined_query = tool_info["query"].strip()
-                                        if refined_query:
-                                            state["refined_query"] = refined_query
-                                            if exp_manager:
-                                                exp_manager.logger.write(f"재작성된 질문: {refined_query}")
-                            except (json.JSONDecodeError, KeyError, IndexError):
-                                # JSON 파싱 실패 시 regex로 query 추출
-                                import re
-                                query_match = re.search(r'"query"\s*:\s*"([^"]+)"', cleaned_response)
-                                if query_match:
-                                    refined_query = query_match.group(1).strip()
+            # ✅ 패턴 매칭 성공 후에도 맥락 참조가 있으면 LLM 호출하여 refined_query 생성
+            if has_contextual_ref and len(state.get("messages", [])) > 1:
+                if exp_manager:
+                    exp_manager.logger.write(f"맥락 참조 감지: LLM 호출하여 질문 재작성")
+
+                # 이전 대화 컨텍스트 추출 (동적 윈도우)
+                messages = state.get("messages", [])
+                context = ""
+                if len(messages) > 1:
+                    # 최근 5개 메시지 사용 (이전 3개 → 5개로 확장)
+                    # 각 메시지는 200자로 제한하여 토큰 사용량 관리
+                    recent_messages = messages[-5:]  # 최근 5개 메시지
+                    context = "\n\n[이전 대화 컨텍스트]\n"
+                    for msg in recent_messages[:-1]:  # 마지막 메시지(현재 질문)는 제외
+                        role = "사용자" if hasattr(msg, 'type') and msg.type == "human" else "AI"
+                        content = msg.content if hasattr(msg, 'content') else str(msg)
+                        context += f"{role}: {content[:200]}...\n" if len(content) > 200 else f"{role}: {content}\n"
+
+                # JSON 프롬프트 로드
+                routing_prompt_template = get_routing_prompt()
+                difficulty = state.get("difficulty", "easy")
+
+                # 프롬프트에 컨텍스트 추가
+                base_prompt = routing_prompt_template.format(question=question, difficulty=difficulty)
+                routing_prompt = f"{context}{base_prompt}" if context else base_prompt
+
+                # 난이도별 LLM 초기화
+                llm_client = LLMClient.from_difficulty(
+                    difficulty=difficulty,
+                    logger=exp_manager.logger if exp_manager else None
+                )
+
+                try:
+                    # LLM 호출
+                    raw_response = llm_client.llm.invoke(routing_prompt).content.strip()
+
+                    # 마크다운 코드 펜스 제거
+                    cleaned_response = raw_response
+                    if "```" in cleaned_response:
+                        lines = cleaned_response.split("\n")
+                        lines = [line for line in lines if not line.strip().startswith("```")]
+                        cleaned_response = "\n".join(lines).strip()
+
+                    # query 필드 추출 (JSON 파싱 시도)
+                    if cleaned_response.strip().startswith("{"):
+                        try:
+                            import json
+                            parsed = json.loads(cleaned_response)
+
+                            if "tools" in parsed and len(parsed["tools"]) > 0:
+                                tool_info = parsed["tools"][0]
+                                if "query" in tool_info and tool_info["query"]:
+                                    refined_query = tool_info["query"].strip()
                                     if refined_query:
                                         state["refined_query"] = refined_query
                                         if exp_manager:
-                                            exp_manager.logger.write(f"재작성된 질문 (regex 추출): {refined_query}")
-                    except Exception as e:
-                        if exp_manager:
-                            exp_manager.logger.write(f"LLM 호출 실패: {str(e)}", print_error=True)
+                                            exp_manager.logger.write(f"재작성된 질문: {refined_query}")
+                        except (json.JSONDecodeError, KeyError, IndexError):
+                            # JSON 파싱 실패 시 regex로 query 추출
+                            import re
+                            query_match = re.search(r'"query"\s*:\s*"([^"]+)"', cleaned_response)
+                            if query_match:
+                                refined_query = query_match.group(1).strip()
+                                if refined_query:
+                                    state["refined_query"] = refined_query
+                                    if exp_manager:
+                                        exp_manager.logger.write(f"재작성된 질문 (regex 추출): {refined_query}")
+                except Exception as e:
+                    if exp_manager:
+                        exp_manager.logger.write(f"LLM 호출 실패: {str(e)}", print_error=True)
 
-                return state
+            # 파이프라인에 없는 도구의 선행 검색 취소 / 폐기
+            settle_prefetch(state, exp_manager)
+            return state
 
         # 패턴 매칭 실패 시 로그
-        if not pattern_matched and exp_manager:
+        if fast_decision["method"] != "pattern" and exp_manager:
             exp_manager.logger.write(f"⚠️ 패턴 매칭 실패: 어떤 패턴도 매칭되지 않음 → LLM 라우팅 사용")
 
     # -------------- 단일 요청 처리 (기존 로직) -------------- #
@@ -233,7 +257,40 @@ def router_node(state: AgentState, exp_manager=None):
         state["routing_method"] = "question_type"
         state["routing_reason"] = f"질문 유형 '{question_type}'에 가장 적합한 도구"
 
-    # ========== 우선순위 2: LLM 라우팅 (보조) ==========
+    # ========== 우선순위 2: 고속 라우터 키워드 점수 (LLM 호출 없음) ==========
+    if (
+        tool_choice is None
+        and fast_router_enabled
+        and fast_decision is not None
+        and fast_decision["method"] == "keyword"
+        and compiled_router.is_confident(fast_decision)
+    ):
+        tool_choice = fast_decision["tool"]
+        if exp_manager:
+            exp_manager.logger.write(
+                f"고속 라우팅: {fast_decision['question_type']} → {tool_choice} "
+                f"(confidence: {fast_decision['confidence']})"
+            )
+
+        # 도구 선택 이유 및 방법 기록
+        state["routing_method"] = "fast_path"
+        state["routing_reason"] = (
+            f"키워드 {fast_decision['matched_keywords']} 기반 질문 유형 "
+            f"'{fast_decision['question_type']}' 추정 (신뢰도 {fast_decision['confidence']})"
+        )
+
+    # ========== 라우팅 LLM 호출 동안 도구 검색 선행 (speculative_prefetch, opt-in) ==========
+    if tool_choice is None:
+        start_prefetch(state, question, difficulty, exp_manager)
+
+    # ========== 우선순위 3-A: 통합 라우팅 (combined 모드, LLM 1회) ==========
+    if tool_choice is None and is_combined_routing():
+        if _combined_routing(state, question, difficulty, exp_manager):
+            settle_prefetch(state, exp_manager)
+            return state
+        # 통합 라우팅 실패 시 기존 체인 방식으로 계속
+
+    # ========== 우선순위 3: LLM 라우팅 (신뢰도 미달 시) ==========
     if tool_choice is None:
         # JSON 프롬프트 로드
         routing_prompt_template = get_routing_prompt()    # JSON 파일에서 프롬프트 로드
@@ -272,8 +329,10 @@ def router_node(state: AgentState, exp_manager=None):
             logger=exp_manager.logger if exp_manager else None
         )
 
-        # LLM 호출
+        # LLM 호출 (지연시간은 combined 모드와 A/B 비교용으로 기록)
+        start = time.perf_counter()
         raw_response = llm_client.llm.invoke(routing_prompt).content.strip()  # 도구 선택
+        state["routing_latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
 
         # 마크다운 코드 펜스 제거 (LLM이 ```json ... ``` 형식으로 응답하는 경우 처리)
         cleaned_response = raw_response
@@ -285,7 +344,7 @@ def router_node(state: AgentState, exp_manager=None):
 
         # 디버깅: 정제된 응답 로깅
         if exp_manager:
-            exp_manager.logger.write(f"정제된 응답 (파싱 전): {cleaned_response[:200]}...")
+            exp_manager.logger.write(f"정제된 응답 (파싱 전): {cleaned_response[:200]}...", level="DEBUG")
 
         # 응답 파싱: JSON 형식이면 JSON으로, 아니면 첫 단어 추출
         tool_choice = "general"  # 기본값
@@ -401,7 +460,7 @@ def router_node(state: AgentState, exp_manager=None):
 
         # 로깅
         if exp_manager:
-            exp_manager.logger.write(f"LLM 라우팅 결정 (원본): {raw_response[:100]}...")
+            exp_manager.logger.write(f"LLM 라우팅 결정 (원본): {raw_response[:100]}...", level="DEBUG")
             exp_manager.logger.write(f"LLM 라우팅 결정 (파싱): {tool_choice}")
 
     # 최종 로깅
@@ -412,10 +471,103 @@ def router_node(state: AgentState, exp_manager=None):
     state["tool_choice"] = tool_choice          # 선택된 도구 저장
     state["tool_pipeline"] = [tool_choice]      # 단일 도구도 파이프라인으로 관리
     state["pipeline_index"] = 1                 # 단일 도구 실행 후 종료
+    state["pipeline_dependencies"] = None       # 순차 실행
+
+    # 선택되지 않은 도구의 선행 검색 취소 / 폐기
+    settle_prefetch(state, exp_manager)
 
     return state                                # 업데이트된 상태 반환
 
 
+# ---------------------- 통합 라우팅 (분류 + 라우팅 + 검증) ---------------------- #
+def _combined_routing(state: AgentState, question: str, difficulty: str, exp_manager=None) -> bool:
+    """
+    질문 유형 / 도구 파이프라인 / 재작성 질문 / 검증 결과를 LLM 1회 호출로 결정
+
+    Args:
+        state (AgentState): Agent 상태 (성공 시 라우팅 결과 기록)
+        question: 사용자 질문
+        difficulty: 난이도
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        bool: 성공 여부 (False면 호출부에서 기존 체인 방식으로 폴백)
+    """
+    # -------------- 이전 대화 컨텍스트 (최근 5개, 메시지당 200자) -------------- #
+    messages = state.get("messages", [])
+    context = ""
+    if len(messages) > 1:
+        context = "\n[이전 대화 컨텍스트]\n"
+        for msg in messages[-5:-1]:  # 마지막 메시지(현재 질문)는 제외
+            role = "사용자" if hasattr(msg, 'type') and msg.type == "human" else "AI"
+            content = msg.content if hasattr(msg, 'content') else str(msg)
+            context += f"{role}: {content[:200]}...\n" if len(content) > 200 else f"{role}: {content}\n"
+
+    prompt = get_combined_routing_prompt().format(question=question, difficulty=difficulty, context=context)
+
+    # -------------- LLM 1회 호출 -------------- #
+    llm_client = LLMClient.from_difficulty(
+        difficulty=difficulty,
+        logger=exp_manager.logger if exp_manager else None
+    )
+    start = time.perf_counter()
+    try:
+        result = invoke_combined_router(
+            llm_client.llm,
+            prompt,
+            use_structured_output=get_routing_config().get("structured_output", True),
+        )
+    except Exception as e:
+        if exp_manager:
+            exp_manager.logger.write(f"통합 라우팅 LLM 호출 실패: {e} → 체인 방식 사용", print_error=True)
+        return False
+    latency_ms = (time.perf_counter() - start) * 1000
+
+    decision = result["decision"]
+    if decision is None:
+        if exp_manager:
+            exp_manager.logger.write(f"통합 라우팅 응답 파싱 실패: {str(result['raw'])[:200]} → 체인 방식 사용", print_error=True)
+        return False
+
+    question_type = decision["question_type"]
+    tools = decision["tools"]
+
+    # -------------- 자체 검증 실패 시 질문 유형 기본 도구 사용 (재호출 없음) -------------- #
+    if not decision["valid"]:
+        tools = get_priority_chain(question_type)[:1]
+        if exp_manager:
+            exp_manager.logger.write(f"통합 라우팅 자체 검증 실패 → 질문 유형 기본 도구 사용: {tools[0]}")
+
+    # -------------- 상태 업데이트 -------------- #
+    state["question_type"] = question_type
+    if not state.get("fallback_chain"):
+        state["fallback_chain"] = get_priority_chain(question_type)
+    state["tool_pipeline"] = tools
+    state["tool_choice"] = tools[0]
+    state["pipeline_index"] = 1
+    state["pipeline_dependencies"] = None               # LLM이 정한 파이프라인은 순차 실행
+    state["validation_failed"] = False                  # 검증은 통합 응답에서 완료
+    state["routing_method"] = "llm_combined"
+    state["routing_reason"] = decision["reason"] or f"통합 라우팅: '{question_type}' → {' → '.join(tools)}"
+    state["routing_latency_ms"] = round(latency_ms, 1)
+    state["pipeline_description"] = (
+        f"순차 실행: {' → '.join(tools)}" if len(tools) > 1 else f"단일 도구: {tools[0]}"
+    )
+    if decision["refined_query"] and decision["refined_query"] != question:
+        state["refined_query"] = decision["refined_query"]
+
+    if exp_manager:
+        exp_manager.logger.write(
+            f"통합 라우팅 결정: {question_type} → {tools} "
+            f"(검증: {decision['valid']}, 구조화 출력: {result['structured']}, {latency_ms:.0f}ms)"
+        )
+        if state.get("refined_query"):
+            exp_manager.logger.write(f"재작성된 질문: {state['refined_query']}")
+        exp_manager.logger.write(f"최종 선택 도구: {tools[0]}")
+
+    return True
+
+
 # ==================== Text-to-SQL 노드 ==================== #
 # ---------------------- 논문 통계 정보 조회 ---------------------- #
 def text2sql_node(state: AgentState, exp_manager=None):
@@ -471,6 +623,7 @@ def text2sql_node(state: AgentState, exp_manager=None):
 
 # ==================== Fallback Router 노드 ==================== #
 # ---------------------- 도구 실패 시 다음 도구 선택 ---------------------- #
+@traced("fallback_router_node")
 def fallback_router_node(state: AgentState, exp_manager=None):
     """
     Fallback Router 노드: 도구 실행 실패 시 다음 우선순위 도구 선택
@@ -654,6 +807,7 @@ def fallback_router_node(state: AgentState, exp_manager=None):
 
 # ==================== Router 검증 노드 ==================== #
 # ---------------------- Router 선택 검증 및 재라우팅 ---------------------- #
+@traced("validate_tool_choice_node")
 def validate_tool_choice_node(state: AgentState, exp_manager=None):
     """
     Router 검증 노드: Router가 선택한 도구가 적절한지 LLM으로 검증
@@ -766,6 +920,7 @@ def validate_tool_choice_node(state: AgentState, exp_manager=None):
 
 # ==================== 최종 Fallback 노드 ==================== #
 # ---------------------- 강제로 general 도구 실행 ---------------------- #
+@traced("final_fallback_node")
 def final_fallback_node(state: AgentState, exp_manager=None):
     """
     최종 Fallback 노드: 모든 시도 실패 시 general 도구 강제 실행
@@ -0,0 +1,289 @@
+# src/agent/parallel_pipeline.py
+"""
+다중 요청 파이프라인 병렬 실행 모듈
+
+tool_pipeline은 기본적으로 순서대로 하나씩 실행됩니다.
+configs/multi_request_patterns.yaml 패턴에 depends_on(도구 → 이전 결과를 사용하는 도구 목록)을
+선언하면, 서로 의존하지 않는 연속 도구 묶음을 한 번에 실행합니다:
+
+    tools: [glossary, search_paper, save_file]
+    depends_on:
+      save_file: [glossary, search_paper]
+    → [glossary + search_paper 동시 실행] → save_file
+
+- depends_on이 없는 패턴은 기존처럼 순차 실행 (검색 도구 Skip 로직 유지)
+- 병렬 도구는 상태 복사본에서 실행 후 파이프라인 순서대로 병합
+  → 최종 상태는 같은 도구를 순차 실행한 결과와 동일 (final_answer = 묶음의 마지막 도구)
+- 답변 토큰 스트리밍은 final_answer가 되는 마지막 도구만 전달 (다른 도구 토큰이 섞이지 않도록)
+- 묶음 중 실패한 도구가 있으면 그 도구까지만 병합하고 Fallback으로 넘김 (이후 도구는 순차 재실행)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.streaming import suppress_answer_stream
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 parallel_pipeline 섹션이 없을 때 사용
+DEFAULT_PARALLEL_PIPELINE_CONFIG = {
+    "enabled": True,                                # false면 depends_on이 있어도 순차 실행
+    "max_parallel_tools": 4,                        # 한 묶음에서 동시에 실행할 최대 도구 수
+}
+
+PARALLEL_NODE = "parallel_tools"                    # 그래프 노드 이름
+
+# 상태 복사 시 도구가 제자리 수정할 수 있는 리스트 필드
+_MUTABLE_LIST_FIELDS = ("tool_timeline", "failed_tools", "tool_pipeline")
+
+
+def get_parallel_pipeline_config() -> Dict[str, Any]:
+    """
+    파이프라인 병렬 실행 설정 로드 (기본값과 병합)
+
+    Returns:
+        파이프라인 병렬 실행 설정 딕셔너리
+    """
+    config = dict(DEFAULT_PARALLEL_PIPELINE_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("parallel_pipeline", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+# ==================== 묶음 계산 ==================== #
+def parallel_group(
+    tool_pipeline: List[str],
+    start: int,
+    dependencies: Optional[Dict[str, List[str]]],
+    max_tools: Optional[int] = None,
+) -> List[str]:
+    """
+    start 위치부터 함께 실행할 수 있는 연속 도구 묶음
+
+    묶음에 이미 들어간 도구를 depends_on으로 참조하는 도구(또는 중복 도구)를 만나면 멈춤
+
+    Args:
+        tool_pipeline: 도구 파이프라인
+        start: 현재 실행할 도구 위치 (pipeline_index - 1)
+        dependencies: 패턴의 depends_on (None이면 순차 실행 → 도구 1개)
+        max_tools: 묶음 최대 크기 (None이면 설정값)
+
+    Returns:
+        List[str]: 도구 묶음 (파이프라인 순서, 최소 1개, start가 범위 밖이면 빈 리스트)
+    """
+    if not 0 <= start < len(tool_pipeline):
+        return []
+
+    group = [tool_pipeline[start]]
+    if dependencies is None:
+        return group
+
+    if max_tools is None:
+        max_tools = int(get_parallel_pipeline_config()["max_parallel_tools"])
+
+    for tool in tool_pipeline[start + 1:]:
+        if len(group) >= max_tools or tool in group:
+            break
+        if any(dep in group for dep in dependencies.get(tool) or []):
+            break
+        group.append(tool)
+    return group
+
+
+def current_group(state) -> List[str]:
+    """
+    현재 실행할 도구 묶음 (병렬 실행 비활성화 시 현재 도구 1개)
+
+    Args:
+        state: Agent 상태 (tool_pipeline, pipeline_index, pipeline_dependencies)
+
+    Returns:
+        List[str]: 도구 묶음
+    """
+    config = get_parallel_pipeline_config()
+    dependencies = state.get("pipeline_dependencies") if config.get("enabled", True) else None
+    return parallel_group(
+        state.get("tool_pipeline", []),
+        state.get("pipeline_index", 1) - 1,
+        dependencies,
+        int(config["max_parallel_tools"]),
+    )
+
+
+# ==================== 상태 분기 / 병합 ==================== #
+def _branch_state(state, tool: str, position: int) -> Dict[str, Any]:
+    """
+    도구별 상태 복사본 (리스트 필드는 별도 복사)
+
+    tool_choice / pipeline_index는 해당 도구를 순차 실행할 때와 같은 값으로 설정
+    """
+    branch = dict(state)
+    for key in _MUTABLE_LIST_FIELDS:
+        if isinstance(branch.get(key), list):
+            branch[key] = list(branch[key])
+    branch["tool_choice"] = tool
+    branch["pipeline_index"] = position + 1
+    return branch
+
+
+def merge_branches(state, start: int, group: List[str], branches: List[Dict[str, Any]], elapsed_ms: float):
+    """
+    도구별 결과 상태를 파이프라인 순서대로 병합
+
+    - 바뀐 필드는 순서대로 덮어씀 (마지막 도구의 final_answer가 남음)
+    - tool_timeline은 도구별 새 이벤트를 순서대로 이어 붙임
+    - 실패한 도구를 만나면 거기서 멈추고 pipeline_index를 그 도구 다음으로 맞춤 (Fallback 대상)
+
+    Args:
+        state: 병렬 실행 전 상태 (제자리 갱신)
+        start: 묶음 시작 위치
+        group: 도구 묶음
+        branches: 도구별 결과 상태 (group 순서)
+        elapsed_ms: 묶음 전체 소요 시간
+
+    Returns:
+        갱신된 state
+    """
+    base = dict(state)
+    base_timeline = list(state.get("tool_timeline") or [])
+    timeline = list(base_timeline)
+    merged_tools = []
+
+    for tool, branch in zip(group, branches):
+        for key, value in branch.items():
+            if key == "tool_timeline":
+                timeline.extend((value or [])[len(base_timeline):])
+            elif key not in base or value != base[key]:
+                state[key] = value
+        merged_tools.append(tool)
+        if branch.get("tool_status", "success") != "success":
+            break
+
+    state["tool_choice"] = merged_tools[-1]
+    state["pipeline_index"] = start + len(merged_tools)
+
+    timeline.append({
+        "timestamp": datetime.now().isoformat(),
+        "event": "pipeline_parallel",
+        "tools": list(group),
+        "merged_tools": merged_tools,
+        "elapsed_ms": round(elapsed_ms, 1),
+        "description": (
+            f"독립 도구 동시 실행: {' + '.join(group)} ({elapsed_ms / 1000:.1f}초)"
+            + ("" if len(merged_tools) == len(group) else f" · '{merged_tools[-1]}' 실패로 이후 도구는 순차 실행")
+        ),
+    })
+    state["tool_timeline"] = timeline
+    return state
+
+
+# ==================== 병렬 실행 스레드 풀 ==================== #
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """병렬 도구 실행용 스레드 풀 (최초 호출 시 생성)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(get_parallel_pipeline_config()["max_parallel_tools"]) * 2,
+                    thread_name_prefix="pipeline-parallel",
+                )
+    return _executor
+
+
+def _call_node(node, state):
+    """그래프에 등록한 노드 호출 (RunnableLambda 또는 partial)"""
+    return node.invoke(state) if hasattr(node, "invoke") else node(state)
+
+
+def _run_branch(node, state, stream_answer: bool):
+    """워커 스레드 본체: 마지막 도구가 아니면 답변 토큰 스트리밍 제외"""
+    if stream_answer:
+        return _call_node(node, state)
+    with suppress_answer_stream():
+        return _call_node(node, state)
+
+
+# ==================== 병렬 노드 ==================== #
+def make_parallel_node(tool_nodes: Dict[str, Any]):
+    """
+    독립 도구 묶음을 동시에 실행하는 그래프 노드 생성
+
+    Args:
+        tool_nodes: 도구 이름 → 그래프에 등록한 노드 (exp_manager 바인딩 완료)
+
+    Returns:
+        tuple: (동기 노드 state → state, 비동기 노드 state → Awaitable[state])
+    """
+    def parallel_tools(state, exp_manager=None):
+        """파이프라인의 독립 도구 묶음 동시 실행 (스레드 풀)"""
+        group = current_group(state)
+        start = state.get("pipeline_index", 1) - 1
+        if exp_manager:
+            exp_manager.logger.write(f"독립 도구 동시 실행: {' + '.join(group)}")
+
+        started = time.perf_counter()
+        executor = _get_executor()
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _run_branch, tool_nodes[tool], _branch_state(state, tool, start + idx), idx == len(group) - 1,
+            )
+            for idx, tool in enumerate(group)
+        ]
+        branches = [future.result() for future in futures]
+        return merge_branches(state, start, group, branches, (time.perf_counter() - started) * 1000)
+
+    async def parallel_tools_async(state, exp_manager=None):
+        """파이프라인의 독립 도구 묶음 동시 실행 (이벤트 루프)"""
+        group = current_group(state)
+        start = state.get("pipeline_index", 1) - 1
+        if exp_manager:
+            exp_manager.logger.write(f"독립 도구 동시 실행 (비동기): {' + '.join(group)}")
+
+        async def branch(tool, idx):
+            node = tool_nodes[tool]
+            if idx == len(group) - 1:
+                return await node.ainvoke(_branch_state(state, tool, start + idx))
+            with suppress_answer_stream():
+                return await node.ainvoke(_branch_state(state, tool, start + idx))
+
+        started = time.perf_counter()
+        branches = await asyncio.gather(*(branch(tool, idx) for idx, tool in enumerate(group)))
+        return merge_branches(state, start, group, list(branches), (time.perf_counter() - started) * 1000)
+
+    return parallel_tools, parallel_tools_async
+
+
+def route_tool_or_parallel(state, tool: str) -> str:
+    """
+    도구 라우팅 결과를 묶음 실행으로 변환 (묶음이 2개 이상이면 PARALLEL_NODE)
+
+    Args:
+        state: Agent 상태
+        tool: 원래 라우팅 대상
+
+    Returns:
+        str: tool 또는 PARALLEL_NODE
+    """
+    group = current_group(state)
+    if len(group) > 1 and group[0] == tool:
+        return PARALLEL_NODE
+    return tool
@@ -4,13 +4,197 @@
 
 사용자 질문을 분석하여 7가지 유형 중 하나로 분류하고,
 적절한 도구 우선순위를 결정합니다.
+
+분류 결과 캐시:
+- 1차: 인메모리 LRU/TTL (최대 크기 제한)
+- 2차: 영구 저장소 (SQLite / PostgreSQL, 선택) → 재시작 후 / 여러 앱 워커 간 공유
+- 키: 정규화된 질문 (공백/대소문자/끝 문장부호 차이 무시) + 분류 프롬프트 버전
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
-from typing import Dict
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
 from src.llm.client import LLMClient
+from src.utils.cache import LRUCache
+from src.utils.tracing import traced
+
+
+# ==================== 캐시 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 classification_cache 섹션이 없을 때 사용
+DEFAULT_CLASSIFICATION_CACHE_CONFIG = {
+    "max_size": 2000,                               # 인메모리 LRU 최대 항목 수
+    "ttl_seconds": 604800,                          # 분류 결과 유효 기간 (초, 7일)
+    "persistent": None,                             # 영구 저장소: None / sqlite / postgres
+    "sqlite_path": "data/cache/classifications.sqlite",
+}
+
+# 끝에 붙은 문장부호/기호 (키 정규화 시 제거)
+_TRAILING_PUNCT = re.compile(r"[\s?？!！.。~,]+$")
+
+
+def _load_classification_cache_config() -> Dict[str, Any]:
+    """
+    분류 캐시 설정 로드 (기본값과 병합)
+
+    Returns:
+        분류 캐시 설정 딕셔너리
+    """
+    config = dict(DEFAULT_CLASSIFICATION_CACHE_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("classification_cache", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def normalize_question(question: str) -> str:
+    """
+    캐시 키용 질문 정규화
+
+    유니코드 NFC + 소문자 + 연속 공백 축약 + 끝 문장부호 제거
+    (예: "Transformer 란 ?" / "transformer 란" → 같은 키)
+
+    Args:
+        question: 원본 질문
+
+    Returns:
+        정규화된 질문
+    """
+    text = " ".join(unicodedata.normalize("NFC", question).lower().split())
+    return _TRAILING_PUNCT.sub("", text)
+
+
+# ==================== 분류 결과 영구 저장소 ==================== #
+
+class SQLiteClassificationStore:
+    """
+    SQLite 기반 분류 결과 저장소 (단일 호스트 재시작 대비)
+
+    Args:
+        path: SQLite 파일 경로
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        # Streamlit 세션 스레드 간 공유를 위해 check_same_thread=False (잠금으로 보호)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS question_classification_cache ("
+            " question_key TEXT PRIMARY KEY,"
+            " question TEXT NOT NULL,"
+            " question_type TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[str]:
+        """키 조회 → question_type (없거나 만료 시 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT question_type, created_at FROM question_classification_cache WHERE question_key = ?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        if ttl_seconds and row[1] + ttl_seconds <= time.time():
+            return None
+        return row[0]
+
+    def put(self, key: str, question: str, question_type: str):
+        """분류 결과 저장 (같은 키는 덮어씀)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO question_classification_cache "
+                "(question_key, question, question_type, created_at) VALUES (?, ?, ?, ?)",
+                (key, question, question_type, time.time()),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM question_classification_cache")
+            self._conn.commit()
+
+
+class PostgresClassificationStore:
+    """
+    PostgreSQL 기반 분류 결과 저장소 (여러 앱 워커 간 공유)
+
+    src.database.db 연결 풀을 사용하며, 최초 사용 시 테이블 생성
+    """
+
+    def __init__(self):
+        from src.database.db import execute_query
+
+        self._execute = execute_query
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS question_classification_cache ("
+            " question_key VARCHAR(64) PRIMARY KEY,"
+            " question TEXT NOT NULL,"
+            " question_type VARCHAR(50) NOT NULL,"
+            " created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[str]:
+        """키 조회 → question_type (없거나 만료 시 None)"""
+        rows = self._execute(
+            "SELECT question_type FROM question_classification_cache "
+            "WHERE question_key = %s AND (%s IS NULL OR created_at > NOW() - %s * INTERVAL '1 second')",
+            (key, ttl_seconds, ttl_seconds),
+            fetch=True,
+        )
+        return rows[0][0] if rows else None
+
+    def put(self, key: str, question: str, question_type: str):
+        """분류 결과 저장 (같은 키는 갱신)"""
+        self._execute(
+            "INSERT INTO question_classification_cache (question_key, question, question_type) "
+            "VALUES (%s, %s, %s) "
+            "ON CONFLICT (question_key) DO UPDATE "
+            "SET question_type = EXCLUDED.question_type, created_at = CURRENT_TIMESTAMP",
+            (key, question, question_type),
+        )
+
+    def clear(self):
+        self._execute("DELETE FROM question_classification_cache")
+
+
+def _build_classification_store(config: Dict[str, Any]):
+    """
+    설정에 따라 영구 저장소 생성 (실패 시 None → 인메모리만 사용)
+
+    Args:
+        config: 분류 캐시 설정
+
+    Returns:
+        SQLiteClassificationStore / PostgresClassificationStore / None
+    """
+    backend = (config.get("persistent") or "").lower()
+    try:
+        if backend == "sqlite":
+            return SQLiteClassificationStore(
+                config.get("sqlite_path", DEFAULT_CLASSIFICATION_CACHE_CONFIG["sqlite_path"])
+            )
+        if backend == "postgres":
+            return PostgresClassificationStore()
+    except Exception:
+        # 저장소 초기화 실패 시 인메모리 캐시만 사용
+        pass
+    return None
 
 
 # ==================== QuestionClassifier 클래스 ==================== #
@@ -67,15 +251,53 @@ term_definition, paper_search, latest_research, paper_summary, statistics, file_
 
 답변:"""
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, max_size: Optional[int] = None, ttl_seconds: Optional[float] = None, store=None):
         """
         QuestionClassifier 초기화
 
         Args:
             logger: 로거 인스턴스 (선택 사항)
+            max_size: 인메모리 캐시 최대 항목 수 (미지정 시 model_config.yaml)
+            ttl_seconds: 분류 결과 유효 기간 (미지정 시 model_config.yaml)
+            store: 영구 저장소 (미지정 시 설정에 따라 최초 분류 시 생성)
         """
+        config = _load_classification_cache_config()
+
         self.logger = logger
-        self.cache: Dict[str, str] = {}  # 질문 → 유형 캐시
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.get("ttl_seconds")
+        self.cache = LRUCache(
+            max_size=int(max_size if max_size is not None else config["max_size"]),
+            ttl_seconds=self.ttl_seconds,
+        )  # 정규화 질문 키 → 유형
+
+        # 영구 저장소는 import 시점 DB 연결을 피하기 위해 지연 생성
+        self._store = store
+        self._store_config = None if store is not None else config
+        self._store_lock = threading.Lock()
+
+        # 분류 프롬프트가 바뀌면 영구 저장소의 이전 결과를 재사용하지 않도록 키에 포함
+        self._prompt_version = hashlib.sha256(self.CLASSIFICATION_PROMPT.encode("utf-8")).hexdigest()[:8]
+
+        # 통계 (인메모리 hit/miss는 LRUCache가 집계)
+        self._stats_lock = threading.Lock()
+        self.persistent_hits = 0
+        self.llm_calls = 0
+
+    # ---------------------- 내부: 캐시 키/저장소 ---------------------- #
+    def _cache_key(self, question: str) -> str:
+        """정규화 질문 + 프롬프트 버전 → sha256 키"""
+        return hashlib.sha256(
+            f"{self._prompt_version}\x00{normalize_question(question)}".encode("utf-8")
+        ).hexdigest()
+
+    def _get_store(self):
+        """영구 저장소 반환 (최초 호출 시 설정에 따라 생성)"""
+        if self._store_config is not None:
+            with self._store_lock:
+                if self._store_config is not None:
+                    self._store = _build_classification_store(self._store_config)
+                    self._store_config = None
+        return self._store
 
     def classify(self, question: str, difficulty: str = "easy") -> str:
         """
@@ -88,11 +310,29 @@ term_definition, paper_search, latest_research, paper_summary, statistics, file_
         Returns:
             str: 질문 유형 (term_definition, paper_search 등)
         """
-        # 캐시 확인
-        if question in self.cache:
+        key = self._cache_key(question)
+
+        # 1차: 인메모리 캐시 확인
+        cached = self.cache.get(key)
+        if cached is not None:
             if self.logger:
-                self.logger.write(f"질문 유형 캐시 적중: {self.cache[question]}")
-            return self.cache[question]
+                self.logger.write(f"질문 유형 캐시 적중: {cached}")
+            return cached
+
+        # 2차: 영구 저장소 확인 (다른 워커 / 이전 실행 결과)
+        store = self._get_store()
+        if store is not None:
+            try:
+                cached = store.get(key, self.ttl_seconds)
+            except Exception:
+                cached = None
+            if cached in self.QUESTION_TYPES:
+                self.cache.set(key, cached)
+                with self._stats_lock:
+                    self.persistent_hits += 1
+                if self.logger:
+                    self.logger.write(f"질문 유형 캐시 적중 (영구 저장소): {cached}")
+                return cached
 
         # LLM 초기화 (분류는 temperature=0.0으로 결정론적)
         llm_client = LLMClient.from_difficulty(
@@ -105,6 +345,8 @@ term_definition, paper_search, latest_research, paper_summary, statistics, file_
 
         # LLM 호출
         try:
+            with self._stats_lock:
+                self.llm_calls += 1
             response = llm_client.llm.invoke(prompt).content.strip()
 
             # 응답 파싱 (첫 번째 단어만 추출)
@@ -117,8 +359,13 @@ term_definition, paper_search, latest_research, paper_summary, statistics, file_
                     self.logger.write("기본값 'general_question' 사용")
                 question_type = "general_question"
 
-            # 캐시 저장
-            self.cache[question] = question_type
+            # 캐시 저장 (인메모리 + 영구 저장소)
+            self.cache.set(key, question_type)
+            if store is not None:
+                try:
+                    store.put(key, question, question_type)
+                except Exception:
+                    pass
 
             if self.logger:
                 self.logger.write(f"질문 유형 분류 완료: {question_type}")
@@ -133,18 +380,52 @@ term_definition, paper_search, latest_research, paper_summary, statistics, file_
             # 실패 시 기본값
             return "general_question"
 
-    def clear_cache(self):
+    def clear_cache(self, persistent: bool = False):
         """
         분류 캐시 초기화
+
+        Args:
+            persistent: True면 영구 저장소도 비움
         """
         self.cache.clear()
+        if persistent and self._get_store() is not None:
+            self._store.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        분류 캐시 통계 반환
+
+        Returns:
+            dict: size, max_size, ttl_seconds, memory_hits, persistent_hits, llm_calls, hit_rate 등
+        """
+        memory = self.cache.stats()
+        with self._stats_lock:
+            persistent_hits = self.persistent_hits
+            llm_calls = self.llm_calls
+
+        # 인메모리 미스 = 영구 저장소 적중 + 영구 저장소 미스(LLM 호출)
+        lookups = memory["hits"] + memory["misses"]
+        hits = memory["hits"] + persistent_hits
+        return {
+            "size": memory["size"],
+            "max_size": memory["max_size"],
+            "ttl_seconds": memory["ttl_seconds"],
+            "memory_hits": memory["hits"],
+            "persistent_hits": persistent_hits,
+            "misses": memory["misses"] - persistent_hits,
+            "llm_calls": llm_calls,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": memory["evictions"],
+            "expirations": memory["expirations"],
+            "persistent_backend": type(self._store).__name__ if self._store else None,
+        }
 
     def get_cache_size(self) -> int:
         """
-        캐시 크기 반환
+        캐시 크기 반환 (하위 호환, 상세 통계는 get_cache_stats 사용)
 
         Returns:
-            int: 캐시된 질문 개수
+            int: 인메모리에 캐시된 질문 개수
         """
         return len(self.cache)
 
@@ -153,6 +434,7 @@ term_definition, paper_search, latest_research, paper_summary, statistics, file_
 _global_classifier = QuestionClassifier()
 
 
+@traced("classify_question")
 def classify_question(question: str, difficulty: str = "easy", logger=None) -> str:
     """
     질문 유형 분류 (전역 함수)
@@ -171,8 +453,21 @@ def classify_question(question: str, difficulty: str = "easy", logger=None) -> s
     return _global_classifier.classify(question, difficulty)
 
 
-def clear_classification_cache():
+def clear_classification_cache(persistent: bool = False):
     """
     전역 분류 캐시 초기화
+
+    Args:
+        persistent: True면 영구 저장소도 비움
+    """
+    _global_classifier.clear_cache(persistent=persistent)
+
+
+def get_classification_cache_stats() -> Dict[str, Any]:
+    """
+    전역 분류 캐시 통계 반환
+
+    Returns:
+        dict: QuestionClassifier.get_cache_stats() 결과
     """
-    _global_classifier.clear_cache()
+    return _global_classifier.get_cache_stats()
@@ -0,0 +1,455 @@
+# src/agent/speculative.py
+"""
+추측 실행(Speculative) 검색 선행 모듈
+
+라우팅 결과는 대부분 search_paper / glossary / general 중 하나이고,
+search_paper / glossary의 검색 단계는 라우터 출력 중 질문(query)에만 의존합니다.
+speculative_prefetch.enabled: true면 질문 유형 분류 / 라우팅 LLM 호출이 진행되는 동안
+질문 임베딩과 용어집 / 논문 검색을 백그라운드에서 미리 시작합니다:
+
+    start_prefetch() ─┬─ [질문 임베딩 → glossary 검색]      (백그라운드)
+                      └─ [질문 임베딩 → search_paper 검색]  (백그라운드)
+    질문 유형 분류 LLM (initialize_fallback_state) / 라우팅 LLM (router_node)
+    settle_prefetch() → 선택되지 않은 도구 검색은 취소 / 폐기
+
+    glossary_node / search_paper_node ─ take_prefetched() → 검색 인자가 같으면 결과 재사용
+
+- Future는 상태에 직렬화할 수 없으므로 상태에는 묶음 ID(speculative_prefetch_id)만 저장
+- 검색 인자(재작성된 질문 포함)가 다르면 재사용하지 않고 폐기 (stale)
+- 선행 검색은 background 우선순위로 호출 스케줄러를 거침 (사용자 요청 LLM 호출을 막지 않음)
+- 적중률 / 낭비된 작업량은 get_speculative_stats()로 확인
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import contextvars
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 speculative_prefetch 섹션이 없을 때 사용
+DEFAULT_SPECULATIVE_CONFIG = {
+    "enabled": False,                               # opt-in (선택되지 않은 도구 검색 비용 발생)
+    "tools": ["glossary", "search_paper"],          # 미리 검색할 도구
+    "max_workers": 4,                               # 선행 검색 스레드 수
+    "wait_timeout_seconds": 30,                     # 도구 노드가 진행 중인 선행 검색을 기다리는 최대 시간
+    "max_pending_batches": 32,                      # 보관할 최대 묶음 수 (초과 시 오래된 묶음 폐기)
+}
+
+_MISSING = object()                                 # 재사용할 결과 없음 표시
+
+
+def get_speculative_config() -> Dict[str, Any]:
+    """
+    추측 실행 검색 설정 로드 (기본값과 병합)
+
+    Returns:
+        추측 실행 검색 설정 딕셔너리
+    """
+    config = dict(DEFAULT_SPECULATIVE_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("speculative_prefetch", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+# ==================== 도구별 선행 검색 작업 ==================== #
+def _glossary_job(question: str, difficulty: str):
+    """glossary_node와 같은 인자로 용어집 검색"""
+    from src.tools.glossary import glossary_search_args, search_glossary
+
+    args = glossary_search_args(question, difficulty)
+    return args, lambda: search_glossary.invoke(args)
+
+
+def _search_paper_job(question: str, difficulty: str):
+    """search_paper_node와 같은 인자로 논문 검색 (브랜치 소요 시간 포함)"""
+    from src.tools.search_paper import get_last_branch_timings, paper_search_args, search_paper_database
+
+    args = paper_search_args(question)
+
+    def run():
+        raw_results = search_paper_database.invoke(args)
+        return raw_results, get_last_branch_timings()   # 브랜치 소요 시간은 워커 스레드 로컬
+
+    return args, run
+
+
+# 도구 이름 → (질문, 난이도) → (검색 인자, 실행 함수)
+_JOBS: Dict[str, Callable] = {
+    "glossary": _glossary_job,
+    "search_paper": _search_paper_job,
+}
+
+
+# ==================== 선행 검색 작업 / 묶음 ==================== #
+class PrefetchTask:
+    """도구 하나의 선행 검색 (Future + 소요 시간)"""
+
+    def __init__(self, tool: str, args: Dict[str, Any]):
+        self.tool = tool
+        self.args = args
+        self.future = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def run(self, func: Callable, warm_query: str):
+        """워커 스레드 본체: 질문 임베딩 캐시 적재 → 검색 (background 우선순위)"""
+        from src.llm.scheduler import background_priority
+
+        self.started_at = time.perf_counter()
+        try:
+            with background_priority():
+                _warm_embedding(warm_query)
+                return func()
+        finally:
+            self.finished_at = time.perf_counter()
+
+    def elapsed_ms(self) -> float:
+        """실행 시간 (진행 중이면 현재까지, 시작 전이면 0)"""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000
+
+
+class PrefetchBatch:
+    """라우팅 1회에 대한 도구별 선행 검색 묶음"""
+
+    def __init__(self, batch_id: str, question: str):
+        self.batch_id = batch_id
+        self.question = question
+        self.tasks: Dict[str, PrefetchTask] = {}
+
+
+def _warm_embedding(question: str):
+    """
+    질문 임베딩을 미리 계산 (CachedEmbeddings LRU 적재)
+
+    도구 검색 / 답변 캐시가 같은 질문을 임베딩할 때 캐시에서 바로 반환
+    """
+    try:
+        from src.database.embeddings import get_embeddings
+        get_embeddings().embed_query(question)
+    except Exception:
+        # 임베딩 실패 시 검색 단계에서 다시 시도
+        pass
+
+
+# ==================== 통계 ==================== #
+class PrefetchStats:
+    """프로세스 전체 선행 검색 적중 / 낭비 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.batches = 0                        # 시작한 묶음 수
+            self.started = 0                        # 시작한 도구 검색 수
+            self.hits = 0                           # 도구 노드가 결과를 재사용
+            self.stale = 0                          # 도구는 선택됐지만 검색 인자가 달라 폐기
+            self.discarded = 0                      # 도구가 선택되지 않아 폐기
+            self.cancelled = 0                      # 폐기 시 실행 전이라 취소됨
+            self.errors = 0                         # 선행 검색 예외 / 대기 시간 초과
+            self.saved_ms = 0.0                     # 재사용으로 줄어든 도구 검색 시간
+            self.wasted_ms = 0.0                    # 폐기된 검색이 사용한 실행 시간
+
+    def add(self, **deltas):
+        with self._lock:
+            for key, value in deltas.items():
+                setattr(self, key, getattr(self, key) + value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            wasted = self.stale + self.discarded
+            return {
+                "batches": self.batches,
+                "started": self.started,
+                "hits": self.hits,
+                "stale": self.stale,
+                "discarded": self.discarded,
+                "cancelled": self.cancelled,
+                "errors": self.errors,
+                "hit_rate": round(self.hits / self.started, 3) if self.started else 0.0,
+                "waste_rate": round(wasted / self.started, 3) if self.started else 0.0,
+                "saved_ms": round(self.saved_ms, 1),
+                "wasted_ms": round(self.wasted_ms, 1),
+            }
+
+
+_stats = PrefetchStats()
+
+
+def get_speculative_stats() -> Dict[str, Any]:
+    """
+    선행 검색 통계 (적중률 / 낭비된 작업량)
+
+    Returns:
+        dict: started, hits, stale, discarded, cancelled, errors, hit_rate, waste_rate, saved_ms, wasted_ms
+    """
+    return _stats.snapshot()
+
+
+def reset_speculative_stats():
+    """선행 검색 통계 초기화 (테스트 / 실험 구간 구분용)"""
+    _stats.reset()
+
+
+# ==================== 묶음 저장소 / 스레드 풀 ==================== #
+_batches: "OrderedDict[str, PrefetchBatch]" = OrderedDict()
+_batches_lock = threading.Lock()
+_batch_ids = itertools.count(1)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """선행 검색용 스레드 풀 (최초 호출 시 생성)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(get_speculative_config()["max_workers"]),
+                    thread_name_prefix="speculative-prefetch",
+                )
+    return _executor
+
+
+def _discard(task: PrefetchTask, reason: str):
+    """
+    선행 검색 폐기 (실행 전이면 취소, 실행 중이면 끝난 뒤 낭비 시간 집계)
+
+    Args:
+        task: 폐기할 작업
+        reason: "discarded" (도구 미선택), "stale" (검색 인자 불일치), "errors" (대기 시간 초과)
+    """
+    _stats.add(**{reason: 1})
+    if task.future.cancel():
+        _stats.add(cancelled=1)
+        return
+    task.future.add_done_callback(lambda _: _stats.add(wasted_ms=task.elapsed_ms()))
+
+
+def _pop_batch(batch_id: Optional[str]) -> Optional[PrefetchBatch]:
+    if not batch_id:
+        return None
+    with _batches_lock:
+        return _batches.pop(batch_id, None)
+
+
+def _get_batch(batch_id: Optional[str]) -> Optional[PrefetchBatch]:
+    if not batch_id:
+        return None
+    with _batches_lock:
+        return _batches.get(batch_id)
+
+
+# ==================== 공개 API ==================== #
+def start_prefetch(state, question: str, difficulty: str, exp_manager=None) -> Optional[str]:
+    """
+    질문 유형 분류 / 라우팅 LLM 호출 전에 도구 검색을 백그라운드에서 시작
+
+    비활성화 상태면 아무것도 하지 않음. 같은 질문으로 진행 중인 묶음이 있으면 재사용,
+    다른 질문이면 이전 묶음은 폐기
+
+    Args:
+        state: Agent 상태 (speculative_prefetch_id 기록)
+        question: 라우팅 대상 질문
+        difficulty: 난이도 (용어집 검색 인자)
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        묶음 ID (비활성화 시 None)
+    """
+    config = get_speculative_config()
+    if not config.get("enabled", False):
+        return None
+
+    # -------------- 같은 질문으로 진행 중인 묶음은 그대로 사용 (분류 → 라우팅) -------------- #
+    previous = _get_batch(state.get("speculative_prefetch_id"))
+    if previous and previous.question == question:
+        return previous.batch_id
+
+    # -------------- 이전 묶음 폐기 (재라우팅) -------------- #
+    if previous and _pop_batch(previous.batch_id):
+        for task in previous.tasks.values():
+            _discard(task, "discarded")
+
+    batch = PrefetchBatch(f"prefetch-{next(_batch_ids)}", question)
+    executor = _get_executor()
+
+    for tool in config.get("tools") or []:
+        job = _JOBS.get(tool)
+        if job is None:
+            continue
+        try:
+            args, func = job(question, difficulty)
+        except Exception as e:
+            # 도구 모듈 로드 실패 시 해당 도구만 건너뜀
+            if exp_manager:
+                exp_manager.logger.write(f"선행 검색 준비 실패 ({tool}): {e}", print_error=True)
+            continue
+
+        task = PrefetchTask(tool, args)
+        task.future = executor.submit(contextvars.copy_context().run, task.run, func, question)
+        batch.tasks[tool] = task
+
+    if not batch.tasks:
+        return None
+
+    _stats.add(batches=1, started=len(batch.tasks))
+
+    # -------------- 묶음 보관 (오래된 묶음부터 폐기) -------------- #
+    evicted = []
+    with _batches_lock:
+        _batches[batch.batch_id] = batch
+        while len(_batches) > int(config["max_pending_batches"]):
+            evicted.append(_batches.popitem(last=False)[1])
+    for old in evicted:
+        for task in old.tasks.values():
+            _discard(task, "discarded")
+
+    state["speculative_prefetch_id"] = batch.batch_id
+    if exp_manager:
+        exp_manager.logger.write(f"선행 검색 시작: {', '.join(batch.tasks)} ({batch.batch_id})")
+    return batch.batch_id
+
+
+def settle_prefetch(state, exp_manager=None) -> Optional[Dict[str, Any]]:
+    """
+    라우팅 결정 직후 호출: tool_pipeline에 없는 도구의 선행 검색 취소 / 폐기
+
+    Args:
+        state: 라우팅이 끝난 Agent 상태 (tool_pipeline)
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        dict: {"kept": [...], "discarded": [...]} (진행 중인 묶음이 없으면 None)
+    """
+    batch_id = state.get("speculative_prefetch_id")
+    batch = _get_batch(batch_id)
+    if batch is None:
+        return None
+
+    pipeline = state.get("tool_pipeline") or []
+    kept = [tool for tool in batch.tasks if tool in pipeline]
+    discarded = [tool for tool in batch.tasks if tool not in pipeline]
+
+    with _batches_lock:
+        dropped = [batch.tasks.pop(tool) for tool in discarded]
+        if not batch.tasks:
+            _batches.pop(batch_id, None)
+    for task in dropped:
+        _discard(task, "discarded")
+
+    # -------------- 타임라인 기록 -------------- #
+    timeline = state.get("tool_timeline", [])
+    timeline.append({
+        "timestamp": datetime.now().isoformat(),
+        "event": "speculative_prefetch",
+        "kept_tools": kept,
+        "discarded_tools": discarded,
+        "description": (
+            f"라우팅 중 선행 검색: 재사용 대기 {', '.join(kept) or '없음'}"
+            f" · 폐기 {', '.join(discarded) or '없음'}"
+        ),
+    })
+    state["tool_timeline"] = timeline
+
+    if exp_manager:
+        exp_manager.logger.write(f"선행 검색 정리: 재사용 대기 {kept} / 폐기 {discarded}")
+        exp_manager.save_speculative_prefetch_stats(get_speculative_stats())
+
+    return {"kept": kept, "discarded": discarded}
+
+
+def take_prefetched(state, tool: str, args: Dict[str, Any], wait_timeout: Optional[float] = None) -> Any:
+    """
+    도구 노드에서 선행 검색 결과 꺼내기 (검색 인자가 같을 때만)
+
+    진행 중이면 wait_timeout까지 기다림. 인자 불일치 / 예외 / 시간 초과면 폐기 후 _MISSING
+
+    Args:
+        state: Agent 상태 (speculative_prefetch_id)
+        tool: 도구 이름
+        args: 도구 노드가 사용할 검색 인자
+        wait_timeout: 최대 대기 시간 (None이면 설정값)
+
+    Returns:
+        선행 검색 결과 (없으면 _MISSING → is_prefetched()로 확인)
+    """
+    batch_id = state.get("speculative_prefetch_id")
+    batch = _get_batch(batch_id)
+    if batch is None:
+        return _MISSING
+
+    with _batches_lock:
+        task = batch.tasks.pop(tool, None)
+        if not batch.tasks:
+            _batches.pop(batch_id, None)
+    if task is None:
+        return _MISSING
+
+    if task.args != args:
+        _discard(task, "stale")
+        return _MISSING
+
+    if wait_timeout is None:
+        wait_timeout = float(get_speculative_config()["wait_timeout_seconds"])
+
+    wait_start = time.perf_counter()
+    try:
+        result = task.future.result(timeout=wait_timeout)
+    except (FutureTimeoutError, CancelledError):
+        _discard(task, "errors")
+        return _MISSING
+    except Exception:
+        # 선행 검색 실패 → 도구 노드가 직접 검색
+        _stats.add(errors=1, wasted_ms=task.elapsed_ms())
+        return _MISSING
+
+    waited_ms = (time.perf_counter() - wait_start) * 1000
+    _stats.add(hits=1, saved_ms=max(task.elapsed_ms() - waited_ms, 0.0))
+    return result
+
+
+def is_prefetched(result: Any) -> bool:
+    """take_prefetched() 결과가 재사용 가능한 값인지"""
+    return result is not _MISSING
+
+
+def run_or_take(state, tool: str, args: Dict[str, Any], run: Callable[[], Any], tool_logger=None) -> Any:
+    """
+    선행 검색 결과가 있으면 재사용, 없으면 run() 실행
+
+    Args:
+        state: Agent 상태
+        tool: 도구 이름
+        args: 검색 인자
+        run: 직접 검색 함수
+        tool_logger: 도구별 Logger (선택 사항)
+
+    Returns:
+        검색 결과
+    """
+    result = take_prefetched(state, tool, args)
+    if is_prefetched(result):
+        if tool_logger:
+            tool_logger.write("라우팅 중 선행 검색 결과 재사용")
+        return result
+    return run()
+
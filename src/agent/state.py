@@ -46,7 +46,13 @@ class AgentState(TypedDict, total=False):
         # 도구 선택 및 실행 상세 정보
         routing_reason (str): 도구 선택 이유
         routing_method (str): 도구 선택 방법 (llm, keyword_fallback, multi_request, etc)
+        routing_latency_ms (float): 라우팅 LLM 호출 지연시간 (combined 모드)
         pipeline_description (str): 다중 요청 파이프라인 설명
+
+        # 답변 캐시 관련 필드 (CachedAgentGraph가 설정)
+        cache_hit (bool): 답변 캐시 히트 여부
+        cache_similarity (float): 캐시된 질문과의 코사인 유사도
+        cached_question (str): 캐시된 원 질문
     """
     # 기본 필드
     question: str                               # 사용자 질문
@@ -76,11 +82,19 @@ class AgentState(TypedDict, total=False):
     # 다중 요청 Pipeline 관련 필드
     tool_pipeline: List[str]                    # 순차 실행 도구 리스트
     pipeline_index: int                         # 현재 Pipeline 실행 인덱스
+    pipeline_dependencies: Optional[Dict[str, List[str]]]  # 도구 → 결과를 사용하는 이전 도구 (None이면 순차)
 
     # 도구 선택 및 실행 상세 정보
     routing_reason: str                         # 도구 선택 이유
     routing_method: str                         # 도구 선택 방법 (llm, keyword_fallback, multi_request, etc)
+    routing_latency_ms: float                   # 라우팅 LLM 호출 지연시간 (ms, combined 모드)
     pipeline_description: str                   # 다중 요청 파이프라인 설명
+    speculative_prefetch_id: Optional[str]      # 라우팅 중 선행 검색 묶음 ID (src/agent/speculative.py)
+
+    # 답변 캐시 관련 필드
+    cache_hit: bool                             # 답변 캐시 히트 여부
+    cache_similarity: float                     # 캐시된 질문과의 코사인 유사도
+    cached_question: str                        # 캐시된 원 질문
 
     # 저장 관련 필드
     save_counter: int                           # 저장 파일 누적 번호
@@ -0,0 +1,145 @@
+# src/agent/streaming.py
+"""
+Agent 그래프 스트리밍 실행 모듈
+
+agent_executor.invoke()는 그래프 전체가 끝날 때까지 아무것도 반환하지 않습니다.
+stream_agent()는 LangGraph stream(stream_mode=["updates", "messages", "values"])으로
+노드 진행 / 답변 토큰 / 최종 상태를 도착하는 즉시 이벤트로 변환합니다.
+
+- 답변 토큰: ANSWER_STREAM_TAG 태그가 붙은 LLM 호출만 전달
+  (라우팅 / 분류 / 제목 추출 / 섹션 정리 같은 중간 호출 토큰은 제외)
+- 수준(level): "level:<수준>" 태그로 구분 → UI는 주 수준 토큰을 먼저 표시
+- 그래프가 stream을 지원하지 않으면 invoke 결과를 final 이벤트 하나로 반환
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# ==================== 기본값 설정 ==================== #
+
+# 최종 답변 LLM 호출에 붙이는 태그 (이 태그가 있는 호출만 토큰 스트리밍)
+ANSWER_STREAM_TAG = "answer_stream"
+LEVEL_TAG_PREFIX = "level:"
+
+# 병렬 파이프라인에서 final_answer가 되지 않는 도구의 답변 토큰 제외용
+_answer_stream_suppressed: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "answer_stream_suppressed", default=False
+)
+
+# configs/model_config.yaml의 streaming 섹션이 없을 때 사용
+DEFAULT_STREAMING_CONFIG = {
+    "enabled": True,                                # UI 스트리밍 실행 모드 사용 여부
+    "render_interval_chars": 20,                    # 이 글자 수만큼 모일 때마다 화면 갱신
+}
+
+
+def get_streaming_config() -> Dict[str, Any]:
+    """
+    스트리밍 설정 로드 (기본값과 병합)
+
+    Returns:
+        스트리밍 설정 딕셔너리
+    """
+    config = dict(DEFAULT_STREAMING_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("streaming", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def answer_stream_config(level: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    최종 답변 LLM 호출용 RunnableConfig (llm.invoke(messages, config=...))
+
+    Args:
+        level: 답변 수준 (elementary/beginner/intermediate/advanced, 선택 사항)
+
+    Returns:
+        {"tags": [...]} (suppress_answer_stream() 블록 안에서는 빈 태그)
+    """
+    if _answer_stream_suppressed.get():
+        return {"tags": []}
+
+    tags = [ANSWER_STREAM_TAG]
+    if level:
+        tags.append(f"{LEVEL_TAG_PREFIX}{level}")
+    return {"tags": tags}
+
+
+@contextmanager
+def suppress_answer_stream():
+    """
+    블록 안의 answer_stream_config()가 답변 태그를 붙이지 않도록 함
+    (병렬로 실행되는 도구 토큰이 화면 답변에 섞이지 않도록)
+    """
+    token = _answer_stream_suppressed.set(True)
+    try:
+        yield
+    finally:
+        _answer_stream_suppressed.reset(token)
+
+
+# ==================== 이벤트 변환 ==================== #
+def _token_event(chunk: Any) -> Optional[Dict[str, Any]]:
+    """messages 모드 청크 (message_chunk, metadata) → token 이벤트 (답변 호출이 아니면 None)"""
+    if not isinstance(chunk, tuple) or len(chunk) != 2:
+        return None
+    message, metadata = chunk
+    metadata = metadata or {}
+    tags = metadata.get("tags") or []
+    if ANSWER_STREAM_TAG not in tags:
+        return None
+
+    content = getattr(message, "content", "")
+    if not isinstance(content, str) or not content:
+        return None
+
+    level = next((tag[len(LEVEL_TAG_PREFIX):] for tag in tags if tag.startswith(LEVEL_TAG_PREFIX)), None)
+    return {
+        "type": "token",
+        "node": metadata.get("langgraph_node"),
+        "level": level,
+        "content": content,
+    }
+
+
+def stream_agent(agent_executor, inputs: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Agent 그래프를 스트리밍 실행하고 이벤트를 도착 순서대로 반환
+
+    Args:
+        agent_executor: create_agent_graph() 결과 (CompiledGraph 또는 CachedAgentGraph)
+        inputs: 그래프 입력 상태 (question, difficulty, messages)
+        config: LangGraph 실행 설정 (callbacks 등)
+
+    Yields:
+        dict: 이벤트
+            {"type": "node", "node": 노드 이름, "update": 노드가 갱신한 상태}
+            {"type": "token", "node": 노드 이름, "level": 수준 또는 None, "content": 토큰}
+            {"type": "final", "state": 그래프 최종 상태}
+    """
+    if not hasattr(agent_executor, "stream"):
+        yield {"type": "final", "state": agent_executor.invoke(inputs, config=config)}
+        return
+
+    final_state: Dict[str, Any] = {}
+    for mode, chunk in agent_executor.stream(inputs, config=config, stream_mode=["updates", "messages", "values"]):
+        if mode == "messages":
+            event = _token_event(chunk)
+            if event:
+                yield event
+
+        elif mode == "updates" and isinstance(chunk, dict):
+            for node, update in chunk.items():
+                yield {"type": "node", "node": node, "update": update if isinstance(update, dict) else {}}
+
+        elif mode == "values" and isinstance(chunk, dict):
+            final_state = chunk
+
+    yield {"type": "final", "state": final_state}
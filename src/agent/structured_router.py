@@ -0,0 +1,200 @@
+# src/agent/structured_router.py
+"""
+통합 라우팅 모듈 (분류 + 라우팅 + 검증을 LLM 1회 호출로)
+
+기존 체인 모드는 콜드 질문 하나에 최대 3번의 순차 LLM 호출이 발생합니다:
+    classify_question → router_node 라우팅 프롬프트 → validate_tool_choice_node
+
+combined 모드는 question_type / tools / refined_query / valid 를
+하나의 구조화 응답(JSON Schema)으로 받습니다.
+
+- LLM이 구조화 출력(with_structured_output)을 지원하면 스키마 강제
+- 미지원 / 실패 시 일반 호출 후 parse_routing_decision으로 견고하게 파싱
+  (코드 펜스, 앞뒤 설명 문장, 도구 별칭 모두 허용)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import json
+from typing import Any, Dict, List, Optional
+
+
+# ==================== 스키마 정의 ==================== #
+VALID_TOOLS = ("general", "glossary", "search_paper", "web_search", "summarize", "text2sql", "save_file")
+
+QUESTION_TYPES = (
+    "term_definition",
+    "paper_search",
+    "latest_research",
+    "paper_summary",
+    "statistics",
+    "file_save",
+    "general_question",
+)
+
+# 도구명 별칭 (LLM이 정식 이름 대신 설명어를 반환하는 경우)
+TOOL_ALIASES = {
+    "paper": "search_paper",
+    "search": "search_paper",
+    "arxiv": "search_paper",
+    "논문": "search_paper",
+    "web": "web_search",
+    "웹": "web_search",
+    "용어": "glossary",
+    "summary": "summarize",
+    "요약": "summarize",
+    "sql": "text2sql",
+    "통계": "text2sql",
+    "save": "save_file",
+    "저장": "save_file",
+}
+
+# with_structured_output / response_format에 전달하는 JSON Schema
+ROUTING_DECISION_SCHEMA = {
+    "title": "routing_decision",
+    "description": "질문 유형 분류, 도구 파이프라인 선택, 자체 검증 결과",
+    "type": "object",
+    "properties": {
+        "question_type": {"type": "string", "enum": list(QUESTION_TYPES)},
+        "tools": {
+            "type": "array",
+            "items": {"type": "string", "enum": list(VALID_TOOLS)},
+            "minItems": 1,
+            "maxItems": 3,
+        },
+        "refined_query": {"type": "string"},
+        "valid": {"type": "boolean"},
+        "reason": {"type": "string"},
+    },
+    "required": ["question_type", "tools", "refined_query", "valid", "reason"],
+    "additionalProperties": False,
+}
+
+
+# ==================== 응답 파싱 ==================== #
+def _extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    텍스트에서 첫 번째 JSON 객체 추출
+
+    코드 펜스나 앞뒤 설명 문장이 있어도 '{' 위치마다 raw_decode를 시도
+
+    Args:
+        text: LLM 원본 응답
+
+    Returns:
+        dict 또는 None
+    """
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = decoder.raw_decode(text, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        start = text.find("{", start + 1)
+    return None
+
+
+def _normalize_tool(name: Any) -> Optional[str]:
+    """도구명 정규화 (정식 이름 → 별칭 순, 알 수 없으면 None)"""
+    if isinstance(name, dict):
+        # 기존 라우팅 프롬프트 형식 {"name": ..., "query": ...} 허용
+        name = name.get("name")
+    if not isinstance(name, str):
+        return None
+
+    lowered = name.strip().lower()
+    if lowered in VALID_TOOLS:
+        return lowered
+    for alias, tool in TOOL_ALIASES.items():
+        if alias in lowered:
+            return tool
+    return None
+
+
+def parse_routing_decision(response: Any) -> Optional[Dict[str, Any]]:
+    """
+    통합 라우팅 응답 파싱 및 검증
+
+    Args:
+        response: 구조화 출력 dict 또는 LLM 원본 문자열
+
+    Returns:
+        dict: {question_type, tools, refined_query, valid, reason}
+        None: JSON 객체가 없거나 유효한 도구가 하나도 없는 경우
+    """
+    parsed = response if isinstance(response, dict) else _extract_json_object(str(response or ""))
+    if not parsed:
+        return None
+
+    # -------------- 도구 파이프라인 -------------- #
+    raw_tools = parsed.get("tools") or parsed.get("tool") or []
+    if not isinstance(raw_tools, list):
+        raw_tools = [raw_tools]
+    tools: List[str] = []
+    for item in raw_tools:
+        tool = _normalize_tool(item)
+        if tool and tool not in tools:
+            tools.append(tool)
+    if not tools:
+        return None
+
+    # refined_query 누락 시 기존 형식의 tools[0].query 사용
+    refined_query = parsed.get("refined_query")
+    if not refined_query and isinstance(raw_tools[0], dict):
+        refined_query = raw_tools[0].get("query")
+
+    # -------------- 질문 유형 / 검증 결과 -------------- #
+    question_type = str(parsed.get("question_type", "")).strip().lower()
+    if question_type not in QUESTION_TYPES:
+        question_type = "general_question"
+
+    valid = parsed.get("valid", True)
+    if isinstance(valid, str):
+        valid = valid.strip().lower() in ("true", "yes", "적절")
+
+    return {
+        "question_type": question_type,
+        "tools": tools[:3],
+        "refined_query": (refined_query or "").strip(),
+        "valid": bool(valid),
+        "reason": str(parsed.get("reason", "")).strip(),
+    }
+
+
+# ==================== LLM 호출 ==================== #
+def invoke_combined_router(llm, prompt: str, use_structured_output: bool = True) -> Dict[str, Any]:
+    """
+    통합 라우팅 LLM 호출 (1회)
+
+    Args:
+        llm: LangChain 채팅 모델 (LLMClient.llm)
+        prompt: get_combined_routing_prompt()로 만든 프롬프트
+        use_structured_output: 구조화 출력(JSON Schema) 우선 사용 여부
+
+    Returns:
+        dict: {
+            "decision": parse_routing_decision 결과 (파싱 실패 시 None),
+            "structured": 스키마 강제 출력 사용 여부,
+            "raw": 원본 응답,
+        }
+
+    Raises:
+        Exception: LLM 호출 자체가 실패한 경우 (호출부에서 체인 모드로 폴백)
+    """
+    # -------------- 1) 구조화 출력 (스키마 강제) -------------- #
+    if use_structured_output and hasattr(llm, "with_structured_output"):
+        try:
+            structured = llm.with_structured_output(ROUTING_DECISION_SCHEMA)
+            result = structured.invoke(prompt)
+            decision = parse_routing_decision(result)
+            if decision:
+                return {"decision": decision, "structured": True, "raw": result}
+        except Exception:
+            # 모델/프로바이더가 구조화 출력을 지원하지 않으면 일반 호출로 폴백
+            pass
+
+    # -------------- 2) 일반 호출 + 견고한 파싱 -------------- #
+    raw = llm.invoke(prompt).content.strip()
+    return {"decision": parse_routing_decision(raw), "structured": False, "raw": raw}
@@ -5,8 +5,6 @@ from __future__ import annotations
 한글 주석과 가독성 중심 구현.
 """
 
-import json
-import os
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -19,6 +17,9 @@ class PaperDocumentLoader:
     """논문 PDF를 LangChain Document로 변환하고 분할합니다."""
 
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200) -> None:
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.failed: Dict[str, str] = {}  # 마지막 load_all_pdfs에서 실패한 파일 → 오류
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
@@ -65,30 +66,35 @@ class PaperDocumentLoader:
             ch.metadata["chunk_index"] = i  # chunk_index 추가 (pgvector 검색용)
         return chunks
 
-    def load_all_pdfs(self, pdf_dir: str | Path, metadata_json_path: str | Path) -> List[Document]:
-        """디렉토리의 모든 PDF를 로드하고 분할합니다."""
+    def load_all_pdfs(
+        self, pdf_dir: str | Path, metadata_json_path: str | Path, workers: Optional[int] = None
+    ) -> List[Document]:
+        """디렉토리의 모든 PDF를 프로세스 풀로 로드하고 분할합니다.
 
-        pdf_dir = Path(pdf_dir)
-        with Path(metadata_json_path).open("r", encoding="utf-8") as f:
-            papers_metadata = json.load(f)
+        실패한 파일은 건너뛰고 self.failed에 오류를 남깁니다.
+        (체크포인트 / 임베딩까지 포함한 적재는 src.data.ingestion.IngestionEngine 사용)
 
-        id_to_meta: Dict[str, Dict] = {}
-        for p in papers_metadata:
-            arxiv_id = p.get("entry_id", "").split("/")[-1]
-            id_to_meta[arxiv_id] = p
+        Args:
+            pdf_dir: PDF 디렉토리
+            metadata_json_path: arxiv_papers_metadata.json 경로
+            workers: 파싱 프로세스 수 (None이면 ingestion.workers 설정, 1이면 순차)
+        """
+
+        from src.data.ingestion import IngestionEngine
+
+        engine = IngestionEngine(
+            pdf_dir,
+            metadata_json_path,
+            workers=workers,
+            config={"chunk_size": self.chunk_size, "chunk_overlap": self.chunk_overlap},
+        )
+        tasks, _ = engine.plan(force=True)
 
         all_chunks: List[Document] = []
-        for filename in os.listdir(pdf_dir):
-            if not filename.endswith(".pdf"):
-                continue
-            arxiv_id = filename[:-4]
-            meta = id_to_meta.get(arxiv_id, {})
-            try:
-                chunks = self.load_and_split(pdf_dir / filename, meta)
-                all_chunks.extend(chunks)
-            except Exception as e:  # noqa: BLE001
-                # 로더 오류 시 해당 파일은 건너뜁니다.
+        self.failed = {}
+        for task, chunks, error in engine.parse(tasks):
+            if error is not None:
+                self.failed[task.path.name] = error
                 continue
+            all_chunks.extend(chunks)
         return all_chunks
-
-
@@ -0,0 +1,445 @@
+"""병렬 · 재개 가능한 논문 PDF 적재 엔진.
+
+    PDF 목록 → 내용 해시 계산 → 체크포인트 확인 (같은 해시로 끝난 논문은 건너뜀)
+        → 프로세스 풀 파싱 (PyPDFLoader + 청크 분할, 동시에 최대 workers × 2편)
+        → 제한 크기 큐 (queue_size편, 가득 차면 파싱 결과 수집이 대기 = 역압)
+        → 임베딩 스레드: paper_id 부여 · 중복 청크 제거 · embed_batch_size개씩 pgvector 저장
+
+- 논문마다 체크포인트(content_hash, stage, status, chunks, error)를 SQLite에 기록
+  재실행 시 done 논문은 건너뛰고, 실패 / 중단된 논문은 처음부터 다시 처리
+- 청크 ID는 (arxiv_id, chunk_index)로 고정 → 다시 저장해도 중복되지 않고 덮어씀
+  (내용이 바뀌어 청크 수가 줄면 남는 이전 청크는 삭제, 청크 수는 임베딩이 끝난 뒤에만 기록)
+- 체크포인트가 없는 논문은 첫 저장 전에 기존 행 삭제 (엔진 도입 전 임의 ID로 저장된 청크 중복 방지)
+- 임베딩 API 호출 속도는 호출 스케줄러(src/llm/scheduler.py)가 조절하므로 임의 sleep 없음
+- 파싱 / 저장 오류는 삼키지 않고 체크포인트와 결과 통계에 남김
+"""
+
+from __future__ import annotations
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import contextvars
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from os import cpu_count
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# 설정 기본값 (configs/model_config.yaml의 ingestion 섹션이 없을 때 사용)
+DEFAULT_INGESTION_CONFIG = {
+    "workers": 0,                                   # 파싱 프로세스 수 (0이면 CPU 코어 수)
+    "queue_size": 8,                                # 임베딩 대기 논문 수 (가득 차면 파싱 결과 수집 대기)
+    "embed_batch_size": 50,                         # pgvector 저장 1회당 청크 수
+    "max_retries": 3,                               # 배치 저장 재시도 횟수
+    "checkpoint_path": "data/processed/ingestion_checkpoints.sqlite3",
+    "chunk_size": 1000,
+    "chunk_overlap": 200,
+}
+
+def get_ingestion_config() -> Dict[str, Any]:
+    """적재 설정 로드 (기본값과 병합)."""
+
+    config = dict(DEFAULT_INGESTION_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("ingestion", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def file_hash(path: str | Path) -> str:
+    """파일 내용 SHA-256 (청크 단위로 읽음)."""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_id(arxiv_id: str, index: int) -> str:
+    """(arxiv_id, chunk_index) → 고정 청크 ID (재저장 시 덮어쓰기용)."""
+
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"arxiv:{arxiv_id}:{index}"))
+
+
+# ==================== 체크포인트 ==================== #
+
+class IngestionCheckpoint:
+    """논문별 적재 진행 상태 (SQLite, 임베딩 스레드와 공유하므로 잠금으로 보호)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS paper_checkpoints ("
+            " arxiv_id TEXT PRIMARY KEY,"
+            " content_hash TEXT NOT NULL,"
+            " stage TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " chunks INTEGER,"
+            " error TEXT,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, arxiv_id: str) -> Optional[Dict[str, Any]]:
+        """논문 체크포인트 조회 (없으면 None)."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, stage, status, chunks, error FROM paper_checkpoints WHERE arxiv_id = ?",
+                (arxiv_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return dict(zip(("content_hash", "stage", "status", "chunks", "error"), row))
+
+    def is_done(self, arxiv_id: str, content_hash: str) -> bool:
+        """같은 내용으로 임베딩까지 끝난 논문인지."""
+
+        cp = self.get(arxiv_id)
+        return bool(cp) and cp["content_hash"] == content_hash and cp["stage"] == "embed" and cp["status"] == "done"
+
+    def mark(
+        self,
+        arxiv_id: str,
+        content_hash: str,
+        stage: str,
+        status: str,
+        chunks: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """논문 단계 / 상태 기록 (chunks를 생략하면 이전 값 유지)."""
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO paper_checkpoints (arxiv_id, content_hash, stage, status, chunks, error, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (arxiv_id) DO UPDATE SET content_hash = excluded.content_hash,"
+                " stage = excluded.stage, status = excluded.status,"
+                " chunks = COALESCE(excluded.chunks, paper_checkpoints.chunks),"
+                " error = excluded.error, updated_at = excluded.updated_at",
+                (arxiv_id, content_hash, stage, status, chunks, error, time.time()),
+            )
+            self._conn.commit()
+
+    def summary(self) -> Dict[str, int]:
+        """"stage/status" → 논문 수."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stage, status, COUNT(*) FROM paper_checkpoints GROUP BY stage, status"
+            ).fetchall()
+        return {f"{stage}/{status}": count for stage, status, count in rows}
+
+    def failures(self) -> Dict[str, str]:
+        """실패한 논문 → 오류 메시지."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT arxiv_id, stage, error FROM paper_checkpoints WHERE status = 'failed'"
+            ).fetchall()
+        return {arxiv_id: f"[{stage}] {error}" for arxiv_id, stage, error in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ==================== 파싱 (프로세스 풀 작업자) ==================== #
+
+_worker_loader = None
+
+
+def _init_worker(chunk_size: int, chunk_overlap: int) -> None:
+    """작업자 프로세스마다 로더 1개 생성 (텍스트 분할기 재사용)."""
+
+    global _worker_loader
+    from src.data.document_loader import PaperDocumentLoader
+
+    _worker_loader = PaperDocumentLoader(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+def parse_paper(pdf_path: str, metadata: Dict[str, Any]) -> List[Any]:
+    """PDF 1편 → 청크 Document 리스트 (작업자 프로세스에서 실행)."""
+
+    if _worker_loader is None:
+        _init_worker(DEFAULT_INGESTION_CONFIG["chunk_size"], DEFAULT_INGESTION_CONFIG["chunk_overlap"])
+    return _worker_loader.load_and_split(pdf_path, metadata)
+
+
+@dataclass
+class PaperTask:
+    """적재할 논문 1편."""
+
+    arxiv_id: str
+    path: Path
+    content_hash: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    previous_chunks: Optional[int] = None           # 이전 적재 때 청크 수 (None이면 엔진으로 저장한 적 없음)
+
+
+def _delete_stored_chunks(arxiv_id: str, paper_id: Optional[int]) -> int:
+    """paper_chunks 컬렉션에서 논문 1편의 기존 청크 삭제 (기본 purge_fn)."""
+
+    from src.database.vector_store import delete_paper_chunks
+
+    return delete_paper_chunks(arxiv_id=arxiv_id, paper_id=paper_id, collection_name="paper_chunks")
+
+
+# ==================== 적재 엔진 ==================== #
+
+class IngestionEngine:
+    """PDF 파싱(프로세스 풀) → 제한 크기 큐 → 임베딩 스레드 적재 엔진.
+
+    Args:
+        pdf_dir: PDF 폴더 (파일명 = arxiv_id.pdf)
+        metadata_path: arxiv_papers_metadata.json (청크 메타데이터)
+        mapping_path: paper_id_mapping.json (없으면 paper_id 미부여)
+        workers: 파싱 프로세스 수 (None이면 설정값, 0이면 CPU 코어 수, 1이면 현재 프로세스에서 순차)
+        checkpoint: 체크포인트 저장소 (None이면 기록 / 건너뛰기 없음)
+        vectorstore: 저장 대상 (None이면 첫 저장 시 paper_chunks 컬렉션)
+        config: 설정 덮어쓰기 (configs/model_config.yaml의 ingestion 섹션과 병합)
+        parse_fn: 논문 1편 파싱 함수 (pickle 가능한 최상위 함수)
+        purge_fn: (arxiv_id, paper_id) → 삭제한 청크 수, 체크포인트 없는 논문의 첫 저장 전 기존 행 삭제
+            (None이면 vectorstore 미지정 시 paper_chunks 컬렉션에서 삭제, 지정 시 삭제 안 함)
+        logger: 진행 기록용 Logger (없으면 print)
+    """
+
+    def __init__(
+        self,
+        pdf_dir: str | Path,
+        metadata_path: Optional[str | Path] = None,
+        mapping_path: Optional[str | Path] = None,
+        workers: Optional[int] = None,
+        checkpoint: Optional[IngestionCheckpoint] = None,
+        vectorstore: Any = None,
+        config: Optional[Dict[str, Any]] = None,
+        parse_fn: Callable[[str, Dict[str, Any]], List[Any]] = parse_paper,
+        purge_fn: Optional[Callable[[str, Optional[int]], int]] = None,
+        logger: Any = None,
+    ) -> None:
+        self.config = dict(get_ingestion_config(), **(config or {}))
+        self.pdf_dir = Path(pdf_dir)
+        self.metadata_path = Path(metadata_path) if metadata_path else None
+        self.mapping_path = Path(mapping_path) if mapping_path else None
+        workers = self.config["workers"] if workers is None else workers
+        self.workers = int(workers) or cpu_count() or 1
+        self.checkpoint = checkpoint
+        self.vectorstore = vectorstore
+        self.parse_fn = parse_fn
+        self.purge_fn = purge_fn if purge_fn is not None or vectorstore is not None else _delete_stored_chunks
+        self.logger = logger
+
+    def _log(self, message: str) -> None:
+        if self.logger is not None:
+            self.logger.write(message)
+        else:
+            print(message)
+
+    # ---------------------- 작업 목록 ---------------------- #
+    def _paper_metadata(self) -> Dict[str, Dict[str, Any]]:
+        if not self.metadata_path or not self.metadata_path.exists():
+            return {}
+        with self.metadata_path.open("r", encoding="utf-8") as f:
+            papers = json.load(f)
+        return {p.get("entry_id", "").split("/")[-1]: p for p in papers}
+
+    def plan(self, force: bool = False) -> Tuple[List[PaperTask], int]:
+        """적재할 논문 목록 + 건너뛴 논문 수 (force면 체크포인트 무시)."""
+
+        id_to_meta = self._paper_metadata()
+        tasks, skipped = [], 0
+        for path in sorted(self.pdf_dir.glob("*.pdf")):
+            arxiv_id = path.stem
+            content_hash = file_hash(path)
+            if not force and self.checkpoint is not None and self.checkpoint.is_done(arxiv_id, content_hash):
+                skipped += 1
+                continue
+            metadata = dict(id_to_meta.get(arxiv_id, {}), arxiv_id=arxiv_id)
+            previous = self.checkpoint.get(arxiv_id) if self.checkpoint is not None else None
+            tasks.append(PaperTask(arxiv_id, path, content_hash, metadata, (previous or {}).get("chunks")))
+        return tasks, skipped
+
+    # ---------------------- 파싱 ---------------------- #
+    def parse(self, tasks: Iterable[PaperTask]) -> Iterator[Tuple[PaperTask, Optional[List[Any]], Optional[str]]]:
+        """논문별 (task, 청크, 오류) 순차 반환 (끝난 순서, 동시에 최대 workers × 2편만 진행)."""
+
+        tasks = iter(tasks)
+        settings = (self.config["chunk_size"], self.config["chunk_overlap"])
+        initializer = _init_worker if self.parse_fn is parse_paper else None
+        if self.workers <= 1:
+            if initializer is not None:
+                initializer(*settings)
+            for task in tasks:
+                try:
+                    yield task, self.parse_fn(str(task.path), task.metadata), None
+                except Exception as e:  # noqa: BLE001
+                    yield task, None, f"{type(e).__name__}: {e}"
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=initializer,
+            initargs=settings if initializer is not None else (),
+        ) as pool:
+            pending = {}
+
+            def submit_next() -> None:
+                task = next(tasks, None)
+                if task is not None:
+                    pending[pool.submit(self.parse_fn, str(task.path), task.metadata)] = task
+
+            for _ in range(self.workers * 2):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = pending.pop(future)
+                    submit_next()
+                    try:
+                        yield task, future.result(), None
+                    except Exception as e:  # noqa: BLE001
+                        yield task, None, f"{type(e).__name__}: {e}"
+
+    # ---------------------- 임베딩 / 저장 ---------------------- #
+    def _store(self):
+        if self.vectorstore is None:
+            from src.database.vector_store import get_pgvector_store
+
+            self.vectorstore = get_pgvector_store(collection_name="paper_chunks")
+        return self.vectorstore
+
+    def _save_paper(self, task: PaperTask, chunks: List[Any], mapping: Dict[str, int], seen: set) -> int:
+        """논문 1편 청크 저장 → 저장한 청크 수 (실패 시 예외)."""
+
+        if mapping:
+            if task.arxiv_id not in mapping:
+                raise KeyError(f"paper_id 매핑 없음: {task.arxiv_id}")
+            for chunk in chunks:
+                chunk.metadata["paper_id"] = mapping[task.arxiv_id]
+
+        # 엔진으로 저장한 적 없는 논문: 기존 행(임의 ID로 저장된 이전 적재 결과) 먼저 삭제
+        if task.previous_chunks is None and self.purge_fn is not None:
+            removed = self.purge_fn(task.arxiv_id, mapping.get(task.arxiv_id))
+            if removed:
+                self._log(f"   🧹 {task.arxiv_id}: 기존 청크 {removed}개 삭제 (체크포인트 없음)")
+
+        # 중복 청크 제거 (이번 실행에서 이미 저장한 내용)
+        docs, ids = [], []
+        for chunk in chunks:
+            digest = hashlib.sha1(chunk.page_content.encode("utf-8")).hexdigest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            docs.append(chunk)
+            ids.append(chunk_id(task.arxiv_id, chunk.metadata.get("chunk_index", len(ids))))
+
+        store = self._store()
+        batch_size = max(int(self.config["embed_batch_size"]), 1)
+        for i in range(0, len(docs), batch_size):
+            for attempt in range(1, int(self.config["max_retries"]) + 1):
+                try:
+                    # 임베딩 API 호출 속도는 호출 스케줄러가 조절 (429 시 제공자 일시 정지 후 재개)
+                    store.add_documents(docs[i:i + batch_size], ids=ids[i:i + batch_size])
+                    break
+                except Exception:
+                    if attempt >= int(self.config["max_retries"]):
+                        raise
+
+        # 내용이 바뀌어 청크 수가 줄었으면 남는 이전 청크 삭제
+        if task.previous_chunks and task.previous_chunks > len(chunks):
+            store.delete(ids=[chunk_id(task.arxiv_id, i) for i in range(len(chunks), task.previous_chunks)])
+        return len(docs)
+
+    def _embed_loop(self, inbox: "queue.Queue", stats: Dict[str, Any], parse_only: bool) -> None:
+        mapping: Dict[str, int] = {}
+        if self.mapping_path and self.mapping_path.exists() and not parse_only:
+            with self.mapping_path.open("r", encoding="utf-8") as f:
+                mapping = json.load(f)
+        seen: set = set()
+
+        while True:
+            item = inbox.get()
+            if item is None:
+                return
+            task, chunks = item
+            if parse_only:
+                continue
+            try:
+                saved = self._save_paper(task, chunks, mapping, seen)
+                stats["embedded"] += 1
+                stats["chunks_saved"] += saved
+                if self.checkpoint is not None:
+                    self.checkpoint.mark(task.arxiv_id, task.content_hash, "embed", "done", chunks=len(chunks))
+                self._log(f"   ✅ {task.arxiv_id}: {saved}/{len(chunks)}개 청크 저장")
+            except Exception as e:  # noqa: BLE001
+                stats["failed"] += 1
+                if self.checkpoint is not None:
+                    self.checkpoint.mark(task.arxiv_id, task.content_hash, "embed", "failed", error=f"{type(e).__name__}: {e}")
+                self._log(f"   ❌ {task.arxiv_id} 저장 실패: {e}")
+
+    # ---------------------- 실행 ---------------------- #
+    def run(self, force: bool = False, parse_only: bool = False) -> Dict[str, Any]:
+        """
+        적재 실행.
+
+        Args:
+            force: 체크포인트와 무관하게 모든 논문 재처리
+            parse_only: 파싱만 실행 (임베딩 / 저장 / 체크포인트 기록 없음, 벤치마크용)
+
+        Returns:
+            {"papers", "skipped", "parsed", "embedded", "failed", "chunks", "chunks_saved",
+             "workers", "elapsed_s", "papers_per_minute"}
+        """
+        started = time.perf_counter()
+        tasks, skipped = self.plan(force)
+        stats: Dict[str, Any] = {
+            "papers": len(tasks) + skipped, "skipped": skipped, "parsed": 0, "embedded": 0,
+            "failed": 0, "chunks": 0, "chunks_saved": 0, "workers": self.workers,
+        }
+        checkpoint = None if parse_only else self.checkpoint
+
+        inbox: "queue.Queue" = queue.Queue(maxsize=max(int(self.config["queue_size"]), 1))
+        # 호출 측 컨텍스트(background_priority / 트레이스)를 임베딩 스레드에 그대로 전달
+        embedder = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._embed_loop, inbox, stats, parse_only),
+            name="ingestion-embedder",
+            daemon=True,
+        )
+        embedder.start()
+        try:
+            for task, chunks, error in self.parse(tasks):
+                if error is not None:
+                    stats["failed"] += 1
+                    if checkpoint is not None:
+                        checkpoint.mark(task.arxiv_id, task.content_hash, "parse", "failed", error=error)
+                    self._log(f"   ❌ {task.arxiv_id} 파싱 실패: {error}")
+                    continue
+                stats["parsed"] += 1
+                stats["chunks"] += len(chunks)
+                if checkpoint is not None:
+                    # 청크 수는 임베딩 완료 시에만 기록 (저장 실패 후 재시도 때 이전 청크 수로 남는 청크 삭제)
+                    checkpoint.mark(task.arxiv_id, task.content_hash, "parse", "done")
+                inbox.put((task, chunks))          # 임베딩이 밀리면 여기서 대기 (역압)
+        finally:
+            inbox.put(None)
+            embedder.join()
+
+        elapsed = time.perf_counter() - started
+        stats["elapsed_s"] = round(elapsed, 2)
+        stats["papers_per_minute"] = round(stats["parsed"] / elapsed * 60, 1) if elapsed > 0 else 0.0
+        return stats
@@ -1,9 +1,82 @@
+# ------------------------- 표준 라이브러리 ------------------------- #
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
 # ------------------------- 서드파티 라이브러리 ------------------------- #
 import psycopg2
 from psycopg2 import pool
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
 from src.utils.config_loader import get_db_config
+from src.utils.tracing import current_trace_id, span
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/db_config.yaml의 connection_pool 섹션이 없을 때 사용
+DEFAULT_POOL_CONFIG = {
+    "min_connections": 1,                           # 최소 연결 수
+    "max_connections": 10,                          # 최대 연결 수
+    "connection_timeout": 30,                       # 연결 타임아웃 (초)
+    "checkout_timeout": 10,                         # 풀 대기 최대 시간 (초)
+    "statement_timeout_ms": 30000,                  # 기본 SQL 실행 제한 (ms, 0이면 무제한)
+}
+
+
+class PoolTimeoutError(pool.PoolError):
+    """checkout_timeout 내에 연결을 얻지 못했을 때 발생"""
+
+
+# ==================== 연결 설정 유틸리티 ==================== #
+
+def _load_pool_config() -> Dict[str, Any]:
+    """
+    연결 풀 설정 로드 (기본값과 병합)
+
+    Returns:
+        연결 풀 설정 딕셔너리
+    """
+    config = dict(DEFAULT_POOL_CONFIG)
+    try:
+        config.update(get_db_config().get("connection_pool", {}) or {})
+    except Exception:
+        pass
+    return config
+
+
+def _connection_kwargs(connection_timeout: int) -> Dict[str, Any]:
+    """
+    psycopg2 연결 인자 생성
+
+    configs/db_config.yaml의 postgresql 설정을 우선 사용하고,
+    호스트 정보가 비어 있으면 DATABASE_URL 환경변수로 폴백
+
+    Args:
+        connection_timeout: 연결 타임아웃 (초)
+
+    Returns:
+        psycopg2.connect 키워드 인자
+    """
+    pg_config = {}
+    try:
+        pg_config = get_db_config().get("postgresql", {}) or {}
+    except Exception:
+        pass
+
+    if not pg_config.get("host") and os.getenv("DATABASE_URL"):
+        return {"dsn": os.getenv("DATABASE_URL"), "connect_timeout": connection_timeout}
+
+    return {
+        "host": pg_config.get("host") or "localhost",
+        "port": pg_config.get("port") or 5432,
+        "database": pg_config.get("database") or "papers",
+        "user": pg_config.get("user") or "postgres",
+        "password": pg_config.get("password") or "",
+        "connect_timeout": connection_timeout,
+    }
 
 
 # ==================== PostgreSQL Connection Pool ==================== #
@@ -12,49 +85,170 @@ class PostgreSQLConnectionPool:
     PostgreSQL 연결 풀 관리 클래스
 
     configs/db_config.yaml 설정 파일을 사용하여 연결합니다.
+    - 스레드 안전 (ThreadedConnectionPool)
+    - 풀 소진 시 checkout_timeout까지 대기 후 PoolTimeoutError
+    - 체크아웃/대기/열린 연결 수 메트릭 제공
     """
 
-    def __init__(self, min_connections=1, max_connections=10):
+    def __init__(
+        self,
+        min_connections: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        checkout_timeout: Optional[float] = None,
+    ):
         """
         연결 풀 초기화
 
         Args:
-            min_connections: 최소 연결 수
-            max_connections: 최대 연결 수
+            min_connections: 최소 연결 수 (미지정 시 db_config.yaml)
+            max_connections: 최대 연결 수 (미지정 시 db_config.yaml)
+            checkout_timeout: 풀 대기 최대 시간 (초, 미지정 시 db_config.yaml)
         """
         # configs/db_config.yaml에서 설정 로드
-        db_config = get_db_config()
-        pg_config = db_config['postgresql']
-
-        self.connection_pool = psycopg2.pool.SimpleConnectionPool(
-            minconn=min_connections,                        # 최소 연결 수
-            maxconn=max_connections,                        # 최대 연결 수
-            host=pg_config['host'],
-            port=pg_config['port'],
-            database=pg_config['database'],
-            user=pg_config['user'],
-            password=pg_config['password']
+        pool_config = _load_pool_config()
+
+        self.min_connections = int(min_connections or pool_config["min_connections"])
+        self.max_connections = int(max_connections or pool_config["max_connections"])
+        self.checkout_timeout = float(checkout_timeout or pool_config["checkout_timeout"])
+        self.statement_timeout_ms = int(pool_config.get("statement_timeout_ms") or 0)
+
+        self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
+            minconn=self.min_connections,                   # 최소 연결 수
+            maxconn=self.max_connections,                   # 최대 연결 수
+            **_connection_kwargs(int(pool_config["connection_timeout"]))
         )
 
+        # 동시 체크아웃 수 제한 (풀 소진 시 PoolError 대신 대기)
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "checkouts": 0,                                 # 총 체크아웃 수
+            "waits": 0,                                     # 풀 소진으로 대기한 횟수
+            "wait_time_ms": 0.0,                            # 누적 대기 시간
+            "timeouts": 0,                                  # 대기 시간 초과 횟수
+            "discarded": 0,                                 # 끊긴 연결 폐기 수
+            "in_use": 0,                                    # 현재 사용 중인 연결 수
+            "max_in_use": 0,                                # 최대 동시 사용 연결 수
+        }
+
     # ---------------------- 연결 가져오기 ---------------------- #
     def get_connection(self):
         """
-        연결 풀에서 연결 가져오기
+        연결 풀에서 연결 가져오기 (풀 소진 시 checkout_timeout까지 대기)
 
         Returns:
             psycopg2 connection 객체
+
+        Raises:
+            PoolTimeoutError: 대기 시간 내에 연결을 얻지 못한 경우
         """
-        return self.connection_pool.getconn()
+        if not self._slots.acquire(blocking=False):
+            start = time.perf_counter()
+            acquired = self._slots.acquire(timeout=self.checkout_timeout)
+            waited_ms = (time.perf_counter() - start) * 1000
+
+            with self._metrics_lock:
+                self._metrics["waits"] += 1
+                self._metrics["wait_time_ms"] += waited_ms
+                if not acquired:
+                    self._metrics["timeouts"] += 1
+
+            if not acquired:
+                raise PoolTimeoutError(
+                    f"{self.checkout_timeout}초 내에 DB 연결을 얻지 못했습니다 "
+                    f"(max_connections={self.max_connections})"
+                )
+
+        try:
+            connection = self.connection_pool.getconn()
+
+            # 서버 측에서 끊긴 연결은 폐기 후 재시도
+            if connection.closed:
+                self.connection_pool.putconn(connection, close=True)
+                with self._metrics_lock:
+                    self._metrics["discarded"] += 1
+                connection = self.connection_pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._metrics_lock:
+            self._metrics["checkouts"] += 1
+            self._metrics["in_use"] += 1
+            self._metrics["max_in_use"] = max(self._metrics["max_in_use"], self._metrics["in_use"])
+
+        return connection
 
     # ---------------------- 연결 반환 ---------------------- #
-    def put_connection(self, connection):
+    def put_connection(self, connection, close: bool = False):
         """
         연결을 풀에 반환
 
         Args:
             connection: psycopg2 connection 객체
+            close: True면 재사용하지 않고 종료
+        """
+        try:
+            self.connection_pool.putconn(connection, close=close or bool(connection.closed))
+        finally:
+            with self._metrics_lock:
+                self._metrics["in_use"] -= 1
+            self._slots.release()
+
+    # ---------------------- 연결 컨텍스트 ---------------------- #
+    @contextmanager
+    def connection(self, statement_timeout_ms: Optional[int] = None):
         """
-        self.connection_pool.putconn(connection)
+        트랜잭션 단위 연결 컨텍스트
+
+        정상 종료 시 commit, 예외 시 rollback 후 연결을 풀에 반환
+
+        Args:
+            statement_timeout_ms: SQL 실행 제한 (ms, 미지정 시 풀 기본값, 0이면 무제한)
+
+        Yields:
+            psycopg2 connection 객체
+        """
+        conn = self.get_connection()
+        broken = False
+        try:
+            timeout = self.statement_timeout_ms if statement_timeout_ms is None else statement_timeout_ms
+            if timeout:
+                # SET LOCAL: 현재 트랜잭션에만 적용 (commit/rollback 시 자동 해제)
+                with conn.cursor() as cur:
+                    cur.execute("SET LOCAL statement_timeout = %s", (int(timeout),))
+
+            yield conn
+            conn.commit()
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+            raise
+        finally:
+            self.put_connection(conn, close=broken)
+
+    # ---------------------- 메트릭 ---------------------- #
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        연결 풀 메트릭 반환
+
+        Returns:
+            dict: checkouts, waits, wait_time_ms, timeouts, in_use, open_connections 등
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+
+        # 열린 연결 수 = 유휴 연결 + 사용 중 연결
+        idle = len(getattr(self.connection_pool, "_pool", []))
+        used = len(getattr(self.connection_pool, "_used", {}))
+        metrics["open_connections"] = idle + used
+        metrics["idle_connections"] = idle
+        metrics["wait_time_ms"] = round(metrics["wait_time_ms"], 2)
+        metrics["min_connections"] = self.min_connections
+        metrics["max_connections"] = self.max_connections
+        return metrics
 
     # ---------------------- 연결 풀 종료 ---------------------- #
     def close_all_connections(self):
@@ -65,7 +259,152 @@ class PostgreSQLConnectionPool:
 
 
 # ==================== 전역 연결 풀 인스턴스 ==================== #
-connection_pool = PostgreSQLConnectionPool()
+# import 시점에 DB 연결을 시도하지 않도록 최초 사용 시 생성
+_connection_pool: Optional[PostgreSQLConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> PostgreSQLConnectionPool:
+    """
+    전역 연결 풀 반환 (최초 호출 시 생성)
+
+    Returns:
+        PostgreSQLConnectionPool 인스턴스
+    """
+    global _connection_pool
+
+    if _connection_pool is None:
+        with _pool_lock:
+            if _connection_pool is None:
+                _connection_pool = PostgreSQLConnectionPool()
+    return _connection_pool
+
+
+def close_connection_pool():
+    """
+    전역 연결 풀 종료 (다음 사용 시 재생성)
+    """
+    global _connection_pool
+
+    with _pool_lock:
+        if _connection_pool is not None:
+            _connection_pool.close_all_connections()
+            _connection_pool = None
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """
+    전역 연결 풀 메트릭 반환 (풀 미생성 시 빈 딕셔너리)
+
+    Returns:
+        dict: 연결 풀 메트릭
+    """
+    if _connection_pool is None:
+        return {}
+    return _connection_pool.get_metrics()
+
+
+# ==================== 커넥션/커서 컨텍스트 ==================== #
+
+@contextmanager
+def get_connection(statement_timeout_ms: Optional[int] = None):
+    """
+    풀에서 연결을 빌려 트랜잭션 단위로 사용
+
+    사용 예:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(...)
+
+    Args:
+        statement_timeout_ms: SQL 실행 제한 (ms, 미지정 시 db_config.yaml 기본값)
+
+    Yields:
+        psycopg2 connection 객체
+    """
+    with get_connection_pool().connection(statement_timeout_ms) as conn:
+        yield conn
+
+
+@contextmanager
+def get_cursor(cursor_factory=None, statement_timeout_ms: Optional[int] = None):
+    """
+    풀에서 연결을 빌려 커서 제공 (종료 시 commit/rollback 및 반환 자동 처리)
+
+    사용 예:
+        with get_cursor(RealDictCursor) as cur:
+            cur.execute("SELECT ...", params)
+            rows = cur.fetchall()
+
+    Args:
+        cursor_factory: psycopg2 커서 팩토리 (RealDictCursor 등)
+        statement_timeout_ms: SQL 실행 제한 (ms, 미지정 시 db_config.yaml 기본값)
+
+    Yields:
+        psycopg2 cursor 객체
+    """
+    with get_connection(statement_timeout_ms) as conn:
+        with conn.cursor(cursor_factory=cursor_factory) as cur:
+            yield trace_cursor(cur)
+
+
+# ==================== 요청 트레이스 SQL span ==================== #
+class TracedCursor:
+    """execute / executemany를 db.sql span으로 기록하는 커서 프록시 (나머지 속성은 원본 커서로 위임)"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def _traced(self, method: str, query, args):
+        with span("db.sql", kind="client", statement=_statement_text(self._cursor, query)) as sql_span:
+            result = getattr(self._cursor, method)(query, args)
+            sql_span.set_attribute("rowcount", self._cursor.rowcount)
+        return result
+
+    def execute(self, query, vars=None):
+        return self._traced("execute", query, vars)
+
+    def executemany(self, query, vars_list):
+        return self._traced("executemany", query, vars_list)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._cursor.__exit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def _statement_text(cursor, query) -> str:
+    """span에 기록할 SQL 문 (파라미터 값은 남기지 않음)"""
+    if isinstance(query, (bytes, bytearray)):
+        return query.decode("utf-8", errors="replace")
+    if not isinstance(query, str) and hasattr(query, "as_string"):
+        try:
+            return query.as_string(cursor)          # psycopg2.sql.Composed
+        except Exception:
+            pass
+    return " ".join(str(query).split())
+
+
+def trace_cursor(cursor):
+    """
+    요청 트레이스 안이면 커서를 TracedCursor로 감쌈 (트레이스 밖이면 원본 그대로)
+
+    Args:
+        cursor: psycopg2 cursor 객체
+
+    Returns:
+        TracedCursor 또는 원본 cursor
+    """
+    if current_trace_id() is None:
+        return cursor
+    return TracedCursor(cursor)
 
 
 # ==================== 간단한 쿼리 실행 함수 ==================== #
@@ -82,25 +421,10 @@ def execute_query(query, params=None, fetch=False):
         fetch=True: 조회 결과 리스트
         fetch=False: None
     """
-    conn = connection_pool.get_connection()          # 연결 가져오기
-    cursor = conn.cursor()
-
-    try:
-        # 쿼리 실행
+    with get_cursor() as cursor:
         cursor.execute(query, params)
-        conn.commit()                                # 트랜잭션 커밋
 
         # 결과 조회
         if fetch:
-            result = cursor.fetchall()               # 모든 결과 가져오기
-            return result
-        else:
-            return None
-
-    except Exception as e:
-        conn.rollback()                              # 오류 발생 시 롤백
-        raise e
-
-    finally:
-        cursor.close()
-        connection_pool.put_connection(conn)        # 연결 반환
\ No newline at end of file
+            return cursor.fetchall()                 # 모든 결과 가져오기
+        return None
@@ -2,33 +2,409 @@
 # 📘 Embeddings 통합 모듈
 # ------------------------------------------
 # - OpenAI Embeddings 팩토리 함수
+# - 모델별 인스턴스 재사용 (프로세스 단위 공유)
+# - 쿼리 임베딩 캐시 (인메모리 LRU + 선택적 영구 저장소)
 # - configs/model_config.yaml 설정 사용
 # ==========================================
 
 # ------------------------- 표준 라이브러리 ------------------------- #
 import os
-from typing import Optional
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 # ------------------------- 서드파티 라이브러리 ------------------------- #
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.llm.scheduler import estimate_tokens
+from src.utils.cache import LRUCache
+from src.utils.tracing import current_span, span
+
 
 # ==================== 기본값 설정 ==================== #
 
 DEFAULT_EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
 
+# 임베딩 캐시 기본 설정 (model_config.yaml의 embeddings.cache로 덮어씀)
+DEFAULT_CACHE_CONFIG = {
+    "enabled": True,                       # 쿼리 임베딩 캐시 사용 여부
+    "max_size": 10000,                     # 인메모리 LRU 최대 항목 수
+    "cache_documents": False,              # 문서(청크) 임베딩도 캐시할지 여부
+    "persistent": None,                    # 영구 저장소: None / sqlite / postgres
+    "sqlite_path": "data/cache/embeddings.sqlite",
+}
+
+# 모델명별 Embeddings 인스턴스 캐시 (HTTP 클라이언트 재사용)
+_embeddings_cache: Dict[str, Embeddings] = {}
+_embeddings_lock = threading.Lock()
+
+
+# ==================== 캐시 유틸리티 ==================== #
+
+def _load_cache_config() -> Dict[str, Any]:
+    """
+    임베딩 캐시 설정 로드
+
+    Returns:
+        기본값과 병합된 캐시 설정 딕셔너리
+    """
+    config = dict(DEFAULT_CACHE_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("embeddings", {}).get("cache", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 텍스트 정규화
+
+    유니코드 NFC 정규화 + 앞뒤 공백 제거 + 연속 공백 축약
+    (대소문자는 임베딩 결과에 영향을 주므로 유지)
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _text_hash(model: str, text: str) -> str:
+    """
+    (모델, 정규화 텍스트) 해시 생성 (영구 저장소 키)
+
+    Args:
+        model: 임베딩 모델명
+        text: 정규화된 텍스트
+
+    Returns:
+        sha256 hex 문자열
+    """
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+def _pack_vector(vector: List[float]) -> bytes:
+    """float 리스트 → bytes (float64)"""
+    return array("d", vector).tobytes()
+
+
+def _unpack_vector(blob: bytes) -> List[float]:
+    """bytes (float64) → float 리스트"""
+    values = array("d")
+    values.frombytes(bytes(blob))
+    return values.tolist()
+
+
+# ==================== 영구 저장소 ==================== #
+
+class SQLiteEmbeddingStore:
+    """
+    SQLite 기반 임베딩 영구 저장소 (단일 호스트 재시작 대비)
+
+    Args:
+        path: SQLite 파일 경로
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        # Streamlit 세션 스레드 간 공유를 위해 check_same_thread=False (잠금으로 보호)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            " text_hash TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, hashes: List[str]) -> Dict[str, List[float]]:
+        """해시 목록 조회 → {hash: vector}"""
+        if not hashes:
+            return {}
+        placeholders = ",".join("?" * len(hashes))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT text_hash, vector FROM embedding_cache WHERE text_hash IN ({placeholders})",
+                hashes,
+            ).fetchall()
+        return {h: _unpack_vector(v) for h, v in rows}
+
+    def put_many(self, model: str, items: Dict[str, List[float]]):
+        """{hash: vector} 저장"""
+        if not items:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (text_hash, model, vector) VALUES (?, ?, ?)",
+                [(h, model, _pack_vector(v)) for h, v in items.items()],
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresEmbeddingStore:
+    """
+    PostgreSQL 기반 임베딩 영구 저장소 (여러 앱 워커 간 공유)
+
+    src.database.db 연결 풀을 사용하며, 최초 사용 시 테이블 생성
+    """
+
+    def __init__(self):
+        from src.database.db import execute_query
+
+        self._execute = execute_query
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            " text_hash VARCHAR(64) PRIMARY KEY,"
+            " model VARCHAR(100) NOT NULL,"
+            " vector BYTEA NOT NULL,"
+            " created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+
+    def get_many(self, hashes: List[str]) -> Dict[str, List[float]]:
+        """해시 목록 조회 → {hash: vector}"""
+        if not hashes:
+            return {}
+        rows = self._execute(
+            "SELECT text_hash, vector FROM embedding_cache WHERE text_hash = ANY(%s)",
+            (hashes,),
+            fetch=True,
+        )
+        return {h: _unpack_vector(v) for h, v in rows}
+
+    def put_many(self, model: str, items: Dict[str, List[float]]):
+        """{hash: vector} 저장"""
+        for h, v in items.items():
+            self._execute(
+                "INSERT INTO embedding_cache (text_hash, model, vector) VALUES (%s, %s, %s) "
+                "ON CONFLICT (text_hash) DO NOTHING",
+                (h, model, _pack_vector(v)),
+            )
+
+    def close(self):
+        pass
+
+
+def _build_persistent_store(config: Dict[str, Any]):
+    """
+    설정에 따라 영구 저장소 생성 (실패 시 None → 인메모리만 사용)
+
+    Args:
+        config: 임베딩 캐시 설정
+
+    Returns:
+        SQLiteEmbeddingStore / PostgresEmbeddingStore / None
+    """
+    backend = (config.get("persistent") or "").lower()
+    try:
+        if backend == "sqlite":
+            return SQLiteEmbeddingStore(config.get("sqlite_path", DEFAULT_CACHE_CONFIG["sqlite_path"]))
+        if backend == "postgres":
+            return PostgresEmbeddingStore()
+    except Exception:
+        # 저장소 초기화 실패 시 인메모리 캐시만 사용
+        pass
+    return None
+
+
+# ==================== 캐시 Embeddings 래퍼 ==================== #
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings 캐시 래퍼
+
+    (모델, 정규화 텍스트) 기준으로 임베딩을 재사용
+    - 1차: 인메모리 LRU
+    - 2차: 영구 저장소 (SQLite / PostgreSQL, 선택)
+    - 미스: 원본 Embeddings 호출 후 양쪽 캐시에 저장
+
+    Args:
+        base: 원본 Embeddings 인스턴스 (OpenAIEmbeddings 등)
+        model: 모델명 (캐시 키 구성용)
+        max_size: 인메모리 LRU 최대 항목 수
+        store: 영구 저장소 (None이면 인메모리만)
+        cache_documents: embed_documents 결과도 캐시할지 여부
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        model: str,
+        max_size: int = 10000,
+        store=None,
+        cache_documents: bool = False,
+    ):
+        self.base = base
+        self.model = model
+        self.store = store
+        self.cache_documents = cache_documents
+        self._memory = LRUCache(max_size=max_size)
+        self._stats_lock = threading.Lock()
+
+        # 통계
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    # ---------------------- 내부: 캐시 조회/저장 ---------------------- #
+    def _embed_cached(self, texts: List[str], embed_fn) -> List[List[float]]:
+        """
+        캐시 우선 임베딩 (미스 항목만 embed_fn으로 일괄 계산)
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            embed_fn: 미스 항목 임베딩 함수 (List[str] → List[List[float]])
+
+        Returns:
+            입력 순서와 동일한 임베딩 리스트
+        """
+        normalized = [normalize_text(t) for t in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}          # 정규화 텍스트 → 결과 인덱스
+
+        # 1차: 인메모리 LRU
+        memory_hits = 0
+        for idx, text in enumerate(normalized):
+            vector = self._memory.get((self.model, text))
+            if vector is not None:
+                results[idx] = vector
+                memory_hits += 1
+            else:
+                pending.setdefault(text, []).append(idx)
+
+        # 2차: 영구 저장소
+        persistent_hits = 0
+        if pending and self.store is not None:
+            hashes = {_text_hash(self.model, text): text for text in pending}
+            try:
+                found = self.store.get_many(list(hashes))
+            except Exception:
+                found = {}
+            for h, vector in found.items():
+                text = hashes[h]
+                self._memory.set((self.model, text), vector)
+                for idx in pending.pop(text):
+                    results[idx] = vector
+                    persistent_hits += 1
+
+        # 미스: 원본 Embeddings 호출 (중복 텍스트는 한 번만)
+        missing = list(pending)
+        if missing:
+            vectors = embed_fn(missing)
+            to_store = {}
+            for text, vector in zip(missing, vectors):
+                self._memory.set((self.model, text), vector)
+                to_store[_text_hash(self.model, text)] = vector
+                for idx in pending[text]:
+                    results[idx] = vector
+
+            if self.store is not None:
+                try:
+                    self.store.put_many(self.model, to_store)
+                except Exception:
+                    pass
+
+        with self._stats_lock:
+            self.memory_hits += memory_hits
+            self.persistent_hits += persistent_hits
+            self.misses += len(missing)
+
+        # 요청 트레이스 embedding span에 캐시 결과 기록
+        current_span().set_attributes(
+            memory_hits=memory_hits,
+            persistent_hits=persistent_hits,
+            misses=len(missing),
+            estimated_tokens=estimate_tokens("".join(missing)) if missing else 0,
+        )
+        return results  # type: ignore[return-value]
+
+    # ---------------------- Embeddings 인터페이스 ---------------------- #
+    def embed_query(self, text: str) -> List[float]:
+        """쿼리 임베딩 (캐시 사용)"""
+        with span("embedding.query", kind="client", model=self.model, texts=1):
+            return self._embed_cached([text], lambda items: [self.base.embed_query(items[0])])[0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (cache_documents=True일 때만 캐시 사용)"""
+        with span("embedding.documents", kind="client", model=self.model, texts=len(texts)):
+            if not self.cache_documents:
+                return self.base.embed_documents(texts)
+            return self._embed_cached(texts, self.base.embed_documents)
+
+    # ---------------------- 통계 ---------------------- #
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: model, memory_hits, persistent_hits, misses, hit_rate, memory_size 등
+        """
+        with self._stats_lock:
+            hits = self.memory_hits + self.persistent_hits
+            total = hits + self.misses
+            return {
+                "model": self.model,
+                "memory_hits": self.memory_hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+                "memory_size": len(self._memory),
+                "memory_max_size": self._memory.max_size,
+                "persistent_backend": type(self.store).__name__ if self.store else None,
+            }
+
+    def clear(self):
+        """인메모리 캐시 비우기 (영구 저장소는 유지)"""
+        self._memory.clear()
+
 
 # ==================== OpenAI Embeddings 팩토리 ==================== #
 
-def get_embeddings(model: Optional[str] = None) -> OpenAIEmbeddings:
+def _scheduled_http_kwargs() -> Dict[str, Any]:
     """
-    OpenAIEmbeddings 인스턴스 생성
+    임베딩 API용 공유 httpx 클라이언트 인자 (호출 스케줄러 "openai_embeddings" 제공자 경유)
+
+    Returns:
+        OpenAIEmbeddings에 전달할 http_client / http_async_client (실패 시 빈 딕셔너리)
+    """
+    try:
+        from src.llm.registry import get_llm_registry
+        return get_llm_registry().http_client_kwargs("openai_embeddings")
+    except Exception:
+        # 레지스트리 사용 불가 시 SDK 기본 HTTP 클라이언트
+        return {}
+
+
+def get_embeddings(model: Optional[str] = None, use_cache: bool = True) -> Embeddings:
+    """
+    Embeddings 인스턴스 반환
+
+    동일 모델은 프로세스 전체에서 하나의 인스턴스를 공유하며,
+    embeddings.cache.enabled 설정 시 쿼리 임베딩 캐시(CachedEmbeddings)로 감싸서 반환
 
     Args:
         model: 사용할 임베딩 모델명 (미지정 시 환경변수(EMBEDDING_MODEL) 또는 기본값 사용)
+        use_cache: False이면 캐시를 거치지 않고 새 OpenAIEmbeddings 인스턴스 생성
 
     Returns:
-        OpenAIEmbeddings 인스턴스
+        CachedEmbeddings 또는 OpenAIEmbeddings 인스턴스
 
     사용 모델:
     - text-embedding-3-small: 1536차원, 비용 효율적
@@ -36,10 +412,60 @@ def get_embeddings(model: Optional[str] = None) -> OpenAIEmbeddings:
 
     참고:
     - OpenAIEmbeddings는 내부적으로 OPENAI_API_KEY 환경변수를 읽음
+    - 임베딩 API 호출은 호출 스케줄러(src/llm/scheduler.py)의 openai_embeddings 한도를 따름
     - configs/model_config.yaml의 embeddings.model 설정 우선 사용 권장
     """
     # 모델명 결정 (파라미터 > 환경변수 > 기본값)
     model_name = model or DEFAULT_EMBEDDING_MODEL
 
-    # OpenAI Embeddings 인스턴스 생성
-    return OpenAIEmbeddings(model=model_name)
+    if not use_cache:
+        return OpenAIEmbeddings(model=model_name, **_scheduled_http_kwargs())
+
+    # 캐시된 인스턴스 재사용 (동시 세션 대비 잠금)
+    with _embeddings_lock:
+        embeddings = _embeddings_cache.get(model_name)
+        if embeddings is None:
+            embeddings = OpenAIEmbeddings(model=model_name, **_scheduled_http_kwargs())
+
+            cache_config = _load_cache_config()
+            if cache_config.get("enabled", True):
+                embeddings = CachedEmbeddings(
+                    base=embeddings,
+                    model=model_name,
+                    max_size=int(cache_config.get("max_size", 10000)),
+                    store=_build_persistent_store(cache_config),
+                    cache_documents=bool(cache_config.get("cache_documents", False)),
+                )
+
+            _embeddings_cache[model_name] = embeddings
+        return embeddings
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """
+    모델별 임베딩 캐시 통계 반환
+
+    Returns:
+        dict: {모델명: 통계} (캐시 미사용 모델은 제외)
+    """
+    with _embeddings_lock:
+        instances = list(_embeddings_cache.values())
+    return {
+        emb.model: emb.stats()
+        for emb in instances
+        if isinstance(emb, CachedEmbeddings)
+    }
+
+
+def clear_embeddings_cache() -> None:
+    """
+    캐시된 Embeddings 인스턴스 전체 제거 (영구 저장소 연결 포함)
+    """
+    with _embeddings_lock:
+        for emb in _embeddings_cache.values():
+            if isinstance(emb, CachedEmbeddings) and emb.store is not None:
+                try:
+                    emb.store.close()
+                except Exception:
+                    pass
+        _embeddings_cache.clear()
@@ -3,18 +3,28 @@
 # ------------------------------------------
 # - PGVector VectorStore 생성 및 관리
 # - get_pgvector_store() 팩토리 함수
+# - (컬렉션, 임베딩 모델, 연결 문자열)별 VectorStore 레지스트리
+# - paper_id 기준 청크 직접 조회 (임베딩 호출 없음, chunk_index 순) / 논문별 청크 삭제
+# - 검색 단위 SQL 실행 제한 (statement_timeout 컨텍스트)
 # - configs/db_config.yaml 설정 사용
 # ==========================================
 
 # ------------------------- 표준 라이브러리 ------------------------- #
 import os
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # ------------------------- 서드파티 라이브러리 ------------------------- #
+from langchain_core.documents import Document
 from langchain_postgres.vectorstores import PGVector
+from sqlalchemy import event
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
-from .embeddings import get_embeddings
+from .db import get_cursor
+from .embeddings import get_embeddings, DEFAULT_EMBEDDING_MODEL
 from src.utils.config_loader import get_postgres_connection_string
 
 
@@ -58,34 +68,325 @@ def _pg_conn_str() -> str:
         return f"postgresql://{user}:{password}@{host}:{port}/{db}"
 
 
+# ==================== SQL 실행 제한 ==================== #
+
+# 현재 컨텍스트의 pgvector SQL 실행 제한 (ms, None이면 DB 기본값)
+_statement_timeout_ms: ContextVar[Optional[int]] = ContextVar("pgvector_statement_timeout_ms", default=None)
+
+
+@contextmanager
+def statement_timeout(timeout_ms: Optional[int]) -> Iterator[None]:
+    """
+    블록 안에서 실행되는 pgvector 검색 SQL에 statement_timeout 적용
+
+    검색 브랜치가 마감 시간을 넘겨 버려진 뒤에도 DB 쿼리가 계속 실행되며
+    공용 스레드를 붙잡지 않도록, 마감 시간과 같은 제한을 서버 쪽에 건다
+    (contextvars 기반이므로 copy_context()로 넘긴 워커 스레드에도 적용)
+
+    Args:
+        timeout_ms: SQL 실행 제한 (ms, None / 0이면 제한 없음)
+    """
+    token = _statement_timeout_ms.set(timeout_ms)
+    try:
+        yield
+    finally:
+        _statement_timeout_ms.reset(token)
+
+
+def _apply_statement_timeout(conn, cursor, statement, parameters, context, executemany) -> None:
+    """SQLAlchemy before_cursor_execute 훅: 컨텍스트의 실행 제한을 현재 트랜잭션에 설정"""
+    timeout = _statement_timeout_ms.get()
+    if timeout:
+        # SET은 바인딩 파라미터를 받지 않으므로 int로 검증한 값을 직접 삽입
+        cursor.execute(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+
+def _install_statement_timeout(store: PGVector) -> None:
+    """
+    PGVector의 SQLAlchemy 엔진에 실행 제한 훅 등록
+
+    Args:
+        store: 대상 PGVector 인스턴스
+    """
+    engine = getattr(store, "_engine", None)
+    if engine is not None and not event.contains(engine, "before_cursor_execute", _apply_statement_timeout):
+        event.listen(engine, "before_cursor_execute", _apply_statement_timeout)
+
+
+# ==================== VectorStore 레지스트리 ==================== #
+
+# (collection_name, embedding_model, connection_string) → PGVector
+_store_registry: Dict[Tuple[str, str, str], PGVector] = {}
+_registry_lock = threading.RLock()
+
+
+def _registry_key(
+    collection_name: str,
+    embedding_model: Optional[str],
+    connection_string: Optional[str],
+) -> Tuple[str, str, str]:
+    """
+    레지스트리 키 생성
+
+    Args:
+        collection_name: pgvector 컬렉션명
+        embedding_model: 임베딩 모델명 (None이면 기본 모델)
+        connection_string: 연결 문자열 (None이면 설정 기반)
+
+    Returns:
+        (컬렉션명, 모델명, 연결 문자열) 튜플
+    """
+    return (
+        collection_name,
+        embedding_model or DEFAULT_EMBEDDING_MODEL,
+        connection_string or _pg_conn_str(),
+    )
+
+
+def _dispose_store(store: PGVector) -> None:
+    """
+    PGVector가 보유한 SQLAlchemy 엔진(커넥션 풀) 정리
+
+    Args:
+        store: 정리할 PGVector 인스턴스
+    """
+    engine = getattr(store, "_engine", None)
+    if engine is not None:
+        try:
+            engine.dispose()
+        except Exception:
+            pass
+
+
+def _create_pgvector_store(collection_name: str, embedding_model: str, conn: str) -> PGVector:
+    """
+    PGVector 인스턴스 신규 생성 (레지스트리 미사용)
+
+    Args:
+        collection_name: pgvector 컬렉션명
+        embedding_model: 임베딩 모델명
+        conn: PostgreSQL 연결 문자열
+
+    Returns:
+        PGVector 인스턴스
+    """
+    # OpenAI Embeddings (모델별 공유 인스턴스)
+    embeddings = get_embeddings(embedding_model)
+
+    # PGVector VectorStore 생성
+    store = PGVector(
+        collection_name=collection_name,
+        embeddings=embeddings,
+        connection=conn,
+        use_jsonb=True,
+    )
+    _install_statement_timeout(store)
+    return store
+
+
+def close_pgvector_stores(collection_name: Optional[str] = None) -> int:
+    """
+    레지스트리에 등록된 VectorStore 종료 및 제거
+
+    Args:
+        collection_name: 지정 시 해당 컬렉션만 종료 (미지정 시 전체)
+
+    Returns:
+        종료된 VectorStore 수
+    """
+    with _registry_lock:
+        keys = [
+            key for key in _store_registry
+            if collection_name is None or key[0] == collection_name
+        ]
+        stores = [_store_registry.pop(key) for key in keys]
+
+    for store in stores:
+        _dispose_store(store)
+
+    return len(stores)
+
+
+def refresh_pgvector_store(
+    collection_name: str,
+    embedding_model: Optional[str] = None,
+    connection_string: Optional[str] = None,
+) -> PGVector:
+    """
+    VectorStore를 새로 생성하여 레지스트리 항목 교체
+
+    연결 정보 변경, 컬렉션 재생성 등으로 기존 인스턴스가 무효해졌을 때 사용
+
+    Args:
+        collection_name: pgvector 컬렉션명
+        embedding_model: 임베딩 모델명
+        connection_string: 명시 연결 문자열
+
+    Returns:
+        새로 생성된 PGVector 인스턴스
+    """
+    key = _registry_key(collection_name, embedding_model, connection_string)
+
+    with _registry_lock:
+        old = _store_registry.pop(key, None)
+        store = _create_pgvector_store(*key)
+        _store_registry[key] = store
+
+    if old is not None:
+        _dispose_store(old)
+
+    return store
+
+
+def get_registered_stores() -> List[Tuple[str, str, str]]:
+    """
+    현재 레지스트리에 등록된 VectorStore 키 목록 반환
+
+    Returns:
+        (컬렉션명, 모델명, 연결 문자열) 리스트
+    """
+    with _registry_lock:
+        return list(_store_registry.keys())
+
+
 # ==================== VectorStore 생성기 ==================== #
 
 def get_pgvector_store(
     collection_name: str,
     embedding_model: Optional[str] = None,
     connection_string: Optional[str] = None,
+    use_cache: bool = True,
 ) -> PGVector:
     """
-    PGVector VectorStore 인스턴스를 생성하여 반환
+    PGVector VectorStore 인스턴스 반환
+
+    (컬렉션, 임베딩 모델, 연결 문자열) 조합마다 하나의 인스턴스를
+    프로세스 전체에서 공유함 (Streamlit 동시 세션 간 스레드 안전)
 
     Args:
         collection_name: pgvector 컬렉션명 (예: 'paper_chunks')
         embedding_model: 임베딩 모델명 (기본: text-embedding-3-small)
         connection_string: 명시 연결 문자열 (미지정 시 configs/db_config.yaml 기반)
+        use_cache: False이면 레지스트리를 거치지 않고 새 인스턴스 생성
 
     Returns:
         PGVector 인스턴스
     """
-    # PostgreSQL 연결 문자열 가져오기
-    conn = connection_string or _pg_conn_str()
+    key = _registry_key(collection_name, embedding_model, connection_string)
 
-    # OpenAI Embeddings 초기화
-    embeddings = get_embeddings(embedding_model)
+    if not use_cache:
+        return _create_pgvector_store(*key)
 
-    # PGVector VectorStore 생성
-    return PGVector(
-        collection_name=collection_name,
-        embeddings=embeddings,
-        connection=conn,
-        use_jsonb=True,
-    )
+    # 등록된 인스턴스 재사용 (없으면 생성 후 등록)
+    with _registry_lock:
+        store = _store_registry.get(key)
+        if store is None:
+            store = _create_pgvector_store(*key)
+            _store_registry[key] = store
+        return store
+
+
+# ==================== 논문별 청크 조회 ==================== #
+
+# paper_id + chunk_index 표현식 인덱스 (database/migrations/002_paper_chunks_paper_id_index.sql)
+PAPER_CHUNK_INDEX_MIGRATION = (
+    Path(__file__).resolve().parents[2] / "database" / "migrations" / "002_paper_chunks_paper_id_index.sql"
+)
+
+
+def ensure_paper_chunk_index() -> bool:
+    """
+    논문별 청크 조회 인덱스 생성 (없을 때만)
+
+    langchain_pg_embedding 테이블은 PGVector가 첫 저장 시 생성하므로
+    임베딩 적재 이후에 호출
+
+    Returns:
+        성공 여부 (테이블 미생성 / 권한 부족 시 False)
+    """
+    try:
+        with get_cursor() as cursor:
+            cursor.execute(PAPER_CHUNK_INDEX_MIGRATION.read_text(encoding="utf-8"))
+        return True
+    except Exception:
+        return False
+
+
+def get_paper_chunks(
+    paper_id: Union[int, str],
+    collection_name: str = "paper_chunks",
+    limit: Optional[int] = None,
+) -> List[Document]:
+    """
+    논문 하나의 모든 청크를 읽기 순서(chunk_index)대로 조회
+
+    similarity_search와 달리 임베딩 호출 없이 JSONB 메타데이터 인덱스로
+    해당 paper_id의 청크만 가져옴 (다른 논문 청크 혼입 없음)
+
+    Args:
+        paper_id: papers.paper_id (메타데이터에 int/str 어느 쪽으로 저장돼도 조회)
+        collection_name: pgvector 컬렉션명
+        limit: 최대 청크 수 (None이면 전체)
+
+    Returns:
+        Document 리스트 (chunk_index 오름차순, chunk_index 없는 청크는 마지막)
+    """
+    query = """
+        SELECT e.document, e.cmetadata
+        FROM langchain_pg_embedding e
+        JOIN langchain_pg_collection c ON c.uuid = e.collection_id
+        WHERE c.name = %s
+          AND e.cmetadata->>'paper_id' = %s
+        ORDER BY (e.cmetadata->>'chunk_index')::int NULLS LAST
+    """
+    params: Tuple = (collection_name, str(paper_id))
+    if limit is not None:
+        query += " LIMIT %s"
+        params += (int(limit),)
+
+    with get_cursor() as cursor:
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+
+    return [Document(page_content=document, metadata=metadata or {}) for document, metadata in rows]
+
+
+def delete_paper_chunks(
+    arxiv_id: Optional[str] = None,
+    paper_id: Optional[Union[int, str]] = None,
+    collection_name: str = "paper_chunks",
+) -> int:
+    """
+    논문 하나의 저장된 청크 삭제 (arxiv_id 또는 paper_id 메타데이터 일치)
+
+    적재 엔진(src/data/ingestion.py)이 체크포인트 없는 논문을 처음 저장하기 전에 호출
+    → 고정 청크 ID 도입 전 임의 ID로 저장된 청크가 새 청크와 중복으로 남지 않음
+
+    Args:
+        arxiv_id: 메타데이터 arxiv_id
+        paper_id: papers.paper_id (메타데이터에 int/str 어느 쪽으로 저장돼도 삭제)
+        collection_name: pgvector 컬렉션명
+
+    Returns:
+        삭제한 청크 수 (조건이 없으면 0)
+    """
+    conditions, params = [], [collection_name]
+    if arxiv_id:
+        conditions.append("e.cmetadata->>'arxiv_id' = %s")
+        params.append(str(arxiv_id))
+    if paper_id is not None:
+        conditions.append("e.cmetadata->>'paper_id' = %s")
+        params.append(str(paper_id))
+    if not conditions:
+        return 0
+
+    query = f"""
+        DELETE FROM langchain_pg_embedding e
+        USING langchain_pg_collection c
+        WHERE c.uuid = e.collection_id
+          AND c.name = %s
+          AND ({" OR ".join(conditions)})
+    """
+    with get_cursor() as cursor:
+        cursor.execute(query, tuple(params))
+        return cursor.rowcount
@@ -14,6 +14,8 @@ from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
+from src.llm.registry import get_llm_registry
+from src.llm.scheduler import background_priority
 from src.utils.logger import Logger
 
 
@@ -112,8 +114,8 @@ class AnswerEvaluator:
         Args:
             exp_manager: ExperimentManager 인스턴스 (선택 사항)
         """
-        # LLM 초기화 (OpenAI GPT-5)
-        self.llm = ChatOpenAI(model="gpt-5", temperature=0)
+        # LLM 초기화 (OpenAI GPT-5, 공유 연결 풀 → 호출 스케줄러 경유)
+        self.llm = ChatOpenAI(model="gpt-5", temperature=0, **get_llm_registry().http_client_kwargs("openai"))
 
         # ExperimentManager 설정
         self.exp_manager = exp_manager
@@ -165,8 +167,9 @@ class AnswerEvaluator:
 
         # -------------- LLM 호출 -------------- #
         try:
-            # LLM 호출
-            response = self.llm.invoke(prompt)
+            # LLM 호출 (평가는 background 우선순위: 채팅 요청이 먼저 처리됨)
+            with background_priority():
+                response = self.llm.invoke(prompt)
             result_text = response.content
 
             self.logger.write(f"LLM 응답 수신: {len(result_text)} 글자")
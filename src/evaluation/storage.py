@@ -11,30 +11,15 @@ from typing import List, Dict
 from datetime import datetime
 
 # ------------------------- 서드파티 라이브러리 ------------------------- #
-import psycopg2
 from dotenv import load_dotenv
 
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.database.db import get_cursor
+
 # ------------------------- 환경 변수 로드 ------------------------- #
 load_dotenv()
 
 
-# ==================== DB 연결 함수 ==================== #
-def _get_conn():
-    """
-    PostgreSQL 연결
-
-    Returns:
-        psycopg2.connection: PostgreSQL 연결 객체
-    """
-    return psycopg2.connect(
-        host=os.getenv("POSTGRES_HOST", "localhost"),
-        port=os.getenv("POSTGRES_PORT", 5432),
-        user=os.getenv("POSTGRES_USER", "postgres"),
-        password=os.getenv("POSTGRES_PASSWORD", ""),
-        database=os.getenv("POSTGRES_DB", "papers")
-    )
-
-
 # ==================== 평가 결과 저장 함수 ==================== #
 def save_evaluation_results(evaluation_results: List[Dict]):
     """
@@ -44,31 +29,24 @@ def save_evaluation_results(evaluation_results: List[Dict]):
         evaluation_results (List[Dict]): 평가 결과 리스트
             [{"question": ..., "answer": ..., "accuracy_score": ..., ...}, ...]
     """
-    # DB 연결
-    conn = _get_conn()
-    cursor = conn.cursor()
-
-    # 평가 결과 삽입
-    for result in evaluation_results:
-        cursor.execute("""
-            INSERT INTO evaluation_results
-            (question, answer, accuracy_score, relevance_score, difficulty_score, citation_score, total_score, comment)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            result['question'],
-            result['answer'],
-            result['accuracy_score'],
-            result['relevance_score'],
-            result['difficulty_score'],
-            result['citation_score'],
-            result['total_score'],
-            result['comment']
-        ))
-
-    # 커밋 및 종료
-    conn.commit()
-    cursor.close()
-    conn.close()
+    # DB 연결 (공용 연결 풀, 블록 종료 시 커밋 및 반환)
+    with get_cursor() as cursor:
+        # 평가 결과 삽입
+        for result in evaluation_results:
+            cursor.execute("""
+                INSERT INTO evaluation_results
+                (question, answer, accuracy_score, relevance_score, difficulty_score, citation_score, total_score, comment)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """, (
+                result['question'],
+                result['answer'],
+                result['accuracy_score'],
+                result['relevance_score'],
+                result['difficulty_score'],
+                result['citation_score'],
+                result['total_score'],
+                result['comment']
+            ))
 
 
 # ==================== 평가 결과 조회 함수 ==================== #
@@ -82,20 +60,18 @@ def get_evaluation_results(limit: int = 10) -> List[Dict]:
     Returns:
         List[Dict]: 평가 결과 리스트
     """
-    # DB 연결
-    conn = _get_conn()
-    cursor = conn.cursor()
-
-    # 최근 평가 결과 조회
-    cursor.execute("""
-        SELECT eval_id, question, answer, accuracy_score, relevance_score,
-               difficulty_score, citation_score, total_score, comment, created_at
-        FROM evaluation_results
-        ORDER BY created_at DESC
-        LIMIT %s
-    """, (limit,))
+    # DB 연결 (공용 연결 풀, 블록 종료 시 커밋 및 반환)
+    with get_cursor() as cursor:
+        # 최근 평가 결과 조회
+        cursor.execute("""
+            SELECT eval_id, question, answer, accuracy_score, relevance_score,
+                   difficulty_score, citation_score, total_score, comment, created_at
+            FROM evaluation_results
+            ORDER BY created_at DESC
+            LIMIT %s
+        """, (limit,))
 
-    rows = cursor.fetchall()
+        rows = cursor.fetchall()
 
     # 딕셔너리 변환
     results = []
@@ -113,10 +89,6 @@ def get_evaluation_results(limit: int = 10) -> List[Dict]:
             "created_at": row[9]
         })
 
-    # 종료
-    cursor.close()
-    conn.close()
-
     return results
 
 
@@ -134,22 +106,20 @@ def get_evaluation_statistics() -> Dict:
             - avg_citation: 평균 출처 명시
             - avg_total: 평균 총점
     """
-    # DB 연결
-    conn = _get_conn()
-    cursor = conn.cursor()
-
-    # 통계 조회
-    cursor.execute("""
-        SELECT COUNT(*),
-               AVG(accuracy_score),
-               AVG(relevance_score),
-               AVG(difficulty_score),
-               AVG(citation_score),
-               AVG(total_score)
-        FROM evaluation_results
-    """)
-
-    row = cursor.fetchone()
+    # DB 연결 (공용 연결 풀, 블록 종료 시 커밋 및 반환)
+    with get_cursor() as cursor:
+        # 통계 조회
+        cursor.execute("""
+            SELECT COUNT(*),
+                   AVG(accuracy_score),
+                   AVG(relevance_score),
+                   AVG(difficulty_score),
+                   AVG(citation_score),
+                   AVG(total_score)
+            FROM evaluation_results
+        """)
+
+        row = cursor.fetchone()
 
     # 통계 딕셔너리 생성
     stats = {
@@ -161,8 +131,4 @@ def get_evaluation_statistics() -> Dict:
         "avg_total": round(row[5] or 0, 2)
     }
 
-    # 종료
-    cursor.close()
-    conn.close()
-
     return stats
@@ -8,6 +8,8 @@ LangChain 기반 다중 LLM 클라이언트 구현:
 - 에러 핸들링 및 재시도 로직
 - 토큰 사용량 추적
 - 스트리밍 응답 처리
+- 채팅 모델 인스턴스 공유 (src/llm/registry.py)
+- 호출 동시성 / 속도 제한 (src/llm/scheduler.py)
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
@@ -28,7 +30,9 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
 from src.utils.config_loader import get_llm_for_difficulty
+from src.llm.registry import LLMTracingCallback, default_streaming, get_llm_registry, is_registry_enabled
 # get_llm_for_difficulty: 난이도별 LLM 모델 선택
+# get_llm_registry: 공유 채팅 모델 / HTTP 연결 풀 레지스트리
 
 
 # ==================== LLM 클라이언트 클래스 ==================== #
@@ -53,16 +57,23 @@ class LLMClient:
         if self.logger:
             self.logger.write(f"LLM 초기화: provider={provider}, model={model}")
 
+        # -------------- 공유 인스턴스 사용 (레지스트리) -------------- #
+        # (provider, model, temperature, streaming) 단위로 채팅 모델 / HTTP 연결 풀 재사용
+        if is_registry_enabled():
+            self.llm = get_llm_registry().get(provider, model, temperature)
+            return
+
         # -------------- OpenAI 클라이언트 생성 -------------- #
         if provider == "openai":
             # GPT-5 모델은 스트리밍 미지원 (조직 권한 필요)
-            enable_streaming = False if model == "gpt-5" else True
+            enable_streaming = default_streaming(provider, model)
 
             self.llm = ChatOpenAI(
                 model=model,                        # 모델명 (gpt-5)
                 temperature=temperature,            # 창의성 수준
                 openai_api_key=os.getenv("OPENAI_API_KEY"),  # API 키
-                streaming=enable_streaming          # 스트리밍 응답 활성화 (GPT-5 제외)
+                streaming=enable_streaming,         # 스트리밍 응답 활성화 (GPT-5 제외)
+                callbacks=[LLMTracingCallback(provider, model)]  # 요청 트레이스 LLM span
             )
 
         # -------------- Solar 클라이언트 생성 -------------- #
@@ -71,7 +82,8 @@ class LLMClient:
                 model=model,                        # Solar 모델명
                 temperature=temperature,            # 창의성 수준
                 api_key=os.getenv("SOLAR_API_KEY"),  # Upstage API 키
-                streaming=True                      # 스트리밍 응답 활성화
+                streaming=True,                     # 스트리밍 응답 활성화
+                callbacks=[LLMTracingCallback(provider, model)]  # 요청 트레이스 LLM span
             )
 
     # ---------------------- 난이도별 LLM 클라이언트 생성 (클래스 메서드) ---------------------- #
@@ -113,6 +125,7 @@ class LLMClient:
         에러 핸들링 및 재시도 로직
 
         최대 3회 재시도, Exponential Backoff (2초 → 4초 → 8초)
+        재시도 요청도 호출 스케줄러 대기열을 거침 (429 시 제공자 일시 정지 → 재시도가 몰리지 않음)
 
         Args:
             messages: LLM에 전달할 메시지 리스트
@@ -0,0 +1,415 @@
+# src/llm/registry.py
+"""
+LLM 채팅 모델 레지스트리
+
+LLMClient를 만들 때마다 ChatOpenAI / ChatUpstage와 HTTP 클라이언트를 새로 생성하던 방식을 대체:
+- (provider, model, temperature, streaming) 단위로 채팅 모델 인스턴스를 프로세스에서 공유
+- 제공자별 httpx 연결 풀 하나를 모든 모델이 공유 (keep-alive → TLS 핸드셰이크 재사용)
+- 공유 연결 풀의 모든 요청은 호출 스케줄러를 거침 (동시성 / RPM / TPM 제한, src/llm/scheduler.py)
+- warm_up(): 앱 시작 시 난이도별 모델 생성 + 연결 수립
+- 모델별 호출 수 / 오류 수 / 지연 시간 통계 (콜백 핸들러로 invoke / stream 모두 집계)
+- 요청 트레이스 안의 호출은 LLM span으로 기록 (소요 시간 + 토큰 수, src/utils/tracing.py)
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# ------------------------- LangChain 라이브러리 ------------------------- #
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_openai import ChatOpenAI
+from langchain_upstage import ChatUpstage
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.llm.scheduler import AsyncScheduledTransport, ScheduledTransport, estimate_tokens
+from src.utils.tracing import NOOP_SPAN, start_span
+
+# httpx는 openai SDK 의존성 (없으면 SDK 기본 HTTP 클라이언트 사용)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 llm_registry 섹션이 없을 때 사용
+DEFAULT_LLM_REGISTRY_CONFIG = {
+    "enabled": True,                                # false면 LLMClient마다 새 인스턴스 생성
+    "max_connections": 20,                          # 제공자별 최대 동시 연결 수
+    "max_keepalive_connections": 10,                # 유지할 유휴 연결 수
+    "keepalive_expiry": 60,                         # 유휴 연결 유지 시간 (초)
+    "timeout": 120,                                 # 요청 타임아웃 (초)
+    "warmup_on_startup": True,                      # 앱 시작 시 warm_up() 실행
+    "warmup_ping": True,                            # warm-up 시 models 엔드포인트로 연결 수립
+}
+
+ClientKey = Tuple[str, str, float, bool]
+
+
+def _load_registry_config() -> Dict[str, Any]:
+    """
+    LLM 레지스트리 설정 로드 (기본값과 병합)
+
+    Returns:
+        LLM 레지스트리 설정 딕셔너리
+    """
+    config = dict(DEFAULT_LLM_REGISTRY_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("llm_registry", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def default_streaming(provider: str, model: str) -> bool:
+    """
+    제공자 / 모델별 스트리밍 기본값 (GPT-5는 조직 권한이 필요해 스트리밍 미사용)
+
+    Args:
+        provider: LLM 제공자
+        model: 모델명
+
+    Returns:
+        bool: 스트리밍 사용 여부
+    """
+    return not (provider == "openai" and model == "gpt-5")
+
+
+# ==================== 호출 통계 ==================== #
+class LLMCallStats(BaseCallbackHandler):
+    """
+    채팅 모델 호출 통계 콜백 (모델 인스턴스에 부착)
+
+    on_chat_model_start → on_llm_end / on_llm_error 사이 시간을 run_id 단위로 측정
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started: Dict[Any, float] = {}
+        self.calls = 0
+        self.errors = 0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        with self._lock:
+            self._started[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        with self._lock:
+            self._started[run_id] = time.perf_counter()
+
+    def _finish(self, run_id, error: bool):
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is None:
+                return
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.calls += 1
+            self.errors += int(error)
+            self.total_latency_ms += elapsed_ms
+            self.max_latency_ms = max(self.max_latency_ms, elapsed_ms)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._finish(run_id, error=False)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, error=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        통계 스냅샷
+
+        Returns:
+            {"calls", "errors", "avg_latency_ms", "max_latency_ms", "total_latency_ms"}
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "avg_latency_ms": round(self.total_latency_ms / self.calls, 1) if self.calls else 0.0,
+                "max_latency_ms": round(self.max_latency_ms, 1),
+                "total_latency_ms": round(self.total_latency_ms, 1),
+            }
+
+
+def _token_usage(response) -> Dict[str, Any]:
+    """LLMResult에서 토큰 사용량 추출 (llm_output.token_usage 또는 message.usage_metadata)"""
+    usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+    if usage:
+        return {
+            "prompt_tokens": usage.get("prompt_tokens"),
+            "completion_tokens": usage.get("completion_tokens"),
+            "total_tokens": usage.get("total_tokens"),
+        }
+    for generations in getattr(response, "generations", None) or []:
+        for generation in generations:
+            metadata = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if metadata:
+                return {
+                    "prompt_tokens": metadata.get("input_tokens"),
+                    "completion_tokens": metadata.get("output_tokens"),
+                    "total_tokens": metadata.get("total_tokens"),
+                }
+    return {}
+
+
+class LLMTracingCallback(BaseCallbackHandler):
+    """
+    LLM 호출 span 콜백 (모델 인스턴스에 부착, 트레이스 밖 호출은 기록 안 함)
+
+    on_chat_model_start / on_llm_start → on_llm_end / on_llm_error 사이를 run_id 단위로 기록
+    """
+
+    run_inline = True                               # 호출 스레드 / 태스크에서 실행 (트레이스 컨텍스트 유지)
+
+    def __init__(self, provider: str, model: str):
+        self.provider = provider
+        self.model = model
+        self._lock = threading.Lock()
+        self._spans: Dict[Any, Any] = {}
+
+    def _start(self, run_id, prompt_text: str):
+        span = start_span(f"llm.{self.provider}", kind="client", provider=self.provider, model=self.model)
+        if span is NOOP_SPAN:
+            return
+        span.set_attribute("estimated_prompt_tokens", estimate_tokens(prompt_text))
+        with self._lock:
+            self._spans[run_id] = span
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id, "".join(str(getattr(m, "content", m)) for batch in messages for m in batch))
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id, "".join(prompts))
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+        if span is not None:
+            span.set_attributes(**_token_usage(response))
+            span.end()
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+        if span is not None:
+            span.record_error(error)
+            span.end()
+
+
+# ==================== 레지스트리 ==================== #
+class LLMRegistry:
+    """
+    채팅 모델 인스턴스 / HTTP 연결 풀 공유 레지스트리
+
+    get()은 같은 키에 대해 항상 같은 인스턴스를 반환 (스레드 안전)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: 레지스트리 설정 (미지정 시 model_config.yaml)
+        """
+        self.config = dict(DEFAULT_LLM_REGISTRY_CONFIG, **(config or _load_registry_config()))
+        self._lock = threading.Lock()
+        self._models: Dict[ClientKey, Any] = {}
+        self._stats: Dict[ClientKey, LLMCallStats] = {}
+        self._http_clients: Dict[str, Any] = {}
+        self._http_lock = threading.Lock()         # get() 잠금 안에서도 호출되므로 별도 잠금
+
+    # ---------------------- 공유 HTTP 클라이언트 ---------------------- #
+    def http_client_kwargs(self, provider: str) -> Dict[str, Any]:
+        """
+        제공자별 공유 httpx 클라이언트 (동기 / 비동기) 인자
+
+        요청은 스케줄러 전송 계층(src/llm/scheduler.py)을 거쳐 동시성 / 속도 제한을 받음
+
+        Args:
+            provider: 제공자 ("openai", "solar", "openai_embeddings" 등)
+
+        Returns:
+            {"http_client", "http_async_client"} (httpx 미설치 시 빈 딕셔너리)
+        """
+        if httpx is None:
+            return {}
+
+        with self._http_lock:
+            if provider not in self._http_clients:
+                limits = httpx.Limits(
+                    max_connections=int(self.config["max_connections"]),
+                    max_keepalive_connections=int(self.config["max_keepalive_connections"]),
+                    keepalive_expiry=float(self.config["keepalive_expiry"]),
+                )
+                timeout = httpx.Timeout(float(self.config["timeout"]))
+                self._http_clients[provider] = {
+                    "http_client": httpx.Client(
+                        transport=ScheduledTransport(provider, httpx.HTTPTransport(limits=limits)),
+                        timeout=timeout,
+                    ),
+                    "http_async_client": httpx.AsyncClient(
+                        transport=AsyncScheduledTransport(provider, httpx.AsyncHTTPTransport(limits=limits)),
+                        timeout=timeout,
+                    ),
+                }
+            return dict(self._http_clients[provider])
+
+    def _create(self, provider: str, model: str, temperature: float, streaming: bool, stats: LLMCallStats):
+        """채팅 모델 인스턴스 생성 (공유 HTTP 클라이언트 + 통계 / 트레이싱 콜백 부착)"""
+        http_kwargs = self.http_client_kwargs(provider)
+        callbacks = [stats, LLMTracingCallback(provider, model)]
+
+        if provider == "openai":
+            return ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                openai_api_key=os.getenv("OPENAI_API_KEY"),
+                streaming=streaming,
+                callbacks=callbacks,
+                **http_kwargs,
+            )
+        if provider == "solar":
+            return ChatUpstage(
+                model=model,
+                temperature=temperature,
+                api_key=os.getenv("SOLAR_API_KEY"),
+                streaming=streaming,
+                callbacks=callbacks,
+                **http_kwargs,
+            )
+        raise ValueError(f"지원하지 않는 LLM 제공자: {provider}")
+
+    # ---------------------- 공개 API ---------------------- #
+    def get(self, provider: str, model: str, temperature: float = 0.7, streaming: Optional[bool] = None):
+        """
+        공유 채팅 모델 반환 (없으면 생성)
+
+        Args:
+            provider: LLM 제공자 ("openai" 또는 "solar")
+            model: 모델명
+            temperature: 창의성 수준
+            streaming: 스트리밍 여부 (None이면 default_streaming)
+
+        Returns:
+            ChatOpenAI 또는 ChatUpstage 인스턴스
+        """
+        if streaming is None:
+            streaming = default_streaming(provider, model)
+        key: ClientKey = (provider, model, float(temperature), bool(streaming))
+
+        llm = self._models.get(key)
+        if llm is None:
+            with self._lock:
+                llm = self._models.get(key)
+                if llm is None:
+                    stats = LLMCallStats()
+                    llm = self._create(provider, model, float(temperature), bool(streaming), stats)
+                    self._stats[key] = stats
+                    self._models[key] = llm
+        return llm
+
+    def warm_up(self, difficulties: Iterable[str] = ("easy", "hard"), ping: Optional[bool] = None) -> List[ClientKey]:
+        """
+        난이도별 모델 미리 생성 + 연결 수립 (첫 질문 지연 감소)
+
+        Args:
+            difficulties: 미리 준비할 난이도 목록
+            ping: models 엔드포인트 호출로 TLS 연결 수립 (None이면 설정값)
+
+        Returns:
+            준비된 클라이언트 키 목록
+        """
+        from src.utils.config_loader import get_llm_for_difficulty
+
+        ping = self.config.get("warmup_ping", True) if ping is None else ping
+        warmed: List[ClientKey] = []
+        pinged = set()
+        for difficulty in difficulties:
+            info = get_llm_for_difficulty(difficulty)
+            llm = self.get(info["provider"], info["model"])
+            warmed.append((info["provider"], info["model"], 0.7, default_streaming(info["provider"], info["model"])))
+
+            if ping and info["provider"] not in pinged:
+                pinged.add(info["provider"])
+                try:
+                    # 토큰을 쓰지 않는 가벼운 요청으로 공유 연결 풀에 연결 확보
+                    llm.root_client.models.list()
+                except Exception:
+                    # 권한 / 엔드포인트 미지원은 무시 (인스턴스 생성만으로도 효과 있음)
+                    pass
+        return warmed
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        클라이언트별 호출 통계
+
+        Returns:
+            {"provider:model(t=온도, stream=여부)": 통계 스냅샷}
+        """
+        with self._lock:
+            items = list(self._stats.items())
+        return {
+            f"{provider}:{model}(t={temperature}, stream={streaming})": stats.snapshot()
+            for (provider, model, temperature, streaming), stats in items
+        }
+
+    def clear(self):
+        """공유 인스턴스 / HTTP 연결 풀 전체 정리"""
+        with self._lock:
+            for clients in self._http_clients.values():
+                try:
+                    clients["http_client"].close()
+                except Exception:
+                    pass
+            self._http_clients.clear()
+            self._models.clear()
+            self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# ==================== 전역 인스턴스 ==================== #
+_registry: Optional[LLMRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_registry() -> LLMRegistry:
+    """
+    프로세스 공용 LLMRegistry 반환 (최초 호출 시 생성)
+
+    Returns:
+        LLMRegistry 인스턴스
+    """
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMRegistry()
+    return _registry
+
+
+def is_registry_enabled() -> bool:
+    """
+    LLM 인스턴스 공유 사용 여부 (model_config.yaml llm_registry.enabled)
+
+    Returns:
+        bool: 사용 여부
+    """
+    return bool(_load_registry_config().get("enabled", True))
+
+
+def get_llm_client_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    공유 LLM 클라이언트별 호출 통계 (레지스트리 미생성 시 빈 딕셔너리)
+
+    Returns:
+        클라이언트별 통계 딕셔너리
+    """
+    return _registry.stats() if _registry is not None else {}
@@ -0,0 +1,600 @@
+# src/llm/scheduler.py
+"""
+외부 API 호출 스케줄러 (동시성 제한 / 속도 제한 / 우선순위)
+
+LLM / 임베딩 / Tavily 호출이 제한 없이 동시에 나가던 방식을 대체:
+- 제공자별 동시 실행 수 제한 (max_concurrency)
+- 토큰 버킷 속도 제한 (rpm: 분당 요청 수, tpm: 분당 토큰 수, 0이면 무제한)
+- 우선순위 클래스: interactive(채팅) > background(적재 / 요약 사전 생성 / 평가)
+  대기열에 interactive 요청이 있으면 background 요청은 뒤로 밀림
+- 429 응답 시 제공자 전체 일시 정지 (Retry-After) → 재시도 폭주 대신 대기열에서 순서대로 재개
+- 제공자별 대기열 길이 / 실행 중 / 대기 시간 통계
+- 요청 트레이스 안의 전송 계층 대기 시간은 scheduler.wait span으로 기록
+
+OpenAI / Solar / 임베딩 호출은 공유 httpx 클라이언트의 전송 계층(ScheduledTransport)에서,
+Tavily 호출은 slot() 컨텍스트 매니저로 스케줄러를 거칩니다
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Optional
+
+# httpx는 openai SDK 의존성 (없으면 전송 계층 연동 없이 slot()만 사용)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils.tracing import span
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 scheduler 섹션이 없을 때 사용
+DEFAULT_SCHEDULER_CONFIG = {
+    "enabled": True,                                # false면 제한 없이 바로 호출
+    "max_wait_seconds": 120,                        # 대기열 최대 대기 시간 (초과 시 SchedulerTimeout)
+    "rate_limit_backoff": 5,                        # Retry-After 없는 429 응답 시 제공자 일시 정지 (초)
+    "default": {"max_concurrency": 4, "rpm": 60, "tpm": 0},
+    "providers": {
+        "openai": {"max_concurrency": 8, "rpm": 500, "tpm": 200000},
+        "solar": {"max_concurrency": 4, "rpm": 100, "tpm": 100000},
+        "openai_embeddings": {"max_concurrency": 4, "rpm": 3000, "tpm": 1000000},
+        "tavily": {"max_concurrency": 4, "rpm": 100, "tpm": 0},
+    },
+}
+
+INTERACTIVE = "interactive"                         # 사용자 채팅 요청 (기본)
+BACKGROUND = "background"                           # 적재 / 요약 사전 생성 / 평가
+
+_PRIORITY_ORDER = {INTERACTIVE: 0, BACKGROUND: 1}
+
+# 현재 실행 컨텍스트의 우선순위 (스레드 풀 / asyncio 태스크로 복사됨)
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("request_priority", default=INTERACTIVE)
+
+
+def _load_scheduler_config() -> Dict[str, Any]:
+    """
+    스케줄러 설정 로드 (기본값과 병합)
+
+    Returns:
+        스케줄러 설정 딕셔너리
+    """
+    config = dict(DEFAULT_SCHEDULER_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("scheduler", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+class SchedulerTimeout(TimeoutError):
+    """대기열에서 max_wait_seconds 안에 실행 슬롯을 얻지 못함"""
+
+
+# ==================== 우선순위 ==================== #
+def current_priority() -> str:
+    """
+    현재 컨텍스트의 우선순위
+
+    Returns:
+        "interactive" 또는 "background"
+    """
+    return _priority.get()
+
+
+@contextmanager
+def background_priority():
+    """
+    블록 안의 외부 호출을 background 우선순위로 실행 (적재 / 평가 / 사전 생성 스크립트용)
+
+    사용 예:
+        with background_priority():
+            vectorstore.add_documents(batch)
+    """
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def estimate_tokens(payload) -> int:
+    """
+    요청 본문 토큰 수 근사 (TPM 버킷용, 약 4바이트 = 1토큰)
+
+    Args:
+        payload: 요청 본문 (bytes 또는 str)
+
+    Returns:
+        int: 추정 토큰 수 (최소 1)
+    """
+    if not payload:
+        return 1
+    size = len(payload) if isinstance(payload, (bytes, bytearray)) else len(str(payload).encode("utf-8"))
+    return size // 4 + 1
+
+
+# ==================== 토큰 버킷 ==================== #
+class TokenBucket:
+    """
+    분당 한도 토큰 버킷 (용량 = 분당 한도, 초당 한도/60씩 연속 충전)
+
+    rate_per_minute가 0 이하이면 무제한
+    """
+
+    def __init__(self, rate_per_minute: float, clock=time.monotonic):
+        self.rate = float(rate_per_minute)
+        self.capacity = self.rate
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / 60.0)
+        self._updated = now
+
+    def _clamp(self, amount: float) -> float:
+        # 용량보다 큰 요청은 버킷이 가득 찼을 때 통과 (영구 대기 방지)
+        return min(float(amount), self.capacity)
+
+    def wait_time(self, amount: float = 1) -> float:
+        """amount만큼 소비하려면 기다려야 하는 시간 (초, 0이면 즉시 가능)"""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        missing = self._clamp(amount) - self._tokens
+        return max(0.0, missing * 60.0 / self.rate)
+
+    def consume(self, amount: float = 1):
+        """amount만큼 소비 (wait_time() == 0 확인 후 호출)"""
+        if self.unlimited:
+            return
+        self._refill()
+        self._tokens -= self._clamp(amount)
+
+
+# ==================== 제공자별 제한기 ==================== #
+class ProviderLimiter:
+    """
+    제공자 하나의 동시 실행 / 속도 제한 + 우선순위 대기열
+
+    대기열은 (우선순위, 도착 순서) 힙이며, 맨 앞 요청만 슬롯을 얻을 수 있음 (순서 보장)
+    """
+
+    def __init__(self, name: str, max_concurrency: int = 4, rpm: float = 0, tpm: float = 0, clock=time.monotonic):
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._clock = clock
+        self._requests = TokenBucket(rpm, clock)
+        self._tokens = TokenBucket(tpm, clock)
+        self._cond = threading.Condition()
+        self._queue: list = []                      # [(우선순위, 순번)]
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+
+        # 통계
+        self.in_flight = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.rate_limited = 0
+        self.max_queue_depth = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    # ---------------------- 내부: 대기열 ---------------------- #
+    def _enqueue(self, priority: str):
+        ticket = (_PRIORITY_ORDER.get(priority, 0), next(self._seq))
+        heapq.heappush(self._queue, ticket)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        return ticket
+
+    def _remove(self, ticket):
+        self._queue.remove(ticket)
+        heapq.heapify(self._queue)
+
+    def _try_grant(self, ticket, tokens: int) -> float:
+        """
+        맨 앞 요청이면 슬롯 확보 시도 (잠금 보유 상태에서 호출)
+
+        Returns:
+            0이면 확보 성공, 아니면 다시 확인할 때까지 대기할 시간 (초)
+        """
+        if self._queue[0] != ticket or self.in_flight >= self.max_concurrency:
+            return 0.05
+        wait = max(
+            self._paused_until - self._clock(),
+            self._requests.wait_time(1),
+            self._tokens.wait_time(tokens),
+        )
+        if wait > 0:
+            return wait
+
+        heapq.heappop(self._queue)
+        self._requests.consume(1)
+        self._tokens.consume(tokens)
+        self.in_flight += 1
+        self._cond.notify_all()                     # 다음 요청이 맨 앞이 됨
+        return 0.0
+
+    def _granted(self, waited_ms: float):
+        self.acquired += 1
+        self.total_wait_ms += waited_ms
+        self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+
+    def _timed_out(self, ticket):
+        self._remove(ticket)
+        self.timeouts += 1
+        self._cond.notify_all()
+        return SchedulerTimeout(f"{self.name}: 대기열 대기 시간 초과 (대기열 {len(self._queue)}개)")
+
+    # ---------------------- 공개 API ---------------------- #
+    def acquire(self, priority: str = INTERACTIVE, tokens: int = 1, timeout: Optional[float] = None):
+        """
+        슬롯 확보까지 대기 (동기)
+
+        Raises:
+            SchedulerTimeout: timeout 초 안에 슬롯을 얻지 못한 경우
+        """
+        start = self._clock()
+        with self._cond:
+            ticket = self._enqueue(priority)
+            while True:
+                wait = self._try_grant(ticket, tokens)
+                if wait == 0:
+                    self._granted((self._clock() - start) * 1000)
+                    return
+                if timeout is not None:
+                    remaining = timeout - (self._clock() - start)
+                    if remaining <= 0:
+                        raise self._timed_out(ticket)
+                    wait = min(wait, remaining)
+                self._cond.wait(wait)
+
+    async def aacquire(self, priority: str = INTERACTIVE, tokens: int = 1, timeout: Optional[float] = None):
+        """
+        슬롯 확보까지 대기 (비동기, 이벤트 루프를 막지 않도록 짧게 잠금 후 asyncio.sleep)
+
+        Raises:
+            SchedulerTimeout: timeout 초 안에 슬롯을 얻지 못한 경우
+        """
+        start = self._clock()
+        with self._cond:
+            ticket = self._enqueue(priority)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_grant(ticket, tokens)
+                    if wait == 0:
+                        self._granted((self._clock() - start) * 1000)
+                        return
+                    if timeout is not None and self._clock() - start >= timeout:
+                        raise self._timed_out(ticket)
+                await asyncio.sleep(min(wait, 0.05))
+        except asyncio.CancelledError:
+            with self._cond:
+                if ticket in self._queue:
+                    self._remove(ticket)
+                    self._cond.notify_all()
+            raise
+
+    def release(self):
+        """슬롯 반환"""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    def pause(self, seconds: float):
+        """
+        429 응답 시 제공자 전체 일시 정지 (대기 중 요청은 순서를 유지한 채 재개)
+
+        Args:
+            seconds: 정지 시간 (초)
+        """
+        with self._cond:
+            self.rate_limited += 1
+            self._paused_until = max(self._paused_until, self._clock() + float(seconds))
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        통계 스냅샷
+
+        Returns:
+            {"queued", "queued_interactive", "queued_background", "in_flight", "max_concurrency",
+             "acquired", "timeouts", "rate_limited", "max_queue_depth", "avg_wait_ms", "max_wait_ms"}
+        """
+        with self._cond:
+            background = sum(1 for rank, _ in self._queue if rank == _PRIORITY_ORDER[BACKGROUND])
+            return {
+                "queued": len(self._queue),
+                "queued_interactive": len(self._queue) - background,
+                "queued_background": background,
+                "in_flight": self.in_flight,
+                "max_concurrency": self.max_concurrency,
+                "acquired": self.acquired,
+                "timeouts": self.timeouts,
+                "rate_limited": self.rate_limited,
+                "max_queue_depth": self.max_queue_depth,
+                "avg_wait_ms": round(self.total_wait_ms / self.acquired, 1) if self.acquired else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 1),
+            }
+
+
+# ==================== 스케줄러 ==================== #
+class RequestScheduler:
+    """
+    제공자별 ProviderLimiter 모음
+
+    설정에 없는 제공자는 default 한도로 생성
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: 스케줄러 설정 (미지정 시 model_config.yaml)
+        """
+        self.config = dict(DEFAULT_SCHEDULER_CONFIG, **(config or _load_scheduler_config()))
+        self.enabled = bool(self.config.get("enabled", True))
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, ProviderLimiter] = {}
+
+    def limiter(self, provider: str) -> ProviderLimiter:
+        """제공자 제한기 반환 (없으면 생성)"""
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(provider)
+                if limiter is None:
+                    limits = dict(DEFAULT_SCHEDULER_CONFIG["default"], **(self.config.get("default") or {}))
+                    limits.update((self.config.get("providers") or {}).get(provider) or {})
+                    limiter = ProviderLimiter(
+                        provider,
+                        max_concurrency=limits.get("max_concurrency", 4),
+                        rpm=limits.get("rpm", 0) or 0,
+                        tpm=limits.get("tpm", 0) or 0,
+                    )
+                    self._limiters[provider] = limiter
+        return limiter
+
+    def _timeout(self) -> Optional[float]:
+        value = self.config.get("max_wait_seconds")
+        return float(value) if value else None
+
+    # ---------------------- 슬롯 ---------------------- #
+    def acquire(self, provider: str, tokens: int = 1, priority: Optional[str] = None) -> Optional[ProviderLimiter]:
+        """
+        슬롯 확보 (동기), 비활성화 시 None
+
+        Returns:
+            release()를 호출할 ProviderLimiter (비활성화 시 None)
+        """
+        if not self.enabled:
+            return None
+        limiter = self.limiter(provider)
+        limiter.acquire(priority or current_priority(), tokens, self._timeout())
+        return limiter
+
+    async def aacquire(self, provider: str, tokens: int = 1, priority: Optional[str] = None) -> Optional[ProviderLimiter]:
+        """슬롯 확보 (비동기), 비활성화 시 None"""
+        if not self.enabled:
+            return None
+        limiter = self.limiter(provider)
+        await limiter.aacquire(priority or current_priority(), tokens, self._timeout())
+        return limiter
+
+    @contextmanager
+    def slot(self, provider: str, tokens: int = 1, priority: Optional[str] = None):
+        """
+        블록 실행 동안 제공자 슬롯 점유
+
+        사용 예:
+            with get_scheduler().slot("tavily"):
+                results = search_tool.invoke({"query": question})
+        """
+        limiter = self.acquire(provider, tokens, priority)
+        try:
+            yield
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+    @asynccontextmanager
+    async def aslot(self, provider: str, tokens: int = 1, priority: Optional[str] = None):
+        """slot()의 비동기 버전"""
+        limiter = await self.aacquire(provider, tokens, priority)
+        try:
+            yield
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+    def report_rate_limited(self, provider: str, retry_after: Optional[float] = None):
+        """
+        429 응답 보고 → 제공자 일시 정지
+
+        Args:
+            provider: 제공자
+            retry_after: Retry-After 헤더 값 (초, 없으면 rate_limit_backoff)
+        """
+        if not self.enabled:
+            return
+        seconds = retry_after if retry_after is not None else float(self.config.get("rate_limit_backoff", 5))
+        self.limiter(provider).pause(seconds)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        제공자별 대기열 / 실행 통계
+
+        Returns:
+            {제공자: 통계 스냅샷}
+        """
+        with self._lock:
+            items = list(self._limiters.items())
+        return {provider: limiter.snapshot() for provider, limiter in items}
+
+
+# ==================== httpx 전송 계층 연동 ==================== #
+def _retry_after(response) -> Optional[float]:
+    """Retry-After 헤더 (초) 파싱, 없거나 날짜 형식이면 None"""
+    value = response.headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000.0
+        except ValueError:
+            pass
+    value = response.headers.get("retry-after")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class _ReleasingStream(httpx.SyncByteStream if httpx else object):
+    """응답 본문을 다 읽거나 닫을 때 슬롯 반환 (스트리밍 응답은 끝날 때까지 슬롯 점유)"""
+
+    def __init__(self, stream, limiter: Optional[ProviderLimiter]):
+        self._stream = stream
+        self._limiter = limiter
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            if self._limiter is not None:
+                self._limiter.release()
+                self._limiter = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream if httpx else object):
+    """_ReleasingStream의 비동기 버전"""
+
+    def __init__(self, stream, limiter: Optional[ProviderLimiter]):
+        self._stream = stream
+        self._limiter = limiter
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._limiter is not None:
+                self._limiter.release()
+                self._limiter = None
+
+
+class ScheduledTransport(httpx.BaseTransport if httpx else object):
+    """
+    요청마다 스케줄러 슬롯을 확보하는 httpx 전송 계층 (OpenAI SDK 내부 재시도 포함)
+
+    TPM은 요청 본문 크기로 추정, 429 응답은 제공자 일시 정지로 보고
+    """
+
+    def __init__(self, provider: str, transport, scheduler: Optional[RequestScheduler] = None):
+        self.provider = provider
+        self._transport = transport
+        self._scheduler = scheduler
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        return self._scheduler or get_scheduler()
+
+    def handle_request(self, request):
+        tokens = estimate_tokens(request.content)
+        with span("scheduler.wait", provider=self.provider, estimated_tokens=tokens):
+            limiter = self.scheduler.acquire(self.provider, tokens)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            if limiter is not None:
+                limiter.release()
+            raise
+        if response.status_code == 429:
+            self.scheduler.report_rate_limited(self.provider, _retry_after(response))
+        response.stream = _ReleasingStream(response.stream, limiter)
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncScheduledTransport(httpx.AsyncBaseTransport if httpx else object):
+    """ScheduledTransport의 비동기 버전"""
+
+    def __init__(self, provider: str, transport, scheduler: Optional[RequestScheduler] = None):
+        self.provider = provider
+        self._transport = transport
+        self._scheduler = scheduler
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        return self._scheduler or get_scheduler()
+
+    async def handle_async_request(self, request):
+        tokens = estimate_tokens(request.content)
+        with span("scheduler.wait", provider=self.provider, estimated_tokens=tokens):
+            limiter = await self.scheduler.aacquire(self.provider, tokens)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            if limiter is not None:
+                limiter.release()
+            raise
+        if response.status_code == 429:
+            self.scheduler.report_rate_limited(self.provider, _retry_after(response))
+        response.stream = _AsyncReleasingStream(response.stream, limiter)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+# ==================== 전역 인스턴스 ==================== #
+_scheduler: Optional[RequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RequestScheduler:
+    """
+    프로세스 공용 RequestScheduler 반환 (최초 호출 시 생성)
+
+    Returns:
+        RequestScheduler 인스턴스
+    """
+    global _scheduler
+
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RequestScheduler()
+    return _scheduler
+
+
+def get_scheduler_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    제공자별 대기열 / 실행 통계 (스케줄러 미생성 시 빈 딕셔너리)
+
+    Returns:
+        제공자별 통계 딕셔너리
+    """
+    return _scheduler.stats() if _scheduler is not None else {}
@@ -9,6 +9,7 @@ from .loader import (
     # 라우팅 프롬프트
     load_routing_prompts,
     get_routing_prompt,
+    get_combined_routing_prompt,
     get_few_shot_examples,
 
     # 도구별 프롬프트
@@ -16,6 +17,7 @@ from .loader import (
     get_tool_prompt,
     get_summarize_title_extraction_prompt,
     get_summarize_template,
+    get_summarize_section_prompt,
     get_web_search_user_prompt_template,
 
     # 평가 프롬프트
@@ -39,6 +41,7 @@ __all__ = [
     # 라우팅
     'load_routing_prompts',
     'get_routing_prompt',
+    'get_combined_routing_prompt',
     'get_few_shot_examples',
 
     # 도구별
@@ -46,6 +49,7 @@ __all__ = [
     'get_tool_prompt',
     'get_summarize_title_extraction_prompt',
     'get_summarize_template',
+    'get_summarize_section_prompt',
     'get_web_search_user_prompt_template',
 
     # 평가
@@ -61,6 +61,11 @@ def get_routing_prompt() -> str:
     return data.get("prompt_template", data.get("routing_prompt", ""))
 
 
+def get_combined_routing_prompt() -> str:
+    """통합 라우팅 프롬프트 텍스트 반환 (분류 + 라우팅 + 검증, {question}/{difficulty}/{context})"""
+    return load_routing_prompts().get("combined_routing_prompt", "")
+
+
 def get_few_shot_examples() -> List[Dict[str, str]]:
     """Few-shot 예시 리스트 반환"""
     data = load_routing_prompts()
@@ -166,6 +171,21 @@ def get_summarize_title_extraction_prompt() -> str:
     return data["summarize_prompts"]["title_extraction"]["template"]
 
 
+def get_summarize_section_prompt(stage: str = "map") -> str:
+    """
+    긴 논문 map-reduce 요약용 섹션 프롬프트 반환
+
+    Args:
+        stage: "map" (섹션 정리) 또는 "reduce" (섹션 정리 통합)
+
+    Returns:
+        프롬프트 템플릿 문자열 ({title}, {text}, map은 {index}/{total} 포함)
+    """
+    data = load_tool_prompts()
+    key = "section_map" if stage == "map" else "section_reduce"
+    return data["summarize_prompts"][key]["template"]
+
+
 def get_summarize_template(difficulty: str = "easy") -> str:
     """
     논문 요약 템플릿 반환
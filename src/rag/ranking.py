@@ -0,0 +1,218 @@
+# ==========================================
+# 📘 하이브리드 검색 순위 결합 모듈
+# ------------------------------------------
+# - RRF (Reciprocal Rank Fusion)
+# - min-max / z-score 정규화 후 가중 합산
+# - 검색 브랜치 수 제한 없음 (vector, keyword, sql 등)
+# - 도구별 가중치: model_config.yaml
+#   rag.hybrid_search.tool_specific_weights
+# ==========================================
+
+import math
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+
+# ---------- 타입 ----------
+# 브랜치 결과: (문서 키, 점수) 리스트. 점수가 None이면 입력 순서를 순위로 사용
+BranchResults = Sequence[Tuple[Hashable, Optional[float]]]
+FusedResults = List[Tuple[Hashable, float]]
+
+# ---------- 상수 ----------
+FUSION_METHODS = ("rrf", "minmax", "zscore")
+DEFAULT_FUSION_METHOD = "minmax"
+DEFAULT_RRF_K = 60
+
+
+# ---------- 유틸: 브랜치 결과 정리 ----------
+def _canonicalize(
+    results: BranchResults,
+    higher_is_better: bool,
+) -> Tuple[List[Hashable], Dict[Hashable, float]]:
+    """
+    브랜치 결과를 (순위순 키 목록, 키별 점수)로 정리.
+    - 같은 키가 여러 번 나오면 가장 좋은 점수만 유지 (예: 같은 논문의 여러 청크).
+    - 점수가 하나라도 None이면 입력 순서를 순위로 보고 점수를 순위 기반 값으로 대체.
+    """
+    if any(score is None for _, score in results):
+        ordered: List[Hashable] = list(dict.fromkeys(key for key, _ in results))
+        n = len(ordered)
+        # 1위 = n, 꼴찌 = 1 (높을수록 좋음)
+        return ordered, {key: float(n - i) for i, key in enumerate(ordered)}
+
+    best: Dict[Hashable, float] = {}
+    for key, score in results:
+        score = float(score)  # type: ignore[arg-type]
+        if key not in best:
+            best[key] = score
+        elif (score > best[key]) if higher_is_better else (score < best[key]):
+            best[key] = score
+
+    # 점수 방향 통일: 항상 "높을수록 좋음"
+    if not higher_is_better:
+        best = {key: -score for key, score in best.items()}
+
+    ordered = sorted(best, key=lambda key: best[key], reverse=True)
+    return ordered, best
+
+
+# ---------- 정규화 ----------
+def minmax_normalize(scores: Mapping[Hashable, float]) -> Dict[Hashable, float]:
+    """
+    min-max 정규화 (0~1, 높을수록 좋음).
+    - 모든 점수가 같으면 1.0 (해당 브랜치에서 모두 동일하게 최상위).
+    """
+    if not scores:
+        return {}
+    lo, hi = min(scores.values()), max(scores.values())
+    if hi == lo:
+        return {key: 1.0 for key in scores}
+    span = hi - lo
+    return {key: (score - lo) / span for key, score in scores.items()}
+
+
+def zscore_normalize(scores: Mapping[Hashable, float]) -> Dict[Hashable, float]:
+    """
+    z-score 정규화 (평균 0, 표준편차 1).
+    - 표준편차가 0이면 모두 0.0.
+    """
+    if not scores:
+        return {}
+    n = len(scores)
+    mean = sum(scores.values()) / n
+    std = math.sqrt(sum((s - mean) ** 2 for s in scores.values()) / n)
+    if std == 0:
+        return {key: 0.0 for key in scores}
+    return {key: (score - mean) / std for key, score in scores.items()}
+
+
+# ---------- 결합: RRF ----------
+def reciprocal_rank_fusion(
+    branches: Mapping[str, BranchResults],
+    weights: Optional[Mapping[str, float]] = None,
+    higher_is_better: Optional[Mapping[str, bool]] = None,
+    k: int = DEFAULT_RRF_K,
+) -> FusedResults:
+    """
+    Reciprocal Rank Fusion.
+    - fused(d) = Σ_b w_b / (k + rank_b(d)), rank는 1부터 시작.
+    - 점수 스케일이 다른 브랜치(거리 vs ts_rank)도 순위만으로 결합.
+    """
+    weights = weights or {}
+    higher_is_better = higher_is_better or {}
+
+    fused: Dict[Hashable, float] = {}
+    for name, results in branches.items():
+        w = float(weights.get(name, 1.0))
+        ordered, _ = _canonicalize(results, higher_is_better.get(name, True))
+        for rank, key in enumerate(ordered, 1):
+            fused[key] = fused.get(key, 0.0) + w / (k + rank)
+
+    return _sorted(fused)
+
+
+# ---------- 결합: 정규화 점수 가중합 ----------
+def normalized_score_fusion(
+    branches: Mapping[str, BranchResults],
+    weights: Optional[Mapping[str, float]] = None,
+    higher_is_better: Optional[Mapping[str, bool]] = None,
+    method: str = "minmax",
+) -> FusedResults:
+    """
+    브랜치별 점수를 정규화한 뒤 가중 합산.
+    - minmax: 브랜치에 없는 문서는 0 (해당 브랜치 최하위와 동일).
+    - zscore: 브랜치에 없는 문서는 해당 브랜치 최소 z-score.
+    """
+    normalize = minmax_normalize if method == "minmax" else zscore_normalize
+    weights = weights or {}
+    higher_is_better = higher_is_better or {}
+
+    normalized: Dict[str, Dict[Hashable, float]] = {}
+    all_keys: Dict[Hashable, None] = {}
+    for name, results in branches.items():
+        ordered, scores = _canonicalize(results, higher_is_better.get(name, True))
+        normalized[name] = normalize(scores)
+        all_keys.update(dict.fromkeys(ordered))
+
+    fused: Dict[Hashable, float] = {key: 0.0 for key in all_keys}
+    for name, norm in normalized.items():
+        if not norm:
+            continue
+        w = float(weights.get(name, 1.0))
+        missing = 0.0 if method == "minmax" else min(norm.values())
+        for key in fused:
+            fused[key] += w * norm.get(key, missing)
+
+    return _sorted(fused)
+
+
+# ---------- 공개 API ----------
+def fuse(
+    branches: Mapping[str, BranchResults],
+    method: str = DEFAULT_FUSION_METHOD,
+    weights: Optional[Mapping[str, float]] = None,
+    higher_is_better: Optional[Mapping[str, bool]] = None,
+    rrf_k: int = DEFAULT_RRF_K,
+) -> FusedResults:
+    """
+    여러 검색 브랜치 결과를 하나의 순위로 결합.
+
+    Parameters
+    ----------
+    branches : Mapping[str, BranchResults]
+        {브랜치명: [(문서 키, 점수 또는 None), ...]}
+    method : str
+        "rrf" | "minmax" | "zscore"
+    weights : Optional[Mapping[str, float]]
+        브랜치별 가중치 (미지정 브랜치는 1.0)
+    higher_is_better : Optional[Mapping[str, bool]]
+        브랜치별 점수 방향 (벡터 거리처럼 낮을수록 좋은 경우 False, 기본 True)
+    rrf_k : int
+        RRF 상수 (method="rrf"일 때만 사용)
+
+    Returns
+    -------
+    List[Tuple[Hashable, float]]
+        (문서 키, 결합 점수) 리스트, 점수 내림차순 (동점은 처음 등장한 순서)
+    """
+    if method not in FUSION_METHODS:
+        raise ValueError(f"지원하지 않는 fusion method: {method} (가능: {FUSION_METHODS})")
+
+    if method == "rrf":
+        return reciprocal_rank_fusion(branches, weights, higher_is_better, k=rrf_k)
+    return normalized_score_fusion(branches, weights, higher_is_better, method=method)
+
+
+def get_fusion_settings(tool_name: Optional[str] = None) -> Dict[str, object]:
+    """
+    model_config.yaml의 rag.hybrid_search에서 결합 설정 로드.
+
+    Returns
+    -------
+    Dict[str, object]
+        {"method": str, "rrf_k": int, "weights": {"vector": float, "keyword": float}}
+        - weights는 tool_specific_weights[tool_name] 우선, 없으면 기본 가중치.
+    """
+    try:
+        from src.utils.config_loader import get_model_config
+        hybrid_config = get_model_config().get("rag", {}).get("hybrid_search", {}) or {}
+    except Exception:
+        # config 로드 실패 시 기본값
+        hybrid_config = {}
+
+    fusion_config = hybrid_config.get("fusion", {}) or {}
+    tool_weights = (hybrid_config.get("tool_specific_weights", {}) or {}).get(tool_name or "", {}) or {}
+
+    return {
+        "method": fusion_config.get("method", DEFAULT_FUSION_METHOD),
+        "rrf_k": int(fusion_config.get("rrf_k", DEFAULT_RRF_K)),
+        "weights": {
+            "vector": float(tool_weights.get("vector_weight", hybrid_config.get("vector_weight", 0.7))),
+            "keyword": float(tool_weights.get("keyword_weight", hybrid_config.get("keyword_weight", 0.3))),
+        },
+    }
+
+
+# ---------- 내부: 정렬 ----------
+def _sorted(fused: Dict[Hashable, float]) -> FusedResults:
+    """결합 점수 내림차순 정렬 (sorted는 안정 정렬 → 동점은 삽입 순서 유지)."""
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
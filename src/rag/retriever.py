@@ -9,11 +9,14 @@
 # - 메타데이터 필터 검색 제공 (년도/카테고리 등)
 # ==========================================
 
+import contextvars
 import os
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 
 from langchain_core.documents import Document
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
 # ---------- MultiQueryRetriever 임포트(버전 호환) ----------
 # - 다양한 langchain 버전 지원을 위한 임포트
 try:
@@ -27,6 +30,7 @@ except ImportError:
 from src.database.vector_store import get_pgvector_store
 from src.utils.config_loader import get_model_config
 from src.llm.client import LLMClient
+from src.utils.tracing import span
 
 
 # ---------- 상수/환경 ----------
@@ -45,7 +49,17 @@ except Exception:
     DEFAULT_LLM_MODEL = "solar-pro2"
     DEFAULT_LLM_TEMPERATURE = 0.0
 
+# 확장 쿼리 검색용 공용 스레드 풀 (호출마다 생성하지 않음)
+# - search_paper의 브랜치 풀과 분리: 브랜치 스레드가 이 풀의 작업을 기다리므로
+#   같은 풀을 쓰면 동시 요청이 많을 때 서로를 기다리며 멈출 수 있음
+_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="multi_query")
+
 # ---------- 유틸: 문서 중복 제거 ----------
+def _doc_key(d: Document) -> str:
+    """page_content+metadata 기반 문서 식별 키 (md5)."""
+    return hashlib.md5((d.page_content + str(d.metadata)).encode("utf-8")).hexdigest()
+
+
 def _dedup_docs(docs: List[Document]) -> List[Document]:
     """
     문서 리스트에서 page_content+metadata 기준으로 중복 제거.
@@ -54,7 +68,7 @@ def _dedup_docs(docs: List[Document]) -> List[Document]:
     seen = set()
     uniq: List[Document] = []
     for d in docs:
-        key = hashlib.md5((d.page_content + str(d.metadata)).encode("utf-8")).hexdigest()
+        key = _doc_key(d)
         if key not in seen:
             seen.add(key)
             uniq.append(d)
@@ -176,17 +190,24 @@ class RAGRetriever:
     # ---------- 공개 API: 기본 검색 ----------
     def invoke(self, query: str) -> List[Document]:
         """기본 검색 실행 (현재 설정된 search_type 사용)."""
-        return self._retriever.invoke(query)
+        with span("pgvector.search", kind="client", search_type=self.search_type, k=self.k):
+            return self._retriever.invoke(query)
 
     def similarity_search(self, query: str, k: Optional[int] = None) -> List[Document]:
         """VectorStore 유사도 검색 (상위 k)."""
         k = k or self.k
-        return self.vectorstore.similarity_search(query, k=k)
+        with span("pgvector.similarity_search", kind="client", k=k) as search_span:
+            docs = self.vectorstore.similarity_search(query, k=k)
+            search_span.set_attribute("results", len(docs))
+        return docs
 
     def similarity_search_with_score(self, query: str, k: Optional[int] = None) -> List[Tuple[Document, float]]:
         """유사도 검색 + 점수 반환."""
         k = k or self.k
-        return self.vectorstore.similarity_search_with_score(query, k=k)
+        with span("pgvector.similarity_search", kind="client", k=k, with_score=True) as search_span:
+            pairs = self.vectorstore.similarity_search_with_score(query, k=k)
+            search_span.set_attribute("results", len(pairs))
+        return pairs
 
     # ---------- 공개 API: 모드 전환 ----------
     def set_mode(self, search_type: str = "similarity"):
@@ -203,7 +224,8 @@ class RAGRetriever:
             search_type="similarity",
             search_kwargs={"k": k, "filter": filter_dict},
         )
-        return filtered.invoke(query)
+        with span("pgvector.similarity_search", kind="client", k=k, filter=sorted(filter_dict)):
+            return filtered.invoke(query)
 
     # ---------- 공개 API: 멀티쿼리 검색 ----------
     def multi_query_search(self, query: str, k: Optional[int] = None) -> List[Document]:
@@ -216,6 +238,57 @@ class RAGRetriever:
             return self._retriever.invoke(query)
 
 
-        docs = self._multi_query_retriever.invoke(query)
+        with span("pgvector.multi_query_search", kind="client", k=k):
+            docs = self._multi_query_retriever.invoke(query)
         docs = _dedup_docs(docs)
-        return docs[:k]
\ No newline at end of file
+        return docs[:k]
+
+    # ---------- 공개 API: 멀티쿼리 검색 (점수 포함) ----------
+    def expand_queries(self, query: str) -> List[str]:
+        """
+        MultiQueryRetriever의 LLM으로 쿼리 확장 (원본 쿼리 포함, 중복 제거).
+        - MultiQuery 비활성화/LLM 오류 시 원본 쿼리만 반환.
+        """
+        queries = [query]
+        if self._multi_query_retriever:
+            try:
+                generated = self._multi_query_retriever.generate_queries(
+                    query, CallbackManagerForRetrieverRun.get_noop_manager()
+                )
+                queries.extend(q.strip() for q in generated if q and q.strip())
+            except Exception:
+                pass
+        return list(dict.fromkeys(queries))
+
+    def multi_query_search_with_score(self, query: str, k: Optional[int] = None) -> List[Tuple[Document, float]]:
+        """
+        확장 쿼리별 similarity_search_with_score를 병렬 실행 후 병합.
+        - 같은 문서는 가장 작은 distance(가장 유사한 점수)만 유지.
+        - multi_query_search + similarity_search_with_score를 따로 돌리던 중복 검색을 대체.
+        """
+        k = k or self.k
+        queries = self.expand_queries(query)
+
+        if len(queries) == 1:
+            return self.similarity_search_with_score(query, k=k)
+
+        # 요청 트레이스 / SQL 실행 제한 컨텍스트를 워커 스레드로 복사 (쿼리별 pgvector span)
+        futures = [
+            _QUERY_EXECUTOR.submit(contextvars.copy_context().run, self.similarity_search_with_score, q, k)
+            for q in queries
+        ]
+        try:
+            per_query = [f.result() for f in futures]
+        finally:
+            # 한 쿼리가 실패하면 아직 시작하지 않은 나머지 쿼리는 취소
+            for f in futures:
+                f.cancel()
+
+        best: Dict[str, Tuple[Document, float]] = {}
+        for pairs in per_query:
+            for d, score in pairs:
+                key = _doc_key(d)
+                if key not in best or score < best[key][1]:
+                    best[key] = (d, score)
+
+        return sorted(best.values(), key=lambda pair: pair[1])[:k]
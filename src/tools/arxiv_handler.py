@@ -8,6 +8,7 @@ arXiv 논문 자동 저장 모듈
 - papers 테이블 저장
 - 고품질 청킹 (PaperDocumentLoader 활용)
 - 임베딩 생성 및 pgvector 저장
+- 수준별 요약 사전 생성 예약 (paper_summaries)
 """
 
 # ==================== Import ==================== #
@@ -17,16 +18,17 @@ import requests
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, List
-import psycopg2
 from langchain_core.documents import Document
-from langchain_openai import OpenAIEmbeddings
-from langchain_postgres.vectorstores import PGVector
 
 # PaperDocumentLoader import
 import sys
 project_root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(project_root))
 from src.data.document_loader import PaperDocumentLoader
+from src.database.vector_store import get_pgvector_store
+from src.database.db import get_cursor
+from src.agent.answer_cache import invalidate_answer_cache
+from src.utils.paper_summaries import schedule_paper_summaries
 
 # PDF 텍스트 추출
 try:
@@ -329,49 +331,45 @@ class ArxivPaperHandler:
             paper_id 또는 None
         """
         try:
-            conn = psycopg2.connect(self.db_url)
-            cursor = conn.cursor()
+            # 공용 연결 풀 사용 (블록 종료 시 커밋 및 연결 반환)
+            with get_cursor() as cursor:
+                # 중복 확인 (arxiv_id 또는 url로 확인)
+                cursor.execute(
+                    "SELECT paper_id FROM papers WHERE arxiv_id = %s OR url = %s",
+                    (metadata['arxiv_id'], metadata['url'])
+                )
+                existing = cursor.fetchone()
+
+                if existing:
+                    paper_id = existing[0]
+                    if self.logger:
+                        self.logger.write(f"논문 이미 존재: paper_id={paper_id}")
+                    return paper_id
+
+                # 새 논문 저장
+                query = """
+                INSERT INTO papers (arxiv_id, title, authors, abstract, publish_date, url, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                RETURNING paper_id
+                """
+
+                cursor.execute(query, (
+                    metadata['arxiv_id'],
+                    metadata['title'],
+                    metadata['authors'],
+                    metadata['abstract'],
+                    metadata['publish_date'],
+                    metadata['url'],
+                    datetime.now()
+                ))
+
+                paper_id = cursor.fetchone()[0]
 
-            # 중복 확인 (arxiv_id 또는 url로 확인)
-            cursor.execute(
-                "SELECT paper_id FROM papers WHERE arxiv_id = %s OR url = %s",
-                (metadata['arxiv_id'], metadata['url'])
-            )
-            existing = cursor.fetchone()
-
-            if existing:
-                paper_id = existing[0]
                 if self.logger:
-                    self.logger.write(f"논문 이미 존재: paper_id={paper_id}")
-                cursor.close()
-                conn.close()
-                return paper_id
-
-            # 새 논문 저장
-            query = """
-            INSERT INTO papers (arxiv_id, title, authors, abstract, publish_date, url, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            RETURNING paper_id
-            """
-
-            cursor.execute(query, (
-                metadata['arxiv_id'],
-                metadata['title'],
-                metadata['authors'],
-                metadata['abstract'],
-                metadata['publish_date'],
-                metadata['url'],
-                datetime.now()
-            ))
-
-            paper_id = cursor.fetchone()[0]
-            conn.commit()
-
-            if self.logger:
-                self.logger.write(f"papers 테이블 저장 완료: paper_id={paper_id}")
+                    self.logger.write(f"papers 테이블 저장 완료: paper_id={paper_id}")
 
-            cursor.close()
-            conn.close()
+            # 새 논문 저장 → papers 의존 답변 캐시 무효화
+            invalidate_answer_cache("papers")
 
             return paper_id
 
@@ -424,13 +422,10 @@ class ArxivPaperHandler:
             if self.logger:
                 self.logger.write(f"중복 제거 후: {len(documents)}개 청크")
 
-            # PGVector에 저장
-            embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-            vectorstore = PGVector(
+            # PGVector에 저장 (프로세스 공유 VectorStore 사용)
+            vectorstore = get_pgvector_store(
                 collection_name="paper_chunks",
-                embeddings=embeddings,
-                connection=self.db_url,
-                use_jsonb=True
+                connection_string=self.db_url
             )
 
             if self.logger:
@@ -441,6 +436,9 @@ class ArxivPaperHandler:
             if self.logger:
                 self.logger.write(f"pgvector 저장 완료: {len(documents)}개 청크")
 
+            # 청크 추가 → 논문 검색/요약 답변 캐시 무효화
+            invalidate_answer_cache("papers")
+
             return True
 
         except Exception as e:
@@ -551,4 +549,8 @@ class ArxivPaperHandler:
             self.logger.write(f"arXiv 논문 처리 완료: {arxiv_id} (paper_id={paper_id})")
             self.logger.write(f"고품질 청킹 적용: RecursiveCharacterTextSplitter + 저작권 필터링 + 중복 제거")
 
+        # 6. 수준별 요약 사전 생성 (백그라운드, paper_summaries 테이블)
+        if success:
+            schedule_paper_summaries(paper_id, logger=self.logger)
+
         return success
@@ -4,26 +4,25 @@
 
 LLM의 자체 지식으로 직접 답변 생성
 난이도별(Easy/Hard) 프롬프트 적용
+두 수준 답변은 동시에 생성 (src/tools/multi_level.py)
 """
 
 # ==================== Import ==================== #
 from langchain.schema import SystemMessage, HumanMessage
 from src.agent.state import AgentState
+from src.agent.streaming import answer_stream_config
 from src.llm.client import LLMClient
 from src.prompts import get_tool_prompt
+from src.tools.multi_level import agenerate_levels, generate_levels
 
 
 # ==================== 도구 1: 일반 답변 노드 ==================== #
-def general_answer_node(state: AgentState, exp_manager=None):
+def _prepare_general_answer(state: AgentState, exp_manager=None):
     """
-    일반 답변 노드: LLM의 자체 지식으로 직접 답변
-
-    Args:
-        state (AgentState): Agent 상태
-        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+    수준별 메시지 구성 / 프롬프트 저장 (동기 / 비동기 노드 공통)
 
     Returns:
-        AgentState: 업데이트된 상태
+        tuple: (levels, level_messages, llm_client, tool_logger)
     """
     # -------------- 상태에서 질문 및 난이도 추출 -------------- #
     question = state["question"]                # 사용자 질문
@@ -49,27 +48,21 @@ def general_answer_node(state: AgentState, exp_manager=None):
     }
 
     levels = level_mapping.get(difficulty, ["beginner", "intermediate"])
-    final_answers = {}
-
     # 난이도별 LLM 초기화 (공통)
     llm_client = LLMClient.from_difficulty(
         difficulty=difficulty,
         logger=exp_manager.logger if exp_manager else None
     )
 
-    # 각 수준별로 답변 생성
+    # 수준별 메시지 구성 및 프롬프트 저장 (프롬프트 파일 기록은 순차)
+    level_messages = {}
     for level in levels:
-        if exp_manager:
-            exp_manager.logger.write(f"수준 '{level}' 답변 생성 시작")
-        if tool_logger:
-            tool_logger.write(f"수준 '{level}' 답변 생성 시작")
-
         # 프롬프트 로드
         system_content = get_tool_prompt("general_answer", level)
         system_msg = SystemMessage(content=system_content)
 
         # 메시지 구성
-        messages = [
+        level_messages[level] = [
             system_msg,
             HumanMessage(content=question)
         ]
@@ -92,22 +85,30 @@ def general_answer_node(state: AgentState, exp_manager=None):
                 "level": level
             })
 
-        # LLM 호출
-        response = llm_client.llm.invoke(messages)
-        final_answers[level] = response.content
+    if exp_manager:
+        exp_manager.logger.write(f"수준별 답변 동시 생성 시작: {', '.join(levels)}")
+    if tool_logger:
+        tool_logger.write(f"수준별 답변 동시 생성 시작: {', '.join(levels)}")
+
+    return levels, level_messages, llm_client, tool_logger
 
-        # 로깅
+
+def _finish_general_answer(state: AgentState, final_answers, levels, exp_manager=None, tool_logger=None):
+    """수준별 답변 로깅 및 상태 저장 (동기 / 비동기 노드 공통)"""
+    # 로깅
+    for level in levels:
+        content = final_answers[level]
         if exp_manager:
-            exp_manager.logger.write(f"수준 '{level}' 답변 생성 완료: {len(response.content)} 글자")
+            exp_manager.logger.write(f"수준 '{level}' 답변 생성 완료: {len(content)} 글자")
             exp_manager.logger.write("=" * 80)
             exp_manager.logger.write(f"[{level} 답변 전체 내용]")
-            exp_manager.logger.write(response.content)
+            exp_manager.logger.write(content)
             exp_manager.logger.write("=" * 80)
         if tool_logger:
-            tool_logger.write(f"수준 '{level}' 답변 생성 완료: {len(response.content)} 글자")
+            tool_logger.write(f"수준 '{level}' 답변 생성 완료: {len(content)} 글자")
             tool_logger.write("=" * 80)
             tool_logger.write(f"[{level} 답변 전체 내용]")
-            tool_logger.write(response.content)
+            tool_logger.write(content)
             tool_logger.write("=" * 80)
 
     # -------------- 최종 답변 저장 -------------- #
@@ -118,3 +119,56 @@ def general_answer_node(state: AgentState, exp_manager=None):
     state["tool_result"] = final_answers[levels[1]]
 
     return state
+
+
+def general_answer_node(state: AgentState, exp_manager=None):
+    """
+    일반 답변 노드: LLM의 자체 지식으로 직접 답변
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        AgentState: 업데이트된 상태
+    """
+    levels, level_messages, llm_client, tool_logger = _prepare_general_answer(state, exp_manager)
+
+    # LLM 호출 (수준별 동시 실행, 주 수준 = final_answer에 들어가는 두 번째 수준)
+    final_answers = generate_levels(
+        levels,
+        lambda level: llm_client.llm.invoke(level_messages[level], config=answer_stream_config(level)).content,
+        state=state,
+        tool_name="general",
+        primary=levels[1],
+    )
+
+    return _finish_general_answer(state, final_answers, levels, exp_manager, tool_logger)
+
+
+async def general_answer_node_async(state: AgentState, exp_manager=None):
+    """
+    일반 답변 노드 (비동기 그래프용): llm.ainvoke로 수준별 답변을 이벤트 루프에서 동시 생성
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        AgentState: 업데이트된 상태
+    """
+    levels, level_messages, llm_client, tool_logger = _prepare_general_answer(state, exp_manager)
+
+    async def answer(level):
+        response = await llm_client.llm.ainvoke(level_messages[level], config=answer_stream_config(level))
+        return response.content
+
+    final_answers = await agenerate_levels(
+        levels,
+        answer,
+        state=state,
+        tool_name="general",
+        primary=levels[1],
+    )
+
+    return _finish_general_answer(state, final_answers, levels, exp_manager, tool_logger)
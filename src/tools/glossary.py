@@ -5,7 +5,7 @@
 # - @tool: search_glossary (hybrid/sql/vector)
 # - PostgreSQL(ILIKE/필터) + PGVector(유사도) 병합
 # - 난이도 모드(easy/hard/auto)로 설명 선택
-# - Agent 노드 통합: glossary_node
+# - Agent 노드 통합: glossary_node (동기) / glossary_node_async (비동기 그래프: llm.ainvoke)
 # ==========================================
 
 # ------------------------- 표준 라이브러리 ------------------------- #
@@ -13,17 +13,23 @@ import os
 from typing import Any, Dict, List, Optional, Tuple
 
 # ------------------------- 서드파티 라이브러리 ------------------------- #
-import psycopg2
 from psycopg2.extras import RealDictCursor
 from langchain_core.tools import tool
 from langchain_core.documents import Document
-from langchain_openai import OpenAIEmbeddings
 from langchain_postgres.vectorstores import PGVector
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
 from src.utils.config_loader import get_postgres_connection_string, get_db_config
+from src.database.vector_store import get_pgvector_store
+from src.database.db import get_cursor
+from src.database.embeddings import get_embedding_cache_stats
+from src.rag.ranking import fuse, get_fusion_settings
+from src.agent.speculative import run_or_take
+from src.agent.async_nodes import run_blocking
 from src.prompts import get_tool_prompt
 from src.llm.client import LLMClient
+from src.tools.multi_level import agenerate_levels
+from src.utils.tracing import span
 from langchain.schema import SystemMessage, HumanMessage
 
 
@@ -118,28 +124,18 @@ def _pg_conn_str() -> str:
 
 def _get_glossary_vectorstore() -> PGVector:
     """
-    용어집 전용 VectorStore 초기화
+    용어집 전용 VectorStore 반환 (프로세스 공유 레지스트리 사용)
 
     Returns:
         PGVector 인스턴스 (glossary_embeddings 컬렉션)
     """
-    # PostgreSQL 연결 문자열 가져오기
-    conn_str = _pg_conn_str()
-
     # 컬렉션명 가져오기 (환경변수 또는 기본값)
     collection = os.getenv("PGV_COLLECTION_GLOSSARY", "glossary_embeddings")
 
-    # Embeddings 초기화
-    embeddings = OpenAIEmbeddings(
-        model=os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
-    )
-
-    # PGVector VectorStore 생성
-    return PGVector(
+    # 공유 VectorStore 반환 (최초 호출 시에만 생성)
+    return get_pgvector_store(
         collection_name=collection,
-        embeddings=embeddings,
-        connection=conn_str,
-        use_jsonb=True,
+        connection_string=_pg_conn_str(),
     )
 
 
@@ -163,50 +159,63 @@ def _fetch_glossary_sql(
     Returns:
         검색 결과 리스트 (딕셔너리)
     """
-    # PostgreSQL 연결
-    conn = psycopg2.connect(_pg_conn_str())
+    # WHERE 절 조건 구성
+    where = []
+    params: List[Any] = []
 
-    try:
-        # WHERE 절 조건 구성
-        where = []
-        params: List[Any] = []
-
-        # 쿼리 필터 (term, definition, easy_explanation, hard_explanation에서 검색)
-        if query:
-            where.append("(term ILIKE %s OR definition ILIKE %s OR easy_explanation ILIKE %s OR hard_explanation ILIKE %s)")
-            like = f"%{query}%"
-            params.extend([like, like, like, like])
-
-        # 카테고리 필터
-        if category:
-            where.append("category = %s")
-            params.append(category)
-
-        # 난이도 필터
-        if difficulty:
-            where.append("difficulty_level = %s")
-            params.append(difficulty)
-
-        # SQL 쿼리 구성
-        sql = """
-            SELECT term_id, term, definition, easy_explanation, hard_explanation,
-                   category, difficulty_level, related_terms, examples, created_at, updated_at
-            FROM glossary
-        """
-        if where:
-            sql += " WHERE " + " AND ".join(where)
-        sql += " ORDER BY term_id ASC LIMIT %s"
-        params.append(limit)
-
-        # 쿼리 실행
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(sql, tuple(params))
-            rows = cur.fetchall()
-            return [dict(r) for r in rows]
-
-    finally:
-        # 연결 종료
-        conn.close()
+    # 쿼리 필터 (term, definition, easy_explanation, hard_explanation에서 검색)
+    if query:
+        where.append("(term ILIKE %s OR definition ILIKE %s OR easy_explanation ILIKE %s OR hard_explanation ILIKE %s)")
+        like = f"%{query}%"
+        params.extend([like, like, like, like])
+
+    # 카테고리 필터
+    if category:
+        where.append("category = %s")
+        params.append(category)
+
+    # 난이도 필터
+    if difficulty:
+        where.append("difficulty_level = %s")
+        params.append(difficulty)
+
+    # SQL 쿼리 구성
+    sql = """
+        SELECT term_id, term, definition, easy_explanation, hard_explanation,
+               category, difficulty_level, related_terms, examples, created_at, updated_at
+        FROM glossary
+    """
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY term_id ASC LIMIT %s"
+    params.append(limit)
+
+    # 쿼리 실행 (공용 연결 풀 사용)
+    with get_cursor(RealDictCursor) as cur:
+        cur.execute(sql, tuple(params))
+        rows = cur.fetchall()
+    return [dict(r) for r in rows]
+
+
+def _sql_match_score(query: Optional[str], term: Optional[str]) -> float:
+    """
+    SQL(ILIKE) 결과의 매칭 정도 점수 (순위 결합용, 높을수록 관련)
+
+    Args:
+        query: 검색 용어
+        term: 조회된 용어
+
+    Returns:
+        1.0: 용어 완전 일치 / 0.7: 용어에 검색어 포함 / 0.3: 정의·설명에서만 매칭
+    """
+    if not query or not term:
+        return 0.3
+    q, t = query.strip().lower(), term.strip().lower()
+    if q == t:
+        return 1.0
+    if q in t:
+        return 0.7
+    return 0.3
 
 
 # ==================== Vector 2차 조회 ==================== #
@@ -226,7 +235,9 @@ def _vector_search_glossary(query: str, k: int) -> List[Tuple[Document, float]]:
     vs = _get_glossary_vectorstore()
 
     # 유사도 검색 + 점수 반환
-    pairs = vs.similarity_search_with_score(query, k=k)
+    with span("pgvector.similarity_search", kind="client", collection="glossary", k=k) as search_span:
+        pairs = vs.similarity_search_with_score(query, k=k)
+        search_span.set_attribute("results", len(pairs))
 
     return pairs
 
@@ -345,7 +356,7 @@ def search_glossary(
     검색 방식:
     - SQL: PostgreSQL ILIKE + 필터
     - Vector: glossary_embeddings 컬렉션 유사도 검색
-    - hybrid: SQL + Vector 결과 병합 후 중복 제거
+    - hybrid: SQL + Vector 결과 중복 제거 후 순위 결합 (src/rag/ranking.fuse)
     """
     # ---------------------- 질문에서 핵심 용어 추출 ---------------------- #
     # "BLEU Score가 뭐야?" -> "BLEU Score"
@@ -372,6 +383,7 @@ def search_glossary(
                     "definition": md.get("definition"),
                     "explanation": _pick_explanation(md, difficulty),
                     "score": float(score) if with_scores else None,
+                    "_source": "vector",
                 }
                 items.append(row)
 
@@ -406,35 +418,67 @@ def search_glossary(
                 "definition": r.get("definition"),
                 "explanation": _pick_explanation(r, difficulty),
                 "score": None,
+                "_source": "sql",
             })
 
-    # ---------------------- 중복 제거 ---------------------- #
-    seen = set()
-    uniq: List[Dict[str, Any]] = []
+    # ---------------------- 중복 제거 + 순위 결합 ---------------------- #
+    # (term, definition) 조합을 문서 키로 사용, 벡터(distance)와 SQL(매칭 정도) 순위를 fuse()로 결합
+    by_key: Dict[Any, Dict[str, Any]] = {}
+    vector_branch: List[Tuple[Any, Optional[float]]] = []
+    sql_branch: List[Tuple[Any, Optional[float]]] = []
 
     for it in items:
-        # (term, definition) 조합으로 중복 체크
         key = (it.get("term"), it.get("definition"))
-        if key not in seen:
-            seen.add(key)
-            uniq.append(it)
+        source = it.pop("_source", "sql")
+        if source == "vector":
+            vector_branch.append((key, it.get("score")))
+        else:
+            sql_branch.append((key, _sql_match_score(query, it.get("term"))))
+        if key not in by_key:
+            by_key[key] = it
+
+    fusion_settings = get_fusion_settings("glossary")
+    fused = fuse(
+        {"vector": vector_branch, "keyword": sql_branch},
+        method=fusion_settings["method"],
+        weights=fusion_settings["weights"],
+        higher_is_better={"vector": False, "keyword": True},  # 벡터는 distance
+        rrf_k=fusion_settings["rrf_k"],
+    )
+    uniq: List[Dict[str, Any]] = [by_key[key] for key, _ in fused]
 
     # ---------------------- top_k 보장 및 포맷팅 ---------------------- #
     return _format_glossary_md(uniq[:top_k])
 
 
 # ==================== Agent 노드: 용어집 검색 ==================== #
-
-def glossary_node(state, exp_manager=None):
+def glossary_search_args(question: str, difficulty: str) -> Dict[str, Any]:
     """
-    Agent 노드: glossary 테이블에서 용어 정의 검색
+    glossary_node의 search_glossary 호출 인자 (라우팅 중 선행 검색과 공유)
 
     Args:
-        state (AgentState): Agent 상태
-        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+        question: 검색 쿼리
+        difficulty: 난이도 모드
 
     Returns:
-        AgentState: 업데이트된 상태
+        search_glossary.invoke() 인자 딕셔너리
+    """
+    return {
+        "query": question,                                # 검색 쿼리
+        "category": None,                                 # 카테고리 필터 없음
+        "difficulty": difficulty,                         # 난이도 모드
+        "mode": "hybrid",                                 # 하이브리드 검색
+        "top_k": 3,                                       # 최대 3개 결과
+        "with_scores": True,                              # 유사도 점수 포함
+    }
+
+
+def _start_glossary(state, exp_manager=None):
+    """
+    질문 / 난이도 추출 및 도구 로거 생성 (동기 / 비동기 노드 공통)
+
+    Returns:
+        tuple: (question, difficulty, tool_logger)
     """
     # -------------- 상태에서 질문 및 난이도 추출 -------------- #
     # ✅ refined_query 우선 사용 (Multi-turn 지원)
@@ -451,50 +495,57 @@ def glossary_node(state, exp_manager=None):
             tool_logger.write(f"용어집 노드 실행: {question}")
         tool_logger.write(f"난이도: {difficulty}")
 
-    # -------------- search_glossary 도구 호출 -------------- #
-    try:
-        # Langchain @tool 함수 호출
-        raw_results = search_glossary.invoke({
-            "query": question,                            # 검색 쿼리
-            "category": None,                             # 카테고리 필터 없음
-            "difficulty": difficulty,                     # 난이도 모드
-            "mode": "hybrid",                             # 하이브리드 검색
-            "top_k": 3,                                   # 최대 3개 결과
-            "with_scores": True,                          # 유사도 점수 포함
-        })
+    return question, difficulty, tool_logger
 
-        if tool_logger:
-            tool_logger.write(f"검색 결과: {len(raw_results)} 글자")
 
-        # -------------- pgvector 검색 기록 -------------- #
-        if exp_manager:
-            exp_manager.log_pgvector_search({
-                "tool": "glossary",
-                "collection": "glossary_embeddings",
-                "query_text": question,
-                "search_mode": "hybrid",
-                "top_k": 3,
-                "with_scores": True,
-                "result_length": len(raw_results)
-            })
+def _prepare_glossary_answer(state, question: str, difficulty: str, exp_manager=None, tool_logger=None):
+    """
+    용어집 검색 + 수준별 메시지 구성 / 프롬프트 저장 (동기 / 비동기 노드 공통, 블로킹 I/O)
 
-        # -------------- 두 수준의 답변 생성 -------------- #
-        level_mapping = {
-            "easy": ["elementary", "beginner"],
-            "hard": ["intermediate", "advanced"]
-        }
+    Returns:
+        tuple: (levels, level_messages, llm_client)
+    """
+    # -------------- search_glossary 도구 호출 -------------- #
+    # Langchain @tool 함수 호출 (라우팅 중 같은 인자로 선행 검색했으면 결과 재사용)
+    search_args = glossary_search_args(question, difficulty)
+    raw_results = run_or_take(
+        state, "glossary", search_args,
+        lambda: search_glossary.invoke(search_args),
+        tool_logger=tool_logger,
+    )
 
-        levels = level_mapping.get(difficulty, ["beginner", "intermediate"])
-        final_answers = {}
+    if tool_logger:
+        tool_logger.write(f"검색 결과: {len(raw_results)} 글자")
+
+    # -------------- pgvector 검색 기록 -------------- #
+    if exp_manager:
+        exp_manager.log_pgvector_search({
+            "tool": "glossary",
+            "collection": "glossary_embeddings",
+            "query_text": question,
+            "search_mode": "hybrid",
+            "top_k": 3,
+            "with_scores": True,
+            "result_length": len(raw_results)
+        })
+        exp_manager.save_embedding_cache_stats(get_embedding_cache_stats())
 
-        # 난이도별 LLM 초기화 (공통)
-        llm_client = LLMClient.from_difficulty(
-            difficulty=difficulty,
-            logger=exp_manager.logger if exp_manager else None
-        )
+    # -------------- 두 수준의 답변 생성 준비 -------------- #
+    level_mapping = {
+        "easy": ["elementary", "beginner"],
+        "hard": ["intermediate", "advanced"]
+    }
+
+    levels = level_mapping.get(difficulty, ["beginner", "intermediate"])
 
-        # 사용자 프롬프트 (공통)
-        user_content = f"""[용어집 검색 결과]
+    # 난이도별 LLM 초기화 (공통)
+    llm_client = LLMClient.from_difficulty(
+        difficulty=difficulty,
+        logger=exp_manager.logger if exp_manager else None
+    )
+
+    # 사용자 프롬프트 (공통)
+    user_content = f"""[용어집 검색 결과]
 {raw_results}
 
 [질문]
@@ -502,64 +553,136 @@ def glossary_node(state, exp_manager=None):
 
 위 검색 결과를 바탕으로 질문에 답변해주세요."""
 
-        # 각 수준별로 답변 생성
-        for level in levels:
-            if tool_logger:
-                tool_logger.write(f"수준 '{level}' 답변 생성 시작")
+    # 수준별 메시지 구성 및 프롬프트 저장
+    level_messages = {}
+    for level in levels:
+        # JSON 프롬프트 로드
+        system_prompt = get_tool_prompt("glossary", level)
+
+        # 메시지 구성
+        level_messages[level] = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_content)
+        ]
 
-            # JSON 프롬프트 로드
-            system_prompt = get_tool_prompt("glossary", level)
-
-            # 메시지 구성
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_content)
-            ]
-
-            # 프롬프트 저장
-            if exp_manager:
-                exp_manager.save_system_prompt(system_prompt, {
-                    "tool": "glossary",
-                    "difficulty": difficulty,
-                    "level": level
-                })
-                final_prompt = f"""[SYSTEM PROMPT - {level}]
+        # 프롬프트 저장
+        if exp_manager:
+            exp_manager.save_system_prompt(system_prompt, {
+                "tool": "glossary",
+                "difficulty": difficulty,
+                "level": level
+            })
+            final_prompt = f"""[SYSTEM PROMPT - {level}]
 {system_prompt}
 
 [USER PROMPT]
 {user_content}"""
-                exp_manager.save_final_prompt(final_prompt, {
-                    "tool": "glossary",
-                    "difficulty": difficulty,
-                    "level": level
-                })
+            exp_manager.save_final_prompt(final_prompt, {
+                "tool": "glossary",
+                "difficulty": difficulty,
+                "level": level
+            })
 
-            # LLM 호출
-            response = llm_client.llm.invoke(messages)
-            final_answers[level] = response.content
+    return levels, level_messages, llm_client
+
+
+def _finish_glossary_answer(state, final_answers, levels, tool_logger=None):
+    """수준별 답변 로깅 및 상태 저장 (동기 / 비동기 노드 공통)"""
+    if tool_logger:
+        for level in levels:
+            content = final_answers[level]
+            tool_logger.write(f"수준 '{level}' 답변 생성 완료: {len(content)} 글자")
+            tool_logger.write("=" * 80)
+            tool_logger.write(f"[{level} 답변 전체 내용]")
+            tool_logger.write(content)
+            tool_logger.write("=" * 80)
+        tool_logger.close()
+
+    # -------------- 최종 답변 저장 -------------- #
+    state["final_answers"] = final_answers
+    state["final_answer"] = final_answers[levels[1]]
+    return state
+
+
+def _fail_glossary_answer(state, error: Exception, tool_logger=None):
+    """용어집 검색 / 답변 생성 예외 처리 (동기 / 비동기 노드 공통)"""
+    if tool_logger:
+        tool_logger.write(f"용어집 검색 실패: {error}")
+        tool_logger.close()
+
+    # 에러 메시지 저장
+    state["final_answer"] = f"용어집 검색 오류: {str(error)}"
+    return state
+
+
+def glossary_node(state, exp_manager=None):
+    """
+    Agent 노드: glossary 테이블에서 용어 정의 검색
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        AgentState: 업데이트된 상태
+    """
+    question, difficulty, tool_logger = _start_glossary(state, exp_manager)
 
-            # 로깅
+    try:
+        levels, level_messages, llm_client = _prepare_glossary_answer(
+            state, question, difficulty, exp_manager, tool_logger
+        )
+
+        # 각 수준별로 답변 생성 (순차)
+        final_answers = {}
+        for level in levels:
             if tool_logger:
-                tool_logger.write(f"수준 '{level}' 답변 생성 완료: {len(response.content)} 글자")
-                tool_logger.write("=" * 80)
-                tool_logger.write(f"[{level} 답변 전체 내용]")
-                tool_logger.write(response.content)
-                tool_logger.write("=" * 80)
+                tool_logger.write(f"수준 '{level}' 답변 생성 시작")
 
-        if tool_logger:
-            tool_logger.close()
+            # LLM 호출
+            response = llm_client.llm.invoke(level_messages[level])
+            final_answers[level] = response.content
 
-        # -------------- 최종 답변 저장 -------------- #
-        state["final_answers"] = final_answers
-        state["final_answer"] = final_answers[levels[1]]
+        return _finish_glossary_answer(state, final_answers, levels, tool_logger)
 
     except Exception as e:
+        return _fail_glossary_answer(state, e, tool_logger)
+
+
+async def glossary_node_async(state, exp_manager=None):
+    """
+    Agent 노드 (비동기 그래프용): 검색은 공용 스레드 풀, 수준별 답변은 llm.ainvoke로 동시 생성
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        AgentState: 업데이트된 상태
+    """
+    question, difficulty, tool_logger = _start_glossary(state, exp_manager)
+
+    try:
+        levels, level_messages, llm_client = await run_blocking(
+            _prepare_glossary_answer, state, question, difficulty, exp_manager, tool_logger
+        )
+
         if tool_logger:
-            tool_logger.write(f"용어집 검색 실패: {e}")
-            tool_logger.close()
+            tool_logger.write(f"수준별 답변 동시 생성 시작: {', '.join(levels)}")
+
+        async def answer(level):
+            response = await llm_client.llm.ainvoke(level_messages[level])
+            return response.content
+
+        final_answers = await agenerate_levels(
+            levels,
+            answer,
+            state=state,
+            tool_name="glossary",
+            primary=levels[1],
+        )
 
-        # 에러 메시지 저장
-        state["final_answer"] = f"용어집 검색 오류: {str(e)}"
+        return _finish_glossary_answer(state, final_answers, levels, tool_logger)
 
-    # -------------- 업데이트된 상태 반환 -------------- #
-    return state
+    except Exception as e:
+        return _fail_glossary_answer(state, e, tool_logger)
@@ -0,0 +1,276 @@
+# src/tools/multi_level.py
+"""
+수준별 답변 동시 생성 모듈
+
+general_answer_node / summarize_node는 두 수준(elementary+beginner, intermediate+advanced)의
+답변을 만들며, 수준별 LLM 호출은 서로 독립적입니다.
+순차 호출 대신 공용 스레드 풀에서 동시에 실행하고 수준별 타임아웃을 적용합니다.
+
+- 주 수준(primary, 기본: final_answer에 들어가는 두 번째 수준)의 결과를 먼저 반환
+  → on_result 콜백으로 UI가 주 수준을 먼저 렌더링 가능
+- 수준별 소요 시간 / 상태는 tool_timeline의 "level_answer" 이벤트로 기록
+- 비동기 그래프(ainvoke)에서는 agenerate_levels로 스레드 없이 동시 실행
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 multi_level 섹션이 없을 때 사용
+DEFAULT_MULTI_LEVEL_CONFIG = {
+    "enabled": True,                                # false면 기존처럼 순차 생성
+    "max_workers": 4,                               # 프로세스 공용 동시 LLM 호출 수
+    "level_timeout_seconds": 120,                   # 수준별 최대 대기 시간 (초)
+}
+
+
+def _load_multi_level_config() -> Dict[str, Any]:
+    """
+    수준별 동시 생성 설정 로드 (기본값과 병합)
+
+    Returns:
+        수준별 동시 생성 설정 딕셔너리
+    """
+    config = dict(DEFAULT_MULTI_LEVEL_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("multi_level", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+# ==================== 공용 스레드 풀 ==================== #
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """수준별 답변 생성용 스레드 풀 (최초 호출 시 생성, 전체 동시 호출 수 제한)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(_load_multi_level_config()["max_workers"]),
+                    thread_name_prefix="multi-level",
+                )
+    return _executor
+
+
+# ==================== 수준별 실행 ==================== #
+def _timed_call(fn: Callable[[str], str], level: str) -> Dict[str, Any]:
+    """워커 스레드 본체: 수준별 생성 + 소요 시간 측정"""
+    started = time.perf_counter()
+    content = fn(level)
+    return {"content": content, "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+def iter_level_results(
+    levels: List[str],
+    fn: Callable[[str], str],
+    primary: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    수준별 생성 함수를 동시에 실행하고 주 수준 결과부터 순서대로 반환
+
+    Args:
+        levels: 생성할 수준 목록
+        fn: 수준 → 답변 텍스트 (예외 발생 시 해당 수준 status="error")
+        primary: 먼저 반환할 수준 (None이면 levels[-1])
+        timeout_seconds: 수준별 최대 대기 시간 (None이면 설정값)
+
+    Yields:
+        dict: {
+            "level": 수준,
+            "content": 답변 텍스트 (실패 / 타임아웃 시 None),
+            "status": "success" | "timeout" | "error",
+            "elapsed_ms": 소요 시간 (ms),
+            "error": 예외 (성공 시 None),
+        }
+    """
+    config = _load_multi_level_config()
+    timeout = float(timeout_seconds if timeout_seconds is not None else config["level_timeout_seconds"])
+    primary = primary if primary in levels else levels[-1]
+    ordered = [primary] + [level for level in levels if level != primary]
+
+    # -------------- 비활성화 / 단일 수준: 순차 실행 -------------- #
+    if not config.get("enabled", True) or len(levels) == 1:
+        for level in ordered:
+            started = time.perf_counter()
+            try:
+                result = _timed_call(fn, level)
+                yield {"level": level, "status": "success", "error": None, **result}
+            except Exception as e:
+                elapsed = round((time.perf_counter() - started) * 1000, 1)
+                yield {"level": level, "content": None, "status": "error", "elapsed_ms": elapsed, "error": e}
+        return
+
+    # -------------- 동시 실행 -------------- #
+    executor = _get_executor()
+    started = time.perf_counter()
+    # 워커마다 호출 스레드의 컨텍스트 복사 → LangChain 콜백 / LangGraph 토큰 스트리밍 유지
+    futures = {
+        level: executor.submit(contextvars.copy_context().run, _timed_call, fn, level)
+        for level in ordered
+    }
+
+    for level in ordered:
+        # 수준별 타임아웃은 제출 시점 기준 (앞 수준 대기 시간 포함)
+        remaining = max(0.0, timeout - (time.perf_counter() - started))
+        try:
+            result = futures[level].result(timeout=remaining)
+            yield {"level": level, "status": "success", "error": None, **result}
+        except FutureTimeoutError as e:
+            futures[level].cancel()
+            yield {
+                "level": level,
+                "content": None,
+                "status": "timeout",
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "error": e,
+            }
+        except Exception as e:
+            yield {
+                "level": level,
+                "content": None,
+                "status": "error",
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "error": e,
+            }
+
+
+def _record_level_event(state: Optional[Dict[str, Any]], tool_name: str, result: Dict[str, Any]):
+    """수준별 결과를 tool_timeline의 "level_answer" 이벤트로 기록"""
+    if state is None:
+        return
+    timeline = state.get("tool_timeline", [])
+    timeline.append({
+        "timestamp": datetime.now().isoformat(),
+        "event": "level_answer",
+        "tool": tool_name,
+        "level": result["level"],
+        "status": result["status"],
+        "elapsed_ms": result["elapsed_ms"],
+        "description": f"수준 '{result['level']}' 답변 {result['status']} ({result['elapsed_ms']:.0f}ms)",
+    })
+    state["tool_timeline"] = timeline
+
+
+def _collect_answers(results: Dict[str, Dict[str, Any]], levels: List[str], primary: Optional[str]) -> Dict[str, str]:
+    """수준별 결과 → {수준: 답변} (모두 실패 시 예외)"""
+    if all(r["status"] != "success" for r in results.values()):
+        first = results[primary if primary in results else levels[-1]]
+        if first["status"] == "timeout":
+            raise TimeoutError(f"수준별 답변 생성 시간 초과: {', '.join(levels)}")
+        raise first["error"]
+
+    answers: Dict[str, str] = {}
+    for level in levels:
+        result = results[level]
+        if result["status"] == "success":
+            answers[level] = result["content"]
+        elif result["status"] == "timeout":
+            answers[level] = f"'{level}' 수준 답변 생성 시간이 초과되었습니다."
+        else:
+            answers[level] = f"'{level}' 수준 답변 생성 중 오류 발생: {result['error']}"
+    return answers
+
+
+def generate_levels(
+    levels: List[str],
+    fn: Callable[[str], str],
+    state: Optional[Dict[str, Any]] = None,
+    tool_name: str = "",
+    primary: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, str]:
+    """
+    수준별 답변 동시 생성 (tool_timeline 기록 포함)
+
+    Args:
+        levels: 생성할 수준 목록 (반환 딕셔너리 키 순서)
+        fn: 수준 → 답변 텍스트
+        state: AgentState (주어지면 tool_timeline에 수준별 이벤트 추가)
+        tool_name: 타임라인에 기록할 도구 이름
+        primary: 먼저 완료 처리할 수준 (None이면 levels[-1])
+        timeout_seconds: 수준별 최대 대기 시간 (None이면 설정값)
+        on_result: 수준 결과가 나올 때마다 호출 (주 수준 먼저, 선택 사항)
+
+    Returns:
+        {수준: 답변} (levels 순서, 실패 / 타임아웃 수준은 안내 문구)
+
+    Raises:
+        Exception: 모든 수준이 실패한 경우 첫 번째 오류
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for result in iter_level_results(levels, fn, primary=primary, timeout_seconds=timeout_seconds):
+        results[result["level"]] = result
+        _record_level_event(state, tool_name, result)
+        if on_result:
+            on_result(result)
+
+    return _collect_answers(results, levels, primary)
+
+
+async def agenerate_levels(
+    levels: List[str],
+    afn: Callable[[str], Awaitable[str]],
+    state: Optional[Dict[str, Any]] = None,
+    tool_name: str = "",
+    primary: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, str]:
+    """
+    generate_levels의 비동기 버전 (스레드 없이 이벤트 루프에서 동시 실행)
+
+    Args:
+        levels: 생성할 수준 목록
+        afn: 수준 → 답변 텍스트 (async def, 예: llm.ainvoke)
+        state / tool_name / primary / timeout_seconds / on_result: generate_levels와 동일
+
+    Returns:
+        {수준: 답변} (levels 순서)
+    """
+    timeout = float(
+        timeout_seconds if timeout_seconds is not None else _load_multi_level_config()["level_timeout_seconds"]
+    )
+    primary = primary if primary in levels else levels[-1]
+    ordered = [primary] + [level for level in levels if level != primary]
+    started = time.perf_counter()
+
+    async def run(level: str) -> Dict[str, Any]:
+        try:
+            content = await asyncio.wait_for(afn(level), timeout=timeout)
+            status, error = "success", None
+        except asyncio.TimeoutError as e:
+            content, status, error = None, "timeout", e
+        except Exception as e:
+            content, status, error = None, "error", e
+        elapsed = round((time.perf_counter() - started) * 1000, 1)
+        return {"level": level, "content": content, "status": status, "elapsed_ms": elapsed, "error": error}
+
+    tasks = {level: asyncio.ensure_future(run(level)) for level in ordered}
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for level in ordered:
+        result = await tasks[level]
+        results[level] = result
+        _record_level_event(state, tool_name, result)
+        if on_result:
+            on_result(result)
+
+    return _collect_answers(results, levels, primary)
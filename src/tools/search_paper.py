@@ -2,49 +2,57 @@
 # 📘 RAG 논문 검색 도구 모듈 + Agent 노드 통합
 # ------------------------------------------
 # - @tool: search_paper_database
-# - Agent 노드: search_paper_node
+# - Agent 노드: search_paper_node (동기) / search_paper_node_async (비동기 그래프: llm.ainvoke)
 # - 검색 모드 선택 (similarity/MMR), MultiQuery 옵션
 # - 메타데이터 필터(year/author/category)
 # - PostgreSQL 메타 조회 → 결과 합성 → Markdown 반환
 # ==========================================
 
+import contextvars
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
 from langchain_core.tools import tool
 from langchain_core.documents import Document
 from langchain.schema import SystemMessage, HumanMessage
 
 from src.rag.retriever import RAGRetriever
+from src.rag.ranking import fuse, get_fusion_settings
+from src.database.db import get_cursor
+from src.database.embeddings import get_embedding_cache_stats
+from src.database.vector_store import statement_timeout
+from src.agent.streaming import answer_stream_config
+from src.agent.async_nodes import run_blocking
+from src.agent.speculative import run_or_take
 from src.prompts import get_tool_prompt
 from src.llm.client import LLMClient
+from src.tools.multi_level import agenerate_levels
+from src.utils.tracing import span
 
 
-# ==================== 내부 유틸: 환경/DB ==================== #
+# 키워드 매칭을 관련 근거로 인정하는 최소 keyword_score (ts_rank_cd 정규화 값)
+# - rag.hybrid_search.min_keyword_score로 덮어씀
+# - 키워드를 OR로 묶으므로 흔한 단어 하나만 스쳐도 매칭됨 → 초록 1회 등장(≈0.29)은 제외,
+#   제목 매칭(≈0.5) / 초록 2회 이상(≈0.44)만 인정
+DEFAULT_MIN_KEYWORD_SCORE = 0.4
 
-def _env(primary: str, alt: str, default: Optional[str] = None) -> Optional[str]:
-    """환경 변수 조회 (우선순위: primary > alt > default)"""
-    return os.getenv(primary) or os.getenv(alt) or default
 
+# ==================== 내부 유틸: DB ==================== #
 
-def _pg_conn_str() -> str:
-    """PostgreSQL 연결 문자열 생성"""
-    user = _env("POSTGRES_USER", "PGUSER", "postgres")
-    password = _env("POSTGRES_PASSWORD", "PGPASSWORD", "postgres")
-    host = _env("POSTGRES_HOST", "PGHOST", "localhost")
-    port = _env("POSTGRES_PORT", "PGPORT", "5432")
-    db = _env("POSTGRES_DB", "PGDATABASE", "papers")
-    return f"postgresql://{user}:{password}@{host}:{port}/{db}"
-
-
-def _fetch_paper_meta(paper_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+def _fetch_paper_meta(
+    paper_ids: List[int],
+    statement_timeout_ms: Optional[int] = None,
+) -> Dict[int, Dict[str, Any]]:
     """
     papers 테이블에서 ID 목록에 해당하는 메타데이터를 일괄 조회.
 
     Args:
         paper_ids: 논문 ID 리스트
+        statement_timeout_ms: SQL 실행 제한 (ms, 미지정 시 db_config.yaml 기본값)
 
     Returns:
         Dict[int, Dict[str, Any]]: {paper_id: {title, authors, ...}}
@@ -52,32 +60,48 @@ def _fetch_paper_meta(paper_ids: List[int]) -> Dict[int, Dict[str, Any]]:
     if not paper_ids:
         return {}
 
-    conn = psycopg2.connect(_pg_conn_str())
+    with get_cursor(RealDictCursor, statement_timeout_ms=statement_timeout_ms) as cur:
+        cur.execute(
+            """
+            SELECT paper_id, title, authors, publish_date, url, category, citation_count
+            FROM papers
+            WHERE paper_id = ANY(%s)
+            """,
+            (paper_ids,),
+        )
+        rows = cur.fetchall()
+
+    out: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        out[row["paper_id"]] = dict(row)
+    return out
+
+
+def _as_paper_id(pid: Any) -> Optional[int]:
+    """
+    청크 메타데이터의 paper_id를 int로 정규화 (str로 저장된 경우 포함).
+
+    Args:
+        pid: paper_id 원본 값
+
+    Returns:
+        Optional[int]: 변환된 paper_id (변환 불가 시 None)
+    """
+    if isinstance(pid, int):
+        return pid
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT paper_id, title, authors, publish_date, url, category, citation_count
-                FROM papers
-                WHERE paper_id = ANY(%s)
-                """,
-                (paper_ids,),
-            )
-            rows = cur.fetchall()
-            out: Dict[int, Dict[str, Any]] = {}
-            for row in rows:
-                out[row["paper_id"]] = dict(row)
-            return out
-    finally:
-        conn.close()
+        return int(pid)
+    except (TypeError, ValueError):
+        return None
 
 
-def _format_markdown(results: List[Dict[str, Any]]) -> str:
+def _format_markdown(results: List[Dict[str, Any]], min_keyword_score: float = DEFAULT_MIN_KEYWORD_SCORE) -> str:
     """
     검색 결과를 Markdown 문자열로 변환.
 
     Args:
         results: 검색 결과 리스트
+        min_keyword_score: 키워드 매칭을 관련 근거로 인정하는 최소 keyword_score
 
     Returns:
         str: Markdown 형식의 문자열
@@ -85,18 +109,21 @@ def _format_markdown(results: List[Dict[str, Any]]) -> str:
     if not results:
         return "관련 논문을 찾을 수 없습니다."
 
-    # ✅ 유사도 점수 검증: 최소 하나의 결과가 임계값 이하(유사도 높음)여야 함
+    # ✅ 관련성 검증: 최소 하나의 결과가 아래 조건 중 하나를 만족해야 함
+    # - 벡터 distance가 임계값 이하 (유사도 높음)
+    # - 키워드(전문 검색) 점수가 min_keyword_score 이상
+    #   (키워드를 OR로 묶으므로 단순 매칭 여부만으로는 거의 모든 질문이 통과함)
+    # - distance 정보가 아예 없음 (with_scores=False / 필터 검색 → 판단 불가, 통과)
     SIMILARITY_THRESHOLD = 0.5  # distance 기준 (낮을수록 유사, pgvector cosine distance)
-    has_relevant_result = False
+    distances = [r["score"] for r in results if r.get("score") is not None]
 
-    for r in results:
-        score = r.get("score")
-        # score가 None이 아니고 임계값 이하(유사도 높음)인 경우
-        if score is not None and score <= SIMILARITY_THRESHOLD:
-            has_relevant_result = True
-            break
+    has_relevant_result = (
+        not distances
+        or any(dist <= SIMILARITY_THRESHOLD for dist in distances)
+        or any((r.get("keyword_score") or 0.0) >= min_keyword_score for r in results)
+    )
 
-    # 모든 결과의 유사도가 낮으면 (score가 모두 임계값 초과) 실패 처리
+    # 모든 결과의 유사도가 낮으면 실패 처리
     if not has_relevant_result:
         return "관련 논문을 찾을 수 없습니다."
 
@@ -111,7 +138,10 @@ def _format_markdown(results: List[Dict[str, Any]]) -> str:
         lines.append(f"- **인용수**: {r.get('citation_count','')}")
         lines.append(f"- **URL**: {r.get('url','')}")
         lines.append(f"- **섹션**: {r.get('section','본문')}")
-        lines.append(f"- **유사도 점수(낮을수록 유사)**: {score_str}\n")
+        lines.append(f"- **유사도 점수(낮을수록 유사)**: {score_str}")
+        if r.get("fused_score") is not None:
+            lines.append(f"- **하이브리드 점수(높을수록 관련)**: {r['fused_score']:.4f}")
+        lines.append("")
 
         preview = (r.get("content") or "")[:600]
         if preview:
@@ -143,22 +173,21 @@ def _build_filter(year_gte: Optional[int], author: Optional[str], category: Opti
     return f
 
 
-def _keyword_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+def _extract_keywords(query: str) -> List[str]:
     """
-    PostgreSQL Full-Text Search로 키워드 검색.
+    질문에서 영어 키워드 추출.
+
+    1. 괄호 안의 영어 구문 (예: "RAG (Retrieval-Augmented Generation)" → "Retrieval-Augmented Generation")
+    2. 3글자 이상 영어 단어 (한글 조사가 붙은 경우도 인식: "RAG란" → "RAG")
 
     Args:
         query: 검색 질문
-        top_k: 반환할 결과 수
 
     Returns:
-        List[Dict[str, Any]]: 키워드 검색 결과 (paper_id, title, abstract, score)
+        List[str]: 중복 제거된 키워드 리스트 (추출 순서 유지)
     """
     import re
 
-    # 쿼리 전처리: 영어 키워드 추출
-    # 1. 괄호 안의 영어 우선 사용 (예: "RAG (Retrieval-Augmented Generation)" → "Retrieval-Augmented Generation")
-    # 2. 없으면 영어 단어들 추출
     english_keywords = []
 
     # 괄호 안의 영어 추출
@@ -166,12 +195,123 @@ def _keyword_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
     if paren_match:
         english_keywords.append(paren_match.group(1).strip())
 
-    # 영어 단어 추출 (3글자 이상)
-    words = re.findall(r'\b[A-Za-z]{3,}(?:-[A-Za-z]+)*\b', query)
+    # 영어 단어 추출 (3글자 이상, 앞뒤가 영문자가 아니면 경계로 인정)
+    words = re.findall(r'(?<![A-Za-z])[A-Za-z]{3,}(?:-[A-Za-z]+)*(?![A-Za-z])', query)
     english_keywords.extend(words)
 
     # 중복 제거 및 공백 제거
-    english_keywords = list(dict.fromkeys([k.strip() for k in english_keywords if k.strip()]))
+    return list(dict.fromkeys([k.strip() for k in english_keywords if k.strip()]))
+
+
+def _row_to_keyword_result(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """키워드 검색 결과 row → dict 변환."""
+    return {
+        "paper_id": row[0],
+        "title": row[1],
+        "abstract": row[2],
+        "authors": row[3],
+        "publish_date": row[4],
+        "category": row[5],
+        "citation_count": row[6],
+        "url": row[7],
+        "keyword_score": float(row[8]),
+    }
+
+
+def _build_tsquery_sql(keywords: List[str]) -> str:
+    """
+    키워드별 plainto_tsquery를 OR(||)로 결합한 tsquery SQL 식 생성.
+
+    키워드 값은 %s 자리표시자로만 전달 (SQL에 직접 삽입하지 않음).
+
+    Args:
+        keywords: 검색 키워드 리스트 (1개 이상)
+
+    Returns:
+        str: tsquery SQL 식 (자리표시자 수 = 키워드 수)
+    """
+    return " || ".join(["plainto_tsquery('english', %s)"] * len(keywords))
+
+
+def _keyword_search(
+    query: str,
+    top_k: int = 5,
+    statement_timeout_ms: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    PostgreSQL Full-Text Search로 키워드 검색.
+
+    papers.search_vector(title 가중치 A + abstract 가중치 B, GIN 인덱스)에 대해
+    추출된 모든 키워드를 OR로 묶은 tsquery를 실행하고 ts_rank_cd로 순위화.
+    keyword_score는 ts_rank_cd 정규화 값(0~1, normalization=32)이다.
+
+    search_vector 컬럼이 없으면(마이그레이션 미적용) ILIKE 검색으로 폴백.
+
+    Args:
+        query: 검색 질문
+        top_k: 반환할 결과 수
+        statement_timeout_ms: SQL 실행 제한 (ms, 미지정 시 db_config.yaml 기본값)
+
+    Returns:
+        List[Dict[str, Any]]: 키워드 검색 결과 (paper_id, title, abstract, keyword_score 등)
+    """
+    import psycopg2.errors
+
+    keywords = _extract_keywords(query) or [query]
+    tsquery_sql = _build_tsquery_sql(keywords)
+
+    sql = f"""
+    WITH q AS (SELECT {tsquery_sql} AS query)
+    SELECT
+        p.paper_id,
+        p.title,
+        p.abstract,
+        p.authors,
+        p.publish_date,
+        p.category,
+        p.citation_count,
+        p.url,
+        ts_rank_cd(p.search_vector, q.query, 32) AS keyword_score
+    FROM papers p, q
+    WHERE p.search_vector @@ q.query
+    ORDER BY keyword_score DESC, p.citation_count DESC NULLS LAST
+    LIMIT %s
+    """
+
+    try:
+        with get_cursor(statement_timeout_ms=statement_timeout_ms) as cursor:
+            cursor.execute(sql, (*keywords, top_k))
+            rows = cursor.fetchall()
+        return [_row_to_keyword_result(row) for row in rows]
+
+    except psycopg2.errors.UndefinedColumn:
+        # database/migrations/001_papers_search_vector.sql 미적용 환경
+        return _keyword_search_ilike(query, top_k, statement_timeout_ms)
+
+    except Exception as e:
+        return []
+
+
+def _keyword_search_ilike(
+    query: str,
+    top_k: int = 5,
+    statement_timeout_ms: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    ILIKE 기반 키워드 검색 (search_vector 컬럼이 없는 DB용 폴백).
+
+    가장 긴 키워드 하나로 title(2.0) / abstract(1.0) 부분일치 점수를 계산하고
+    _keyword_search와 같은 0~1 범위가 되도록 3.0으로 나눈다.
+
+    Args:
+        query: 검색 질문
+        top_k: 반환할 결과 수
+        statement_timeout_ms: SQL 실행 제한 (ms)
+
+    Returns:
+        List[Dict[str, Any]]: 키워드 검색 결과
+    """
+    english_keywords = _extract_keywords(query)
 
     if not english_keywords:
         # 영어가 없으면 원본 쿼리 사용
@@ -180,11 +320,7 @@ def _keyword_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         # 가장 긴 키워드 우선 사용 (더 구체적)
         search_query = max(english_keywords, key=len)
 
-    conn = psycopg2.connect(_pg_conn_str())
     try:
-        cursor = conn.cursor()
-
-        # PostgreSQL Full-Text Search (title, abstract)
         sql = """
         SELECT
             paper_id,
@@ -204,7 +340,7 @@ def _keyword_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
                     WHEN abstract ILIKE %s THEN 1.0
                     ELSE 0.0
                 END
-            ) AS keyword_score
+            ) / 3.0 AS keyword_score
         FROM papers
         WHERE title ILIKE %s OR abstract ILIKE %s
         ORDER BY keyword_score DESC, citation_count DESC
@@ -212,29 +348,122 @@ def _keyword_search(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
 
         search_pattern = f"%{search_query}%"
-        cursor.execute(sql, (search_pattern, search_pattern, search_pattern, search_pattern, top_k))
-
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                "paper_id": row[0],
-                "title": row[1],
-                "abstract": row[2],
-                "authors": row[3],
-                "publish_date": row[4],
-                "category": row[5],
-                "citation_count": row[6],
-                "url": row[7],
-                "keyword_score": float(row[8]),
-            })
+        with get_cursor(statement_timeout_ms=statement_timeout_ms) as cursor:
+            cursor.execute(sql, (search_pattern, search_pattern, search_pattern, search_pattern, top_k))
+            rows = cursor.fetchall()
 
-        cursor.close()
-        return results
+        return [_row_to_keyword_result(row) for row in rows]
 
     except Exception as e:
         return []
-    finally:
-        conn.close()
+
+
+# ==================== 병렬 검색 브랜치 실행 ==================== #
+
+# 브랜치 병렬 실행용 공용 스레드 풀 (요청마다 생성하지 않음)
+_BRANCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="search_paper")
+
+# 브랜치별 기본 마감 시간 (초) - rag.hybrid_search.parallel.branch_timeouts로 덮어씀
+DEFAULT_BRANCH_TIMEOUTS = {"vector": 20.0, "keyword": 5.0, "metadata": 5.0}
+
+# 마지막 검색의 브랜치별 실행 기록 (스레드별 보관, search_paper_node에서 로깅)
+_last_search = threading.local()
+
+
+def get_last_branch_timings() -> Dict[str, Dict[str, Any]]:
+    """
+    현재 스레드에서 마지막으로 실행한 search_paper_database의 브랜치별 실행 기록 반환
+
+    vector 브랜치 시간에는 이어서 실행되는 metadata 조회 시간이 포함됨
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {branch: {"elapsed_ms", "status", "count"}}
+    """
+    return dict(getattr(_last_search, "timings", {}))
+
+
+def _timed(name: str, fn: Callable[[], Any], timings: Dict[str, Dict[str, Any]]) -> Any:
+    """
+    브랜치 함수 실행 + 소요 시간/상태 기록 (예외는 그대로 전달)
+
+    Args:
+        name: 브랜치명
+        fn: 실행할 함수
+        timings: 기록 대상 딕셔너리
+
+    Returns:
+        fn의 반환값
+    """
+    start = time.perf_counter()
+    try:
+        with span(f"search_paper.{name}"):
+            result = fn()
+        timings[name] = {"elapsed_ms": round((time.perf_counter() - start) * 1000, 1), "status": "ok"}
+        return result
+    except Exception as e:
+        timings[name] = {
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            "status": "error",
+            "error": str(e),
+        }
+        raise
+
+
+def _run_branches(
+    branches: Dict[str, Callable[[], Any]],
+    timeouts: Dict[str, float],
+    parallel: bool,
+    timings: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    검색 브랜치 실행 (병렬 모드에서는 브랜치별 마감 시간 적용)
+
+    - 마감 시간을 넘긴 브랜치는 결과를 None으로 처리하고 나머지 결과로 진행
+      (아직 시작 전이면 취소, 실행 중이면 브랜치 안의 SQL 실행 제한으로 종료됨)
+    - 실패한 브랜치도 None으로 처리 (검색 전체를 실패시키지 않음)
+
+    Args:
+        branches: {브랜치명: 실행 함수}
+        timeouts: {브랜치명: 마감 시간(초)}
+        parallel: True면 공용 스레드 풀에서 동시 실행
+        timings: 브랜치별 실행 기록 (갱신됨)
+
+    Returns:
+        Dict[str, Any]: {브랜치명: 결과 또는 None}
+    """
+    results: Dict[str, Any] = {}
+
+    if not parallel:
+        for name, fn in branches.items():
+            try:
+                results[name] = _timed(name, fn, timings)
+            except Exception:
+                results[name] = None
+        return results
+
+    start = time.perf_counter()
+    futures = {
+        name: _BRANCH_EXECUTOR.submit(contextvars.copy_context().run, _timed, name, fn, timings)
+        for name, fn in branches.items()
+    }
+
+    for name, future in futures.items():
+        # 브랜치 마감 시각 = 팬아웃 시작 + 브랜치 timeout
+        remaining = timeouts.get(name, 10.0) - (time.perf_counter() - start)
+        try:
+            results[name] = future.result(timeout=max(remaining, 0.0))
+        except FutureTimeoutError:
+            # 풀 대기 중인 브랜치는 공용 스레드를 차지하지 않도록 취소
+            future.cancel()
+            results[name] = None
+            timings[name] = {
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+                "status": "timeout",
+            }
+        except Exception:
+            results[name] = None
+
+    return results
 
 
 # ==================== @tool: 논문 검색 ==================== #
@@ -251,6 +480,7 @@ def search_paper_database(
     search_mode: str = "mmr",  # "similarity" | "mmr"
     use_hybrid: bool = True,   # 하이브리드 검색 사용 여부
     tool_name: str = "search_paper",  # 도구명 (가중치 조정용)
+    parallel: Optional[bool] = None,  # 브랜치 병렬 실행 (None이면 config 사용)
 ) -> str:
     """
     논문 VectorDB + PostgreSQL 메타데이터를 함께 조회하여 결과를 반환.
@@ -278,6 +508,8 @@ def search_paper_database(
         하이브리드 검색 사용 여부
     tool_name : str
         도구명 (glossary, search_paper 등)
+    parallel : Optional[bool]
+        벡터/키워드/메타데이터 브랜치 동시 실행 여부 (None이면 rag.hybrid_search.parallel.enabled)
     """
 
     # ---------- Config에서 하이브리드 검색 가중치 로드 ----------
@@ -287,29 +519,39 @@ def search_paper_database(
     hybrid_config = config.get("rag", {}).get("hybrid_search", {})
     hybrid_enabled = hybrid_config.get("enabled", True) and use_hybrid
 
-    # 도구별 가중치 우선 사용, 없으면 기본 가중치
-    tool_weights = hybrid_config.get("tool_specific_weights", {}).get(tool_name, {})
-    vector_weight = tool_weights.get("vector_weight", hybrid_config.get("vector_weight", 0.7))
-    keyword_weight = tool_weights.get("keyword_weight", hybrid_config.get("keyword_weight", 0.3))
+    # 결합 방식 + 도구별 가중치 (tool_specific_weights 우선, 없으면 기본 가중치)
+    fusion_settings = get_fusion_settings(tool_name)
+
+    # 병렬 실행 설정 (브랜치별 마감 시간)
+    parallel_config = hybrid_config.get("parallel", {}) or {}
+    if parallel is None:
+        parallel = parallel_config.get("enabled", True)
+    timeouts = {**DEFAULT_BRANCH_TIMEOUTS, **(parallel_config.get("branch_timeouts", {}) or {})}
+    min_keyword_score = float(hybrid_config.get("min_keyword_score", DEFAULT_MIN_KEYWORD_SCORE))
 
     # ---------- Retriever 준비 ----------
     r = RAGRetriever(search_type=search_mode, k=top_k)
 
-    # ---------- 검색 실행 (필터/멀티쿼리 처리) ----------
     filter_dict = _build_filter(year_gte, author, category)
-    docs: List[Document] = []
-    pairs: List[Tuple[Document, float]] = []
-
-    if any(filter_dict.values()):
-        # 메타데이터 필터가 있으면 similarity + filter로 수행
-        docs = r.search_with_filter(query, filter_dict, k=top_k)
-        if with_scores:
-            pairs = [(d, None) for d in docs]  # type: ignore
-    else:
-        if use_multi_query:
-            docs = r.multi_query_search(query, k=top_k)
+    timings: Dict[str, Dict[str, Any]] = {}
+
+    # ---------- 브랜치 1: 벡터 검색 (+ 메타데이터 조회) ----------
+    def _vector_search() -> Tuple[List[Document], List[Tuple[Document, float]]]:
+        docs: List[Document] = []
+        pairs: List[Tuple[Document, float]] = []
+
+        if any(filter_dict.values()):
+            # 메타데이터 필터가 있으면 similarity + filter로 수행
+            docs = r.search_with_filter(query, filter_dict, k=top_k)
             if with_scores:
-                pairs = r.similarity_search_with_score(query, k=len(docs) or top_k)
+                pairs = [(d, None) for d in docs]  # type: ignore
+        elif use_multi_query:
+            if with_scores:
+                # 확장 쿼리별 점수 검색을 한 번에 수행 (중복 similarity 검색 제거)
+                pairs = r.multi_query_search_with_score(query, k=top_k)
+                docs = [d for d, _ in pairs]
+            else:
+                docs = r.multi_query_search(query, k=top_k)
         else:
             if with_scores:
                 pairs = r.similarity_search_with_score(query, k=top_k)
@@ -317,116 +559,174 @@ def search_paper_database(
             else:
                 docs = r.similarity_search(query, k=top_k)
 
-    # ---------- 하이브리드 검색: 키워드 검색 추가 ----------
-    keyword_results = []
-    if hybrid_enabled:
-        keyword_results = _keyword_search(query, top_k=top_k)
+        return docs, pairs
+
+    def _vector_branch() -> Tuple[List[Document], List[Tuple[Document, float]], Dict[int, Dict[str, Any]]]:
+        # pgvector SQL에 브랜치 마감 시간과 같은 실행 제한 적용 (버려진 뒤에도 계속 실행되지 않도록)
+        deadline = time.perf_counter() + timeouts["vector"]
+        with statement_timeout(int(timeouts["vector"] * 1000)):
+            docs, pairs = _vector_search()
+
+        # 마감 시간을 넘겼으면 이미 버려진 브랜치이므로 메타데이터 조회 생략
+        if parallel and time.perf_counter() >= deadline:
+            return docs, pairs, {}
+
+        # paper_id 메타로 PostgreSQL 메타데이터 조회 (키워드 브랜치와 겹쳐서 실행됨)
+        paper_ids = [pid for pid in (_as_paper_id(d.metadata.get("paper_id")) for d in docs) if pid is not None]
+
+        try:
+            meta_map = _timed(
+                "metadata",
+                lambda: _fetch_paper_meta(
+                    list(set(paper_ids)),
+                    statement_timeout_ms=int(timeouts["metadata"] * 1000),
+                ),
+                timings,
+            )
+        except Exception:
+            # 메타데이터 실패 시 청크 메타데이터로 대체
+            meta_map = {}
+
+        return docs, pairs, meta_map
+
+    # ---------- 브랜치 2: 하이브리드 키워드 검색 ----------
+    def _keyword_branch() -> List[Dict[str, Any]]:
+        return _keyword_search(
+            query,
+            top_k=top_k,
+            statement_timeout_ms=int(timeouts["keyword"] * 1000),
+        )
 
-    # ---------- paper_id 메타로 PostgreSQL 메타데이터 조회 ----------
-    paper_ids = []
-    for d in docs:
-        pid = d.metadata.get("paper_id")
-        if isinstance(pid, int):
-            paper_ids.append(pid)
-        else:
-            # 혹시 str이면 int 로 변환 시도
-            try:
-                paper_ids.append(int(pid))
-            except Exception:
-                pass
-    meta_map = _fetch_paper_meta(list(set(paper_ids)))
-
-    # ---------- 결과 합성 (하이브리드 검색 가중치 적용) ----------
-    score_map: Dict[int, float] = {}  # paper_id → final_score
-
-    # 1. 벡터 검색 점수 (가중치 적용)
-    if with_scores and pairs:
-        for d, s in pairs:
-            if s is None:
-                continue
-            pid = d.metadata.get("paper_id")
-            if pid:
-                # 벡터 검색 점수: 낮을수록 유사 (distance) → 정규화 필요
-                # score = 1 / (1 + distance) 형태로 변환
-                normalized_score = 1.0 / (1.0 + float(s))
-                score_map[pid] = score_map.get(pid, 0.0) + normalized_score * vector_weight
-
-    # 2. 키워드 검색 점수 (가중치 적용)
+    branches: Dict[str, Callable[[], Any]] = {"vector": _vector_branch}
+    if hybrid_enabled:
+        branches["keyword"] = _keyword_branch
+
+    # ---------- 브랜치 실행 (병렬 / 순차) ----------
+    branch_results = _run_branches(branches, timeouts, parallel, timings)
+
+    docs, pairs, meta_map = branch_results.get("vector") or ([], [], {})
+    keyword_results = branch_results.get("keyword") or []
+
+    # 브랜치별 실행 기록 보관 (마감 후 늦게 끝난 스레드가 덮어쓰지 않도록 복사)
+    snapshot = {name: dict(info) for name, info in list(timings.items())}
+    if "vector" in snapshot:
+        snapshot["vector"]["count"] = len(docs)
+    if "keyword" in snapshot:
+        snapshot["keyword"]["count"] = len(keyword_results)
+    _last_search.timings = snapshot
+
+    # ---------- 결과 합성 (src/rag/ranking.fuse) ----------
+    # 벡터: 청크 단위 → 논문 단위(가장 가까운 청크 distance), 점수 없으면 검색 순위 사용
+    vector_branch: List[Tuple[Any, Optional[float]]] = []
+    distance_map: Dict[Any, float] = {}  # paper_id → 최소 distance (낮을수록 유사)
+    for d, dist in (pairs if pairs else [(d, None) for d in docs]):
+        pid = _as_paper_id(d.metadata.get("paper_id"))
+        if pid is None:
+            continue
+        vector_branch.append((pid, dist))
+        if dist is not None:
+            distance_map[pid] = min(float(dist), distance_map.get(pid, float("inf")))
+
+    fusion_branches: Dict[str, List[Tuple[Any, Optional[float]]]] = {"vector": vector_branch}
     if hybrid_enabled and keyword_results:
-        for kw_result in keyword_results:
-            pid = kw_result["paper_id"]
-            keyword_score = kw_result["keyword_score"]
-            # 키워드 점수: 높을수록 좋음 (title: 2.0, abstract: 1.0)
-            # 정규화: 최대 3.0 기준 (title + abstract)
-            normalized_kw_score = keyword_score / 3.0
-            score_map[pid] = score_map.get(pid, 0.0) + normalized_kw_score * keyword_weight
-
-    # 3. 최종 결과 생성 (score 기준 정렬)
-    results: List[Dict[str, Any]] = []
-    seen_pids = set()
-
-    # 벡터 검색 결과 추가
+        fusion_branches["keyword"] = [(kw["paper_id"], kw["keyword_score"]) for kw in keyword_results]
+
+    fused = fuse(
+        fusion_branches,
+        method=fusion_settings["method"],
+        weights=fusion_settings["weights"],
+        higher_is_better={"vector": False, "keyword": True},  # 벡터는 distance
+        rrf_k=fusion_settings["rrf_k"],
+    )
+    score_map: Dict[Any, float] = dict(fused)  # paper_id → 결합 점수 (높을수록 관련)
+    keyword_scores = {kw["paper_id"]: kw["keyword_score"] for kw in keyword_results} if hybrid_enabled else {}
+
+    # 논문별 대표 항목 구성
+    by_pid: Dict[Any, Dict[str, Any]] = {}
+
+    # 벡터 검색 결과 (논문별 첫 청크)
     for d in docs:
-        pid = d.metadata.get("paper_id")
-        if pid and pid not in seen_pids:
-            seen_pids.add(pid)
-            meta = meta_map.get(pid, {}) if pid is not None else {}
-            results.append({
-                "paper_id": pid,
-                "title": meta.get("title") or d.metadata.get("title"),
-                "authors": meta.get("authors") or d.metadata.get("authors"),
-                "publish_date": meta.get("publish_date") or d.metadata.get("publish_date"),
-                "url": meta.get("url") or d.metadata.get("url"),
-                "category": meta.get("category") or d.metadata.get("category"),
-                "citation_count": meta.get("citation_count"),
-                "section": d.metadata.get("section", "본문"),
-                "content": d.page_content,
-                "score": score_map.get(pid, 0.0) if with_scores else None,
-            })
+        pid = _as_paper_id(d.metadata.get("paper_id"))
+        if pid is None or pid in by_pid:
+            continue
+        meta = meta_map.get(pid, {})
+        by_pid[pid] = {
+            "paper_id": pid,
+            "title": meta.get("title") or d.metadata.get("title"),
+            "authors": meta.get("authors") or d.metadata.get("authors"),
+            "publish_date": meta.get("publish_date") or d.metadata.get("publish_date"),
+            "url": meta.get("url") or d.metadata.get("url"),
+            "category": meta.get("category") or d.metadata.get("category"),
+            "citation_count": meta.get("citation_count"),
+            "section": d.metadata.get("section", "본문"),
+            "content": d.page_content,
+        }
 
-    # 키워드 검색 결과 추가 (중복 제외)
-    if hybrid_enabled and keyword_results:
-        for kw_result in keyword_results:
-            pid = kw_result["paper_id"]
-            if pid not in seen_pids:
-                seen_pids.add(pid)
-                # 키워드 검색으로만 찾은 경우 content는 abstract 사용
-                results.append({
-                    "paper_id": pid,
-                    "title": kw_result.get("title"),
-                    "authors": kw_result.get("authors"),
-                    "publish_date": kw_result.get("publish_date"),
-                    "url": kw_result.get("url"),
-                    "category": kw_result.get("category"),
-                    "citation_count": kw_result.get("citation_count"),
-                    "section": "초록",
-                    "content": kw_result.get("abstract", ""),
-                    "score": score_map.get(pid, 0.0) if with_scores else None,
-                })
-
-    # 점수 기준 정렬 (높은 점수부터)
-    if with_scores and hybrid_enabled:
-        results.sort(key=lambda x: x.get("score", 0.0), reverse=True)
-
-    # top_k 제한
-    results = results[:top_k]
+    # 키워드 검색으로만 찾은 논문 (content는 abstract 사용, 약한 키워드 매칭은 제외)
+    for kw_result in keyword_results if hybrid_enabled else []:
+        pid = kw_result["paper_id"]
+        if pid in by_pid or kw_result["keyword_score"] < min_keyword_score:
+            continue
+        by_pid[pid] = {
+            "paper_id": pid,
+            "title": kw_result.get("title"),
+            "authors": kw_result.get("authors"),
+            "publish_date": kw_result.get("publish_date"),
+            "url": kw_result.get("url"),
+            "category": kw_result.get("category"),
+            "citation_count": kw_result.get("citation_count"),
+            "section": "초록",
+            "content": kw_result.get("abstract", ""),
+        }
+
+    # 결합 점수 순으로 정렬 + top_k 제한
+    results: List[Dict[str, Any]] = []
+    for pid, fused_score in fused:
+        if pid not in by_pid:
+            continue
+        item = by_pid[pid]
+        item["score"] = distance_map.get(pid) if with_scores else None
+        item["fused_score"] = fused_score if with_scores else None
+        item["keyword_score"] = keyword_scores.get(pid)
+        results.append(item)
+        if len(results) >= top_k:
+            break
 
     # ---------- Markdown 포맷으로 반환 ----------
-    return _format_markdown(results)
+    return _format_markdown(results, min_keyword_score)
 
 
 # ==================== Agent 노드: RAG 검색 ==================== #
-
-def search_paper_node(state, exp_manager=None):
+def paper_search_args(question: str) -> Dict[str, Any]:
     """
-    Agent 노드: 논문 DB에서 관련 논문 검색 및 답변 생성
+    search_paper_node의 search_paper_database 호출 인자 (라우팅 중 선행 검색과 공유)
 
     Args:
-        state (AgentState): Agent 상태
-        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+        question: 검색 쿼리
 
     Returns:
-        AgentState: 업데이트된 상태
+        search_paper_database.invoke() 인자 딕셔너리
+    """
+    return {
+        "query": question,                                # 검색 쿼리
+        "year_gte": None,                                 # 연도 필터 없음
+        "author": None,                                   # 저자 필터 없음
+        "category": None,                                 # 카테고리 필터 없음
+        "top_k": 5,                                       # Top-5 검색
+        "with_scores": True,                              # 유사도 점수 포함
+        "use_multi_query": True,                          # ✅ MultiQuery 활성화 (검색 강화)
+        "search_mode": "similarity",                      # 유사도 검색
+        "use_hybrid": True,                               # ✅ 하이브리드 검색 활성화 (벡터+키워드)
+        "tool_name": "search_paper",                      # ✅ 도구명 (가중치 조정용)
+    }
+
+
+def _start_search_paper(state, exp_manager=None):
+    """
+    질문 / 난이도 추출 및 도구 로거 생성 (동기 / 비동기 노드 공통)
+
+    Returns:
+        tuple: (question, difficulty, tool_logger)
     """
     # -------------- 상태에서 질문 및 난이도 추출 -------------- #
     # ✅ refined_query 우선 사용 (Multi-turn 지원)
@@ -443,64 +743,72 @@ def search_paper_node(state, exp_manager=None):
             tool_logger.write(f"RAG 검색 노드 실행: {question}")
         tool_logger.write(f"난이도: {difficulty}")
 
-    # -------------- search_paper_database 도구 호출 -------------- #
-    try:
-        # Langchain @tool 함수 호출
-        raw_results = search_paper_database.invoke({
-            "query": question,                            # 검색 쿼리
-            "year_gte": None,                             # 연도 필터 없음
-            "author": None,                               # 저자 필터 없음
-            "category": None,                             # 카테고리 필터 없음
-            "top_k": 5,                                   # Top-5 검색
-            "with_scores": True,                          # 유사도 점수 포함
-            "use_multi_query": True,                      # ✅ MultiQuery 활성화 (검색 강화)
-            "search_mode": "similarity",                  # 유사도 검색
-            "use_hybrid": True,                           # ✅ 하이브리드 검색 활성화 (벡터+키워드)
-            "tool_name": "search_paper",                  # ✅ 도구명 (가중치 조정용)
-        })
+    return question, difficulty, tool_logger
 
-        if tool_logger:
-            tool_logger.write(f"검색 결과: {len(raw_results)} 글자")
 
-        # -------------- 검색 결과 없음 체크 (Fallback 트리거) -------------- #
-        if "관련 논문을 찾을 수 없습니다" in raw_results:
-            if tool_logger:
-                tool_logger.write("데이터베이스에서 논문을 찾지 못했습니다. Fallback 필요.")
-                tool_logger.close()
+def _prepare_search_answer(state, question: str, difficulty: str, exp_manager=None, tool_logger=None):
+    """
+    논문 검색 + 수준별 메시지 구성 / 프롬프트 저장 (동기 / 비동기 노드 공통, 블로킹 I/O)
 
-            # 명확한 실패 메시지 반환 (failure_detector 패턴과 정확히 일치)
-            state["final_answer"] = "데이터베이스에서 찾지 못했습니다."
-            return state
+    Returns:
+        tuple: (levels, level_messages, llm_client) - 검색 결과가 없으면 None (state에 실패 메시지 저장)
+    """
+    # -------------- search_paper_database 도구 호출 -------------- #
+    # Langchain @tool 함수 호출 (라우팅 중 같은 인자로 선행 검색했으면 결과 재사용)
+    search_args = paper_search_args(question)
+    raw_results, branch_timings = run_or_take(
+        state, "search_paper", search_args,
+        lambda: (search_paper_database.invoke(search_args), get_last_branch_timings()),
+        tool_logger=tool_logger,
+    )
 
-        # -------------- pgvector 검색 기록 -------------- #
-        if exp_manager:
-            exp_manager.log_pgvector_search({
-                "tool": "search_paper",
-                "collection": "paper_chunks",
-                "query_text": question,
-                "search_mode": "similarity",
-                "top_k": 5,
-                "use_multi_query": False,
-                "result_length": len(raw_results)
-            })
+    if tool_logger:
+        tool_logger.write(f"검색 결과: {len(raw_results)} 글자")
+        for branch, info in branch_timings.items():
+            tool_logger.write(
+                f"검색 브랜치 [{branch}]: {info.get('elapsed_ms')}ms ({info.get('status')})"
+            )
 
-        # -------------- 두 수준의 답변 생성 -------------- #
-        level_mapping = {
-            "easy": ["elementary", "beginner"],
-            "hard": ["intermediate", "advanced"]
-        }
+    # -------------- 검색 결과 없음 체크 (Fallback 트리거) -------------- #
+    if "관련 논문을 찾을 수 없습니다" in raw_results:
+        if tool_logger:
+            tool_logger.write("데이터베이스에서 논문을 찾지 못했습니다. Fallback 필요.")
+            tool_logger.close()
 
-        levels = level_mapping.get(difficulty, ["beginner", "intermediate"])
-        final_answers = {}
+        # 명확한 실패 메시지 반환 (failure_detector 패턴과 정확히 일치)
+        state["final_answer"] = "데이터베이스에서 찾지 못했습니다."
+        return None
+
+    # -------------- pgvector 검색 기록 -------------- #
+    if exp_manager:
+        exp_manager.log_pgvector_search({
+            "tool": "search_paper",
+            "collection": "paper_chunks",
+            "query_text": question,
+            "search_mode": "similarity",
+            "top_k": 5,
+            "use_multi_query": False,
+            "result_length": len(raw_results),
+            "branch_timings": branch_timings
+        })
+        exp_manager.save_embedding_cache_stats(get_embedding_cache_stats())
 
-        # 난이도별 LLM 초기화 (공통)
-        llm_client = LLMClient.from_difficulty(
-            difficulty=difficulty,
-            logger=exp_manager.logger if exp_manager else None
-        )
+    # -------------- 두 수준의 답변 생성 준비 -------------- #
+    level_mapping = {
+        "easy": ["elementary", "beginner"],
+        "hard": ["intermediate", "advanced"]
+    }
 
-        # 사용자 프롬프트 (공통)
-        user_content = f"""[논문 검색 결과]
+    levels = level_mapping.get(difficulty, ["beginner", "intermediate"])
+
+    # 난이도별 LLM 초기화 (공통)
+    llm_client = LLMClient.from_difficulty(
+        difficulty=difficulty,
+        logger=exp_manager.logger if exp_manager else None
+    )
+
+    # 사용자 프롬프트 (공통)
+    user_content = f"""[논문 검색 결과]
 {raw_results}
 
 [질문]
@@ -508,65 +816,139 @@ def search_paper_node(state, exp_manager=None):
 
 위 검색 결과를 바탕으로 질문에 답변해주세요."""
 
-        # 각 수준별로 답변 생성
-        for level in levels:
-            if tool_logger:
-                tool_logger.write(f"수준 '{level}' 답변 생성 시작")
+    # 수준별 메시지 구성 및 프롬프트 저장
+    level_messages = {}
+    for level in levels:
+        # JSON 프롬프트 로드
+        system_prompt = get_tool_prompt("search_paper", level)
 
-            # JSON 프롬프트 로드
-            system_prompt = get_tool_prompt("search_paper", level)
-
-            # 메시지 구성
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_content)
-            ]
-
-            # 프롬프트 저장
-            if exp_manager:
-                exp_manager.save_system_prompt(system_prompt, {
-                    "tool": "search_paper",
-                    "difficulty": difficulty,
-                    "level": level
-                })
-                final_prompt = f"""[SYSTEM PROMPT - {level}]
+        # 메시지 구성
+        level_messages[level] = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_content)
+        ]
+
+        # 프롬프트 저장
+        if exp_manager:
+            exp_manager.save_system_prompt(system_prompt, {
+                "tool": "search_paper",
+                "difficulty": difficulty,
+                "level": level
+            })
+            final_prompt = f"""[SYSTEM PROMPT - {level}]
 {system_prompt}
 
 [USER PROMPT]
 {user_content}"""
-                exp_manager.save_final_prompt(final_prompt, {
-                    "tool": "search_paper",
-                    "difficulty": difficulty,
-                    "level": level
-                })
+            exp_manager.save_final_prompt(final_prompt, {
+                "tool": "search_paper",
+                "difficulty": difficulty,
+                "level": level
+            })
+
+    return levels, level_messages, llm_client
+
+
+def _finish_search_answer(state, final_answers, levels, tool_logger=None):
+    """수준별 답변 로깅 및 상태 저장 (동기 / 비동기 노드 공통)"""
+    if tool_logger:
+        for level in levels:
+            content = final_answers[level]
+            tool_logger.write(f"수준 '{level}' 답변 생성 완료: {len(content)} 글자")
+            tool_logger.write("=" * 80)
+            tool_logger.write(f"[{level} 답변 전체 내용]")
+            tool_logger.write(content)
+            tool_logger.write("=" * 80)
+        tool_logger.close()
+
+    # -------------- 최종 답변 저장 -------------- #
+    state["final_answers"] = final_answers
+    state["final_answer"] = final_answers[levels[1]]
+    state["tool_result"] = final_answers[levels[1]]  # Skip 로직을 위한 tool_result 설정
+    return state
+
+
+def _fail_search_answer(state, error: Exception, tool_logger=None):
+    """논문 검색 / 답변 생성 예외 처리 (동기 / 비동기 노드 공통)"""
+    if tool_logger:
+        tool_logger.write(f"논문 검색 실패: {error}")
+        tool_logger.close()
+
+    # 에러 메시지 저장
+    state["final_answer"] = f"논문 검색 오류: {str(error)}"
+    return state
 
-            # LLM 호출
-            response = llm_client.llm.invoke(messages)
-            final_answers[level] = response.content
 
-            # 로깅
+def search_paper_node(state, exp_manager=None):
+    """
+    Agent 노드: 논문 DB에서 관련 논문 검색 및 답변 생성
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        AgentState: 업데이트된 상태
+    """
+    question, difficulty, tool_logger = _start_search_paper(state, exp_manager)
+
+    try:
+        prepared = _prepare_search_answer(state, question, difficulty, exp_manager, tool_logger)
+        if prepared is None:
+            return state
+        levels, level_messages, llm_client = prepared
+
+        # 각 수준별로 답변 생성 (순차)
+        final_answers = {}
+        for level in levels:
             if tool_logger:
-                tool_logger.write(f"수준 '{level}' 답변 생성 완료: {len(response.content)} 글자")
-                tool_logger.write("=" * 80)
-                tool_logger.write(f"[{level} 답변 전체 내용]")
-                tool_logger.write(response.content)
-                tool_logger.write("=" * 80)
+                tool_logger.write(f"수준 '{level}' 답변 생성 시작")
 
-        if tool_logger:
-            tool_logger.close()
+            # LLM 호출
+            response = llm_client.llm.invoke(level_messages[level], config=answer_stream_config(level))
+            final_answers[level] = response.content
 
-        # -------------- 최종 답변 저장 -------------- #
-        state["final_answers"] = final_answers
-        state["final_answer"] = final_answers[levels[1]]
-        state["tool_result"] = final_answers[levels[1]]  # Skip 로직을 위한 tool_result 설정
+        return _finish_search_answer(state, final_answers, levels, tool_logger)
 
     except Exception as e:
+        return _fail_search_answer(state, e, tool_logger)
+
+
+async def search_paper_node_async(state, exp_manager=None):
+    """
+    Agent 노드 (비동기 그래프용): 검색은 공용 스레드 풀, 수준별 답변은 llm.ainvoke로 동시 생성
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        AgentState: 업데이트된 상태
+    """
+    question, difficulty, tool_logger = _start_search_paper(state, exp_manager)
+
+    try:
+        prepared = await run_blocking(_prepare_search_answer, state, question, difficulty, exp_manager, tool_logger)
+        if prepared is None:
+            return state
+        levels, level_messages, llm_client = prepared
+
         if tool_logger:
-            tool_logger.write(f"논문 검색 실패: {e}")
-            tool_logger.close()
+            tool_logger.write(f"수준별 답변 동시 생성 시작: {', '.join(levels)}")
+
+        async def answer(level):
+            response = await llm_client.llm.ainvoke(level_messages[level], config=answer_stream_config(level))
+            return response.content
+
+        final_answers = await agenerate_levels(
+            levels,
+            answer,
+            state=state,
+            tool_name="search_paper",
+            primary=levels[1],
+        )
 
-        # 에러 메시지 저장
-        state["final_answer"] = f"논문 검색 오류: {str(e)}"
+        return _finish_search_answer(state, final_answers, levels, tool_logger)
 
-    # -------------- 업데이트된 상태 반환 -------------- #
-    return state
+    except Exception as e:
+        return _fail_search_answer(state, e, tool_logger)
@@ -3,41 +3,44 @@
 논문 요약 도구 모듈
 
 PostgreSQL papers 테이블에서 논문 검색
-pgvector에서 논문 청크 조회
+paper_summaries 테이블의 저장된 요약 우선 사용 (미스 시 생성 후 저장)
+pgvector에서 paper_id로 논문 청크 직접 조회 (chunk_index 순)
 load_summarize_chain (stuff 방식) 사용
 난이도별 요약 프롬프트 적용
+누락된 수준 요약은 동시에 생성 (src/tools/multi_level.py)
+비동기 그래프(summarize_node_async): 제목 추출 / 파이프라인 요약은 llm.ainvoke
 """
 
 # ==================== Import ==================== #
-import os
-from langchain_openai import OpenAIEmbeddings
-from langchain_postgres.vectorstores import PGVector
+import threading
+
 from langchain.chains.summarize import load_summarize_chain
 from langchain.prompts import PromptTemplate
-import psycopg2
+from langchain.schema import SystemMessage, HumanMessage
+from src.agent.async_nodes import run_blocking
 from src.agent.state import AgentState
+from src.database.vector_store import get_paper_chunks
+from src.utils.paper_summaries import (
+    LEVEL_MAPPING,
+    generate_summary,
+    get_or_create_summary,
+    get_stored_summary,
+    is_summary_store_enabled,
+)
+from src.database.db import get_cursor
 from src.llm.client import LLMClient
-from src.prompts import get_summarize_title_extraction_prompt, get_summarize_template
+from src.prompts import get_summarize_title_extraction_prompt
+from src.tools.multi_level import generate_levels
 
 
 # ==================== 도구 6: 논문 요약 노드 ==================== #
-def summarize_node(state: AgentState, exp_manager=None):
+def _start_summarize(state: AgentState, exp_manager=None):
     """
-    논문 요약 노드
-    PostgreSQL papers 테이블에서 논문을 검색하고,
-    pgvector에서 해당 논문의 모든 청크를 조회하여 요약 생성
-    난이도별(Easy/Hard) 요약 프롬프트 적용
-
-    Args:
-        state (AgentState): Agent 상태
-        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+    질문 / 난이도 추출 및 도구 로거 생성 (동기 / 비동기 노드 공통)
 
     Returns:
-        AgentState: 업데이트된 상태 (final_answer에 요약 결과)
+        tuple: (question, difficulty, tool_logger)
     """
-    # ============================================================ #
-    #                     초기화 및 상태 추출                      #
-    # ============================================================ #
     question = state.get("question", "")        # 사용자 질문
     difficulty = state.get("difficulty", "easy") # 난이도
 
@@ -47,30 +50,25 @@ def summarize_node(state: AgentState, exp_manager=None):
         tool_logger = exp_manager.get_tool_logger('summarize')
         tool_logger.write(f"논문 요약 노드 실행 - 질문: {question}, 난이도: {difficulty}")
 
-    # ============================================================ #
-    #           파이프라인 모드: 이전 도구 결과 사용               #
-    # ============================================================ #
+    return question, difficulty, tool_logger
+
+
+def _pipeline_source(state: AgentState):
+    """파이프라인 실행 중이고 이전 도구 결과가 있으면 그 결과 (없으면 None)"""
     tool_pipeline = state.get("tool_pipeline", [])
     pipeline_index = state.get("pipeline_index", 0)
     tool_result = state.get("tool_result", "")
 
-    # 파이프라인 실행 중이고 이전 도구 결과가 있으면 바로 요약
     if tool_pipeline and pipeline_index > 1 and tool_result:
-        if tool_logger:
-            tool_logger.write(f"파이프라인 모드: 이전 도구 결과 사용 ({len(tool_result)} 글자)")
-
-        # 난이도별 LLM 초기화
-        llm_client = LLMClient.from_difficulty(
-            difficulty=difficulty,
-            logger=exp_manager.logger if exp_manager else None
-        )
+        return tool_result
+    return None
 
-        # 파이프라인 모드: 간단한 요약 프롬프트 사용
-        from langchain.schema import SystemMessage, HumanMessage
 
-        # 난이도별 시스템 프롬프트
-        if difficulty == "easy":
-            system_content = """당신은 논문을 쉽게 설명하는 친절한 AI 어시스턴트입니다.
+def _pipeline_summary_messages(tool_result: str, difficulty: str):
+    """파이프라인 모드: 이전 도구 결과 요약용 간단한 메시지 구성"""
+    # 난이도별 시스템 프롬프트
+    if difficulty == "easy":
+        system_content = """당신은 논문을 쉽게 설명하는 친절한 AI 어시스턴트입니다.
 
 답변 규칙:
 - 핵심 아이디어를 3-5개 포인트로 정리하세요
@@ -80,8 +78,8 @@ def summarize_node(state: AgentState, exp_manager=None):
   2. 핵심 포인트
   3. 한 줄 요약
 - 친근하고 이해하기 쉬운 톤 유지"""
-        else:  # hard
-            system_content = """당신은 논문을 기술적으로 분석하는 전문 연구자입니다.
+    else:  # hard
+        system_content = """당신은 논문을 기술적으로 분석하는 전문 연구자입니다.
 
 답변 규칙:
 - 다음 구조로 체계적으로 요약하세요:
@@ -92,205 +90,199 @@ def summarize_node(state: AgentState, exp_manager=None):
 - 기술적 세부사항을 포함하세요
 - 비판적 관점을 유지하세요"""
 
-        user_content = f"""다음 내용을 요약해주세요:
+    user_content = f"""다음 내용을 요약해주세요:
 
 {tool_result}
 
 요약:"""
 
-        # 메시지 구성
-        messages = [
-            SystemMessage(content=system_content),
-            HumanMessage(content=user_content)
-        ]
+    # 메시지 구성
+    messages = [
+        SystemMessage(content=system_content),
+        HumanMessage(content=user_content)
+    ]
 
-        # LLM 호출
-        response = llm_client.llm.invoke(messages)
-        summary = response.content
+    return messages
 
-        if tool_logger:
-            tool_logger.write(f"파이프라인 요약 완료: {len(summary)} 글자")
 
-        state["final_answer"] = summary
-        state["tool_result"] = summary
-        return state
+def _finish_pipeline_summary(state: AgentState, summary: str, tool_logger=None):
+    """파이프라인 요약 결과 상태 저장 (동기 / 비동기 노드 공통)"""
+    if tool_logger:
+        tool_logger.write(f"파이프라인 요약 완료: {len(summary)} 글자")
+        tool_logger.close()
 
-    try:
-        # ============================================================ #
-        #              1단계: 논문 제목 추출 (LLM 사용)               #
-        # ============================================================ #
-        # 난이도별 LLM 초기화
-        llm_client = LLMClient.from_difficulty(
-            difficulty=difficulty,
-            logger=exp_manager.logger if exp_manager else None
-        )
-        # JSON 프롬프트 로드
-        extract_prompt_template = get_summarize_title_extraction_prompt()
-        extract_prompt = extract_prompt_template.format(question=question)
+    state["final_answer"] = summary
+    state["tool_result"] = summary
+    return state
 
-        if tool_logger:
-            tool_logger.write(f"논문 제목 추출 프롬프트: {extract_prompt}")
 
-        paper_title = llm_client.llm.invoke(extract_prompt).content.strip()
+def _title_extraction_prompt(question: str, tool_logger=None) -> str:
+    """1단계: 논문 제목 추출 프롬프트 (JSON 프롬프트 로드)"""
+    extract_prompt_template = get_summarize_title_extraction_prompt()
+    extract_prompt = extract_prompt_template.format(question=question)
 
-        if tool_logger:
-            tool_logger.write(f"추출된 논문 제목: {paper_title}")
+    if tool_logger:
+        tool_logger.write(f"논문 제목 추출 프롬프트: {extract_prompt}")
 
-        # ============================================================ #
-        #       2단계: PostgreSQL papers 테이블에서 논문 검색          #
-        # ============================================================ #
-        conn = psycopg2.connect(os.getenv("DATABASE_URL"))
-        cursor = conn.cursor()
+    return extract_prompt
 
-        # 논문 제목으로 검색 (ILIKE로 부분 일치 허용)
-        query = """
-        SELECT paper_id, title, authors, abstract, publish_date
-        FROM papers
-        WHERE title ILIKE %s
-        LIMIT 1
-        """
 
-        cursor.execute(query, (f"%{paper_title}%",))
-        result = cursor.fetchone()
+def _summarize_paper_by_title(state: AgentState, paper_title: str, difficulty: str, exp_manager=None, tool_logger=None):
+    """
+    2~7단계: 논문 검색 → 저장된 요약 조회 → 누락 수준 요약 생성 → 상태 / summary.md 저장
+    (동기 / 비동기 노드 공통, 블로킹 I/O)
 
-        # ExperimentManager SQL 쿼리 기록
-        if exp_manager:
-            exp_manager.log_sql_query(
-                query=query,
-                params=(f"%{paper_title}%",),
-                result_count=1 if result else 0
-            )
-
-        # 논문을 찾지 못한 경우
-        if not result:
-            if tool_logger:
-                tool_logger.write(f"논문을 찾지 못함: {paper_title}")
+    Args:
+        state (AgentState): Agent 상태
+        paper_title: 1단계에서 추출한 논문 제목
+        difficulty: 난이도
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+        tool_logger: 도구 로거 (선택 사항)
 
-            cursor.close()
-            conn.close()
+    Returns:
+        AgentState: 업데이트된 상태
+    """
+    if tool_logger:
+        tool_logger.write(f"추출된 논문 제목: {paper_title}")
 
-            state["final_answer"] = f"'{paper_title}' 논문을 데이터베이스에서 찾지 못했습니다. 논문 제목을 정확히 확인해주세요."
-            return state
+    # ============================================================ #
+    #       2단계: PostgreSQL papers 테이블에서 논문 검색          #
+    # ============================================================ #
+    # 논문 제목으로 검색 (ILIKE로 부분 일치 허용)
+    query = """
+    SELECT paper_id, title, authors, abstract, publish_date
+    FROM papers
+    WHERE title ILIKE %s
+    LIMIT 1
+    """
 
-        # 논문 정보 추출
-        paper_id, title, authors, abstract, publish_date = result
+    # 공용 연결 풀 사용
+    with get_cursor() as cursor:
+        cursor.execute(query, (f"%{paper_title}%",))
+        result = cursor.fetchone()
+
+    # ExperimentManager SQL 쿼리 기록
+    if exp_manager:
+        exp_manager.log_sql_query(
+            query=query,
+            params=(f"%{paper_title}%",),
+            result_count=1 if result else 0
+        )
 
+    # 논문을 찾지 못한 경우
+    if not result:
         if tool_logger:
-            tool_logger.write(f"논문 발견 - ID: {paper_id}, 제목: {title}")
+            tool_logger.write(f"논문을 찾지 못함: {paper_title}")
+            tool_logger.close()
+
+        state["final_answer"] = f"'{paper_title}' 논문을 데이터베이스에서 찾지 못했습니다. 논문 제목을 정확히 확인해주세요."
+        return state
 
-        cursor.close()
-        conn.close()
+    # 논문 정보 추출
+    paper_id, title, authors, abstract, publish_date = result
 
+    if tool_logger:
+        tool_logger.write(f"논문 발견 - ID: {paper_id}, 제목: {title}")
+
+    # ============================================================ #
+    #      3단계: 저장된 요약 조회 (paper_summaries, lazy fill)     #
+    # ============================================================ #
+    levels = LEVEL_MAPPING.get(difficulty, ["beginner", "intermediate"])
+    final_answers = {}
+    paper = {
+        "paper_id": paper_id,
+        "title": title,
+        "authors": authors,
+        "abstract": abstract,
+        "publish_date": publish_date,
+    }
+
+    if is_summary_store_enabled():
+        for level in levels:
+            try:
+                stored = get_stored_summary(paper_id, level)
+            except Exception as e:
+                stored = None
+                if tool_logger:
+                    tool_logger.write(f"저장된 요약 조회 실패: {e}")
+            if stored is not None:
+                final_answers[level] = stored
+                if tool_logger:
+                    tool_logger.write(f"수준 '{level}' 저장된 요약 사용 (LLM 호출 없음)")
+
+    missing_levels = [level for level in levels if level not in final_answers]
+
+    if missing_levels:
         # ============================================================ #
-        #      3단계: pgvector에서 논문의 모든 청크 조회               #
+        #      4단계: pgvector에서 논문의 모든 청크 조회               #
         # ============================================================ #
-        embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-        vectorstore = PGVector(
-            collection_name="paper_chunks",
-            embeddings=embeddings,
-            connection=os.getenv("DATABASE_URL")
-        )
-
-        # 논문 제목으로 시맨틱 검색하여 관련 청크 조회
-        # filter는 source 필드와 정확히 매치되지 않을 수 있으므로
-        # 제목을 query로 사용하여 관련 청크를 찾음
-        docs = vectorstore.similarity_search(
-            query=title,  # 논문 제목으로 검색
-            k=50          # 충분한 청크 수
-        )
+        # paper_id 메타데이터 인덱스로 해당 논문 청크만 읽기 순서대로 조회
+        # (임베딩 호출 / ANN 검색 없음 → 다른 논문 청크 혼입 없음)
+        docs = get_paper_chunks(paper_id, collection_name="paper_chunks")
 
         if tool_logger:
-            tool_logger.write(f"조회된 청크 수: {len(docs)}")
+            tool_logger.write(f"조회된 청크 수: {len(docs)} (paper_id={paper_id}, chunk_index 순)")
 
-        # ExperimentManager pgvector 검색 기록
+        # ExperimentManager pgvector 조회 기록
         if exp_manager:
             exp_manager.log_pgvector_search({
                 "tool": "summarize",
                 "collection": "paper_chunks",
-                "query_text": title,
-                "top_k": 50,
+                "query_text": f"paper_id={paper_id}",
+                "top_k": None,
                 "result_count": len(docs)
             })
 
         # 청크가 없는 경우
         if not docs:
+            if tool_logger:
+                tool_logger.close()
             state["final_answer"] = f"'{title}' 논문의 내용을 찾지 못했습니다."
             return state
 
-        # ============================================================ #
-        #        4단계: JSON 프롬프트 로드 및 두 수준 요약 생성           #
-        # ============================================================ #
-        level_mapping = {
-            "easy": ["elementary", "beginner"],
-            "hard": ["intermediate", "advanced"]
-        }
-
-        levels = level_mapping.get(difficulty, ["beginner", "intermediate"])
-        final_answers = {}
+        # SystemMessage / 최종 프롬프트 저장 콜백 (수준별 워커 스레드에서 호출)
+        prompt_lock = threading.Lock()
 
-        # 난이도별 LLM 초기화 (공통)
-        llm_client_summarize = LLMClient.from_difficulty(
-            difficulty=difficulty,
-            logger=exp_manager.logger if exp_manager else None
-        )
-
-        # 논문 청크들을 하나의 텍스트로 결합 (공통)
-        combined_text = "\n\n".join([doc.page_content for doc in docs])
-
-        # 각 수준별로 요약 생성
-        for level in levels:
-            if tool_logger:
-                tool_logger.write(f"수준 '{level}' 요약 생성 시작")
-
-            # JSON에서 요약 템플릿 로드
-            summary_template_str = get_summarize_template(level)
-
-            # 템플릿에 논문 정보 포맷팅
-            system_content = summary_template_str.format(
-                system_prompt=f"난이도: {level}",
-                title=title,
-                authors=authors if authors else "N/A",
-                publish_date=publish_date if publish_date else "N/A",
-                abstract=abstract if abstract else "N/A",
-                combined_text=combined_text
-            )
-
-            # 프롬프트 생성
-            summary_prompt = f"""{system_content}
-
-논문 정보:
-- 제목: {title}
-- 저자: {authors}
-- 발행일: {publish_date}
-- 초록: {abstract}
-
-논문 내용:
-{combined_text}
-
-위 논문의 방법론 부분을 중심으로 요약해주세요.
-요약:"""
-
-            # SystemMessage 저장
+        def record_prompt(system_content, summary_prompt, level):
             if exp_manager:
-                exp_manager.save_system_prompt(system_content, {
-                    "tool": "summarize",
-                    "level": level
-                })
-                exp_manager.save_final_prompt(summary_prompt, {
-                    "tool": "summarize",
-                    "difficulty": difficulty,
-                    "level": level,
-                    "paper_title": title
-                })
-
-            if tool_logger:
-                tool_logger.write(f"LLM 요약 생성 중 (수준: {level})...")
-                tool_logger.write(f"결합된 텍스트 길이: {len(combined_text)} 문자")
+                with prompt_lock:
+                    exp_manager.save_system_prompt(system_content, {
+                        "tool": "summarize",
+                        "level": level
+                    })
+                    exp_manager.save_final_prompt(summary_prompt, {
+                        "tool": "summarize",
+                        "difficulty": difficulty,
+                        "level": level,
+                        "paper_title": title
+                    })
 
-            # LLM으로 요약 생성
-            summary = llm_client_summarize.llm.invoke(summary_prompt).content
-            final_answers[level] = summary
+        # ============================================================ #
+        #    5단계: 누락된 수준 요약 동시 생성 후 저장 (lazy fill)      #
+        # ============================================================ #
+        def summarize_level(level):
+            if is_summary_store_enabled():
+                summary, _ = get_or_create_summary(
+                    paper, level, docs=docs, logger=tool_logger, on_prompt=record_prompt
+                )
+            else:
+                summary = generate_summary(paper, level, docs=docs, logger=tool_logger, on_prompt=record_prompt)
+            return summary
 
+        if tool_logger:
+            tool_logger.write(f"수준별 요약 동시 생성 시작: {', '.join(missing_levels)}")
+
+        # 주 수준 = final_answer에 들어가는 두 번째 수준
+        final_answers.update(generate_levels(
+            missing_levels,
+            summarize_level,
+            state=state,
+            tool_name="summarize",
+            primary=levels[1],
+        ))
+
+        for level in missing_levels:
+            summary = final_answers[level]
             if tool_logger:
                 tool_logger.write(f"수준 '{level}' 요약 생성 완료 - 길이: {len(summary)} 문자")
                 tool_logger.write("=" * 80)
@@ -298,28 +290,28 @@ def summarize_node(state: AgentState, exp_manager=None):
                 tool_logger.write(summary)
                 tool_logger.write("=" * 80)
 
-        if tool_logger:
-            tool_logger.close()
+        # 수준 순서 유지 (저장된 요약 + 새로 생성한 요약)
+        final_answers = {level: final_answers[level] for level in levels}
 
-        # ============================================================ #
-        #                  5단계: 최종 답변 저장                       #
-        # ============================================================ #
-        state["final_answers"] = final_answers
-        state["final_answer"] = final_answers[levels[1]]
+    # ============================================================ #
+    #                  6단계: 최종 답변 저장                       #
+    # ============================================================ #
+    state["final_answers"] = final_answers
+    state["final_answer"] = final_answers[levels[1]]
 
-        # ============================================================ #
-        #                  6단계: summary.md 저장                      #
-        # ============================================================ #
-        if exp_manager:
-            # 두 수준의 요약을 하나의 Markdown으로 저장
-            level_labels = {
-                "elementary": "초등학생용 (8-13세)",
-                "beginner": "초급자용 (14-22세)",
-                "intermediate": "중급자용 (23-30세)",
-                "advanced": "고급자용 (30세 이상)"
-            }
+    # ============================================================ #
+    #                  7단계: summary.md 저장                      #
+    # ============================================================ #
+    if exp_manager:
+        # 두 수준의 요약을 하나의 Markdown으로 저장
+        level_labels = {
+            "elementary": "초등학생용 (8-13세)",
+            "beginner": "초급자용 (14-22세)",
+            "intermediate": "중급자용 (23-30세)",
+            "advanced": "고급자용 (30세 이상)"
+        }
 
-            summary_md = f"""# 논문 요약
+        summary_md = f"""# 논문 요약
 
 ## 기본 정보
 
@@ -328,41 +320,135 @@ def summarize_node(state: AgentState, exp_manager=None):
 - **발행일**: {publish_date}
 
 """
-            # 각 수준별 요약 추가
-            for level_name, content in final_answers.items():
-                summary_md += f"## 요약: {level_labels.get(level_name, level_name)}\n\n"
-                summary_md += f"{content}\n\n---\n\n"
+        # 각 수준별 요약 추가
+        for level_name, content in final_answers.items():
+            summary_md += f"## 요약: {level_labels.get(level_name, level_name)}\n\n"
+            summary_md += f"{content}\n\n---\n\n"
 
-            summary_md += f"*생성 시간: {exp_manager.metadata.get('start_time', '')}*\n"
+        summary_md += f"*생성 시간: {exp_manager.metadata.get('start_time', '')}*\n"
 
-            # summary 폴더에 논문 제목을 파일명으로 저장
-            summary_dir = exp_manager.outputs_dir / "summary"
-            summary_dir.mkdir(exist_ok=True)
+        # summary 폴더에 논문 제목을 파일명으로 저장
+        summary_dir = exp_manager.outputs_dir / "summary"
+        summary_dir.mkdir(exist_ok=True)
 
-            # 논문 제목을 파일명으로 사용 (특수문자 제거)
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_title = safe_title.replace(' ', '_')[:100]  # 최대 100자
+        # 논문 제목을 파일명으로 사용 (특수문자 제거)
+        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_title = safe_title.replace(' ', '_')[:100]  # 최대 100자
 
-            summary_file = summary_dir / f"{safe_title}.md"
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(summary_md)
+        summary_file = summary_dir / f"{safe_title}.md"
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write(summary_md)
 
-            if tool_logger:
-                tool_logger.write(f"논문 요약 저장 완료: {summary_file.name}")
+        if tool_logger:
+            tool_logger.write(f"논문 요약 저장 완료: {summary_file.name}")
+
+    state["tool_result"] = state["final_answer"]  # 도구 실행 결과
+
+    if tool_logger:
+        tool_logger.write("논문 요약 노드 실행 완료")
+        tool_logger.close()
 
-        state["tool_result"] = state["final_answer"]  # 도구 실행 결과
+    return state
 
+
+def _fail_summarize(state: AgentState, error: Exception, tool_logger=None):
+    """논문 요약 예외 처리 (동기 / 비동기 노드 공통)"""
+    error_msg = f"논문 요약 중 오류 발생: {str(error)}"
+
+    if tool_logger:
+        tool_logger.write(f"오류: {error_msg}")
+        tool_logger.close()
+
+    state["final_answer"] = error_msg
+    return state
+
+
+def summarize_node(state: AgentState, exp_manager=None):
+    """
+    논문 요약 노드
+    PostgreSQL papers 테이블에서 논문을 검색하고,
+    pgvector에서 해당 논문의 모든 청크를 조회하여 요약 생성
+    난이도별(Easy/Hard) 요약 프롬프트 적용
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
+
+    Returns:
+        AgentState: 업데이트된 상태 (final_answer에 요약 결과)
+    """
+    question, difficulty, tool_logger = _start_summarize(state, exp_manager)
+
+    # -------------- 파이프라인 모드: 이전 도구 결과 사용 -------------- #
+    tool_result = _pipeline_source(state)
+    if tool_result:
         if tool_logger:
-            tool_logger.write("논문 요약 노드 실행 완료")
+            tool_logger.write(f"파이프라인 모드: 이전 도구 결과 사용 ({len(tool_result)} 글자)")
 
-        return state
+        # 난이도별 LLM 초기화
+        llm_client = LLMClient.from_difficulty(
+            difficulty=difficulty,
+            logger=exp_manager.logger if exp_manager else None
+        )
+        response = llm_client.llm.invoke(_pipeline_summary_messages(tool_result, difficulty))
+        return _finish_pipeline_summary(state, response.content, tool_logger)
+
+    try:
+        # 1단계: 논문 제목 추출 (LLM 사용)
+        llm_client = LLMClient.from_difficulty(
+            difficulty=difficulty,
+            logger=exp_manager.logger if exp_manager else None
+        )
+        paper_title = llm_client.llm.invoke(_title_extraction_prompt(question, tool_logger)).content.strip()
+
+        # 2~7단계: 논문 검색 및 요약
+        return _summarize_paper_by_title(state, paper_title, difficulty, exp_manager, tool_logger)
 
     except Exception as e:
-        # 예외 처리
-        error_msg = f"논문 요약 중 오류 발생: {str(e)}"
+        return _fail_summarize(state, e, tool_logger)
+
+
+async def summarize_node_async(state: AgentState, exp_manager=None):
+    """
+    논문 요약 노드 (비동기 그래프용)
+
+    파이프라인 요약 / 논문 제목 추출은 llm.ainvoke로 이벤트 루프에서 실행,
+    논문 검색 / 저장된 요약 조회 / 누락 수준 요약 생성(map-reduce)은 공용 스레드 풀에서 실행
+
+    Args:
+        state (AgentState): Agent 상태
+        exp_manager: ExperimentManager 인스턴스 (선택 사항)
 
+    Returns:
+        AgentState: 업데이트된 상태 (final_answer에 요약 결과)
+    """
+    question, difficulty, tool_logger = _start_summarize(state, exp_manager)
+
+    # -------------- 파이프라인 모드: 이전 도구 결과 사용 -------------- #
+    tool_result = _pipeline_source(state)
+    if tool_result:
         if tool_logger:
-            tool_logger.write(f"오류: {error_msg}")
+            tool_logger.write(f"파이프라인 모드: 이전 도구 결과 사용 ({len(tool_result)} 글자)")
 
-        state["final_answer"] = error_msg
-        return state
+        # 난이도별 LLM 초기화
+        llm_client = LLMClient.from_difficulty(
+            difficulty=difficulty,
+            logger=exp_manager.logger if exp_manager else None
+        )
+        response = await llm_client.llm.ainvoke(_pipeline_summary_messages(tool_result, difficulty))
+        return _finish_pipeline_summary(state, response.content, tool_logger)
+
+    try:
+        # 1단계: 논문 제목 추출 (LLM 사용)
+        llm_client = LLMClient.from_difficulty(
+            difficulty=difficulty,
+            logger=exp_manager.logger if exp_manager else None
+        )
+        response = await llm_client.llm.ainvoke(_title_extraction_prompt(question, tool_logger))
+        paper_title = response.content.strip()
+
+        # 2~7단계: 논문 검색 및 요약
+        return await run_blocking(_summarize_paper_by_title, state, paper_title, difficulty, exp_manager, tool_logger)
+
+    except Exception as e:
+        return _fail_summarize(state, e, tool_logger)
@@ -0,0 +1,309 @@
+# src/tools/summarize_engine.py
+"""
+긴 논문 map-reduce 요약 엔진
+
+summarize 도구가 논문 전체 청크를 한 프롬프트에 넣던 방식을 대체:
+- 짧은 논문 (single_pass_max_tokens 이하): 청크를 그대로 결합 (stuff)
+- 긴 논문: 연속 청크를 토큰 예산 단위 섹션으로 묶어 섹션별 정리 (map, 동시 실행)
+  → 정리 결과가 reduce_max_tokens를 넘으면 묶어서 다시 정리 (계층 reduce)
+- 섹션 정리는 (모델, 프롬프트, 섹션 본문) 해시로 캐시 → 같은 논문의 다른 수준 요약에서 재사용
+  (수준별 요약이 동시에 실행되므로 진행 중인 같은 키 호출은 한 번만 보내고 결과를 공유)
+
+최종 수준별(easy/hard) 요약은 호출부가 condense() 결과를 요약 템플릿의 {combined_text}로 사용
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import contextvars
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.prompts import get_summarize_section_prompt
+from src.utils.cache import LRUCache
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 summarize_engine 섹션이 없을 때 사용
+DEFAULT_SUMMARIZE_ENGINE_CONFIG = {
+    "single_pass_max_tokens": 6000,                 # 이하면 map 없이 원문 그대로 사용
+    "section_max_tokens": 3000,                     # map 섹션당 최대 입력 토큰
+    "reduce_max_tokens": 6000,                      # 최종 요약 입력 최대 토큰 (초과 시 계층 reduce)
+    "map_concurrency": 4,                           # 섹션 정리 동시 LLM 호출 수
+    "section_cache_size": 2000,                     # 섹션 정리 캐시 최대 항목 수
+}
+
+
+def _load_engine_config() -> Dict[str, Any]:
+    """
+    요약 엔진 설정 로드 (기본값과 병합)
+
+    Returns:
+        요약 엔진 설정 딕셔너리
+    """
+    config = dict(DEFAULT_SUMMARIZE_ENGINE_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("summarize_engine", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+# ==================== 토큰 계산 ==================== #
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    # tiktoken 미설치 / 인코딩 다운로드 불가 시 문자 수 기반 근사
+    _ENCODING = None
+
+
+def count_tokens(text: str) -> int:
+    """
+    텍스트 토큰 수 (tiktoken cl100k_base, 없으면 3자당 1토큰으로 보수적 근사)
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        토큰 수
+    """
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return len(text) // 3 + 1
+
+
+def batch_by_tokens(texts: List[str], max_tokens: int) -> List[List[str]]:
+    """
+    순서를 유지하며 연속 텍스트를 토큰 예산 단위로 묶기 (greedy)
+
+    예산보다 큰 단일 텍스트는 단독 묶음으로 둠 (청크 자체는 자르지 않음)
+
+    Args:
+        texts: 순서대로 정렬된 텍스트 리스트 (chunk_index 순)
+        max_tokens: 묶음당 최대 토큰 수
+
+    Returns:
+        텍스트 묶음 리스트
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for text in texts:
+        tokens = count_tokens(text)
+        if current and current_tokens + tokens > max_tokens:
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+# ==================== 섹션 정리 캐시 ==================== #
+_section_cache: Optional[LRUCache] = None
+_section_cache_lock = threading.Lock()
+
+# 진행 중인 섹션 정리 호출: (캐시 id, 키) → Future (동시에 같은 섹션을 정리하는 수준끼리 공유)
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def get_section_cache() -> LRUCache:
+    """
+    프로세스 공용 섹션 정리 캐시 반환 (최초 호출 시 생성)
+
+    Returns:
+        LRUCache 인스턴스
+    """
+    global _section_cache
+
+    if _section_cache is None:
+        with _section_cache_lock:
+            if _section_cache is None:
+                _section_cache = LRUCache(max_size=int(_load_engine_config()["section_cache_size"]))
+    return _section_cache
+
+
+# ==================== Map-Reduce 요약기 ==================== #
+class MapReduceSummarizer:
+    """
+    토큰 예산 기반 map-reduce 논문 압축기
+
+    condense() 결과는 수준별 요약 템플릿의 {combined_text}에 그대로 사용
+    """
+
+    def __init__(
+        self,
+        invoke_fn: Callable[[str], str],
+        model_key: str,
+        config: Optional[Dict[str, Any]] = None,
+        cache: Optional[LRUCache] = None,
+    ):
+        """
+        Args:
+            invoke_fn: 프롬프트 → 응답 텍스트 (LLM 호출)
+            model_key: 캐시 키에 포함할 모델 식별자 ("provider:model")
+            config: 엔진 설정 (미지정 시 model_config.yaml)
+            cache: 섹션 정리 캐시 (미지정 시 프로세스 공용 캐시)
+        """
+        self.invoke_fn = invoke_fn
+        self.model_key = model_key
+        self.config = dict(DEFAULT_SUMMARIZE_ENGINE_CONFIG, **(config or _load_engine_config()))
+        self.cache = cache if cache is not None else get_section_cache()
+
+        self._stats_lock = threading.Lock()
+        self.stats = {"method": None, "sections": 0, "map_calls": 0, "reduce_calls": 0, "cache_hits": 0}
+
+    # ---------------------- 내부: 캐시된 LLM 호출 ---------------------- #
+    def _cached_invoke(self, stage: str, prompt: str, body: str) -> str:
+        """(모델, 단계 프롬프트, 본문) 해시로 캐시된 LLM 호출"""
+        key = hashlib.sha256(
+            f"{self.model_key}\x00{stage}\x00{get_summarize_section_prompt(stage)}\x00{body}".encode("utf-8")
+        ).hexdigest()
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            with self._stats_lock:
+                self.stats["cache_hits"] += 1
+            return cached
+
+        # 같은 키를 이미 다른 스레드(다른 수준)가 호출 중이면 그 결과를 기다림
+        inflight_key = (id(self.cache), key)
+        with _inflight_lock:
+            cached = self.cache.get(key)
+            future = _inflight.get(inflight_key) if cached is None else None
+            owner = cached is None and future is None
+            if owner:
+                future = _inflight[inflight_key] = Future()
+
+        if not owner:
+            result = cached if cached is not None else future.result()
+            with self._stats_lock:
+                self.stats["cache_hits"] += 1
+            return result
+
+        try:
+            result = self.invoke_fn(prompt)
+            self.cache.set(key, result)
+            future.set_result(result)
+        except BaseException as e:
+            # 기다리던 호출에도 같은 오류 전달 (캐시에는 남기지 않음)
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(inflight_key, None)
+
+        with self._stats_lock:
+            self.stats["map_calls" if stage == "map" else "reduce_calls"] += 1
+        return result
+
+    def _run_concurrently(self, fn, items: List[Any]) -> List[str]:
+        """순서를 유지하며 map_concurrency만큼 동시 실행 (호출 컨텍스트: 우선순위 / 콜백 복사)"""
+        workers = max(1, min(int(self.config["map_concurrency"]), len(items)))
+        if workers == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summarize-map") as executor:
+            futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+            return [future.result() for future in futures]
+
+    # ---------------------- map / reduce 단계 ---------------------- #
+    def map_sections(self, title: str, sections: List[List[str]]) -> List[str]:
+        """
+        섹션별 정리 (동시 실행)
+
+        Args:
+            title: 논문 제목
+            sections: batch_by_tokens 결과
+
+        Returns:
+            섹션 순서대로 정리 텍스트 리스트
+        """
+        template = get_summarize_section_prompt("map")
+        total = len(sections)
+
+        def summarize(indexed):
+            index, texts = indexed
+            body = "\n\n".join(texts)
+            prompt = template.format(title=title, index=index, total=total, text=body)
+            return self._cached_invoke("map", prompt, body)
+
+        return self._run_concurrently(summarize, list(enumerate(sections, 1)))
+
+    def reduce_notes(self, title: str, notes: List[str]) -> List[str]:
+        """
+        정리 결과가 예산을 넘으면 묶어서 다시 정리 (계층 reduce, 예산 이하가 될 때까지)
+
+        Args:
+            title: 논문 제목
+            notes: 섹션 정리 리스트
+
+        Returns:
+            reduce_max_tokens 이하로 줄어든 정리 리스트
+        """
+        template = get_summarize_section_prompt("reduce")
+        budget = int(self.config["reduce_max_tokens"])
+
+        def reduce(group):
+            body = "\n\n".join(group)
+            return self._cached_invoke("reduce", template.format(title=title, text=body), body)
+
+        while len(notes) > 1 and count_tokens("\n\n".join(notes)) > budget:
+            groups = batch_by_tokens(notes, budget)
+            if len(groups) == len(notes):
+                # 묶을 수 없으면 (각 정리가 예산 절반 초과) 두 개씩 강제로 묶음
+                groups = [notes[i:i + 2] for i in range(0, len(notes), 2)]
+            notes = self._run_concurrently(reduce, groups)
+        return notes
+
+    # ---------------------- 공개 API ---------------------- #
+    def condense(self, title: str, texts: List[str]) -> str:
+        """
+        논문 본문을 요약 템플릿 입력 크기로 압축
+
+        Args:
+            title: 논문 제목
+            texts: chunk_index 순 청크 텍스트 리스트
+
+        Returns:
+            요약 템플릿의 {combined_text}로 사용할 텍스트
+        """
+        combined = "\n\n".join(texts)
+        if count_tokens(combined) <= int(self.config["single_pass_max_tokens"]):
+            self.stats.update(method="stuff", sections=1)
+            return combined
+
+        sections = batch_by_tokens(texts, int(self.config["section_max_tokens"]))
+        notes = self.map_sections(title, sections)
+        notes = self.reduce_notes(title, notes)
+        self.stats.update(method="map_reduce", sections=len(sections))
+
+        return "\n\n".join(f"[섹션 {i}]\n{note}" for i, note in enumerate(notes, 1))
+
+
+def get_engine_version() -> str:
+    """
+    요약 결과에 영향을 주는 엔진 설정/프롬프트 해시 (저장 요약 버전 키에 포함)
+
+    Returns:
+        버전 문자열 (sha256 앞 8자)
+    """
+    config = _load_engine_config()
+    signature = "\x00".join([
+        get_summarize_section_prompt("map"),
+        get_summarize_section_prompt("reduce"),
+        str(config["single_pass_max_tokens"]),
+        str(config["section_max_tokens"]),
+        str(config["reduce_max_tokens"]),
+    ])
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()[:8]
@@ -3,7 +3,6 @@ import os
 import re
 import time
 import json
-import psycopg2
 import psycopg2.extras
 from typing import List, Tuple, Any, Optional
 
@@ -12,6 +11,7 @@ from dotenv import load_dotenv
 
 # LLMClient import 추가 (config 기반)
 from src.utils.config_loader import get_model_config
+from src.database.db import get_connection, trace_cursor
 from src.llm.client import LLMClient
 from src.prompts import get_tool_prompt
 
@@ -44,13 +44,11 @@ load_dotenv()
 # DB 연결 유틸
 # ───────────────────────────────────────────────────────────────────────────────
 def _get_conn():
-    return psycopg2.connect(
-        host=os.getenv("POSTGRES_HOST", "localhost"),
-        port=int(os.getenv("POSTGRES_PORT", "5432")),
-        user=os.getenv("POSTGRES_USER", "postgres"),
-        password=os.getenv("POSTGRES_PASSWORD", "postgres"),
-        dbname=os.getenv("POSTGRES_DB", "postgres"),
-    )
+    """
+    공용 연결 풀에서 연결을 빌려오는 컨텍스트 매니저
+    (블록 종료 시 commit/rollback 후 풀에 반환, db_config.yaml의 statement_timeout 적용)
+    """
+    return get_connection()
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -76,6 +74,7 @@ def _fetch_schema_snapshot() -> str:
     ORDER BY table_name, ordinal_position;
     """
     with _get_conn() as conn, conn.cursor() as cur:
+        cur = trace_cursor(cur)
         cur.execute(q, (list(ALLOWED_TABLES),))
         rows = cur.fetchall()
 
@@ -247,6 +246,7 @@ def _explain_safe(sql: str) -> bool:
     """
     try:
         with _get_conn() as conn, conn.cursor() as cur:
+            cur = trace_cursor(cur)
             cur.execute("EXPLAIN " + sql)
             plan_rows = cur.fetchall()
             plan_text = "\n".join(r[0] for r in plan_rows)
@@ -261,6 +261,7 @@ def _explain_safe(sql: str) -> bool:
 # ───────────────────────────────────────────────────────────────────────────────
 def _run_query(sql: str) -> Tuple[List[str], List[Tuple[Any, ...]]]:
     with _get_conn() as conn, conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+        cur = trace_cursor(cur)
         cur.execute(sql)
         cols = [d.name for d in cur.description]
         rows = cur.fetchall()
@@ -293,6 +294,7 @@ def _log_query(user_query: str,
     """
     try:
         with _get_conn() as conn, conn.cursor() as cur:
+            cur = trace_cursor(cur)
             cur.execute(
                 """
                 INSERT INTO query_logs (user_query, difficulty_mode, tool_used, response,
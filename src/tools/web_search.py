@@ -12,7 +12,9 @@ import os
 from langchain.schema import SystemMessage, HumanMessage
 from langchain_community.tools.tavily_search import TavilySearchResults
 from src.agent.state import AgentState
+from src.agent.streaming import answer_stream_config
 from src.llm.client import LLMClient
+from src.llm.scheduler import get_scheduler
 from src.tools.arxiv_handler import ArxivPaperHandler
 from src.prompts import get_tool_prompt, get_web_search_user_prompt_template
 
@@ -61,7 +63,9 @@ def web_search_node(state: AgentState, exp_manager=None):
         if tool_logger:
             tool_logger.write("Tavily Search API 호출 시작")
 
-        search_results = search_tool.invoke({"query": question})  # 검색 실행
+        # 검색 실행 (호출 스케줄러의 tavily 동시성 / 속도 제한 적용)
+        with get_scheduler().slot("tavily"):
+            search_results = search_tool.invoke({"query": question})
 
         if tool_logger:
             tool_logger.write(f"검색 결과 수: {len(search_results)}")
@@ -171,7 +175,7 @@ def web_search_node(state: AgentState, exp_manager=None):
                 })
 
             # LLM 호출
-            response = llm_client.llm.invoke(messages)
+            response = llm_client.llm.invoke(messages, config=answer_stream_config(level))
             final_answers[level] = response.content
 
             # 로깅
@@ -0,0 +1,160 @@
+# ---------------------- 인메모리 캐시 모듈 ---------------------- #
+"""
+스레드 안전 LRU/TTL 캐시
+
+주요 기능:
+- 최대 항목 수 제한 (가장 오래 사용하지 않은 항목부터 제거)
+- 항목별 만료 시간(TTL) 지원 (선택)
+- hit/miss/eviction 통계 제공
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import threading                               # 동시 접근 잠금
+import time                                    # 만료 시간 계산
+from collections import OrderedDict            # LRU 순서 관리
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# 캐시 미스 표시용 센티널 (None 값 저장과 구분)
+_MISSING = object()
+
+
+# ==================== LRUCache 클래스 정의 ==================== #
+class LRUCache:
+    """
+    최대 크기와 TTL을 갖는 스레드 안전 LRU 캐시
+
+    Args:
+        max_size: 최대 항목 수 (0 이하이면 저장하지 않음)
+        ttl_seconds: 항목 만료 시간 (초, None이면 만료 없음)
+    """
+
+    # ---------------------- 초기화 메서드 ---------------------- #
+    def __init__(self, max_size: int = 1000, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        # key → (value, 만료 시각)
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+    # ---------------------- 조회 ---------------------- #
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 조회 (조회된 항목은 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+            default: 미스 시 반환값
+
+        Returns:
+            캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+
+            # 만료된 항목 제거
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+
+    # ---------------------- 저장 ---------------------- #
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        캐시 저장 (최대 크기 초과 시 LRU 항목 제거)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl_seconds: 항목별 TTL (미지정 시 캐시 기본 TTL)
+        """
+        if self.max_size <= 0:
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+
+    # ---------------------- 삭제 ---------------------- #
+    def delete(self, key: Hashable) -> bool:
+        """
+        캐시 항목 삭제
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            bool: 삭제 여부
+        """
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+
+    def clear(self):
+        """전체 항목 삭제 (통계는 유지)"""
+        with self._lock:
+            self._data.clear()
+
+
+    # ---------------------- 통계 ---------------------- #
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: size, max_size, hits, misses, hit_rate, evictions, expirations
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return False
+            _, expires_at = entry
+            return expires_at is None or expires_at > time.monotonic()
@@ -11,9 +11,11 @@ YAML 설정 파일을 로드하고 환경 변수를 치환하여 반환합니다
 # ==================================================================================== #
 
 # ------------------------- 표준 라이브러리 ------------------------- #
+import copy
 import os
 import re
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Tuple
 
 # ------------------------- 서드파티 라이브러리 ------------------------- #
 import yaml
@@ -48,6 +50,10 @@ class ConfigLoader:
         """
         self.config_dir = config_dir
 
+        # 파일 경로 → (수정 시각, 치환된 설정): 파일이 바뀌지 않으면 YAML 재파싱 생략
+        self._yaml_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._yaml_lock = threading.Lock()
+
     # ---------------------- 환경 변수 치환 ---------------------- #
     def _replace_env_vars(self, value: Any) -> Any:
         """
@@ -100,14 +106,23 @@ class ConfigLoader:
         """
         file_path = os.path.join(self.config_dir, filename)
 
-        # YAML 파일 로드
-        with open(file_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        # 수정 시각이 같으면 캐시된 설정 사용 (노드 / 도구 호출마다 재파싱 방지)
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = self._yaml_cache.get(file_path)
+        if cached is None or cached[0] != mtime:
+            # YAML 파일 로드
+            with open(file_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f)
+
+            # 환경 변수 치환
+            config = self._replace_env_vars(config)
 
-        # 환경 변수 치환
-        config = self._replace_env_vars(config)
+            with self._yaml_lock:
+                self._yaml_cache[file_path] = (mtime, config)
+            cached = (mtime, config)
 
-        return config
+        # 호출부 수정이 캐시에 반영되지 않도록 복사본 반환
+        return copy.deepcopy(cached[1])
 
     # ---------------------- 데이터베이스 설정 로드 ---------------------- #
     def load_db_config(self) -> Dict[str, Any]:
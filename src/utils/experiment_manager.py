@@ -11,6 +11,8 @@
 - 프롬프트 기록
 - UI 인터랙션 로그
 - 평가 지표 저장
+- 요청 경로 파일 기록은 비동기 기록기(src/utils/log_writer.py)로 처리
+- 메타데이터 / 평가 지표는 지표 저장소(src/utils/metrics_store.py)에도 기록 (폴더 순회 없는 집계용)
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
@@ -24,6 +26,8 @@ import yaml                                    # YAML 파일 처리
 
 # ------------------------- 프로젝트 모듈 ------------------------- #
 from src.utils.logger import Logger            # Logger 클래스
+from src.utils.log_writer import get_log_writer  # 비동기 파일 기록기
+from src.utils.metrics_store import get_metrics_store, request_row  # 지표 저장소
 
 
 # ==================== ExperimentManager 클래스 정의 ==================== #
@@ -78,6 +82,12 @@ class ExperimentManager:
 
         self.metadata_file = self.experiment_dir / "metadata.json"
 
+        # 비동기 기록기 (logging.async_writer: false면 None → 동기 기록)
+        self._writer = get_log_writer()
+
+        # 지표 저장소 (metrics_store.enabled: false면 None → JSON 파일만 기록)
+        self._metrics = get_metrics_store()
+
         # Logger 초기화
         self.logger = Logger(str(self.experiment_dir / "chatbot.log"))
         self.logger.write(f"세션 시작: session_{session_id:03d}")
@@ -171,6 +181,60 @@ class ExperimentManager:
                 self.logger.write(f"설정 파일 복사 실패: {config_file} - {e}")
 
 
+    # ---------------------- 파일 기록 (비동기 기록기) ---------------------- #
+    def _write_text(self, path: Path, text: str):
+        """
+        파일 전체 기록 (비동기 기록기가 있으면 기록 스레드에 위임)
+
+        Args:
+            path: 파일 경로
+            text: 기록할 내용
+        """
+        if self._writer is not None:
+            self._writer.write(path, text)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+    def _append_text(self, path: Path, text: str):
+        """
+        파일 끝에 추가 (비동기 기록기가 있으면 열린 파일 핸들 재사용)
+
+        Args:
+            path: 파일 경로
+            text: 추가할 내용
+        """
+        if self._writer is not None:
+            self._writer.append(path, text)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(text)
+
+
+    def _write_json(self, path: Path, data):
+        """JSON 직렬화는 호출 시점에 수행 (이후 원본 변경과 무관), 파일 쓰기는 _write_text"""
+        self._write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+    # ---------------------- 기록 반영 대기 ---------------------- #
+    def sync(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        대기 중인 로그 / 파일 기록이 디스크에 반영될 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 제한 시간 안에 반영 완료 여부
+        """
+        return self.logger.sync(timeout)
+
+
     # ==================== 도구 로그 메서드 ==================== #
     # ---------------------- 도구별 Logger 생성 ---------------------- #
     def get_tool_logger(self, tool_name: str) -> Logger:
@@ -227,9 +291,8 @@ class ExperimentManager:
 
         self.db_queries.append(query_record)
 
-        # queries.sql 파일에 즉시 추가
-        with open(self.database_dir / "queries.sql", 'a', encoding='utf-8') as f:
-            f.write(query_record)
+        # queries.sql 파일에 추가 (기록 스레드가 열린 파일 핸들에 묶음 기록)
+        self._append_text(self.database_dir / "queries.sql", query_record)
 
         self.logger.write(f"SQL 쿼리 기록: {description}")
 
@@ -252,8 +315,7 @@ class ExperimentManager:
         self.pgvector_searches.append(search_info)
 
         # pgvector_searches.json 업데이트
-        with open(self.database_dir / "pgvector_searches.json", 'w', encoding='utf-8') as f:
-            json.dump(self.pgvector_searches, f, ensure_ascii=False, indent=2)
+        self._write_json(self.database_dir / "pgvector_searches.json", self.pgvector_searches)
 
         self.logger.write(f"pgvector 검색 기록: {search_info.get('tool', 'unknown')}")
 
@@ -271,8 +333,7 @@ class ExperimentManager:
         self.search_results[tool_name] = results
 
         # search_results.json 업데이트
-        with open(self.database_dir / "search_results.json", 'w', encoding='utf-8') as f:
-            json.dump(self.search_results, f, ensure_ascii=False, indent=2)
+        self._write_json(self.database_dir / "search_results.json", self.search_results)
 
         self.logger.write(f"검색 결과 저장: {tool_name}")
 
@@ -291,6 +352,50 @@ class ExperimentManager:
         self.logger.write("DB 성능 정보 저장 완료")
 
 
+    # ---------------------- 임베딩 캐시 통계 저장 ---------------------- #
+    def save_embedding_cache_stats(self, cache_stats: Dict):
+        """
+        임베딩 캐시 hit/miss 통계 저장
+
+        Args:
+            cache_stats: 모델별 캐시 통계 딕셔너리 (get_embedding_cache_stats() 결과)
+        """
+        data = {
+            'timestamp': datetime.now().isoformat(),
+            'models': cache_stats
+        }
+
+        self._write_json(self.database_dir / "embedding_cache.json", data)
+
+        for model, stats in cache_stats.items():
+            self.logger.write(
+                f"임베딩 캐시 [{model}]: hit {stats.get('memory_hits', 0)}"
+                f"+{stats.get('persistent_hits', 0)} / miss {stats.get('misses', 0)}"
+                f" (hit_rate={stats.get('hit_rate', 0.0)})"
+            )
+
+
+    # ---------------------- 선행 검색 통계 저장 ---------------------- #
+    def save_speculative_prefetch_stats(self, prefetch_stats: Dict):
+        """
+        라우팅 중 선행 검색 적중 / 낭비 통계 저장
+
+        Args:
+            prefetch_stats: 선행 검색 통계 딕셔너리 (get_speculative_stats() 결과)
+        """
+        data = {
+            'timestamp': datetime.now().isoformat(),
+            'stats': prefetch_stats
+        }
+
+        self._write_json(self.database_dir / "speculative_prefetch.json", data)
+
+        self.logger.write(
+            f"선행 검색: hit {prefetch_stats.get('hits', 0)} / 시작 {prefetch_stats.get('started', 0)}"
+            f" (hit_rate={prefetch_stats.get('hit_rate', 0.0)}, 낭비 {prefetch_stats.get('wasted_ms', 0.0)}ms)"
+        )
+
+
     # ==================== 프롬프트 관련 메서드 ==================== #
     # ---------------------- 시스템 프롬프트 저장 ---------------------- #
     def save_system_prompt(self, system_prompt: str, metadata: Optional[Dict] = None):
@@ -308,8 +413,7 @@ class ExperimentManager:
             for key, value in metadata.items():
                 content += f"{key}: {value}\n"
 
-        with open(self.prompts_dir / "system_prompt.txt", 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_text(self.prompts_dir / "system_prompt.txt", content)
 
         self.logger.write("시스템 프롬프트 저장 완료")
 
@@ -330,8 +434,7 @@ class ExperimentManager:
             for key, value in metadata.items():
                 content += f"{key}: {value}\n"
 
-        with open(self.prompts_dir / "user_prompt.txt", 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_text(self.prompts_dir / "user_prompt.txt", content)
 
         self.logger.write("사용자 프롬프트 저장 완료")
 
@@ -352,8 +455,7 @@ class ExperimentManager:
             for key, value in metadata.items():
                 content += f"{key}: {value}\n"
 
-        with open(self.prompts_dir / "final_prompt.txt", 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_text(self.prompts_dir / "final_prompt.txt", content)
 
         self.logger.write("최종 프롬프트 저장 완료")
 
@@ -398,14 +500,10 @@ class ExperimentManager:
         Args:
             interaction: 인터랙션 설명
         """
-        # ui 폴더 존재 확인 및 생성
-        self.ui_dir.mkdir(parents=True, exist_ok=True)
-
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_line = f"{timestamp} | {interaction}\n"
 
-        with open(self.ui_dir / "user_interactions.log", 'a', encoding='utf-8') as f:
-            f.write(log_line)
+        self._append_text(self.ui_dir / "user_interactions.log", log_line)
 
 
     # ---------------------- UI 이벤트 기록 ---------------------- #
@@ -482,6 +580,7 @@ class ExperimentManager:
         with open(self.evaluation_dir / "rag_metrics.json", 'w', encoding='utf-8') as f:
             json.dump(metrics, f, ensure_ascii=False, indent=2)
 
+        self._record_metrics("rag", metrics)
         self.logger.write("RAG 평가 지표 저장 완료")
 
 
@@ -498,6 +597,7 @@ class ExperimentManager:
         with open(self.evaluation_dir / "agent_accuracy.json", 'w', encoding='utf-8') as f:
             json.dump(accuracy_data, f, ensure_ascii=False, indent=2)
 
+        self._record_metrics("agent_accuracy", accuracy_data)
         self.logger.write("Agent 정확도 저장 완료")
 
 
@@ -514,6 +614,7 @@ class ExperimentManager:
         with open(self.evaluation_dir / "latency_report.json", 'w', encoding='utf-8') as f:
             json.dump(latency_data, f, ensure_ascii=False, indent=2)
 
+        self._record_metrics("latency", latency_data)
         self.logger.write("응답 시간 분석 저장 완료")
 
 
@@ -530,6 +631,7 @@ class ExperimentManager:
         with open(self.evaluation_dir / "cost_analysis.json", 'w', encoding='utf-8') as f:
             json.dump(cost_data, f, ensure_ascii=False, indent=2)
 
+        self._record_metrics("cost", cost_data)
         self.logger.write("비용 분석 저장 완료")
 
 
@@ -668,12 +770,28 @@ class ExperimentManager:
         """
         self.metadata.update(kwargs)
 
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(self.metadata, f, ensure_ascii=False, indent=2)
+        self._write_json(self.metadata_file, self.metadata)
+        self._record_session()
 
         self.logger.write(f"메타데이터 업데이트: {list(kwargs.keys())}")
 
 
+    # ---------------------- 지표 저장소 기록 ---------------------- #
+    def _record_session(self):
+        """현재 메타데이터를 지표 저장소 requests 테이블에 기록 (같은 세션은 덮어씀)"""
+        if self._metrics is None:
+            return
+        metadata = dict(self.metadata, date=self.experiment_dir.parent.name)
+        self._metrics.record_request(
+            request_row(self.experiment_dir.name, metadata, "session", str(self.experiment_dir))
+        )
+
+    def _record_metrics(self, kind: str, data: Dict):
+        """평가 지표를 지표 저장소 metrics 테이블에 기록"""
+        if self._metrics is not None:
+            self._metrics.record_metrics(self.experiment_dir.name, kind, data, date=self.experiment_dir.parent.name)
+
+
     # ---------------------- 전체 설정 저장 ---------------------- #
     def save_config(self, config: Dict):
         """
@@ -728,9 +846,17 @@ class ExperimentManager:
         # SQL 쿼리 플러시 (database 폴더에 저장)
         self.flush_queries_to_file()
 
+        # 기록 스레드가 열어 둔 append 파일 핸들 닫기 (queries.sql / user_interactions.log)
+        if self._writer is not None:
+            self._writer.close_file(self.database_dir / "queries.sql")
+            self._writer.close_file(self.ui_dir / "user_interactions.log")
+
         # 종료 시간 기록
         self.metadata['end_time'] = datetime.now().isoformat()
 
+        # 대기 중인 기록 반영 (최종 메타데이터 / 빈 폴더 정리보다 먼저)
+        self.sync()
+
         # 최종 메타데이터 저장
         with open(self.metadata_file, 'w', encoding='utf-8') as f:
             json.dump(self.metadata, f, ensure_ascii=False, indent=2)
@@ -743,6 +869,12 @@ class ExperimentManager:
         self.cleanup_empty_folders()
 
         self.logger.close()
+        self.sync()
+
+        # 지표 저장소에 최종 메타데이터 반영 (종료 직후 집계 CLI에서 조회 가능)
+        self._record_session()
+        if self._metrics is not None:
+            self._metrics.flush()
 
 
     # ==================== Context Manager 지원 ==================== #
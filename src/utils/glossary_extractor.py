@@ -15,11 +15,9 @@ import os
 import json
 from typing import List, Dict, Optional
 
-# ------------------------- 서드파티 라이브러리 ------------------------- #
-import psycopg2
-
 # ------------------------- 프로젝트 모듈 ------------------------- #
 from src.llm.client import LLMClient
+from src.database.db import get_cursor
 
 
 # ==================================================================================== #
@@ -235,60 +233,59 @@ def save_terms_to_glossary(terms: List[Dict[str, str]], logger=None) -> int:
 
     # -------------- PostgreSQL 연결 -------------- #
     try:
-        conn = psycopg2.connect(os.getenv("DATABASE_URL"))
-        cursor = conn.cursor()
-
-        if logger:
-            logger.write(f"glossary 테이블에 {len(terms)}개 용어 저장 시작")
-
-        # -------------- INSERT 쿼리 -------------- #
-        insert_query = """
-        INSERT INTO glossary (term, definition, easy_explanation, hard_explanation, category, created_at)
-        VALUES (%s, %s, %s, %s, %s, NOW())
-        ON CONFLICT (term) DO NOTHING
-        RETURNING term_id;
-        """
-
-        saved_count = 0
-
-        for term_data in terms:
-            term = term_data.get("term", "").strip()
-            definition = term_data.get("definition", "").strip()
-            easy_explanation = term_data.get("easy_explanation", "").strip()
-            hard_explanation = term_data.get("hard_explanation", "").strip()
-            category = term_data.get("category", "AI/ML").strip()
-
-            # 필수 필드 확인
-            if not term or not definition:
-                if logger:
-                    logger.write(f"용어 건너뛰기 (필수 필드 없음): {term_data}")
-                continue
-
-            try:
-                cursor.execute(insert_query, (term, definition, easy_explanation, hard_explanation, category))
-                result = cursor.fetchone()
-
-                # RETURNING이 None이면 중복으로 인해 저장되지 않음
-                if result:
-                    saved_count += 1
+        # 공용 연결 풀 사용 (블록 종료 시 커밋 및 연결 반환)
+        with get_cursor() as cursor:
+            if logger:
+                logger.write(f"glossary 테이블에 {len(terms)}개 용어 저장 시작")
+
+            # -------------- INSERT 쿼리 -------------- #
+            insert_query = """
+            INSERT INTO glossary (term, definition, easy_explanation, hard_explanation, category, created_at)
+            VALUES (%s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (term) DO NOTHING
+            RETURNING term_id;
+            """
+
+            saved_count = 0
+
+            for term_data in terms:
+                term = term_data.get("term", "").strip()
+                definition = term_data.get("definition", "").strip()
+                easy_explanation = term_data.get("easy_explanation", "").strip()
+                hard_explanation = term_data.get("hard_explanation", "").strip()
+                category = term_data.get("category", "AI/ML").strip()
+
+                # 필수 필드 확인
+                if not term or not definition:
                     if logger:
-                        logger.write(f"용어 저장 성공: {term}")
-                else:
+                        logger.write(f"용어 건너뛰기 (필수 필드 없음): {term_data}")
+                    continue
+
+                try:
+                    cursor.execute(insert_query, (term, definition, easy_explanation, hard_explanation, category))
+                    result = cursor.fetchone()
+
+                    # RETURNING이 None이면 중복으로 인해 저장되지 않음
+                    if result:
+                        saved_count += 1
+                        if logger:
+                            logger.write(f"용어 저장 성공: {term}")
+                    else:
+                        if logger:
+                            logger.write(f"용어 이미 존재 (건너뜀): {term}")
+
+                except Exception as e:
                     if logger:
-                        logger.write(f"용어 이미 존재 (건너뜀): {term}")
-
-            except Exception as e:
-                if logger:
-                    logger.write(f"용어 저장 실패 ({term}): {e}", print_error=True)
-
-        # -------------- 커밋 및 종료 -------------- #
-        conn.commit()
-        cursor.close()
-        conn.close()
+                        logger.write(f"용어 저장 실패 ({term}): {e}", print_error=True)
 
         if logger:
             logger.write(f"용어 저장 완료: {saved_count}/{len(terms)}개")
 
+        # 새 용어가 저장되면 glossary 의존 답변 캐시 무효화
+        if saved_count:
+            from src.agent.answer_cache import invalidate_answer_cache
+            invalidate_answer_cache("glossary")
+
         return saved_count
 
     except Exception as e:
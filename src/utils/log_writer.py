@@ -0,0 +1,325 @@
+# ---------------------- 비동기 로그 기록 모듈 ---------------------- #
+"""
+백그라운드 파일 기록기 (Logger / ExperimentManager 공용)
+
+요청 스레드는 기록할 내용을 큐에 넣기만 하고, 전용 스레드가 파일 쓰기를 처리합니다:
+
+    Logger.write() / ExperimentManager.log_sql_query() / save_*_prompt()
+        → AsyncLogWriter 큐 (put_nowait, 디스크 I/O 없음)
+        → 기록 스레드: 파일 핸들 재사용 + 묶음 쓰기 + flush_interval마다 flush
+
+- durability: none (버퍼가 찰 때 / 파일 닫을 때만) · flush (주기적 flush, 기본값) · fsync (flush + os.fsync)
+- level: 이 수준 미만의 Logger.write(level=...) 메시지는 포맷팅 전에 버림 (DEBUG < INFO < WARNING < ERROR)
+- 큐가 가득 차면 기다리지 않고 버린 뒤 dropped로 집계 (요청 스레드는 절대 대기하지 않음)
+- sync(): 대기 중인 기록을 모두 파일에 반영할 때까지 대기 (세션 종료 / 테스트용)
+- 프로세스 종료 시(atexit) 남은 기록 반영 후 파일 닫기
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import atexit
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 logging 섹션이 없을 때 사용
+DEFAULT_LOGGING_CONFIG = {
+    "async_writer": True,                           # false면 기존처럼 매 줄 동기 기록 + flush
+    "level": "DEBUG",                               # 파일 / 콘솔에 기록할 최소 수준 (INFO면 디버깅 로그 제외)
+    "flush_interval_seconds": 0.5,                  # 주기적 flush 간격
+    "durability": "flush",                          # none | flush | fsync
+    "max_queue_size": 10000,                        # 대기열 최대 길이 (초과 시 버림)
+    "batch_size": 256,                              # 한 번에 처리할 최대 기록 수
+}
+
+# 로그 수준 (숫자가 클수록 중요)
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+DURABILITY_MODES = ("none", "flush", "fsync")
+
+
+def get_logging_config() -> Dict[str, Any]:
+    """
+    로깅 설정 로드 (기본값과 병합)
+
+    Returns:
+        로깅 설정 딕셔너리
+    """
+    config = dict(DEFAULT_LOGGING_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("logging", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def level_value(level: Optional[str]) -> int:
+    """수준 이름 → 숫자 (알 수 없는 이름은 INFO)"""
+    return LEVELS.get(str(level or "INFO").upper(), LEVELS["INFO"])
+
+
+# ==================== 비동기 기록기 ==================== #
+class AsyncLogWriter:
+    """큐 + 전용 스레드로 파일 쓰기를 처리하는 기록기"""
+
+    def __init__(
+        self,
+        flush_interval: float = 0.5,
+        durability: str = "flush",
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+    ):
+        """
+        Args:
+            flush_interval: 주기적 flush 간격 (초)
+            durability: none | flush | fsync
+            max_queue_size: 대기열 최대 길이 (0이면 무제한)
+            batch_size: 한 번에 처리할 최대 기록 수
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"지원하지 않는 durability: {durability} ({' | '.join(DURABILITY_MODES)})")
+
+        self.flush_interval = max(float(flush_interval), 0.01)
+        self.durability = durability
+        self.batch_size = max(int(batch_size), 1)
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(int(max_queue_size), 0))
+        self._files: Dict[Path, Any] = {}           # 경로 → 열린 파일 핸들 (기록 스레드 전용)
+        self._dirty = set()                         # 마지막 flush 이후 쓰기가 있었던 경로
+        self._stats_lock = threading.Lock()
+        self._stats = {"records": 0, "batches": 0, "flushes": 0, "dropped": 0, "errors": 0, "max_queue_depth": 0}
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="async-log-writer", daemon=True)
+        self._thread.start()
+
+    # ---------------------- 요청 스레드 API (대기 없음) ---------------------- #
+    def append(self, path, text: str):
+        """파일 끝에 text 추가 (로그 줄 / queries.sql)"""
+        self._put(("append", Path(path), text))
+
+    def write(self, path, text: str):
+        """파일 전체를 text로 기록 (프롬프트 저장)"""
+        self._put(("write", Path(path), text))
+
+    def close_file(self, path):
+        """파일 핸들 닫기 (이후 기록이 오면 다시 열림)"""
+        self._put(("close", Path(path), None))
+
+    def _put(self, op):
+        if self._closed:
+            self._apply_sync(op)                    # 종료 후 기록은 동기 처리 (atexit 이후 로그)
+            return
+        try:
+            self._queue.put_nowait(op)
+        except queue.Full:
+            self._count(dropped=1)
+            return
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+
+    # ---------------------- 동기화 / 종료 ---------------------- #
+    def sync(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        대기 중인 기록을 모두 파일에 반영할 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            bool: 제한 시간 안에 반영 완료 여부
+        """
+        if self._closed or threading.current_thread() is self._thread:
+            return True
+        done = threading.Event()
+        self._queue.put(("sync", None, done))       # 가득 차도 sync 표시는 반드시 전달
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 10.0):
+        """남은 기록 반영 후 기록 스레드 종료 및 파일 닫기"""
+        if self._closed:
+            return
+        self.sync(timeout)
+        self._closed = True
+        self._queue.put(("stop", None, None))
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        기록기 통계
+
+        Returns:
+            dict: queued, records, batches, flushes, dropped, errors, max_queue_depth, durability
+        """
+        with self._stats_lock:
+            data = dict(self._stats)
+        data["queued"] = self._queue.qsize()
+        data["durability"] = self.durability
+        return data
+
+    def _count(self, **deltas):
+        with self._stats_lock:
+            for key, value in deltas.items():
+                self._stats[key] += value
+
+    # ---------------------- 기록 스레드 ---------------------- #
+    def _run(self):
+        """기록 스레드 본체: 묶음 단위로 처리하고 flush_interval마다 flush"""
+        last_flush = time.monotonic()
+
+        while True:
+            timeout = max(self.flush_interval - (time.monotonic() - last_flush), 0.0)
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while batch and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            waiters = []
+            for op in batch:
+                kind = op[0]
+                if kind == "sync":
+                    waiters.append(op[2])
+                elif kind == "stop":
+                    stop = True
+                else:
+                    self._apply(op)
+            if batch:
+                self._count(batches=1)
+
+            # -------------- 주기적 flush / sync 요청 / 종료 시 flush -------------- #
+            if waiters or stop:
+                self._flush(force=True)
+                last_flush = time.monotonic()
+            elif time.monotonic() - last_flush >= self.flush_interval:
+                self._flush()
+                last_flush = time.monotonic()
+
+            for done in waiters:
+                done.set()
+            if stop:
+                self._close_all()
+                return
+
+    def _open(self, path: Path):
+        handle = self._files.get(path)
+        if handle is None or handle.closed:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(path, "a", encoding="utf-8")
+            self._files[path] = handle
+        return handle
+
+    def _apply(self, op):
+        """기록 스레드에서 작업 1개 처리 (예외는 집계 후 무시)"""
+        kind, path, text = op
+        try:
+            if kind == "append":
+                self._open(path).write(text)
+                self._dirty.add(path)
+            elif kind == "write":
+                self._close_path(path)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+            elif kind == "close":
+                self._close_path(path)
+            self._count(records=1)
+        except Exception:
+            self._count(errors=1)
+
+    def _apply_sync(self, op):
+        """종료 후 기록: 호출 스레드에서 바로 처리"""
+        kind, path, text = op
+        if kind == "close":
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a" if kind == "append" else "w", encoding="utf-8") as f:
+                f.write(text)
+        except Exception:
+            self._count(errors=1)
+
+    def _close_path(self, path: Path):
+        handle = self._files.pop(path, None)
+        self._dirty.discard(path)
+        if handle is not None and not handle.closed:
+            handle.close()
+
+    def _flush(self, force: bool = False):
+        """쓰기가 있었던 파일 flush (durability에 따라 fsync)"""
+        if self.durability == "none" and not force:
+            return
+        for path in list(self._dirty):
+            handle = self._files.get(path)
+            if handle is None or handle.closed:
+                continue
+            try:
+                handle.flush()
+                if self.durability == "fsync":
+                    os.fsync(handle.fileno())
+            except Exception:
+                self._count(errors=1)
+        if self._dirty:
+            self._count(flushes=1)
+        self._dirty.clear()
+
+    def _close_all(self):
+        for path in list(self._files):
+            try:
+                self._close_path(path)
+            except Exception:
+                self._count(errors=1)
+
+
+# ==================== 전역 기록기 ==================== #
+_writer: Optional[AsyncLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> Optional[AsyncLogWriter]:
+    """
+    전역 비동기 기록기 (최초 호출 시 생성, async_writer: false면 None)
+
+    Returns:
+        AsyncLogWriter 또는 None (동기 기록)
+    """
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                config = get_logging_config()
+                if not config.get("async_writer", True):
+                    return None
+                _writer = AsyncLogWriter(
+                    flush_interval=config["flush_interval_seconds"],
+                    durability=config["durability"],
+                    max_queue_size=config["max_queue_size"],
+                    batch_size=config["batch_size"],
+                )
+                atexit.register(_writer.shutdown)
+    return _writer
+
+
+def sync_log_writer(timeout: Optional[float] = 10.0) -> bool:
+    """전역 기록기의 대기 중인 기록을 파일에 반영 (기록기가 없으면 바로 True)"""
+    return _writer.sync(timeout) if _writer is not None else True
+
+
+def get_log_writer_stats() -> Dict[str, Any]:
+    """전역 기록기 통계 (기록기가 없으면 빈 딕셔너리)"""
+    return _writer.stats() if _writer is not None else {}
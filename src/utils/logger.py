@@ -5,6 +5,8 @@ from datetime import datetime                    # 현재 시간 가져오기 
 from pathlib import Path                         # 경로 처리 모듈
 from typing import Optional                      # 타입 힌팅 모듈
 
+from src.utils.log_writer import get_log_writer, get_logging_config, level_value  # 비동기 기록기 / 로그 수준
+
 # tqdm은 선택적 의존성
 try:
     from tqdm import tqdm                        # 진행률 표시 모듈
@@ -17,32 +19,68 @@ class Logger:                                    # Logger 클래스 정의
     """
     로그를 파일에 저장하고, 표준 출력(stdout)과 표준 에러(stderr)를
     로그 파일로 리디렉션하는 기능이 추가된 Logger 클래스
+
+    logging.async_writer: true(기본값)면 파일 쓰기는 백그라운드 기록기(src/utils/log_writer.py)가 처리하고,
+    logging.level 미만 수준의 메시지는 포맷팅 전에 버립니다.
     """
     # 초기화 함수 정의
-    def __init__(self, log_path: str, print_also: bool = True):
+    def __init__(self, log_path: str, print_also: bool = True, level: Optional[str] = None):
         self.log_path = Path(log_path)           # 로그 파일 경로 저장 (pathlib.Path 사용)
         self.print_also = print_also             # 콘솔 출력 여부 저장
-
-        # 로그 폴더 자동 생성
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.min_level = level_value(level or get_logging_config()["level"])  # 기록할 최소 수준
 
         # 원본 표준 출력을 저장해 둡니다.
         self.original_stdout = sys.stdout        # 원본 표준 출력 저장
         self.original_stderr = sys.stderr        # 원본 표준 에러 저장
 
-        # 로그 파일을 열고, UTF-8 인코딩을 사용합니다.
-        self.log_file = open(self.log_path, 'a', encoding='utf-8')  # 로그 파일 열기
+        # 비동기 기록기 사용 시 파일은 기록 스레드가 엽니다 (폴더 생성 포함)
+        self._writer = get_log_writer()          # None이면 동기 기록
+        self.log_file = None                     # 동기 기록용 파일 핸들
+        self._closed = False                     # 중복 close 방지
+
+        if self._writer is None:
+            # 로그 폴더 자동 생성
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # 로그 파일을 열고, UTF-8 인코딩을 사용합니다.
+            self.log_file = open(self.log_path, 'a', encoding='utf-8')  # 로그 파일 열기
 
         # tqdm 진행률 추적 변수
         self._tqdm_last_percent = {}             # {desc: last_percent} - 작업별 마지막 기록 진행률
 
     
+    # 파일 기록 함수 정의
+    def _emit(self, line: str):
+        """
+        한 줄을 로그 파일에 기록합니다.
+        비동기 기록기가 있으면 큐에 넣기만 하고, 없으면 바로 쓰고 플러시합니다.
+        close() 이후 기록은 두 경로 모두 무시합니다 (기록 스레드가 파일을 다시 열지 않도록).
+        """
+        if self._closed:                         # 닫힌 뒤 기록은 무시
+            return
+        if self._writer is not None:
+            self._writer.append(self.log_path, line)  # 기록 스레드가 묶음 단위로 기록
+            return
+
+        if self.log_file is None or self.log_file.closed:  # 닫힌 뒤 기록은 무시
+            return
+        self.log_file.write(line)                # 로그 파일에 기록
+        self.log_file.flush()                    # 버퍼 즉시 플러시 (데이터 손실 방지)
+
+
     # 로그 기록 함수 정의
-    def write(self, message: str, print_also: Optional[bool] = None, print_error: bool = False):
+    def write(self, message: str, print_also: Optional[bool] = None, print_error: bool = False, level: str = "INFO"):
         """
         로그 메시지를 파일에 기록하고,
         print_also=True일 경우 콘솔에도 출력합니다.
+        level이 logging.level 미만이면 기록하지 않습니다 (print_error=True는 ERROR).
         """
+        # 수준 필터 (포맷팅 전에 판단해 hot path 비용 최소화)
+        if print_error:
+            level = "ERROR"
+        if level_value(level) < self.min_level:
+            return
+
         # 메시지 앞뒤 공백을 제거하고, 개행 문자가 없으면 추가합니다.
         message = message.strip()                # 메시지 공백 제거
         if not message:                          # 메시지가 비어있으면
@@ -51,8 +89,7 @@ class Logger:                                    # Logger 클래스 정의
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # 현재 시간 타임스탬프 생성
         line = f"{timestamp} | {message}\n"      # 타임스탬프와 메시지 결합
 
-        self.log_file.write(line)                # 로그 파일에 기록
-        self.log_file.flush()                    # 버퍼 즉시 플러시 (데이터 손실 방지)
+        self._emit(line)                         # 로그 파일에 기록
 
         # 콘솔 출력 옵션 처리 (None이면 기본값 사용)
         should_print = print_also if print_also is not None else self.print_also
@@ -78,8 +115,7 @@ class Logger:                                    # Logger 클래스 정의
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # 현재 시간 타임스탬프 생성
         line = f"{timestamp} | {separator}\n"    # 타임스탬프와 분기점 결합
 
-        self.log_file.write(line)                # 로그 파일에 기록
-        self.log_file.flush()                    # 버퍼 즉시 플러시 (데이터 손실 방지)
+        self._emit(line)                         # 로그 파일에 기록
 
         # 콘솔에도 출력 (기본 설정에 따름)
         if self.print_also:
@@ -90,8 +126,24 @@ class Logger:                                    # Logger 클래스 정의
     def flush(self):
         """
         스트림 인터페이스에 필요한 flush 메서드입니다.
+        비동기 기록기 사용 시 기록 스레드가 주기적으로 플러시하므로 기다리지 않습니다.
         """
-        self.log_file.flush()   # 로그 파일 버퍼 플러시
+        if self.log_file is not None and not self.log_file.closed:
+            self.log_file.flush()   # 로그 파일 버퍼 플러시
+
+
+    # 기록 반영 대기 함수 정의
+    def sync(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        대기 중인 기록이 파일에 반영될 때까지 기다립니다 (세션 종료 / 테스트용).
+
+        Returns:
+            bool: 제한 시간 안에 반영 완료 여부
+        """
+        if self._writer is not None:
+            return self._writer.sync(timeout)    # 기록 스레드 큐 비우기
+        self.flush()
+        return True
 
 
     # 리다이렉션 시작 함수 정의
@@ -185,7 +237,13 @@ class Logger:                                    # Logger 클래스 정의
         로그 파일을 닫습니다.
         """
         # 중복 close 방지
-        if hasattr(self, 'log_file') and self.log_file and not self.log_file.closed:
+        if getattr(self, '_closed', True):
+            return
+        self._closed = True
+
+        if self._writer is not None:
+            self._writer.close_file(self.log_path)  # 기록 스레드에서 파일 핸들 닫기
+        elif self.log_file and not self.log_file.closed:
             self.log_file.close()                # 로그 파일 닫기
 
     # 소멸자 정의
@@ -0,0 +1,634 @@
+# ---------------------- 실험 지표 저장소 모듈 ---------------------- #
+"""
+SQLite 기반 실험 지표 저장소 (추가 전용 + 인덱스)
+
+ExperimentManager / TelemetryManager가 JSON 파일과 함께 구조화된 행을 기록하고,
+scripts/system/aggregate_metrics.py / find_experiments.py는 폴더 순회 대신 이 저장소를 조회합니다:
+
+    update_metadata() / 요청 종료 요약   → requests 테이블 (세션 / 요청 1건 = 1행)
+    save_rag_metrics() / save_*()        → metrics 테이블 (세션 × 종류 × 지표 이름 = 1행)
+
+- 기록은 큐에 넣기만 하고 전용 스레드가 묶음 트랜잭션으로 반영 (요청 스레드는 디스크 I/O 없음)
+- WAL 모드: 기록 중에도 집계 CLI가 동시에 조회 가능
+- 같은 세션 / 요청 키는 덮어씀(INSERT OR REPLACE) → 기존 실험 폴더 재적재(import_experiments)도 안전
+- flat / nested 지표 이름은 기록 시점에 표준 이름으로 정규화 (METRIC_ALIASES)
+- 기간 집계(평균 / 최소 / 최대 / 합계 / 백분위수)는 SQL 한 번으로 계산
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 metrics_store 섹션이 없을 때 사용
+DEFAULT_METRICS_STORE_CONFIG = {
+    "enabled": True,                                # false면 JSON 파일만 기록 (집계 CLI의 --import로 나중에 적재)
+    "path": "experiments/metrics.sqlite3",          # SQLite 파일 경로
+    "batch_size": 500,                              # 한 트랜잭션에 반영할 최대 기록 수
+    "max_pending": 10000,                           # 대기열 최대 길이 (초과 시 버림)
+}
+
+# 평가 지표 종류 → evaluation/ 파일 이름
+METRIC_KINDS = {
+    "rag": "rag_metrics.json",
+    "agent_accuracy": "agent_accuracy.json",
+    "latency": "latency_report.json",
+    "cost": "cost_analysis.json",
+}
+
+# 표준 지표 이름 → 후보 경로 (flat 우선, 없으면 nested)
+METRIC_ALIASES = {
+    "rag": {
+        "recall_at_5": ("recall_at_5", "retrieval_metrics.recall_at_5"),
+        "precision_at_5": ("precision_at_5", "retrieval_metrics.precision_at_5"),
+        "faithfulness": ("faithfulness", "generation_metrics.faithfulness"),
+        "answer_relevancy": ("answer_relevancy", "generation_metrics.answer_relevancy"),
+    },
+    "agent_accuracy": {
+        "routing_accuracy": ("routing_accuracy",),
+        "correct_decisions": ("correct_decisions", "routing_decision.correct"),
+        "incorrect_decisions": ("incorrect_decisions",),
+        "average_confidence": ("average_confidence", "routing_decision.confidence"),
+    },
+    "latency": {
+        "total_time_ms": ("total_time_ms", "total_latency.total_time_ms"),
+        "routing_time_ms": ("routing_time_ms", "breakdown.routing_time_ms"),
+        "retrieval_time_ms": ("retrieval_time_ms", "breakdown.retrieval_time_ms"),
+        "generation_time_ms": ("generation_time_ms", "breakdown.generation_time_ms"),
+    },
+    "cost": {
+        "total_tokens": ("total_tokens", "llm_usage.total_tokens"),
+        "cost_usd": ("cost_usd", "cost_breakdown_usd.total_cost"),
+        "cost_krw": ("cost_krw", "cost_breakdown_krw.total_cost"),
+    },
+}
+
+# requests 테이블 컬럼 (key / date 제외)
+REQUEST_COLUMNS = (
+    "ts", "source", "difficulty", "tool_used", "success", "response_time_ms", "first_token_ms",
+    "cache_hit", "total_tokens", "sql_queries", "pgvector_searches", "trace_id", "user_query", "path",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    key TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    ts TEXT,
+    source TEXT,
+    difficulty TEXT,
+    tool_used TEXT,
+    success INTEGER,
+    response_time_ms REAL,
+    first_token_ms REAL,
+    cache_hit INTEGER,
+    total_tokens INTEGER,
+    sql_queries INTEGER,
+    pgvector_searches INTEGER,
+    trace_id TEXT,
+    user_query TEXT,
+    path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_requests_date ON requests(date, response_time_ms);
+CREATE INDEX IF NOT EXISTS idx_requests_tool ON requests(tool_used, date);
+CREATE INDEX IF NOT EXISTS idx_requests_difficulty ON requests(difficulty, date);
+CREATE TABLE IF NOT EXISTS metrics (
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    ts TEXT,
+    value REAL,
+    PRIMARY KEY (key, kind, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_metrics_kind ON metrics(kind, name, date, value);
+"""
+
+PERCENTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+
+def get_metrics_store_config() -> Dict[str, Any]:
+    """
+    지표 저장소 설정 로드 (기본값과 병합)
+
+    Returns:
+        지표 저장소 설정 딕셔너리
+    """
+    config = dict(DEFAULT_METRICS_STORE_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("metrics_store", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+# ==================== 행 변환 ==================== #
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """중첩 딕셔너리의 숫자 / bool 값만 "a.b" 경로로 평탄화"""
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        elif isinstance(value, (bool, int, float)):
+            flat[path] = float(value)
+    return flat
+
+
+def normalize_metrics(kind: str, data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    평가 지표 딕셔너리 → {표준 이름: 값}
+
+    표준 이름이 있는 지표는 후보 경로 중 처음 찾은 값으로 기록하고,
+    나머지 숫자 값은 평탄화한 경로 그대로 기록
+
+    Args:
+        kind: 지표 종류 (rag / agent_accuracy / latency / cost)
+        data: save_*()에 전달된 딕셔너리
+
+    Returns:
+        {지표 이름: 값}
+    """
+    flat = _flatten(data)
+    values = {}
+    for name, candidates in METRIC_ALIASES.get(kind, {}).items():
+        for candidate in candidates:
+            if candidate in flat:
+                values[name] = flat.pop(candidate)
+                break
+
+    # nested 구조의 단일 라우팅 결정: 틀린 결정도 1건으로 집계
+    if kind == "agent_accuracy" and isinstance(data.get("routing_decision"), dict):
+        values.setdefault("incorrect_decisions", 1.0 - values.get("correct_decisions", 0.0))
+
+    values.update(flat)
+    return values
+
+
+def _date_of(timestamp: Optional[str]) -> str:
+    """ISO 시각 → YYYYMMDD (없으면 오늘)"""
+    try:
+        return datetime.fromisoformat(str(timestamp)).strftime("%Y%m%d")
+    except (TypeError, ValueError):
+        return datetime.now().strftime("%Y%m%d")
+
+
+def request_row(key: str, metadata: Dict[str, Any], source: str, path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    metadata.json / 요청 요약 → requests 테이블 행
+
+    Args:
+        key: 세션 폴더 이름 또는 request_id
+        metadata: 메타데이터 딕셔너리
+        source: session | request
+        path: 실험 폴더 경로
+
+    Returns:
+        requests 테이블 행 딕셔너리
+    """
+    tokens = metadata.get("tokens_used")
+    success = metadata.get("success")
+    cache_hit = metadata.get("cache_hit")
+    response_time_ms = metadata.get("response_time_ms")
+    if response_time_ms is None:
+        response_time_ms = metadata.get("duration_ms")
+    return {
+        "key": key,
+        "date": metadata.get("date") or _date_of(metadata.get("start_time")),
+        "ts": metadata.get("start_time"),
+        "source": source,
+        "difficulty": metadata.get("difficulty"),
+        "tool_used": metadata.get("tool_used"),
+        "success": None if success is None else int(bool(success)),
+        "response_time_ms": response_time_ms,
+        "first_token_ms": metadata.get("first_token_ms"),
+        "cache_hit": None if cache_hit is None else int(bool(cache_hit)),
+        "total_tokens": tokens.get("total") if isinstance(tokens, dict) else metadata.get("total_tokens"),
+        "sql_queries": metadata.get("sql_queries"),
+        "pgvector_searches": metadata.get("pgvector_searches"),
+        "trace_id": metadata.get("trace_id"),
+        "user_query": metadata.get("user_query"),
+        "path": path,
+    }
+
+
+def _date_range(date_from: Optional[str], date_to: Optional[str]) -> tuple:
+    """기간 → (시작, 끝) YYYYMMDD 문자열 (비어 있으면 전체)"""
+    return (date_from or "00000000", date_to or date_from or "99999999")
+
+
+# ==================== 저장소 ==================== #
+class MetricsStore:
+    """
+    실험 지표 SQLite 저장소
+
+    기록(record_*)은 전용 스레드가 처리하고, 조회(find_requests / aggregate_*)는 호출 스레드에서
+    별도 연결로 실행 (WAL 모드라 기록과 동시에 가능)
+
+    Args:
+        path: SQLite 파일 경로
+        batch_size: 한 트랜잭션에 반영할 최대 기록 수
+        max_pending: 대기열 최대 길이 (초과 시 버림)
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, max_pending: int = 10000):
+        self.path = Path(path)
+        self.batch_size = max(int(batch_size), 1)
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(int(max_pending), 0))
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+
+    # ---------------------- 연결 ---------------------- #
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    # ---------------------- 기록 API (대기 없음) ---------------------- #
+    def record_request(self, row: Dict[str, Any]):
+        """requests 행 기록 (같은 key는 덮어씀)"""
+        self._put(("request", row))
+
+    def record_metrics(self, key: str, kind: str, data: Dict[str, Any], date: Optional[str] = None):
+        """
+        평가 지표 기록 (같은 key / kind / 이름은 덮어씀)
+
+        Args:
+            key: 세션 폴더 이름 또는 request_id
+            kind: 지표 종류 (rag / agent_accuracy / latency / cost)
+            data: save_*()에 전달된 딕셔너리
+            date: YYYYMMDD (없으면 data의 timestamp 기준)
+        """
+        timestamp = data.get("timestamp")
+        rows = [
+            (key, kind, name, date or _date_of(timestamp), timestamp, value)
+            for name, value in normalize_metrics(kind, data).items()
+        ]
+        if rows:
+            self._put(("metrics", rows))
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """대기 중인 기록이 모두 커밋될 때까지 대기"""
+        if self._thread is None or self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """남은 기록 반영 후 기록 스레드 종료"""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(("stop", None))
+            self._thread.join(timeout)
+
+    def _put(self, item: tuple):
+        if self._closed:
+            return
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="metrics-store", daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    # ---------------------- 기록 스레드 ---------------------- #
+    def _apply(self, conn: sqlite3.Connection, batch: List[tuple]):
+        requests = [item for kind, item in batch if kind == "request"]
+        metrics = [row for kind, rows in batch if kind == "metrics" for row in rows]
+        columns = ("key", "date") + REQUEST_COLUMNS
+        with conn:
+            if requests:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO requests ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    [tuple(row.get(c) for c in columns) for row in requests],
+                )
+            if metrics:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO metrics (key, kind, name, date, ts, value) VALUES (?, ?, ?, ?, ?, ?)",
+                    metrics,
+                )
+
+    def _run(self):
+        conn = None
+        while True:
+            item = self._queue.get()
+            batch, waiters, stop = [], [], False
+            while True:
+                if item[0] == "flush":
+                    waiters.append(item[1])
+                elif item[0] == "stop":
+                    stop = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    # 실험 폴더가 지워졌으면 새 파일로 다시 연결
+                    if conn is None or not self.path.exists():
+                        if conn is not None:
+                            conn.close()
+                        conn = self._connect()
+                    self._apply(conn, batch)
+                except Exception:
+                    # 기록 실패가 스레드를 멈추지 않도록 버림
+                    self.dropped += len(batch)
+                    conn = None
+
+            for done in waiters:
+                done.set()
+            if stop:
+                if conn is not None:
+                    conn.close()
+                return
+
+    # ==================== 조회 ==================== #
+    def _read(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        if not self.path.exists():
+            return []
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute(sql, tuple(params)).fetchall()
+        finally:
+            conn.close()
+
+    def find_requests(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        tool: Optional[str] = None,
+        success: Optional[bool] = None,
+        min_response_time: Optional[float] = None,
+        max_response_time: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 세션 / 요청 행 (시작 시각 순)
+
+        Args:
+            date_from / date_to: 기간 (YYYYMMDD, date_to 없으면 date_from 하루)
+            difficulty / tool / success: 필터
+            min_response_time / max_response_time: 응답 시간 범위 (ms)
+            limit: 최대 행 수
+
+        Returns:
+            requests 테이블 행 딕셔너리 리스트
+        """
+        where, params = ["date BETWEEN ? AND ?"], list(_date_range(date_from, date_to))
+        for column, value in (("difficulty", difficulty), ("tool_used", tool)):
+            if value:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if success is not None:
+            where.append("success = ?")
+            params.append(int(success))
+        if min_response_time:
+            where.append("response_time_ms >= ?")
+            params.append(min_response_time)
+        if max_response_time:
+            where.append("response_time_ms <= ?")
+            params.append(max_response_time)
+
+        sql = f"SELECT * FROM requests WHERE {' AND '.join(where)} ORDER BY ts, key"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(row) for row in self._read(sql, params)]
+
+    def _percentiles(self, table_sql: str, params: List[Any], group: str) -> Dict[Any, Dict[str, float]]:
+        """그룹별 p50 / p95 / p99 (창 함수로 정렬 1회, 가장 가까운 순위)"""
+        rank_sql = " OR ".join(
+            f"rn = CAST({q} * (n - 1) + 0.5 AS INTEGER) + 1" for q in PERCENTILES.values()
+        )
+        rows = self._read(
+            f"SELECT grp, rn, n, value FROM ("
+            f" SELECT {group} AS grp, value,"
+            f" ROW_NUMBER() OVER (PARTITION BY {group} ORDER BY value) AS rn,"
+            f" COUNT(*) OVER (PARTITION BY {group}) AS n"
+            f" FROM ({table_sql})"
+            f") WHERE {rank_sql}",
+            params,
+        )
+        result: Dict[Any, Dict[str, float]] = {}
+        for row in rows:
+            for label, q in PERCENTILES.items():
+                if row["rn"] == int(q * (row["n"] - 1) + 0.5) + 1:
+                    result.setdefault(row["grp"], {})[label] = row["value"]
+        return result
+
+    def aggregate_metrics(
+        self,
+        kind: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        names: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        평가 지표 기간 집계
+
+        Args:
+            kind: 지표 종류 (rag / agent_accuracy / latency / cost)
+            date_from / date_to: 기간 (YYYYMMDD)
+            names: 집계할 지표 이름 (기본값: METRIC_ALIASES의 표준 이름)
+
+        Returns:
+            {"total_sessions": N, 지표 이름: {"count", "mean", "min", "max", "sum", "p50", "p95", "p99"}}
+        """
+        names = list(names or METRIC_ALIASES.get(kind, {}))
+        if not names:
+            return {}
+        start, end = _date_range(date_from, date_to)
+        params = [kind, start, end, *names]
+        source = (
+            "SELECT key, name, value FROM metrics WHERE kind = ? AND date BETWEEN ? AND ?"
+            f" AND name IN ({', '.join('?' * len(names))})"
+        )
+
+        stats = self._read(
+            f"SELECT name, COUNT(value) AS count, AVG(value) AS mean, MIN(value) AS min,"
+            f" MAX(value) AS max, SUM(value) AS sum FROM ({source}) GROUP BY name",
+            params,
+        )
+        if not stats:
+            return {}
+        sessions = self._read(f"SELECT COUNT(DISTINCT key) AS n FROM ({source})", params)[0]["n"]
+        percentiles = self._percentiles(source, params, "name")
+
+        result: Dict[str, Any] = {"total_sessions": sessions}
+        for row in stats:
+            result[row["name"]] = {
+                "count": row["count"], "mean": row["mean"], "min": row["min"],
+                "max": row["max"], "sum": row["sum"], **percentiles.get(row["name"], {}),
+            }
+        return result
+
+    def aggregate_requests(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> Dict[str, Any]:
+        """
+        세션 / 요청 기간 집계: 응답 시간 백분위수 + 도구 / 난이도 분포 + 성공률
+
+        Args:
+            date_from / date_to: 기간 (YYYYMMDD)
+
+        Returns:
+            {"total", "successes", "failures", "cache_hits", "total_tokens", "response_time_ms": {...},
+             "tools": {도구: {"count", "success_rate", "mean_ms", "p50", "p95", "p99"}}, "difficulties": {...},
+             "days": {YYYYMMDD: 건수}}
+        """
+        params = list(_date_range(date_from, date_to))
+        where = "WHERE date BETWEEN ? AND ?"
+        totals = self._read(
+            f"SELECT COUNT(*) AS total, SUM(success = 1) AS successes, SUM(success = 0) AS failures,"
+            f" SUM(cache_hit = 1) AS cache_hits, SUM(total_tokens) AS total_tokens,"
+            f" AVG(response_time_ms) AS mean, MIN(response_time_ms) AS min, MAX(response_time_ms) AS max"
+            f" FROM requests {where}",
+            params,
+        )
+        if not totals or not totals[0]["total"]:
+            return {}
+        totals = dict(totals[0])
+
+        latency_source = (
+            f"SELECT tool_used, response_time_ms AS value FROM requests {where} AND response_time_ms IS NOT NULL"
+        )
+        overall = self._percentiles(latency_source, params, "1").get(1, {})
+        by_tool = self._percentiles(latency_source, params, "COALESCE(tool_used, 'unknown')")
+
+        tools = {}
+        for row in self._read(
+            f"SELECT COALESCE(tool_used, 'unknown') AS tool, COUNT(*) AS count, AVG(success) AS success_rate,"
+            f" AVG(response_time_ms) AS mean_ms FROM requests {where} GROUP BY tool ORDER BY count DESC",
+            params,
+        ):
+            tools[row["tool"]] = {
+                "count": row["count"], "success_rate": row["success_rate"],
+                "mean_ms": row["mean_ms"], **by_tool.get(row["tool"], {}),
+            }
+
+        difficulties = {
+            row["difficulty"]: row["count"]
+            for row in self._read(
+                f"SELECT COALESCE(difficulty, 'unknown') AS difficulty, COUNT(*) AS count"
+                f" FROM requests {where} GROUP BY difficulty",
+                params,
+            )
+        }
+        days = {
+            row["date"]: row["count"]
+            for row in self._read(f"SELECT date, COUNT(*) AS count FROM requests {where} GROUP BY date", params)
+        }
+
+        return {
+            "total": totals["total"],
+            "successes": totals["successes"] or 0,
+            "failures": totals["failures"] or 0,
+            "cache_hits": totals["cache_hits"] or 0,
+            "total_tokens": totals["total_tokens"] or 0,
+            "response_time_ms": {"mean": totals["mean"], "min": totals["min"], "max": totals["max"], **overall},
+            "tools": tools,
+            "difficulties": difficulties,
+            "days": days,
+        }
+
+    # ==================== 기존 실험 폴더 적재 ==================== #
+    def import_experiments(
+        self,
+        base_dir: str = "experiments",
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> int:
+        """
+        저장소 도입 전 실험 폴더(metadata.json / evaluation/*.json)를 저장소에 적재
+
+        같은 세션은 덮어쓰므로 여러 번 실행해도 중복되지 않음
+
+        Args:
+            base_dir: 실험 루트 폴더
+            date_from / date_to: 적재할 기간 (YYYYMMDD)
+
+        Returns:
+            적재한 세션 수
+        """
+        start, end = _date_range(date_from, date_to)
+        count = 0
+        for date_dir in sorted(Path(base_dir).glob("[0-9]" * 8)):
+            if not start <= date_dir.name <= end:
+                continue
+            for session_dir in date_dir.glob("*_session_*"):
+                # metadata.json이 있는 세션만 requests 행으로 기록 (평가 지표는 파일이 있으면 기록)
+                try:
+                    with open(session_dir / "metadata.json", encoding="utf-8") as f:
+                        metadata = json.load(f)
+                    metadata.setdefault("date", date_dir.name)
+                    self.record_request(request_row(session_dir.name, metadata, "session", str(session_dir)))
+                except Exception:
+                    pass
+
+                for kind, filename in METRIC_KINDS.items():
+                    path = session_dir / "evaluation" / filename
+                    if not path.exists():
+                        continue
+                    try:
+                        with open(path, encoding="utf-8") as f:
+                            self.record_metrics(session_dir.name, kind, json.load(f), date=date_dir.name)
+                    except Exception:
+                        continue
+                count += 1
+        self.flush(None)
+        return count
+
+
+# ==================== 전역 저장소 ==================== #
+_store: Optional[MetricsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_metrics_store() -> Optional[MetricsStore]:
+    """
+    전역 지표 저장소 (최초 호출 시 생성, enabled: false면 None)
+
+    Returns:
+        MetricsStore 또는 None
+    """
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                config = get_metrics_store_config()
+                if not config.get("enabled", True):
+                    return None
+                _store = MetricsStore(
+                    config["path"],
+                    batch_size=config["batch_size"],
+                    max_pending=config["max_pending"],
+                )
+                atexit.register(_store.close)
+    return _store
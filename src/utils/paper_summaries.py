@@ -0,0 +1,468 @@
+# src/utils/paper_summaries.py
+
+"""
+논문 요약 사전 계산 / 저장 모듈
+
+paper_summaries 테이블에 (paper_id, level, prompt_version, model) 단위로 요약을 저장하고
+summarize_node는 저장된 요약을 먼저 조회 (미스 시 생성 후 저장 = lazy fill)
+
+- 수집 시점: ArxivPaperHandler.process_arxiv_paper / scripts/data/precompute_summaries.py
+  → schedule_paper_summaries()로 백그라운드 생성
+- prompt_version: 요약 템플릿(prompts/tool_prompts.json) + 요약 엔진 설정 해시 → 수정 시 자동 재생성
+- 긴 논문은 src/tools/summarize_engine의 map-reduce로 압축한 뒤 수준별 템플릿에 한 번만 포함
+- model: "provider:model" → 난이도별 모델 변경 시 자동 재생성
+"""
+
+# ==================================================================================== #
+#                                   IMPORT MODULES                                     #
+# ==================================================================================== #
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.agent.streaming import answer_stream_config
+from src.llm.client import LLMClient
+from src.llm.scheduler import background_priority
+from src.database.db import execute_query, get_cursor
+from src.database.vector_store import get_paper_chunks
+from src.prompts import get_summarize_template
+from src.utils.config_loader import get_llm_for_difficulty
+
+
+# ==================================================================================== #
+#                                     CONSTANTS                                        #
+# ==================================================================================== #
+
+# configs/model_config.yaml의 paper_summaries 섹션이 없을 때 사용
+DEFAULT_PAPER_SUMMARY_CONFIG = {
+    "enabled": True,                                # 저장된 요약 사용 여부
+    "precompute_on_ingest": True,                   # 논문 수집 시 백그라운드 사전 생성
+    "levels": ["elementary", "beginner", "intermediate", "advanced"],
+    "max_workers": 1,                               # 백그라운드 생성 동시 실행 수
+}
+
+# 요청 난이도 → 생성할 두 수준
+LEVEL_MAPPING = {
+    "easy": ["elementary", "beginner"],
+    "hard": ["intermediate", "advanced"],
+}
+
+# 수준 → LLM 선택용 난이도
+LEVEL_DIFFICULTY = {
+    "elementary": "easy",
+    "beginner": "easy",
+    "intermediate": "hard",
+    "advanced": "hard",
+}
+
+DDL_PAPER_SUMMARIES = """
+CREATE TABLE IF NOT EXISTS paper_summaries (
+    summary_id SERIAL PRIMARY KEY,
+    paper_id INT NOT NULL REFERENCES papers(paper_id) ON DELETE CASCADE,
+    level VARCHAR(20) NOT NULL,
+    prompt_version VARCHAR(16) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    summary TEXT NOT NULL,
+    chunk_count INT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (paper_id, level, prompt_version, model)
+)
+"""
+
+
+# ==================================================================================== #
+#                                  CONFIG / VERSION                                    #
+# ==================================================================================== #
+
+def _load_paper_summary_config() -> Dict[str, Any]:
+    """
+    논문 요약 저장소 설정 로드 (기본값과 병합)
+
+    Returns:
+        논문 요약 저장소 설정 딕셔너리
+    """
+    config = dict(DEFAULT_PAPER_SUMMARY_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("paper_summaries", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def get_prompt_version(level: str) -> str:
+    """
+    수준별 요약 템플릿 버전 (템플릿 + 요약 엔진 버전 sha256 앞 12자)
+
+    Args:
+        level: 요약 수준 (elementary/beginner/intermediate/advanced)
+
+    Returns:
+        프롬프트 버전 문자열
+    """
+    # src.tools 패키지 → summarize → 이 모듈 순환 import 방지를 위해 지연 import
+    from src.tools.summarize_engine import get_engine_version
+
+    signature = f"{get_summarize_template(level)}\x00{get_engine_version()}"
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()[:12]
+
+
+def get_model_key(level: str) -> str:
+    """
+    수준별 요약 생성 모델 키 ("provider:model")
+
+    Args:
+        level: 요약 수준
+
+    Returns:
+        모델 키 문자열
+    """
+    model_info = get_llm_for_difficulty(LEVEL_DIFFICULTY.get(level, "easy"))
+    return f"{model_info['provider']}:{model_info['model']}"
+
+
+# ==================================================================================== #
+#                                  PROMPT BUILDER                                      #
+# ==================================================================================== #
+
+def build_summary_prompt(level: str, paper: Dict[str, Any], combined_text: str) -> Tuple[str, str]:
+    """
+    수준별 요약 프롬프트 생성
+
+    Args:
+        level: 요약 수준
+        paper: {"title", "authors", "publish_date", "abstract"}
+        combined_text: 논문 본문 (짧은 논문은 원문, 긴 논문은 섹션 정리 결과)
+
+    Returns:
+        (system_content, summary_prompt)
+        템플릿에 논문 정보와 본문이 이미 포함되므로 본문은 한 번만 들어감
+    """
+    title = paper.get("title")
+    authors = paper.get("authors")
+    publish_date = paper.get("publish_date")
+    abstract = paper.get("abstract")
+
+    # JSON 템플릿에 논문 정보 포맷팅
+    system_content = get_summarize_template(level).format(
+        system_prompt=f"난이도: {level}",
+        title=title,
+        authors=authors if authors else "N/A",
+        publish_date=publish_date if publish_date else "N/A",
+        abstract=abstract if abstract else "N/A",
+        combined_text=combined_text
+    )
+
+    summary_prompt = f"""{system_content}
+
+위 논문의 방법론 부분을 중심으로 요약해주세요.
+요약:"""
+
+    return system_content, summary_prompt
+
+
+# ==================================================================================== #
+#                                  STORAGE FUNCTIONS                                   #
+# ==================================================================================== #
+
+_table_ready = False
+_table_lock = threading.Lock()
+
+
+def _ensure_table():
+    """paper_summaries 테이블 생성 (프로세스당 1회)"""
+    global _table_ready
+
+    if _table_ready:
+        return
+    with _table_lock:
+        if not _table_ready:
+            execute_query(DDL_PAPER_SUMMARIES)
+            _table_ready = True
+
+
+def fetch_paper(paper_id: int) -> Optional[Dict[str, Any]]:
+    """
+    papers 테이블에서 요약에 필요한 논문 정보 조회
+
+    Args:
+        paper_id: 논문 ID
+
+    Returns:
+        {"paper_id", "title", "authors", "abstract", "publish_date"} 또는 None
+    """
+    with get_cursor() as cursor:
+        cursor.execute(
+            "SELECT paper_id, title, authors, abstract, publish_date FROM papers WHERE paper_id = %s",
+            (paper_id,),
+        )
+        row = cursor.fetchone()
+
+    if not row:
+        return None
+    return dict(zip(("paper_id", "title", "authors", "abstract", "publish_date"), row))
+
+
+def get_stored_summary(paper_id: int, level: str) -> Optional[str]:
+    """
+    현재 프롬프트 버전 / 모델 기준으로 저장된 요약 조회
+
+    Args:
+        paper_id: 논문 ID
+        level: 요약 수준
+
+    Returns:
+        요약 텍스트 또는 None (미생성 / 버전 불일치)
+    """
+    _ensure_table()
+    rows = execute_query(
+        """
+        SELECT summary FROM paper_summaries
+        WHERE paper_id = %s AND level = %s AND prompt_version = %s AND model = %s
+        """,
+        (paper_id, level, get_prompt_version(level), get_model_key(level)),
+        fetch=True,
+    )
+    return rows[0][0] if rows else None
+
+
+def save_summary(paper_id: int, level: str, summary: str, chunk_count: Optional[int] = None):
+    """
+    요약 저장 (같은 키는 갱신)
+
+    Args:
+        paper_id: 논문 ID
+        level: 요약 수준
+        summary: 요약 텍스트
+        chunk_count: 요약에 사용한 청크 수
+    """
+    _ensure_table()
+    execute_query(
+        """
+        INSERT INTO paper_summaries (paper_id, level, prompt_version, model, summary, chunk_count)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (paper_id, level, prompt_version, model)
+        DO UPDATE SET summary = EXCLUDED.summary,
+                      chunk_count = EXCLUDED.chunk_count,
+                      created_at = CURRENT_TIMESTAMP
+        """,
+        (paper_id, level, get_prompt_version(level), get_model_key(level), summary, chunk_count),
+    )
+
+
+# ==================================================================================== #
+#                                  SUMMARY GENERATION                                  #
+# ==================================================================================== #
+
+# 같은 (paper_id, level) 동시 생성 방지 (백그라운드 작업 + lazy fill 경합)
+_key_locks: Dict[Tuple[int, str], threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+
+def _key_lock(paper_id: int, level: str) -> threading.Lock:
+    with _key_locks_guard:
+        return _key_locks.setdefault((paper_id, level), threading.Lock())
+
+
+def generate_summary(
+    paper: Dict[str, Any],
+    level: str,
+    docs: Optional[List] = None,
+    logger=None,
+    on_prompt=None,
+) -> Optional[str]:
+    """
+    수준별 요약 생성 후 저장
+
+    Args:
+        paper: fetch_paper() 결과
+        level: 요약 수준
+        docs: 논문 청크 (None이면 get_paper_chunks로 조회)
+        logger: Logger 인스턴스 (선택 사항)
+        on_prompt: (system_content, summary_prompt, level) 콜백 (프롬프트 기록용, 선택 사항)
+
+    Returns:
+        요약 텍스트 (청크가 없으면 None)
+    """
+    if docs is None:
+        docs = get_paper_chunks(paper["paper_id"])
+    if not docs:
+        return None
+
+    llm_client = LLMClient.from_difficulty(
+        difficulty=LEVEL_DIFFICULTY.get(level, "easy"),
+        logger=logger
+    )
+
+    from src.tools.summarize_engine import MapReduceSummarizer
+
+    # 긴 논문은 섹션 map-reduce로 압축 (섹션 정리는 같은 모델의 다른 수준과 공유)
+    summarizer = MapReduceSummarizer(
+        invoke_fn=lambda prompt: llm_client.llm.invoke(prompt).content,
+        model_key=get_model_key(level),
+    )
+    combined_text = summarizer.condense(paper.get("title") or "", [doc.page_content for doc in docs])
+
+    system_content, summary_prompt = build_summary_prompt(level, paper, combined_text)
+    if on_prompt:
+        on_prompt(system_content, summary_prompt, level)
+
+    if logger:
+        stats = summarizer.stats
+        logger.write(
+            f"LLM 요약 생성 중 (수준: {level}, 방식: {stats['method']}, 섹션: {stats['sections']}, "
+            f"섹션 호출: {stats['map_calls'] + stats['reduce_calls']}, 섹션 캐시 적중: {stats['cache_hits']}, "
+            f"입력 텍스트 길이: {len(combined_text)} 문자)"
+        )
+
+    summary = llm_client.llm.invoke(summary_prompt, config=answer_stream_config(level)).content
+
+    try:
+        save_summary(paper["paper_id"], level, summary, chunk_count=len(docs))
+    except Exception as e:
+        # 저장 실패해도 생성한 요약은 반환
+        if logger:
+            logger.write(f"요약 저장 실패 (paper_id={paper['paper_id']}, {level}): {e}", print_error=True)
+
+    return summary
+
+
+def get_or_create_summary(
+    paper: Dict[str, Any],
+    level: str,
+    docs: Optional[List] = None,
+    logger=None,
+    on_prompt=None,
+) -> Tuple[Optional[str], bool]:
+    """
+    저장된 요약 조회, 없으면 생성 후 저장 (lazy fill)
+
+    Args:
+        paper: fetch_paper() 결과
+        level: 요약 수준
+        docs: 논문 청크 (생성 시에만 사용, None이면 조회)
+        logger: Logger 인스턴스 (선택 사항)
+        on_prompt: 프롬프트 기록 콜백 (생성 시에만 호출)
+
+    Returns:
+        (요약 텍스트 또는 None, 저장소 적중 여부)
+    """
+    paper_id = paper["paper_id"]
+
+    with _key_lock(paper_id, level):
+        try:
+            stored = get_stored_summary(paper_id, level)
+        except Exception as e:
+            stored = None
+            if logger:
+                logger.write(f"저장된 요약 조회 실패: {e}", print_error=True)
+
+        if stored is not None:
+            return stored, True
+
+        return generate_summary(paper, level, docs=docs, logger=logger, on_prompt=on_prompt), False
+
+
+def precompute_paper_summaries(paper_id: int, levels: Optional[List[str]] = None, logger=None) -> int:
+    """
+    논문 하나의 수준별 요약 사전 생성 (이미 있는 수준은 건너뜀)
+
+    Args:
+        paper_id: 논문 ID
+        levels: 생성할 수준 목록 (None이면 설정값)
+        logger: Logger 인스턴스 (선택 사항)
+
+    Returns:
+        새로 생성한 요약 수
+    """
+    paper = fetch_paper(paper_id)
+    if not paper:
+        return 0
+
+    docs = None
+    created = 0
+    for level in levels or _load_paper_summary_config()["levels"]:
+        if docs is None:
+            # 청크는 첫 미스 때 한 번만 조회
+            if get_stored_summary(paper_id, level) is not None:
+                continue
+            docs = get_paper_chunks(paper_id)
+            if not docs:
+                break
+
+        _, hit = get_or_create_summary(paper, level, docs=docs, logger=logger)
+        if not hit:
+            created += 1
+
+    if logger:
+        logger.write(f"논문 요약 사전 생성 완료: paper_id={paper_id}, 신규 {created}개")
+    return created
+
+
+# ==================================================================================== #
+#                                  BACKGROUND JOBS                                     #
+# ==================================================================================== #
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """백그라운드 요약 생성용 스레드 풀 (최초 호출 시 생성)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(_load_paper_summary_config()["max_workers"]),
+                    thread_name_prefix="paper-summary",
+                )
+    return _executor
+
+
+def _run_precompute(paper_id: int, levels: Optional[List[str]], logger) -> int:
+    """백그라운드 작업 본체 (예외는 로그만 남기고 삼킴, LLM 호출은 background 우선순위)"""
+    try:
+        with background_priority():
+            return precompute_paper_summaries(paper_id, levels=levels, logger=logger)
+    except Exception as e:
+        if logger:
+            logger.write(f"논문 요약 사전 생성 실패 (paper_id={paper_id}): {e}", print_error=True)
+        return 0
+
+
+def schedule_paper_summaries(paper_id: int, levels: Optional[List[str]] = None, logger=None) -> Optional[Future]:
+    """
+    논문 수집 직후 요약 사전 생성을 백그라운드로 예약
+
+    Args:
+        paper_id: 논문 ID
+        levels: 생성할 수준 목록 (None이면 설정값)
+        logger: Logger 인스턴스 (선택 사항)
+
+    Returns:
+        Future (비활성화 시 None)
+    """
+    config = _load_paper_summary_config()
+    if not (config.get("enabled", True) and config.get("precompute_on_ingest", True)):
+        return None
+
+    if logger:
+        logger.write(f"논문 요약 사전 생성 예약: paper_id={paper_id}")
+    return _get_executor().submit(_run_precompute, paper_id, levels, logger)
+
+
+def is_summary_store_enabled() -> bool:
+    """
+    저장된 요약 사용 여부 (model_config.yaml paper_summaries.enabled)
+
+    Returns:
+        bool: 사용 여부
+    """
+    return bool(_load_paper_summary_config().get("enabled", True))
@@ -0,0 +1,675 @@
+# ---------------------- 요청 단위 텔레메트리 모듈 ---------------------- #
+"""
+Streamlit 요청(질문 1개) 단위 텔레메트리
+
+ui/app.py가 ExperimentManager 하나를 st.cache_resource로 공유하던 방식은
+동시 사용자의 로그 / db_queries / 메타데이터 / 대화 기록이 한 세션 폴더에 섞이고
+db_queries 등 메모리 리스트가 가동 기간 내내 커졌습니다. 이를 대체:
+
+    TelemetryManager (그래프에 바인딩, 프로세스 공유, 상태 없음)
+        └─ request(): 요청마다 RequestTelemetry 생성 (contextvars로 전파, 폴더 생성 / 설정 복사 없음)
+              - logger / get_tool_logger(): 날짜별 공용 로그 파일에 [request_id] 접두어로 기록 (비동기 기록기)
+              - log_sql_query / save_*_prompt / save_search_results ...: 날짜별 events.jsonl에 한 줄씩 추가
+              - update_metadata(): 메모리 dict만 갱신 (요청 종료 시 요약 1건 생성)
+        └─ 요청 종료 → TelemetryAggregator (백그라운드 스레드)
+              - requests.jsonl에 요청 요약 추가 (+ 지표 저장소 requests 테이블, src/utils/metrics_store.py)
+              - 날짜별 rollup.json (요청 수 / 성공률 / 도구 분포 / 지연 시간 히스토그램) 주기적 갱신
+
+메모리 상한:
+- 요청별 기록 리스트는 max_records_per_request개까지만 보관 (deque)
+- 집계 대기열은 max_pending_requests개 (초과 시 버리고 dropped 집계)
+- 날짜별 집계는 retain_days일만 메모리에 유지 (지연 시간은 고정 구간 히스토그램)
+
+요청 밖(앱 시작 / 사이드바 조작)의 기록은 날짜별 "app" 컨텍스트로 기록됩니다.
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import atexit
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# ------------------------- 프로젝트 모듈 ------------------------- #
+from src.utils.logger import Logger
+from src.utils.log_writer import get_log_writer, get_logging_config
+from src.utils.metrics_store import get_metrics_store, request_row
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 telemetry 섹션이 없을 때 사용
+DEFAULT_TELEMETRY_CONFIG = {
+    "enabled": True,                                # false면 UI가 기존 공유 ExperimentManager 사용
+    "base_dir": "experiments",                      # {base_dir}/{YYYYMMDD}/telemetry/ 아래에 기록
+    "max_records_per_request": 200,                 # 요청별 SQL / pgvector 기록 최대 보관 수
+    "max_pending_requests": 10000,                  # 집계 대기열 최대 길이 (초과 시 버림)
+    "rollup_interval_seconds": 30,                  # rollup.json 갱신 주기
+    "retain_days": 2,                               # 메모리에 유지할 날짜별 집계 수
+}
+
+# 지연 시간 히스토그램 구간 상한 (ms, 마지막 구간은 초과 전체)
+LATENCY_BUCKETS_MS = (
+    100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000,
+    7500, 10000, 15000, 20000, 30000, 60000,
+)
+
+_current: contextvars.ContextVar = contextvars.ContextVar("request_telemetry", default=None)
+
+
+def get_telemetry_config() -> Dict[str, Any]:
+    """
+    요청 텔레메트리 설정 로드 (기본값과 병합)
+
+    Returns:
+        텔레메트리 설정 딕셔너리
+    """
+    config = dict(DEFAULT_TELEMETRY_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("telemetry", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def day_dir(base_dir: str, date: str) -> Path:
+    """날짜별 텔레메트리 폴더 경로 ({base_dir}/{date}/telemetry)"""
+    return Path(base_dir) / date / "telemetry"
+
+
+# 이미 만든 폴더 (출력 폴더처럼 호출 측이 바로 파일을 여는 경우만 동기 생성)
+_created_dirs = set()
+_created_lock = threading.Lock()
+
+
+def _ensure_dir(path: Path) -> Path:
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        with _created_lock:
+            _created_dirs.add(path)
+    return path
+
+
+# ==================== 요청 로거 ==================== #
+class RequestLogger(Logger):
+    """날짜별 공용 로그 파일에 [request_id] 접두어를 붙여 기록하는 Logger"""
+
+    def __init__(self, log_path: str, request_id: str, level: Optional[str] = None):
+        super().__init__(log_path, level=level)
+        self.request_id = request_id
+
+        # 동기 기록 모드: 요청마다 파일 핸들을 붙잡지 않고 줄 단위로 열고 닫음
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    def _emit(self, line: str):
+        # "타임스탬프 | 메시지" → "타임스탬프 | [request_id] 메시지"
+        line = line.replace(" | ", f" | [{self.request_id}] ", 1)
+        if self._writer is not None:
+            self._writer.append(self.log_path, line)
+            return
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def close(self):
+        # 공용 파일이므로 요청 종료 시 닫지 않음 (기록 스레드가 핸들 유지)
+        pass
+
+
+# ==================== 요청 컨텍스트 ==================== #
+class RequestTelemetry:
+    """
+    요청 1개의 텔레메트리 (ExperimentManager와 같은 기록 API)
+
+    생성 시 파일 / 폴더를 만들지 않고, 모든 기록은 비동기 기록기의 추가(append)로 처리
+    """
+
+    def __init__(self, request_id: str, config: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None,
+                 log_level: Optional[str] = None):
+        """
+        Args:
+            request_id: 요청 ID (로그 접두어)
+            config: 텔레메트리 설정
+            metadata: 초기 메타데이터
+            log_level: 로그 최소 수준 (미지정 시 logging 설정)
+        """
+        self.request_id = request_id
+        self.config = config
+        self.log_level = log_level
+        self.date = datetime.now().strftime("%Y%m%d")
+        self.experiment_dir = day_dir(config["base_dir"], self.date)
+        self.events_file = self.experiment_dir / "events.jsonl"
+        self._writer = get_log_writer()
+        self._started = time.perf_counter()
+
+        max_records = int(config["max_records_per_request"])
+        self.db_queries = deque(maxlen=max_records)
+        self.pgvector_searches = deque(maxlen=max_records)
+
+        self.metadata: Dict[str, Any] = {
+            "request_id": request_id,
+            "start_time": datetime.now().isoformat(),
+            "difficulty": None,
+            "tool_used": None,
+            "user_query": None,
+            "success": None,
+            "response_time_ms": None,
+            "end_time": None,
+        }
+        self.metadata.update(metadata or {})
+
+        self.logger = RequestLogger(str(self.experiment_dir / "chatbot.log"), request_id, log_level)
+
+    # ---------------------- 폴더 (호출 측이 직접 파일을 여는 경우) ---------------------- #
+    @property
+    def outputs_dir(self) -> Path:
+        return _ensure_dir(self.experiment_dir / "outputs")
+
+    @property
+    def ui_dir(self) -> Path:
+        return _ensure_dir(self.experiment_dir / "ui")
+
+    # ---------------------- 내부: 기록 ---------------------- #
+    def _append(self, path: Path, text: str):
+        if self._writer is not None:
+            self._writer.append(path, text)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+    def _event(self, event_type: str, data: Any):
+        """events.jsonl에 {request_id, timestamp, type, data} 한 줄 추가"""
+        record = {
+            "request_id": self.request_id,
+            "timestamp": datetime.now().isoformat(),
+            "type": event_type,
+            "data": data,
+        }
+        self._append(self.events_file, json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def sync(self, timeout: Optional[float] = 10.0) -> bool:
+        """대기 중인 기록이 파일에 반영될 때까지 대기"""
+        return self.logger.sync(timeout)
+
+    # ---------------------- 로거 ---------------------- #
+    def get_tool_logger(self, tool_name: str) -> Logger:
+        """도구별 Logger (날짜별 tools/{tool_name}.log 공용 파일)"""
+        return RequestLogger(str(self.experiment_dir / "tools" / f"{tool_name}.log"), self.request_id, self.log_level)
+
+    # ---------------------- DB 기록 ---------------------- #
+    def log_sql_query(
+        self,
+        query: str,
+        description: str = "",
+        tool: str = "",
+        execution_time_ms: Optional[int] = None,
+        params: Optional[tuple] = None,
+        result_count: Optional[int] = None
+    ):
+        """SQL 쿼리 기록"""
+        record = {
+            "query": query,
+            "description": description,
+            "tool": tool,
+            "execution_time_ms": execution_time_ms,
+            "params": list(params) if params else None,
+            "result_count": result_count,
+        }
+        self.db_queries.append(record)
+        self._event("sql_query", record)
+        self.logger.write(f"SQL 쿼리 기록: {description}")
+
+    def log_pgvector_search(self, search_info: Dict):
+        """pgvector 검색 기록"""
+        self.pgvector_searches.append(search_info)
+        self._event("pgvector_search", search_info)
+        self.logger.write(f"pgvector 검색 기록: {search_info.get('tool', 'unknown')}")
+
+    def save_search_results(self, tool_name: str, results: Dict):
+        """DB 검색 결과 기록"""
+        self._event("search_results", {"tool": tool_name, "results": results})
+        self.logger.write(f"검색 결과 저장: {tool_name}")
+
+    def save_db_performance(self, performance_data: Dict):
+        """DB 성능 정보 기록"""
+        self._event("db_performance", performance_data)
+
+    def save_embedding_cache_stats(self, cache_stats: Dict):
+        """임베딩 캐시 hit/miss 통계 기록"""
+        self._event("embedding_cache", cache_stats)
+
+    def save_speculative_prefetch_stats(self, prefetch_stats: Dict):
+        """라우팅 중 선행 검색 통계 기록"""
+        self._event("speculative_prefetch", prefetch_stats)
+
+    # ---------------------- 프롬프트 기록 ---------------------- #
+    def save_system_prompt(self, system_prompt: str, metadata: Optional[Dict] = None):
+        """시스템 프롬프트 기록"""
+        self._event("system_prompt", {"prompt": system_prompt, "metadata": metadata})
+
+    def save_user_prompt(self, user_prompt: str, metadata: Optional[Dict] = None):
+        """사용자 프롬프트 기록"""
+        self._event("user_prompt", {"prompt": user_prompt, "metadata": metadata})
+
+    def save_final_prompt(self, final_prompt: str, metadata: Optional[Dict] = None):
+        """최종 프롬프트 기록"""
+        self._event("final_prompt", {"prompt": final_prompt, "metadata": metadata})
+
+    def save_prompt_template(self, template_info: Dict):
+        """프롬프트 템플릿 정보 기록"""
+        self._event("prompt_template", template_info)
+
+    # ---------------------- UI 기록 ---------------------- #
+    def log_ui_interaction(self, interaction: str):
+        """UI 인터랙션 로그 (날짜별 ui/user_interactions.log)"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._append(
+            self.experiment_dir / "ui" / "user_interactions.log",
+            f"{timestamp} | [{self.request_id}] {interaction}\n",
+        )
+
+    def log_ui_event(self, event: Dict):
+        """UI 이벤트 기록"""
+        self._event("ui_event", event)
+
+    def save_streamlit_session(self, session_data: Dict):
+        """Streamlit 세션 상태 기록"""
+        self._event("streamlit_session", session_data)
+
+    # ---------------------- 결과물 / 평가 / 대화 ---------------------- #
+    def save_output(self, filename: str, content: str) -> str:
+        """
+        결과물 저장 (save_file 도구가 경로를 바로 사용하므로 동기 기록)
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        if filename.endswith('.md') and '_' in filename:
+            output_path = _ensure_dir(self.outputs_dir / "save_data") / filename
+        else:
+            output_path = self.outputs_dir / filename
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        self.logger.write(f"결과물 저장: {filename}")
+        return str(output_path)
+
+    def save_evaluation_result(self, evaluation_data: Dict):
+        """답변 평가 결과 기록"""
+        self._event("evaluation", evaluation_data)
+        self.logger.write("평가 결과 저장")
+
+    def save_conversation(self, conversation_data: list, difficulty: str = "easy"):
+        """
+        대화 기록 (요청 단위이므로 이번 질문 / 답변만 기록)
+
+        Args:
+            conversation_data: 현재 채팅의 전체 메시지 리스트
+            difficulty: 난이도 (easy/hard)
+        """
+        turn = [
+            {k: v for k, v in msg.items() if k in ("role", "content", "tool_choice", "timestamp")}
+            for msg in conversation_data[-2:]
+        ]
+        self._event("conversation", {"difficulty": difficulty, "messages": turn})
+
+    def save_debug_info(self, filename: str, data: Dict):
+        """디버그 정보 기록"""
+        self._event("debug", {"name": filename, "data": data})
+
+    # ---------------------- 메타데이터 ---------------------- #
+    def update_metadata(self, **kwargs):
+        """메타데이터 갱신 (메모리만, 요청 종료 시 요약으로 기록)"""
+        self.metadata.update(kwargs)
+
+    def summary(self) -> Dict[str, Any]:
+        """요청 요약 (집계기로 전달, requests.jsonl 한 줄)"""
+        data = dict(self.metadata)
+        data["date"] = self.date
+        data["sql_queries"] = len(self.db_queries)
+        data["pgvector_searches"] = len(self.pgvector_searches)
+        data["duration_ms"] = round((time.perf_counter() - self._started) * 1000, 1)
+        return data
+
+
+# ==================== 날짜별 집계 ==================== #
+class DailyRollup:
+    """날짜 1개의 요청 집계 (고정 크기: 카운터 + 지연 시간 히스토그램)"""
+
+    def __init__(self, date: str):
+        self.date = date
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.cache_hits = 0
+        self.sql_queries = 0
+        self.pgvector_searches = 0
+        self.tools: Dict[str, int] = {}
+        self.difficulties: Dict[str, int] = {}
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.latency_count = 0
+
+    def add(self, summary: Dict[str, Any]):
+        self.requests += 1
+        if summary.get("success") is True:
+            self.successes += 1
+        elif summary.get("success") is False:
+            self.failures += 1
+        self.cache_hits += int(bool(summary.get("cache_hit")))
+        self.sql_queries += int(summary.get("sql_queries") or 0)
+        self.pgvector_searches += int(summary.get("pgvector_searches") or 0)
+
+        tool = summary.get("tool_used")
+        if tool:
+            self.tools[tool] = self.tools.get(tool, 0) + 1
+        difficulty = summary.get("difficulty")
+        if difficulty:
+            self.difficulties[difficulty] = self.difficulties.get(difficulty, 0) + 1
+
+        latency = summary.get("response_time_ms")
+        if latency is not None:
+            latency = float(latency)
+            index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if latency <= bound), len(LATENCY_BUCKETS_MS))
+            self.latency_histogram[index] += 1
+            self.latency_sum_ms += latency
+            self.latency_max_ms = max(self.latency_max_ms, latency)
+            self.latency_count += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """히스토그램 기반 백분위수 (구간 상한, 마지막 구간은 최댓값)"""
+        if not self.latency_count:
+            return None
+        target = q * self.latency_count
+        seen = 0
+        for i, count in enumerate(self.latency_histogram):
+            seen += count
+            if seen >= target and count:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.latency_max_ms
+        return self.latency_max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "date": self.date,
+            "updated_at": datetime.now().isoformat(),
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "success_rate": round(self.successes / self.requests, 4) if self.requests else 0.0,
+            "cache_hits": self.cache_hits,
+            "sql_queries": self.sql_queries,
+            "pgvector_searches": self.pgvector_searches,
+            "tools": dict(sorted(self.tools.items(), key=lambda kv: -kv[1])),
+            "difficulties": self.difficulties,
+            "latency_ms": {
+                "count": self.latency_count,
+                "avg": round(self.latency_sum_ms / self.latency_count, 1) if self.latency_count else None,
+                "p50": self.percentile(0.5),
+                "p95": self.percentile(0.95),
+                "p99": self.percentile(0.99),
+                "max": round(self.latency_max_ms, 1),
+                "buckets_ms": list(LATENCY_BUCKETS_MS),
+                "histogram": list(self.latency_histogram),
+                "sum": round(self.latency_sum_ms, 1),
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DailyRollup":
+        """기존 rollup.json 이어서 집계 (앱 재시작)"""
+        rollup = cls(data["date"])
+        for key in ("requests", "successes", "failures", "cache_hits", "sql_queries", "pgvector_searches"):
+            setattr(rollup, key, int(data.get(key, 0)))
+        rollup.tools = dict(data.get("tools", {}))
+        rollup.difficulties = dict(data.get("difficulties", {}))
+        latency = data.get("latency_ms", {})
+        if list(latency.get("buckets_ms", [])) == list(LATENCY_BUCKETS_MS):
+            rollup.latency_histogram = list(latency["histogram"])
+            rollup.latency_sum_ms = float(latency.get("sum", 0.0))
+            rollup.latency_max_ms = float(latency.get("max", 0.0))
+            rollup.latency_count = int(latency.get("count", 0))
+        return rollup
+
+
+class TelemetryAggregator:
+    """끝난 요청 요약을 받아 날짜별 집계 / requests.jsonl을 갱신하는 백그라운드 스레드"""
+
+    def __init__(self, base_dir: str = "experiments", interval: float = 30.0,
+                 max_pending: int = 10000, retain_days: int = 2):
+        self.base_dir = base_dir
+        self.interval = max(float(interval), 0.05)
+        self.retain_days = max(int(retain_days), 1)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(int(max_pending), 0))
+        self._rollups: "OrderedDict[str, DailyRollup]" = OrderedDict()
+        self._dirty = set()
+        self._writer = get_log_writer()
+        self._metrics = get_metrics_store()
+        self.dropped = 0
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="telemetry-aggregator", daemon=True)
+        self._thread.start()
+
+    # ---------------------- 요청 스레드 API (대기 없음) ---------------------- #
+    def submit(self, summary: Dict[str, Any]):
+        """요청 요약 전달 (대기열이 가득 차면 버림)"""
+        try:
+            self._queue.put_nowait(("summary", summary))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """대기 중인 요약을 집계하고 rollup.json을 기록할 때까지 대기"""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 10.0):
+        """남은 요약 집계 후 종료"""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        self._queue.put(("stop", None))
+        self._thread.join(timeout)
+
+    def rollups(self) -> Dict[str, Dict[str, Any]]:
+        """메모리에 있는 날짜별 집계 스냅샷"""
+        return {date: rollup.to_dict() for date, rollup in list(self._rollups.items())}
+
+    # ---------------------- 집계 스레드 ---------------------- #
+    def _rollup_for(self, date: str) -> DailyRollup:
+        rollup = self._rollups.get(date)
+        if rollup is None:
+            path = day_dir(self.base_dir, date) / "rollup.json"
+            try:
+                with open(path, encoding="utf-8") as f:
+                    rollup = DailyRollup.from_dict(json.load(f))
+            except Exception:
+                rollup = DailyRollup(date)
+            self._rollups[date] = rollup
+        return rollup
+
+    def _write(self, path: Path, text: str, append: bool):
+        if self._writer is not None:
+            (self._writer.append if append else self._writer.write)(path, text)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a" if append else "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _add(self, summary: Dict[str, Any]):
+        date = summary.get("date") or datetime.now().strftime("%Y%m%d")
+        self._rollup_for(date).add(summary)
+        self._dirty.add(date)
+        self._write(
+            day_dir(self.base_dir, date) / "requests.jsonl",
+            json.dumps(summary, ensure_ascii=False, default=str) + "\n",
+            append=True,
+        )
+        if self._metrics is not None:
+            self._metrics.record_request(request_row(
+                summary.get("request_id") or os.urandom(6).hex(), dict(summary, date=date),
+                "request", str(day_dir(self.base_dir, date)),
+            ))
+
+    def _write_rollups(self):
+        for date in list(self._dirty):
+            rollup = self._rollups.get(date)
+            if rollup is not None:
+                self._write(
+                    day_dir(self.base_dir, date) / "rollup.json",
+                    json.dumps(rollup.to_dict(), ensure_ascii=False, indent=2),
+                    append=False,
+                )
+        self._dirty.clear()
+
+        # 오래된 날짜 집계는 기록 후 메모리에서 제거
+        while len(self._rollups) > self.retain_days:
+            self._rollups.popitem(last=False)
+
+    def _run(self):
+        last_write = time.monotonic()
+        while True:
+            timeout = max(self.interval - (time.monotonic() - last_write), 0.0)
+            try:
+                kind, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                kind, payload = None, None
+
+            try:
+                if kind == "summary":
+                    self._add(payload)
+                if kind in ("flush", "stop") or time.monotonic() - last_write >= self.interval:
+                    self._write_rollups()
+                    last_write = time.monotonic()
+                    if kind == "flush":
+                        if self._writer is not None:
+                            self._writer.sync()
+                        if self._metrics is not None:
+                            self._metrics.flush()
+            except Exception:
+                # 집계 실패가 스레드를 멈추지 않도록 무시
+                pass
+
+            if kind == "flush":
+                payload.set()
+            elif kind == "stop":
+                return
+
+
+# ==================== 요청 텔레메트리 관리자 ==================== #
+class TelemetryManager:
+    """
+    그래프 / UI에 ExperimentManager 대신 넘기는 프로세스 공유 객체
+
+    속성 접근(logger, log_sql_query, update_metadata ...)은 현재 컨텍스트의 RequestTelemetry로 위임
+    (request() 블록 밖이면 날짜별 "app" 컨텍스트)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = dict(DEFAULT_TELEMETRY_CONFIG, **(config or get_telemetry_config()))
+        self.log_level = get_logging_config()["level"]      # 요청마다 설정을 다시 읽지 않도록 1회 로드
+        self.aggregator = TelemetryAggregator(
+            base_dir=self.config["base_dir"],
+            interval=self.config["rollup_interval_seconds"],
+            max_pending=self.config["max_pending_requests"],
+            retain_days=self.config["retain_days"],
+        )
+        atexit.register(self.aggregator.shutdown)
+        self._app_context: Optional[RequestTelemetry] = None
+        self._app_lock = threading.Lock()
+
+    def current(self) -> RequestTelemetry:
+        """현재 요청 컨텍스트 (요청 밖이면 오늘 날짜의 app 컨텍스트)"""
+        context = _current.get()
+        if context is not None:
+            return context
+
+        today = datetime.now().strftime("%Y%m%d")
+        app_context = self._app_context
+        if app_context is None or app_context.date != today:
+            with self._app_lock:
+                if self._app_context is None or self._app_context.date != today:
+                    self._app_context = RequestTelemetry("app", self.config, log_level=self.log_level)
+                app_context = self._app_context
+        return app_context
+
+    @contextmanager
+    def request(self, **metadata):
+        """
+        요청 1개의 텔레메트리 컨텍스트
+
+        사용 예:
+            with exp_manager.request(difficulty="easy"):
+                agent_executor.invoke(...)
+
+        Args:
+            **metadata: 초기 메타데이터 (difficulty 등)
+
+        Yields:
+            RequestTelemetry
+        """
+        context = RequestTelemetry(os.urandom(6).hex(), self.config, metadata, self.log_level)
+        token = _current.set(context)
+        try:
+            yield context
+        except Exception as e:
+            context.update_metadata(success=False, error=str(e))
+            raise
+        finally:
+            _current.reset(token)
+            context.metadata["end_time"] = datetime.now().isoformat()
+            self.aggregator.submit(context.summary())
+
+    def __getattr__(self, name):
+        # 정의되지 않은 속성은 현재 요청 컨텍스트로 위임 (내부 속성은 위임하지 않음)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.current(), name)
+
+    def sync(self, timeout: Optional[float] = 10.0) -> bool:
+        """집계 반영 + 대기 중인 파일 기록 반영"""
+        return self.aggregator.flush(timeout) and self.current().sync(timeout)
+
+    def close(self):
+        """집계 스레드 종료 (남은 요약 기록)"""
+        self.aggregator.shutdown()
+        atexit.unregister(self.aggregator.shutdown)
+
+
+def request_scope(exp_manager, **metadata):
+    """
+    exp_manager가 TelemetryManager면 요청 컨텍스트, 아니면(ExperimentManager / None) 빈 컨텍스트
+
+    Args:
+        exp_manager: TelemetryManager / ExperimentManager / None
+        **metadata: 초기 메타데이터
+
+    Returns:
+        컨텍스트 매니저
+    """
+    if isinstance(exp_manager, TelemetryManager):
+        return exp_manager.request(**metadata)
+    return nullcontext()
+
+
+def current_request_id() -> Optional[str]:
+    """현재 요청 ID (요청 밖이면 None)"""
+    context = _current.get()
+    return context.request_id if context is not None else None
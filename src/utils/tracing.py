@@ -0,0 +1,397 @@
+# ---------------------- 요청 단위 트레이싱 모듈 ---------------------- #
+"""
+질문 1개(요청) 단위 트레이싱
+
+전체 응답 시간(response_time_ms)과 타임스탬프만 있는 tool_timeline으로는
+라우터 / 도구 / DB / LLM 중 어디서 시간이 걸렸는지 알기 어렵습니다.
+질문마다 trace_id를 만들고 contextvars로 전파해 구간(span)별 소요 시간을 기록합니다:
+
+    with start_trace("chat.question", difficulty="easy"):     # UI: 질문 1개
+        with span("router_node"):                             # 그래프 노드 / 도구
+            ...                                               # LLM 호출 (콜백), 임베딩, SQL, pgvector 검색
+
+- 트레이스가 없으면 span()은 아무것도 기록하지 않음 (배치 스크립트 / 테스트 오버헤드 없음)
+- 스레드 풀로 넘긴 작업도 contextvars.copy_context()로 같은 트레이스에 기록
+- 트레이스가 끝나면 OTLP JSON(ExportTraceServiceRequest) 한 줄을 JSONL 파일에 추가
+  (비동기 기록기 사용, OpenTelemetry Collector otlpjsonfile 수신기로 읽을 수 있는 형식)
+- scripts/system/trace_report.py: 트레이스별 span 트리 / 임계 경로(critical path) 출력
+"""
+
+# ------------------------- 표준 라이브러리 ------------------------- #
+import contextvars
+import functools
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# ==================== 기본값 설정 ==================== #
+
+# configs/model_config.yaml의 tracing 섹션이 없을 때 사용
+DEFAULT_TRACING_CONFIG = {
+    "enabled": True,                                # false면 start_trace()가 트레이스를 만들지 않음
+    "export_path": "logs/traces/traces_{date}.jsonl",  # {date}: YYYYMMDD
+    "service_name": "langchain-project",            # OTLP resource service.name
+    "sample_rate": 1.0,                             # 기록할 질문 비율 (0.0 ~ 1.0)
+    "max_spans_per_trace": 2000,                    # 트레이스당 최대 span 수 (초과분은 dropped_spans로 집계)
+    "max_attribute_length": 500,                    # 문자열 속성 최대 길이 (SQL 문 등)
+}
+
+# span 종류 (OTLP SpanKind)
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("trace", default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("trace_span", default=None)
+
+
+def get_tracing_config() -> Dict[str, Any]:
+    """
+    트레이싱 설정 로드 (기본값과 병합)
+
+    Returns:
+        트레이싱 설정 딕셔너리
+    """
+    config = dict(DEFAULT_TRACING_CONFIG)
+    try:
+        from src.utils.config_loader import get_model_config
+        config.update(get_model_config().get("tracing", {}) or {})
+    except Exception:
+        # config 로드 실패 시 기본값
+        pass
+    return config
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+# ==================== Span / Trace ==================== #
+class Span:
+    """구간 1개 (시작 / 종료 시각, 속성, 상태)"""
+
+    def __init__(self, trace: "Trace", name: str, kind: str = "internal",
+                 parent_id: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.trace = trace
+        self.name = name
+        self.kind = kind
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter()
+        self.end_ns: Optional[int] = None
+        self.duration_ms: Optional[float] = None
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set_attribute(self, key: str, value: Any):
+        """속성 기록 (None은 무시)"""
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, **attributes):
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_error(self, error: BaseException):
+        """예외 기록 (status=error)"""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self):
+        """구간 종료 (중복 호출 무시)"""
+        if self.end_ns is not None:
+            return
+        self.duration_ms = (time.perf_counter() - self._start_perf) * 1000
+        self.end_ns = self.start_ns + int(self.duration_ms * 1_000_000)
+        self.trace.add(self)
+
+
+class _NoopSpan:
+    """트레이스가 없을 때 반환하는 span (모든 기록 무시)"""
+
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, **attributes):
+        pass
+
+    def record_error(self, error):
+        pass
+
+    def end(self):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """질문 1개의 span 모음 (여러 스레드에서 추가)"""
+
+    def __init__(self, name: str, max_spans: int = 2000):
+        self.trace_id = _new_id(16)
+        self.name = name
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def add(self, span: Span):
+        with self._lock:
+            if self.closed:
+                return                              # 트레이스 종료 후 끝난 span (백그라운드 작업)은 버림
+            if len(self.spans) >= self.max_spans:
+                self.dropped_spans += 1
+                return
+            self.spans.append(span)
+
+    def close(self) -> List[Span]:
+        with self._lock:
+            self.closed = True
+            return list(self.spans)
+
+
+# ==================== 공개 API ==================== #
+def current_trace_id() -> Optional[str]:
+    """현재 컨텍스트의 trace_id (트레이스 밖이면 None)"""
+    trace = _current_trace.get()
+    return trace.trace_id if trace is not None else None
+
+
+def current_span():
+    """현재 컨텍스트의 span (트레이스 밖이면 NOOP_SPAN)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def start_span(name: str, kind: str = "internal", **attributes):
+    """
+    수동 종료 span 시작 (콜백처럼 시작 / 종료가 다른 함수에 있을 때)
+
+    현재 span을 부모로 사용하지만 컨텍스트의 현재 span은 바꾸지 않음. 반드시 span.end() 호출
+
+    Args:
+        name: span 이름
+        kind: internal | server | client
+        **attributes: 속성
+
+    Returns:
+        Span (트레이스 밖이면 NOOP_SPAN)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return NOOP_SPAN
+    parent = _current_span.get()
+    return Span(trace, name, kind, parent.span_id if parent else None, attributes)
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes):
+    """
+    구간 기록 컨텍스트 (트레이스 밖이면 아무것도 기록하지 않음)
+
+    사용 예:
+        with span("db.sql", kind="client", statement=query) as s:
+            cur.execute(query)
+            s.set_attribute("rows", cur.rowcount)
+
+    Args:
+        name: span 이름
+        kind: internal | server | client
+        **attributes: 속성
+
+    Yields:
+        Span 또는 NOOP_SPAN
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    current = Span(trace, name, kind, parent.span_id if parent else None, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end()
+
+
+def traced(name: Optional[str] = None, kind: str = "internal"):
+    """
+    함수 호출을 span으로 기록하는 데코레이터 (동기 / 비동기 함수 모두 지원)
+
+    Args:
+        name: span 이름 (기본값: 함수 이름)
+        kind: internal | server | client
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def start_trace(name: str, **attributes):
+    """
+    질문 1개에 대한 트레이스 시작 (루트 span 포함), 종료 시 JSONL 파일로 내보냄
+
+    이미 트레이스 안이면 새 트레이스 대신 하위 span으로 기록
+
+    Args:
+        name: 루트 span 이름
+        **attributes: 루트 span 속성 (difficulty 등)
+
+    Yields:
+        루트 Span (비활성화 / 샘플링 제외 시 NOOP_SPAN)
+    """
+    if _current_trace.get() is not None:
+        with span(name, **attributes) as nested:
+            yield nested
+        return
+
+    config = get_tracing_config()
+    if not config.get("enabled", True) or random.random() >= float(config.get("sample_rate", 1.0)):
+        yield NOOP_SPAN
+        return
+
+    trace = Trace(name, int(config["max_spans_per_trace"]))
+    trace_token = _current_trace.set(trace)
+    try:
+        with span(name, kind="server", **attributes) as root:
+            yield root
+    finally:
+        _current_trace.reset(trace_token)
+        spans = trace.close()
+        try:
+            export_trace(trace, spans, config)
+        except Exception:
+            # 내보내기 실패가 응답을 막지 않도록 무시
+            pass
+
+
+# ==================== 내보내기 (OTLP JSON) ==================== #
+def _otlp_value(value: Any, max_length: int) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}             # OTLP JSON: int64는 문자열
+    if isinstance(value, float):
+        return {"doubleValue": round(value, 3)}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v, max_length) for v in value]}}
+    text = str(value)
+    return {"stringValue": text if len(text) <= max_length else text[:max_length] + "…"}
+
+
+def _otlp_span(span_: Span, max_length: int) -> Dict[str, Any]:
+    attributes = dict(span_.attributes)
+    attributes["duration_ms"] = round(span_.duration_ms or 0.0, 3)
+    data = {
+        "traceId": span_.trace_id,
+        "spanId": span_.span_id,
+        "name": span_.name,
+        "kind": SPAN_KINDS.get(span_.kind, 1),
+        "startTimeUnixNano": str(span_.start_ns),
+        "endTimeUnixNano": str(span_.end_ns or span_.start_ns),
+        "attributes": [{"key": k, "value": _otlp_value(v, max_length)} for k, v in attributes.items()],
+        "status": {"code": 2, "message": span_.error or ""} if span_.status == "error" else {"code": 1},
+    }
+    if span_.parent_id:
+        data["parentSpanId"] = span_.parent_id
+    return data
+
+
+def to_otlp_json(trace: Trace, spans: List[Span], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    트레이스 → OTLP ExportTraceServiceRequest JSON
+
+    Args:
+        trace: 트레이스
+        spans: 종료된 span 목록
+        config: 트레이싱 설정 (None이면 로드)
+
+    Returns:
+        dict: {"resourceSpans": [...]}
+    """
+    config = config or get_tracing_config()
+    max_length = int(config["max_attribute_length"])
+    resource_attributes = {
+        "service.name": config["service_name"],
+        "trace.name": trace.name,
+        "trace.dropped_spans": trace.dropped_spans,
+    }
+    return {
+        "resourceSpans": [{
+            "resource": {
+                "attributes": [
+                    {"key": k, "value": _otlp_value(v, max_length)} for k, v in resource_attributes.items()
+                ],
+            },
+            "scopeSpans": [{
+                "scope": {"name": "src.utils.tracing"},
+                "spans": [_otlp_span(s, max_length) for s in sorted(spans, key=lambda s: s.start_ns)],
+            }],
+        }],
+    }
+
+
+def export_trace(trace: Trace, spans: List[Span], config: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+    """
+    트레이스를 JSONL 파일에 한 줄로 추가 (비동기 기록기 사용)
+
+    Args:
+        trace: 트레이스
+        spans: 종료된 span 목록
+        config: 트레이싱 설정 (None이면 로드)
+
+    Returns:
+        기록 파일 경로 (span이 없으면 None)
+    """
+    if not spans:
+        return None
+    config = config or get_tracing_config()
+    path = Path(str(config["export_path"]).format(date=datetime.now().strftime("%Y%m%d")))
+    line = json.dumps(to_otlp_json(trace, spans, config), ensure_ascii=False) + "\n"
+
+    from src.utils.log_writer import get_log_writer
+    writer = get_log_writer()
+    if writer is not None:
+        writer.append(path, line)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+    return path
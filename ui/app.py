@@ -23,7 +23,9 @@ import streamlit as st
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.agent.graph import create_agent_graph
+from src.llm.registry import get_llm_registry
 from src.utils.experiment_manager import ExperimentManager
+from src.utils.request_telemetry import TelemetryManager, get_telemetry_config
 from ui.components.sidebar import render_sidebar
 from ui.components.chat_interface import (
     display_chat_history,
@@ -75,19 +77,33 @@ def initialize_agent(_today: str):
     """
     Agent 및 ExperimentManager 초기화 (캐싱)
 
+    telemetry.enabled면 요청마다 기록이 분리되는 TelemetryManager를 공유
+
     Args:
         _today: 날짜 (YYYYMMDD) - 캐시 키로 사용 (날짜 변경 시 새로 초기화)
 
     Returns:
-        tuple: (agent_executor, exp_manager)
+        tuple: (agent_executor, exp_manager)  # exp_manager: TelemetryManager 또는 ExperimentManager
     """
     try:
-        # ExperimentManager 생성
-        exp_manager = ExperimentManager()
+        # 요청 단위 텔레메트리 (동시 사용자 기록 분리) 또는 기존 공유 ExperimentManager
+        if get_telemetry_config().get("enabled", True):
+            exp_manager = TelemetryManager()
+        else:
+            exp_manager = ExperimentManager()
 
         # Agent 그래프 생성
         agent_executor = create_agent_graph(exp_manager=exp_manager)
 
+        # LLM 공유 인스턴스 / 연결 풀 미리 준비 (첫 질문 지연 감소)
+        llm_registry = get_llm_registry()
+        if llm_registry.config.get("warmup_on_startup", True):
+            try:
+                warmed = llm_registry.warm_up()
+                exp_manager.logger.write(f"LLM warm-up 완료: {len(warmed)}개 클라이언트")
+            except Exception as e:
+                exp_manager.logger.write(f"LLM warm-up 실패 (무시): {e}")
+
         exp_manager.logger.write("Streamlit UI 시작")
         exp_manager.logger.write(f"실험 폴더: {exp_manager.experiment_dir}")
 
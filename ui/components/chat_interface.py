@@ -6,10 +6,11 @@
 Streamlit 채팅 UI 구성:
 - 채팅 히스토리 표시
 - 사용자 입력 처리
-- Agent 실행 및 답변 표시
+- Agent 실행 및 답변 표시 (스트리밍 모드: 토큰 도착 즉시 표시)
 """
 
 # ------------------------- 표준 라이브러리 ------------------------- #
+import time
 from datetime import datetime
 
 # ------------------------- 서드파티 라이브러리 ------------------------- #
@@ -25,6 +26,9 @@ from ui.components.chat_manager import (
     export_current_chat
 )
 from src.evaluation import AnswerEvaluator, save_evaluation_results
+from src.agent.streaming import get_streaming_config, stream_agent
+from src.utils.tracing import start_trace
+from src.utils.request_telemetry import request_scope
 
 
 # ==================== 채팅 히스토리 관리 ==================== #
@@ -58,7 +62,8 @@ def display_chat_history():
                     "save_file": "💾 파일 저장"
                 }
                 tool_label = tool_labels.get(tool_choice, f"🔧 {tool_choice}")
-                st.caption(f"**사용된 도구**: {tool_label}")
+                cache_label = " · ⚡ 캐시된 답변" if message.get("cache_hit") else ""
+                st.caption(f"**사용된 도구**: {tool_label}{cache_label}")
 
             st.markdown(content)
 
@@ -151,6 +156,81 @@ def add_user_message(prompt: str, exp_manager=None):
         exp_manager.update_metadata(user_query=prompt)
 
 
+# ---------------------- Agent 스트리밍 실행 ---------------------- #
+# 스트리밍 중 노드 진행 상태 라벨
+STREAM_NODE_LABELS = {
+    "router": "🧭 도구 선택 중",
+    "general": "🗣️ 일반 답변 생성",
+    "search_paper": "📚 논문 검색",
+    "web_search": "🌐 웹 검색",
+    "glossary": "📖 용어집 검색",
+    "summarize": "📄 논문 요약",
+    "save_file": "💾 파일 저장",
+    "text2sql": "📊 통계 조회",
+    "parallel_tools": "⚡ 독립 도구 동시 실행",
+}
+
+# 난이도별 주 수준 (final_answer에 들어가는 수준, 먼저 표시)
+STREAM_PRIMARY_LEVEL = {"easy": "beginner", "hard": "advanced"}
+
+
+def _run_agent_streaming(agent_executor, inputs: dict, config: dict, message_placeholder, difficulty: str):
+    """
+    Agent를 스트리밍 실행하며 message_placeholder에 진행 상태와 답변 토큰을 즉시 표시
+
+    Args:
+        agent_executor: Agent 실행기
+        inputs: 그래프 입력 상태
+        config: LangGraph 실행 설정 (callbacks)
+        message_placeholder: 답변 표시용 st.empty()
+        difficulty: 난이도 (주 수준 선택용)
+
+    Returns:
+        tuple: (그래프 최종 상태, 첫 토큰 표시까지 걸린 시간 ms 또는 None)
+    """
+    started = time.perf_counter()
+    render_interval = int(get_streaming_config().get("render_interval_chars", 20))
+    primary_level = STREAM_PRIMARY_LEVEL.get(difficulty)
+
+    buffers = {}                                # 수준별 누적 토큰
+    shown_level = None                          # 화면에 표시 중인 수준
+    rendered_len = 0
+    first_token_ms = None
+    response = {}
+
+    message_placeholder.markdown("🤖 질문 분석 중...")
+
+    for event in stream_agent(agent_executor, inputs, config=config):
+        if event["type"] == "token":
+            level = event["level"]
+            buffers[level] = buffers.get(level, "") + event["content"]
+
+            # 주 수준 토큰이 오면 주 수준으로 전환, 그 전까지는 처음 도착한 수준 표시
+            if shown_level is None or (level == primary_level and shown_level != primary_level):
+                shown_level, rendered_len = level, 0
+            if level != shown_level:
+                continue
+
+            text = buffers[level]
+            if first_token_ms is None:
+                first_token_ms = int((time.perf_counter() - started) * 1000)
+            if len(text) - rendered_len >= render_interval or rendered_len == 0:
+                message_placeholder.markdown(text + " ▌")
+                rendered_len = len(text)
+
+        elif event["type"] == "node" and not buffers:
+            update = event["update"]
+            if event["node"] == "router" and update.get("tool_choice"):
+                message_placeholder.markdown(f"🧭 선택된 도구: **{update['tool_choice']}** · 실행 중...")
+            elif event["node"] in STREAM_NODE_LABELS:
+                message_placeholder.markdown(f"{STREAM_NODE_LABELS[event['node']]} 완료")
+
+        elif event["type"] == "final":
+            response = event["state"]
+
+    return response, first_token_ms
+
+
 # ---------------------- Agent 응답 처리 ---------------------- #
 def handle_agent_response(agent_executor, prompt: str, difficulty: str, exp_manager=None):
     """
@@ -193,16 +273,35 @@ def handle_agent_response(agent_executor, prompt: str, difficulty: str, exp_mana
             from ui.components.chat_manager import get_current_messages
             previous_messages = get_current_messages()
 
-            with st.spinner("🤖 답변 생성 중..."):
-                response = agent_executor.invoke(
-                    {
-                        "question": prompt,
-                        "difficulty": difficulty,
-                        "messages": previous_messages  # 이전 대화 전달
-                    },
-                    config={"callbacks": [st_callback]}
+            agent_inputs = {
+                "question": prompt,
+                "difficulty": difficulty,
+                "messages": previous_messages  # 이전 대화 전달
+            }
+
+            streaming = get_streaming_config().get("enabled", True)
+
+            # 질문 1개 = 트레이스 1개 (라우터 / 도구 / LLM / 임베딩 / SQL / pgvector 구간 기록)
+            with start_trace("chat.question", difficulty=difficulty, streaming=streaming) as trace_span:
+                if streaming:
+                    # 스트리밍 실행: 라우팅 / 도구 진행 / 답변 토큰을 도착 즉시 표시
+                    response, first_token_ms = _run_agent_streaming(
+                        agent_executor, agent_inputs, {"callbacks": [st_callback]}, message_placeholder, difficulty
+                    )
+                    trace_span.set_attribute("first_token_ms", first_token_ms)
+                    if exp_manager and first_token_ms is not None:
+                        exp_manager.update_metadata(first_token_ms=first_token_ms)
+                else:
+                    with st.spinner("🤖 답변 생성 중..."):
+                        response = agent_executor.invoke(agent_inputs, config={"callbacks": [st_callback]})
+                trace_span.set_attributes(
+                    tool_choice=response.get("tool_choice"),
+                    tool_pipeline=response.get("tool_pipeline"),
                 )
 
+            if exp_manager and trace_span.trace_id:
+                exp_manager.update_metadata(trace_id=trace_span.trace_id)
+
             # 종료 시간 계산
             end_time = datetime.now()
             response_time_ms = int((end_time - start_time).total_seconds() * 1000)
@@ -226,7 +325,21 @@ def handle_agent_response(agent_executor, prompt: str, difficulty: str, exp_mana
                 "text2sql": "📊 통계 조회"
             }
             tool_label = tool_labels.get(tool_choice, f"🔧 {tool_choice}")
-            st.caption(f"**사용된 도구**: {tool_label}")
+
+            # 답변 캐시 히트 시 캡션에 표시 (그래프 실행 생략)
+            cache_hit = bool(response.get("cache_hit"))
+            if cache_hit:
+                st.caption(
+                    f"**사용된 도구**: {tool_label} · ⚡ 캐시된 답변 "
+                    f"(유사도 {response.get('cache_similarity', 0):.3f}, {response_time_ms}ms)"
+                )
+                if exp_manager:
+                    exp_manager.log_ui_interaction(
+                        f"답변 캐시 히트: '{response.get('cached_question')}' "
+                        f"(유사도 {response.get('cache_similarity')})"
+                    )
+            else:
+                st.caption(f"**사용된 도구**: {tool_label}")
 
             # -------------- 도구 선택 이유 표시 -------------- #
             routing_reason = response.get("routing_reason")
@@ -240,6 +353,8 @@ def handle_agent_response(agent_executor, prompt: str, difficulty: str, exp_mana
                             "multi_request": "다중 요청 패턴",
                             "question_type": "질문 유형 분석",
                             "llm": "LLM 분석",
+                            "llm_combined": "LLM 통합 분석 (분류+라우팅+검증)",
+                            "fast_path": "키워드 고속 라우팅",
                             "keyword_fallback": "키워드 매칭"
                         }
                         method_label = method_labels.get(routing_method, routing_method)
@@ -254,7 +369,7 @@ def handle_agent_response(agent_executor, prompt: str, difficulty: str, exp_mana
             # -------------- 도구 선택 로그 기록 -------------- #
             if exp_manager:
                 exp_manager.log_ui_interaction(f"선택된 도구: {tool_choice} ({tool_label})")
-                exp_manager.update_metadata(tool_used=tool_choice)
+                exp_manager.update_metadata(tool_used=tool_choice, cache_hit=cache_hit)
 
             # -------------- 도구 실행 타임라인 표시 -------------- #
             # response에 tool_timeline이 있으면 모든 이벤트 표시
@@ -289,6 +404,17 @@ def handle_agent_response(agent_executor, prompt: str, difficulty: str, exp_mana
                                 total = event.get("total_tools", "?")
                                 st.info(f"**{idx}. ▶️ 다중 요청 진행**\n\n{description}\n\n- 도구: {tool_label} ({pipeline_idx}/{total})")
 
+                            elif event_type == "pipeline_parallel":
+                                tools_text = " + ".join(tool_labels.get(t, f"🔧 {t}") for t in event.get("tools", []))
+                                st.info(f"**{idx}. ⚡ 독립 도구 동시 실행**\n\n{description}\n\n- 도구: {tools_text}")
+
+                            elif event_type == "speculative_prefetch":
+                                st.write(f"**{idx}. 🔮 라우팅 중 선행 검색**: {description}")
+
+                            elif event_type == "level_answer":
+                                status_icon = {"success": "✅", "timeout": "⏱️"}.get(event.get("status"), "❌")
+                                st.write(f"**{idx}. {status_icon} 수준별 답변**: {description}")
+
                             else:
                                 st.write(f"**{idx}. {event_type}**: {description}")
 
@@ -553,7 +679,8 @@ def handle_agent_response(agent_executor, prompt: str, difficulty: str, exp_mana
                 role="assistant",
                 content=answer_for_export,
                 tool_choice=tool_choice,
-                sources=sources if sources else None
+                sources=sources if sources else None,
+                cache_hit=cache_hit
             )
 
             # -------------- 전체 대화 outputs 폴더에 저장 -------------- #
@@ -698,13 +825,15 @@ def render_chat_input(agent_executor, difficulty: str, exp_manager=None):
     """
     # 채팅 입력창 표시
     if prompt := st.chat_input("논문에 대해 질문해보세요..."):
-        # 사용자 메시지 추가
-        add_user_message(prompt, exp_manager=exp_manager)
-
-        # Agent 응답 처리
-        handle_agent_response(
-            agent_executor=agent_executor,
-            prompt=prompt,
-            difficulty=difficulty,
-            exp_manager=exp_manager
-        )
+        # 질문 1개 = 요청 텔레메트리 1개 (TelemetryManager일 때만, 동시 사용자 기록 분리)
+        with request_scope(exp_manager, difficulty=difficulty):
+            # 사용자 메시지 추가
+            add_user_message(prompt, exp_manager=exp_manager)
+
+            # Agent 응답 처리
+            handle_agent_response(
+                agent_executor=agent_executor,
+                prompt=prompt,
+                difficulty=difficulty,
+                exp_manager=exp_manager
+            )